@@ -50,9 +50,13 @@ License:
     limitations under the License.
 """
 
+import collections
+import concurrent.futures
 import multiprocessing
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from sqlalchemy.orm import Session
 
@@ -66,6 +70,7 @@ from PyFunceble.checker.base import CheckerBase
 from PyFunceble.checker.syntax.domain import DomainSyntaxChecker
 from PyFunceble.checker.syntax.ip import IPSyntaxChecker
 from PyFunceble.checker.syntax.url import URLSyntaxChecker
+from PyFunceble.helpers.executor import ExecutorHelper
 from PyFunceble.helpers.regex import RegexHelper
 from PyFunceble.query.dns.query_tool import DNSQueryTool
 from PyFunceble.query.http_status_code import HTTPStatusCode
@@ -103,6 +108,9 @@ class AvailabilityCheckerBase(CheckerBase):
     :param bool use_whois_db:
         Optional, Activates/Disable the usage of a local database to store the
         WHOIS datasets.
+    :param float deadline:
+        Optional, The maximal number of seconds we are allowed to spend on a
+        single subject.
     """
 
     # pylint: disable=too-many-public-methods, too-many-instance-attributes
@@ -114,6 +122,27 @@ class AvailabilityCheckerBase(CheckerBase):
     STD_USE_HTTP_CODE_LOOKUP: bool = True
     STD_USE_REPUTATION_LOOKUP: bool = False
     STD_USE_WHOIS_DB: bool = True
+    STD_DEADLINE: Optional[float] = None
+
+    DNS_MAX_WORKERS: int = 64
+    """
+    The maximal number of DNS queries the checkers (threads) of the current
+    process run concurrently.
+    """
+
+    DNS_MAX_QUERIES_PER_SUBJECT: int = 2
+    """
+    The maximal number of DNS queries a single subject runs concurrently. The
+    next record type is only queried once one of them came back empty.
+    """
+
+    dns_executor: ExecutorHelper = ExecutorHelper(
+        DNS_MAX_WORKERS, thread_name_prefix="pyfunceble_dns"
+    )
+    """
+    The pool of threads which runs our DNS queries. It is shared by all the
+    checkers of the current process.
+    """
 
     dns_query_tool: Optional[DNSQueryTool] = None
     whois_query_tool: Optional[WhoisQueryTool] = None
@@ -131,6 +160,11 @@ class AvailabilityCheckerBase(CheckerBase):
     _use_http_code_lookup: bool = False
     _use_reputation_lookup: bool = False
     _use_whois_db: bool = False
+    _lookup_throttle: Optional[Callable[[str], Any]] = None
+    _deadline: Optional[float] = None
+
+    started_at: Optional[float] = None
+    capped_timeouts: Optional[Dict[Tuple[int, str], Tuple[Any, str, Any]]] = None
 
     status: Optional[AvailabilityCheckerStatus] = None
     params: Optional[AvailabilityCheckerParams] = None
@@ -148,6 +182,7 @@ class AvailabilityCheckerBase(CheckerBase):
         do_syntax_check_first: Optional[bool] = None,
         db_session: Optional[Session] = None,
         use_whois_db: Optional[bool] = None,
+        deadline: Optional[float] = None,
     ) -> None:
         self.dns_query_tool = DNSQueryTool().guess_all_settings()
         self.whois_query_tool = WhoisQueryTool()
@@ -158,6 +193,7 @@ class AvailabilityCheckerBase(CheckerBase):
         self.ip_syntax_checker = IPSyntaxChecker()
         self.url_syntax_checker = URLSyntaxChecker()
         self.db_session = db_session
+        self.capped_timeouts = {}
 
         self.params = AvailabilityCheckerParams()
 
@@ -201,6 +237,11 @@ class AvailabilityCheckerBase(CheckerBase):
         else:
             self.guess_and_set_use_whois_db()
 
+        if deadline is not None:
+            self.deadline = deadline
+        else:
+            self.guess_and_set_deadline()
+
         super().__init__(
             subject, do_syntax_check_first=do_syntax_check_first, db_session=db_session
         )
@@ -470,6 +511,222 @@ class AvailabilityCheckerBase(CheckerBase):
 
         return self
 
+    @property
+    def lookup_throttle(self) -> Optional[Callable[[str], Any]]:
+        """
+        Provides the current value of the :code:`_lookup_throttle` attribute.
+        """
+
+        return self._lookup_throttle
+
+    @lookup_throttle.setter
+    def lookup_throttle(self, value: Optional[Callable[[str], Any]]) -> None:
+        """
+        Sets the callable to call (with the type of the lookup) before each
+        lookup we perform.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not callable.
+        """
+
+        if value is not None and not callable(value):
+            raise TypeError(f"<value> should be callable, {type(value)} given.")
+
+        self._lookup_throttle = value
+
+    def set_lookup_throttle(
+        self, value: Optional[Callable[[str], Any]]
+    ) -> "AvailabilityCheckerBase":
+        """
+        Sets the callable to call (with the type of the lookup) before each
+        lookup we perform.
+
+        :param value:
+            The value to set.
+        """
+
+        self.lookup_throttle = value
+
+        return self
+
+    def throttle(self, lookup: str) -> "AvailabilityCheckerBase":
+        """
+        Gives our lookup throttle - if any - the opportunity to hold the given
+        lookup.
+
+        :param lookup:
+            The type of the lookup we are going to perform.
+            Available: :code:`dns` | :code:`whois` | :code:`netinfo` |
+            :code:`http_status_code`
+        """
+
+        if self.lookup_throttle:
+            self.lookup_throttle(lookup)
+
+        return self
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """
+        Provides the current value of the :code:`_deadline` attribute.
+        """
+
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, value: Optional[Union[int, float]]) -> None:
+        """
+        Sets the maximal number of seconds we are allowed to spend on a single
+        subject.
+
+        :param value:
+            The value to set. :code:`None` means no deadline.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int` nor
+            :py:class:`float`.
+        :raise ValueError:
+            When the given :code:`value` is not greater than :code:`0`.
+        """
+
+        if value is not None:
+            if not isinstance(value, (int, float)):
+                raise TypeError(
+                    f"<value> should be {int} or {float}, {type(value)} given."
+                )
+
+            if value <= 0:
+                raise ValueError(f"<value> ({value!r}) should be greater than 0.")
+
+            value = float(value)
+
+        self._deadline = value
+
+    def set_deadline(
+        self, value: Optional[Union[int, float]]
+    ) -> "AvailabilityCheckerBase":
+        """
+        Sets the maximal number of seconds we are allowed to spend on a single
+        subject.
+
+        :param value:
+            The value to set.
+        """
+
+        self.deadline = value
+
+        return self
+
+    def get_remaining_time(self) -> Optional[float]:
+        """
+        Provides the number of seconds left before we reach the deadline of
+        the current subject.
+
+        :return:
+            :code:`None` when no deadline is set.
+        """
+
+        if self.deadline is None:
+            return None
+
+        if self.started_at is None:
+            return self.deadline
+
+        return self.deadline - (time.monotonic() - self.started_at)
+
+    def is_deadline_exceeded(self) -> bool:
+        """
+        Checks if we reached the deadline of the current subject.
+        """
+
+        remaining_time = self.get_remaining_time()
+
+        return remaining_time is not None and remaining_time <= 0
+
+    def get_timeout_attributes(self, lookup: str) -> List[Tuple[Any, str]]:
+        """
+        Provides the tool(s) - and their timeout attribute - behind the given
+        lookup.
+
+        :param lookup:
+            The type of the lookup.
+            Available: :code:`dns` | :code:`whois` | :code:`netinfo` |
+            :code:`http_status_code`
+        """
+
+        return {
+            "dns": [(self.dns_query_tool, "query_timeout")],
+            "whois": [(self.whois_query_tool, "query_timeout")],
+            "netinfo": [
+                (self.addressinfo_query_tool, "timeout"),
+                (self.hostbyaddr_query_tool, "timeout"),
+            ],
+            "http_status_code": [(self.http_status_code_query_tool, "timeout")],
+        }[lookup]
+
+    def cap_timeouts(self, lookup: str) -> "AvailabilityCheckerBase":
+        """
+        Caps the timeout of the tool(s) behind the given lookup to the time
+        left before the deadline of the current subject.
+
+        .. note::
+            The timeouts are restored as soon as another subject is given.
+
+        :param lookup:
+            The type of the lookup we are going to perform.
+        """
+
+        remaining_time = self.get_remaining_time()
+
+        if remaining_time is None:
+            return self
+
+        for tool, attribute in self.get_timeout_attributes(lookup):
+            key = (id(tool), attribute)
+
+            if key not in self.capped_timeouts:
+                self.capped_timeouts[key] = (tool, attribute, getattr(tool, attribute))
+
+            configured = self.capped_timeouts[key][-1]
+
+            # Our tools don't accept a timeout below a second.
+            timeout = max(1.0, remaining_time)
+
+            if configured is not None:
+                timeout = min(configured, timeout)
+
+            setattr(tool, attribute, timeout)
+
+        return self
+
+    def restore_timeouts(self) -> "AvailabilityCheckerBase":
+        """
+        Restores the timeouts we capped while testing the previous subject.
+        """
+
+        for tool, attribute, value in self.capped_timeouts.values():
+            setattr(tool, attribute, value)
+
+        self.capped_timeouts.clear()
+
+        return self
+
+    def before_lookup(self, lookup: str) -> "AvailabilityCheckerBase":
+        """
+        Prepares the given lookup. In other words, we let our lookup throttle
+        hold it and cap its timeout to the time left before our deadline.
+
+        :param lookup:
+            The type of the lookup we are going to perform.
+            Available: :code:`dns` | :code:`whois` | :code:`netinfo` |
+            :code:`http_status_code`
+        """
+
+        return self.throttle(lookup).cap_timeouts(lookup)
+
     def subject_propagator(self) -> "CheckerBase":
         """
         Propagate the currently set subject.
@@ -484,6 +741,9 @@ class AvailabilityCheckerBase(CheckerBase):
         self.hostbyaddr_query_tool.set_subject(self.idna_subject)
         self.http_status_code_query_tool.set_subject(self.idna_subject)
 
+        self.restore_timeouts()
+        self.started_at = time.monotonic()
+
         self.domain_syntax_checker.subject = self.idna_subject
         self.ip_syntax_checker.subject = self.idna_subject
         self.url_syntax_checker.subject = self.idna_subject
@@ -506,6 +766,9 @@ class AvailabilityCheckerBase(CheckerBase):
         Checks if we are allowed to continue a standard testing.
         """
 
+        if self.is_deadline_exceeded():
+            return False
+
         return bool(
             not self.status.status
             or status_post_syntax_checker == PyFunceble.storage.STATUS.invalid
@@ -603,6 +866,19 @@ class AvailabilityCheckerBase(CheckerBase):
         else:
             self.use_whois_db = self.STD_USE_WHOIS_DB
 
+    def guess_and_set_deadline(self) -> "AvailabilityCheckerBase":
+        """
+        Try to guess and set the value of the :code:`deadline` attribute
+        from the configuration file.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            self.deadline = PyFunceble.storage.CONFIGURATION.lookup.deadline
+        else:
+            self.deadline = self.STD_DEADLINE
+
+        return self
+
     def guess_all_settings(
         self,
     ) -> "AvailabilityCheckerBase":  # pragma: no cover ## Method are more important
@@ -654,6 +930,12 @@ class AvailabilityCheckerBase(CheckerBase):
     def query_dns_record(self) -> Optional[Dict[str, Optional[List[str]]]]:
         """
         Tries to query the DNS record(s) of the given subject.
+
+        The record types are queried concurrently - up to
+        :code:`DNS_MAX_QUERIES_PER_SUBJECT` at once, in the order of our lookup.
+        The first answer wins and the queries which are still running (or
+        waiting for a thread) are cancelled. When multiple answers came at once,
+        the order of our lookup decides which one is reported.
         """
 
         PyFunceble.facility.Logger.info(
@@ -672,17 +954,64 @@ class AvailabilityCheckerBase(CheckerBase):
         else:
             lookup_order = []
 
-        if lookup_order:
-            for record_type in lookup_order:
-                local_result = self.dns_query_tool.set_query_record_type(
-                    record_type
-                ).query()
+        query_tools = dict()
+        pending = dict()
+        cancel_event = threading.Event()
+        to_query = collections.deque(lookup_order)
+
+        try:
+            while (pending or to_query) and not result:
+                while to_query and len(pending) < self.DNS_MAX_QUERIES_PER_SUBJECT:
+                    if self.is_deadline_exceeded():
+                        to_query.clear()
+                        break
+
+                    record_type = to_query.popleft()
+
+                    self.before_lookup("dns")
+
+                    # Our query tool keeps the state of its query. Therefore,
+                    # each record type gets its own.
+                    query_tool = self.dns_query_tool.clone()
+                    query_tool.cancel_event = cancel_event
+                    query_tool.set_query_record_type(record_type)
+
+                    query_tools[record_type] = query_tool
+                    pending[self.dns_executor.submit(query_tool.query)] = record_type
+
+                if not pending:
+                    break
 
-                if local_result:
-                    result[record_type] = local_result
+                done, _ = concurrent.futures.wait(
+                    pending,
+                    timeout=self.get_remaining_time(),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
 
+                if not done:
+                    # The deadline is exceeded.
                     break
 
+                done = sorted(done, key=lambda x: lookup_order.index(pending[x]))
+
+                for future in done:
+                    record_type = pending.pop(future)
+                    local_result = future.result()
+
+                    if local_result and not result:
+                        result[record_type] = local_result
+        finally:
+            cancel_event.set()
+
+            for future in pending:
+                # Those which did not start yet never will.
+                future.cancel()
+
+        if query_tools:
+            # The record of the reported answer - or of our last query.
+            reported = next(iter(result)) if result else list(query_tools)[-1]
+            self.status.dns_lookup_record = query_tools[reported].lookup_record
+
         PyFunceble.facility.Logger.debug("DNS Record:\n%r", result)
 
         PyFunceble.facility.Logger.info(
@@ -732,6 +1061,8 @@ class AvailabilityCheckerBase(CheckerBase):
             if not known_record:
                 # We assume that expired dataset are never saved into the
                 # dataset.
+                self.before_lookup("whois")
+
                 self.status.expiration_date = (
                     self.whois_query_tool.get_expiration_date()
                 )
@@ -759,6 +1090,8 @@ class AvailabilityCheckerBase(CheckerBase):
                 self.status.expiration_date = known_record["expiration_date"]
                 self.status.whois_record = None
         else:
+            self.before_lookup("whois")
+
             self.status.expiration_date = self.whois_query_tool.get_expiration_date()
             self.status.whois_record = self.whois_query_tool.lookup_record.record
 
@@ -818,12 +1151,15 @@ class AvailabilityCheckerBase(CheckerBase):
         )
 
         if self.status.domain_syntax:
+            self.before_lookup("netinfo")
             lookup_result = self.addressinfo_query_tool.get_info()
         elif self.status.ip_syntax:
+            self.before_lookup("netinfo")
             lookup_result = self.hostbyaddr_query_tool.get_info()
         elif self.status.idna_subject.isdigit():
             lookup_result = None
         else:
+            self.before_lookup("netinfo")
             lookup_result = self.addressinfo_query_tool.get_info()
 
         if lookup_result:
@@ -863,6 +1199,8 @@ class AvailabilityCheckerBase(CheckerBase):
                 f"http://{self.idna_subject}:80"
             )
 
+        self.before_lookup("http_status_code")
+
         lookup_result = self.http_status_code_query_tool.get_status_code()
 
         if (
@@ -167,7 +167,11 @@ class DomainAvailabilityChecker(AvailabilityCheckerBase):
 
         if not self.status.status:
             self.status.status = PyFunceble.storage.STATUS.down
-            self.status.status_source = "STDLOOKUP"
+
+            if self.is_deadline_exceeded():
+                self.status.status_source = "TIMEOUT"
+            else:
+                self.status.status_source = "STDLOOKUP"
 
             PyFunceble.facility.Logger.info(
                 "Could not define status the status of %r. Setting to %r",
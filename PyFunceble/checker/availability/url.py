@@ -127,6 +127,8 @@ class URLAvailabilityChecker(AvailabilityCheckerBase):
             self.status.idna_subject,
         )
 
+        self.before_lookup("http_status_code")
+
         lookup_result = self.http_status_code_query_tool.get_status_code()
 
         if (
@@ -222,7 +224,11 @@ class URLAvailabilityChecker(AvailabilityCheckerBase):
 
         if not self.status.status:
             self.status.status = PyFunceble.storage.STATUS.down
-            self.status.status_source = "STDLOOKUP"
+
+            if self.is_deadline_exceeded():
+                self.status.status_source = "TIMEOUT"
+            else:
+                self.status.status_source = "STDLOOKUP"
 
             PyFunceble.facility.Logger.info(
                 "Could not define status the status of %r. Setting to %r",
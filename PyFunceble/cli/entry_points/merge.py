@@ -0,0 +1,147 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the CLI of our output directories merger.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import os
+import sys
+import traceback
+
+import colorama
+
+import PyFunceble.cli.storage
+import PyFunceble.cli.utils.ascii_logo
+import PyFunceble.facility
+from PyFunceble.cli.filesystem.merge import FilesystemMerger
+from PyFunceble.cli.system.integrator import SystemIntegrator
+
+
+def merger() -> None:
+    """
+    Provides the CLI of our output directories merger.
+    """
+
+    PyFunceble.facility.ConfigLoader.start()
+
+    colorama.init(autoreset=True)
+
+    description = (
+        f"{colorama.Style.BRIGHT}{colorama.Fore.GREEN}PyFunceble Merger"
+        f"{colorama.Style.RESET_ALL} - "
+        "Merges multiple output directories (e.g. the ones of multiple shards) "
+        "into a single one."
+    )
+
+    parser = argparse.ArgumentParser(
+        description=description,
+        epilog=PyFunceble.cli.storage.STD_EPILOG,
+        add_help=True,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+
+    parser.add_argument(
+        "sources",
+        type=str,
+        nargs="+",
+        help="Sets the output directories to merge.",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        required=True,
+        help="Sets the output directory to write into.",
+    )
+
+    parser.add_argument(
+        "--hierarchical",
+        dest="cli_testing__sorting_mode__hierarchical",
+        action="store_true",
+        help="Activates or disables the sorting of the files\n"
+        "content (output) in a hierarchical order.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--cpu-workers",
+        dest="cli_testing__cpu_workers",
+        type=int,
+        help="Sets the number of files to merge concurrently.",
+        default=None,
+    )
+
+    args = parser.parse_args()
+
+    for source in args.sources:
+        if not os.path.isdir(source):
+            parser.error(f"{source!r} is not a directory.")
+
+    if os.path.realpath(args.output) in [os.path.realpath(x) for x in args.sources]:
+        parser.error("--output should not be one of the sources.")
+
+    if args.cli_testing__cpu_workers is not None and args.cli_testing__cpu_workers <= 0:
+        parser.error("--cpu-workers must be a positive digit.")
+
+    SystemIntegrator(args).start()
+
+    print(PyFunceble.cli.utils.ascii_logo.get_home_representation())
+
+    try:
+        print(f"Started merge into {args.output}.", end=" ")
+
+        FilesystemMerger(args.sources, args.output).start()
+
+        print(PyFunceble.cli.storage.DONE)
+    except:  # pylint: disable=bare-except
+        print(PyFunceble.cli.storage.ERROR)
+        print(traceback.format_exc())
+        sys.exit(1)
@@ -53,6 +53,8 @@ License:
 import argparse
 from typing import Optional, Sequence, Text
 
+from PyFunceble.cli.processes.remote import get_address
+
 # pylint: disable=raising-bad-type
 
 
@@ -71,18 +73,160 @@ class OurArgumentParser(argparse.ArgumentParser):
         if namespace.lookup__timeout is not None and namespace.lookup__timeout <= 0:
             raise self.error("--timeout must be a positive digit.")
 
+        if namespace.lookup__deadline is not None and namespace.lookup__deadline <= 0:
+            raise self.error("--deadline must be a positive digit.")
+
         if (
             namespace.cli_testing__cooldown_time is not None
             and namespace.cli_testing__cooldown_time < 0
         ):
             raise self.error("--cooldown-time must be zero or a positive digit.")
 
+        if (
+            namespace.cli_testing__rate_limit__test is not None
+            and namespace.cli_testing__rate_limit__test <= 0
+        ):
+            raise self.error("--rate-limit must be a positive digit.")
+
+        if (
+            namespace.cli_testing__rate_limit__dns is not None
+            and namespace.cli_testing__rate_limit__dns <= 0
+        ):
+            raise self.error("--dns-rate-limit must be a positive digit.")
+
+        if (
+            namespace.cli_testing__rate_limit__http_status_code is not None
+            and namespace.cli_testing__rate_limit__http_status_code <= 0
+        ):
+            raise self.error("--http-rate-limit must be a positive digit.")
+
+        if (
+            namespace.cli_testing__rate_limit__netinfo is not None
+            and namespace.cli_testing__rate_limit__netinfo <= 0
+        ):
+            raise self.error("--netinfo-rate-limit must be a positive digit.")
+
+        if (
+            namespace.cli_testing__rate_limit__whois is not None
+            and namespace.cli_testing__rate_limit__whois <= 0
+        ):
+            raise self.error("--whois-rate-limit must be a positive digit.")
+
         if (
             namespace.cli_testing__max_workers is not None
             and namespace.cli_testing__max_workers <= 0
         ):
             raise self.error("--max-workers must be a positive digit.")
 
+        if (
+            namespace.cli_testing__cpu_workers is not None
+            and namespace.cli_testing__cpu_workers <= 0
+        ):
+            raise self.error("--cpu-workers must be a positive digit.")
+
+        if (
+            namespace.cli_testing__autoscale_max_workers is not None
+            and namespace.cli_testing__autoscale_max_workers <= 0
+        ):
+            raise self.error("--autoscale-max-workers must be a positive digit.")
+
+        if (
+            namespace.cli_testing__max_rss is not None
+            and namespace.cli_testing__max_rss <= 0
+        ):
+            raise self.error("--max-rss must be a positive digit.")
+
+        if (
+            namespace.cli_testing__max_tasks_per_worker is not None
+            and namespace.cli_testing__max_tasks_per_worker <= 0
+        ):
+            raise self.error("--max-tasks-per-worker must be a positive digit.")
+
+        if (
+            namespace.cli_testing__max_rss_per_worker is not None
+            and namespace.cli_testing__max_rss_per_worker <= 0
+        ):
+            raise self.error("--max-rss-per-worker must be a positive digit.")
+
+        if (
+            namespace.cli_testing__stall_timeout is not None
+            and namespace.cli_testing__stall_timeout <= 0
+        ):
+            raise self.error("--stall-timeout must be a positive digit.")
+
+        if (
+            namespace.cli_testing__batch_size is not None
+            and namespace.cli_testing__batch_size <= 0
+        ):
+            raise self.error("--batch-size must be a positive digit.")
+
+        if (
+            namespace.cli_testing__batch_timeout is not None
+            and namespace.cli_testing__batch_timeout < 0
+        ):
+            raise self.error("--batch-timeout must be zero or a positive digit.")
+
+        if (
+            namespace.cli_testing__high_water_mark is not None
+            and namespace.cli_testing__high_water_mark <= 0
+        ):
+            raise self.error("--high-water-mark must be a positive digit.")
+
+        if (
+            namespace.cli_testing__weights__fresh is not None
+            and namespace.cli_testing__weights__fresh < 0
+        ):
+            raise self.error("--fresh-weight must be zero or a positive digit.")
+
+        if (
+            namespace.cli_testing__weights__complements is not None
+            and namespace.cli_testing__weights__complements < 0
+        ):
+            raise self.error("--complements-weight must be zero or a positive digit.")
+
+        if (
+            namespace.cli_testing__weights__inactive is not None
+            and namespace.cli_testing__weights__inactive < 0
+        ):
+            raise self.error("--inactive-weight must be zero or a positive digit.")
+
+        if (
+            namespace.cli_testing__file_workers is not None
+            and namespace.cli_testing__file_workers <= 0
+        ):
+            raise self.error("--file-workers must be a positive digit.")
+
+        if (
+            namespace.cli_testing__max_inflight is not None
+            and namespace.cli_testing__max_inflight <= 0
+        ):
+            raise self.error("--max-inflight must be a positive digit.")
+
+        if (
+            namespace.cli_testing__shard_count is not None
+            and namespace.cli_testing__shard_count <= 0
+        ):
+            raise self.error("--shard-count must be a positive digit.")
+
+        if (
+            namespace.cli_testing__shard_index is not None
+            and namespace.cli_testing__shard_index < 0
+        ):
+            raise self.error("--shard-index must be zero or a positive digit.")
+
+        if (
+            namespace.cli_testing__shard_index is not None
+            and namespace.cli_testing__shard_count is not None
+            and namespace.cli_testing__shard_index >= namespace.cli_testing__shard_count
+        ):
+            raise self.error("--shard-index must be lower than --shard-count.")
+
+        if namespace.cli_testing__coordinator is not None:
+            try:
+                get_address(namespace.cli_testing__coordinator)
+            except ValueError:
+                raise self.error("--coordinator must be given as HOST:PORT.")
+
         if namespace.cli_decoding__adblock and namespace.cli_decoding__wildcard:
             raise self.error("--adblock and --wildcard are incompatible.")
 
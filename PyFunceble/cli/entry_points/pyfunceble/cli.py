@@ -250,7 +250,8 @@ def get_filtering_group_data() -> List[Tuple[List[str], dict]]:
                 "dest": "cli_testing.preload_file",
                 "action": "store_true",
                 "help": "Activates or disables the preloading of the input\n"
-                "file(s) into the continue dataset before starting the tests.\n\n"
+                "file(s) into the continue dataset. Each subject is tested\n"
+                "as soon as it was preloaded.\n\n"
                 "This reduces the waiting time while continuing a previous\n"
                 "session.\n"
                 "Note: This is useless when the auto continue subsystem is not "
@@ -268,6 +269,31 @@ def get_filtering_group_data() -> List[Tuple[List[str], dict]]:
                 % get_configured_value("cli_testing.file_filter"),
             },
         ),
+        (
+            [
+                "--shard-count",
+            ],
+            {
+                "dest": "cli_testing.shard_count",
+                "type": int,
+                "help": "Sets the number of shards to split the subjects of\n"
+                "the given input(s) into. Each shard tests a disjoint slice\n"
+                "of the subjects and writes into its own outputs. %s"
+                % get_configured_value("cli_testing.shard_count"),
+            },
+        ),
+        (
+            [
+                "--shard-index",
+            ],
+            {
+                "dest": "cli_testing.shard_index",
+                "type": int,
+                "help": "Sets the shard to test. It should be between 0 and\n"
+                "the number of shards - 1. %s"
+                % get_configured_value("cli_testing.shard_index"),
+            },
+        ),
         (
             [
                 "--mining",
@@ -336,6 +362,66 @@ def get_test_control_group_data() -> List[Tuple[List[str], dict]]:
                 "each test. %s" % get_configured_value("cli_testing.cooldown_time"),
             },
         ),
+        (
+            [
+                "--rate-limit",
+            ],
+            {
+                "dest": "cli_testing.rate_limit.test",
+                "type": float,
+                "help": "Sets the maximal number of tests (per second) across\n"
+                "all our tester workers. %s"
+                % get_configured_value("cli_testing.rate_limit.test"),
+            },
+        ),
+        (
+            [
+                "--dns-rate-limit",
+            ],
+            {
+                "dest": "cli_testing.rate_limit.dns",
+                "type": float,
+                "help": "Sets the maximal number of DNS queries (per second)\n"
+                "across all our tester workers. %s"
+                % get_configured_value("cli_testing.rate_limit.dns"),
+            },
+        ),
+        (
+            [
+                "--http-rate-limit",
+            ],
+            {
+                "dest": "cli_testing.rate_limit.http_status_code",
+                "type": float,
+                "help": "Sets the maximal number of HTTP status code lookups\n"
+                "(per second) across all our tester workers. %s"
+                % get_configured_value("cli_testing.rate_limit.http_status_code"),
+            },
+        ),
+        (
+            [
+                "--netinfo-rate-limit",
+            ],
+            {
+                "dest": "cli_testing.rate_limit.netinfo",
+                "type": float,
+                "help": "Sets the maximal number of network information\n"
+                "lookups (per second) across all our tester workers. %s"
+                % get_configured_value("cli_testing.rate_limit.netinfo"),
+            },
+        ),
+        (
+            [
+                "--whois-rate-limit",
+            ],
+            {
+                "dest": "cli_testing.rate_limit.whois",
+                "type": float,
+                "help": "Sets the maximal number of WHOIS lookups (per second)\n"
+                "across all our tester workers. %s"
+                % get_configured_value("cli_testing.rate_limit.whois"),
+            },
+        ),
         (
             [
                 "--local",
@@ -450,6 +536,19 @@ def get_test_control_group_data() -> List[Tuple[List[str], dict]]:
                 % get_configured_value("lookup.timeout"),
             },
         ),
+        (
+            [
+                "--deadline",
+            ],
+            {
+                "dest": "lookup.deadline",
+                "type": float,
+                "help": "Sets the maximal number of seconds we are allowed to\n"
+                "spend on a single subject. Once reached, the subject is\n"
+                "reported as INACTIVE (TIMEOUT). %s"
+                % get_configured_value("lookup.deadline"),
+            },
+        ),
         (
             [
                 "-ua",
@@ -536,6 +635,39 @@ def get_dns_control_group_data() -> List[Tuple[List[str], dict]]:
                 % get_configured_value("dns.trust_server"),
             },
         ),
+        (
+            ["--dns-cache"],
+            {
+                "dest": "dns.cache",
+                "action": "store_true",
+                "help": "Activates or disables the caching of the responses of\n"
+                "our DNS queries - as long as their TTL allows it. %s"
+                % get_configured_value("dns.cache"),
+            },
+        ),
+        (
+            ["--dns-hedge"],
+            {
+                "dest": "dns.hedge",
+                "action": "store_true",
+                "help": "Activates or disables the hedging of our DNS queries.\n"
+                "When a nameserver is slower than usual, the same query\n"
+                "is sent to the next nameserver and the first response\n"
+                "wins. %s" % get_configured_value("dns.hedge"),
+            },
+        ),
+        (
+            ["--dns-persistent-connections"],
+            {
+                "dest": "dns.persistent_connections",
+                "action": "store_true",
+                "help": "Activates or disables the usage of persistent\n"
+                "connections. When activated, our TCP, TLS and HTTPS\n"
+                "queries reuse the connections we already have with our\n"
+                "nameservers. %s"
+                % get_configured_value("dns.persistent_connections"),
+            },
+        ),
     ]
 
 
@@ -820,9 +952,11 @@ def get_multiprocessing_group_data() -> List[Tuple[List[str], dict]]:
     available_cpu = os.cpu_count()
 
     if available_cpu:
-        default_max_workers = available_cpu * 5
+        default_max_workers = max(available_cpu, 2)
+        default_cpu_workers = max(available_cpu - 2, 1)
     else:
-        default_max_workers = 1
+        default_max_workers = 2
+        default_cpu_workers = 1
 
     return [
         (
@@ -833,12 +967,261 @@ def get_multiprocessing_group_data() -> List[Tuple[List[str], dict]]:
             {
                 "dest": "cli_testing.max_workers",
                 "type": int,
-                "help": "Sets the number of maximal workers to use.\n"
+                "help": "Sets the number of maximal (tester) workers to use.\n"
                 f"If not given, {default_max_workers} "
                 "(based on the current machine) will be applied. %s"
                 % get_configured_value("cli_testing.max_workers"),
             },
         ),
+        (
+            [
+                "--cpu-workers",
+            ],
+            {
+                "dest": "cli_testing.cpu_workers",
+                "type": int,
+                "help": "Sets the number of maximal workers to use for our\n"
+                "CPU-bound tasks (e.g. sorting).\n"
+                f"If not given, {default_cpu_workers} "
+                "(based on the current machine) will be applied. %s"
+                % get_configured_value("cli_testing.cpu_workers"),
+            },
+        ),
+        (
+            [
+                "--autoscale",
+            ],
+            {
+                "dest": "cli_testing.autoscale",
+                "action": "store_true",
+                "help": "Activates or deactivates the autoscaling of our\n"
+                "tester workers. %s" % get_configured_value("cli_testing.autoscale"),
+            },
+        ),
+        (
+            [
+                "--autoscale-max-workers",
+            ],
+            {
+                "dest": "cli_testing.autoscale_max_workers",
+                "type": int,
+                "help": "Sets the maximal number of tester workers the\n"
+                "autoscaling is allowed to reach.\n"
+                "If not given, 4 times --max-workers will be applied. %s"
+                % get_configured_value("cli_testing.autoscale_max_workers"),
+            },
+        ),
+        (
+            [
+                "--max-rss",
+            ],
+            {
+                "dest": "cli_testing.max_rss",
+                "type": int,
+                "help": "Sets the maximal (total) RSS - in MB - of our tester\n"
+                "workers. The autoscaling shrinks our pool when we get\n"
+                "close to it. %s" % get_configured_value("cli_testing.max_rss"),
+            },
+        ),
+        (
+            [
+                "--max-tasks-per-worker",
+            ],
+            {
+                "dest": "cli_testing.max_tasks_per_worker",
+                "type": int,
+                "help": "Sets the number of tests after which a tester worker\n"
+                "is replaced by a fresh one. %s"
+                % get_configured_value("cli_testing.max_tasks_per_worker"),
+            },
+        ),
+        (
+            [
+                "--max-rss-per-worker",
+            ],
+            {
+                "dest": "cli_testing.max_rss_per_worker",
+                "type": int,
+                "help": "Sets the RSS - in MB - from which a tester worker is\n"
+                "replaced by a fresh one. %s"
+                % get_configured_value("cli_testing.max_rss_per_worker"),
+            },
+        ),
+        (
+            [
+                "--stall-timeout",
+            ],
+            {
+                "dest": "cli_testing.stall_timeout",
+                "type": float,
+                "help": "Sets the number of seconds from which a tester worker\n"
+                "which is still testing the same subject is considered as\n"
+                "stalled. A stalled worker is replaced by a fresh one and\n"
+                "the subject is reported as INACTIVE (TIMEOUT). %s"
+                % get_configured_value("cli_testing.stall_timeout"),
+            },
+        ),
+        (
+            [
+                "--queue-backend",
+            ],
+            {
+                "dest": "cli_testing.queue_backend",
+                "type": str.lower,
+                "choices": ["queue", "manager"],
+                "help": "Sets the backend of the queues to use between our\n"
+                "processes. %s" % get_configured_value("cli_testing.queue_backend"),
+            },
+        ),
+        (
+            [
+                "--batch-size",
+            ],
+            {
+                "dest": "cli_testing.batch_size",
+                "type": int,
+                "help": "Sets the maximal number of messages to send at once\n"
+                "between our processes. Use 1 to deactivate the batching. %s"
+                % get_configured_value("cli_testing.batch_size"),
+            },
+        ),
+        (
+            [
+                "--batch-timeout",
+            ],
+            {
+                "dest": "cli_testing.batch_timeout",
+                "type": float,
+                "help": "Sets the maximal number of milliseconds a message\n"
+                "is allowed to wait before being sent to the next process. %s"
+                % get_configured_value("cli_testing.batch_timeout"),
+            },
+        ),
+        (
+            [
+                "--high-water-mark",
+            ],
+            {
+                "dest": "cli_testing.high_water_mark",
+                "type": int,
+                "help": "Sets the maximal number of subjects allowed to wait\n"
+                "for our tester workers. When reached, the reading of the\n"
+                "input stops until our tester workers catch up. %s"
+                % get_configured_value("cli_testing.high_water_mark"),
+            },
+        ),
+        (
+            [
+                "--disk-queue",
+            ],
+            {
+                "dest": "cli_testing.disk_queue",
+                "action": "store_true",
+                "help": "Activates or deactivates the queuing of what our\n"
+                "tester workers have to test on disk. %s"
+                % get_configured_value("cli_testing.disk_queue"),
+            },
+        ),
+        (
+            [
+                "--fresh-weight",
+            ],
+            {
+                "dest": "cli_testing.weights.fresh",
+                "type": int,
+                "help": "Sets the weight of the subjects read from the given\n"
+                "inputs. %s" % get_configured_value("cli_testing.weights.fresh"),
+            },
+        ),
+        (
+            [
+                "--complements-weight",
+            ],
+            {
+                "dest": "cli_testing.weights.complements",
+                "type": int,
+                "help": "Sets the weight of the complements of the subjects\n"
+                "read from the given inputs. %s"
+                % get_configured_value("cli_testing.weights.complements"),
+            },
+        ),
+        (
+            [
+                "--inactive-weight",
+            ],
+            {
+                "dest": "cli_testing.weights.inactive",
+                "type": int,
+                "help": "Sets the weight of the subjects retested from our\n"
+                "inactive dataset. %s"
+                % get_configured_value("cli_testing.weights.inactive"),
+            },
+        ),
+        (
+            [
+                "--file-workers",
+            ],
+            {
+                "dest": "cli_testing.file_workers",
+                "type": int,
+                "help": "Sets the maximal number of files to read (and\n"
+                "preload) concurrently. %s"
+                % get_configured_value("cli_testing.file_workers"),
+            },
+        ),
+        (
+            [
+                "--tester-engine",
+            ],
+            {
+                "dest": "cli_testing.tester_engine",
+                "type": str.lower,
+                "choices": ["standard", "thread"],
+                "help": "Sets the engine of our tester workers.\n"
+                "With thread, each tester worker keeps multiple subjects\n"
+                "in flight. %s"
+                % get_configured_value("cli_testing.tester_engine"),
+            },
+        ),
+        (
+            [
+                "--max-inflight",
+            ],
+            {
+                "dest": "cli_testing.max_inflight",
+                "type": int,
+                "help": "Sets the maximal number of subjects a single tester\n"
+                "worker is allowed to test concurrently. %s"
+                % get_configured_value("cli_testing.max_inflight"),
+            },
+        ),
+        (
+            [
+                "--autotune-inflight",
+            ],
+            {
+                "dest": "cli_testing.autotune_inflight",
+                "action": "store_true",
+                "help": "Activates or deactivates the auto-tuning of the number\n"
+                "of subjects a single tester worker keeps in flight.\n"
+                "When activated, --max-inflight is used as ceiling.\n"
+                "Only applies to the thread engine. %s"
+                % get_configured_value("cli_testing.autotune_inflight"),
+            },
+        ),
+        (
+            [
+                "--coordinator",
+            ],
+            {
+                "dest": "cli_testing.coordinator",
+                "type": str,
+                "help": "Sets the address (HOST:PORT) to listen to in order to\n"
+                "share our tests with remote worker nodes (see\n"
+                "node-pyfunceble). %s"
+                % get_configured_value("cli_testing.coordinator"),
+            },
+        ),
     ]
 
 
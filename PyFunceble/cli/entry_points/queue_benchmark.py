@@ -0,0 +1,133 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the CLI of our queue backends benchmark.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+
+import argparse
+import sys
+import traceback
+
+import colorama
+
+import PyFunceble.cli.storage
+import PyFunceble.cli.utils.ascii_logo
+from PyFunceble.cli.processes.base import ProcessesManagerBase
+from PyFunceble.cli.scripts.queue_benchmark import QueueBenchmark
+
+
+def benchmarker() -> None:
+    """
+    Provides the CLI for the queue backends benchmark.
+    """
+
+    colorama.init(autoreset=True)
+
+    description = (
+        f"{colorama.Style.BRIGHT}{colorama.Fore.GREEN}PyFunceble Queue Benchmark"
+        f"{colorama.Style.RESET_ALL} - "
+        "Compares the throughput of the queue backends of PyFunceble."
+    )
+
+    parser = argparse.ArgumentParser(
+        description=description,
+        epilog=PyFunceble.cli.storage.STD_EPILOG,
+        add_help=True,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+
+    parser.add_argument(
+        "-b",
+        "--backend",
+        type=str.lower,
+        nargs="+",
+        choices=ProcessesManagerBase.SUPPORTED_QUEUE_BACKENDS,
+        help="Sets the backend(s) to benchmark. (Default: all)",
+        default=None,
+    )
+
+    parser.add_argument(
+        "-m",
+        "--messages",
+        type=int,
+        help="Sets the number of messages to send through each backend. "
+        f"(Default: {QueueBenchmark.STD_MESSAGES})",
+        default=None,
+    )
+
+    parser.add_argument(
+        "-w",
+        "--max-workers",
+        type=int,
+        help="Sets the number of consumer processes to use. "
+        f"(Default: {QueueBenchmark.STD_CONSUMERS})",
+        default=None,
+    )
+
+    args = parser.parse_args()
+
+    utility = QueueBenchmark(
+        messages=args.messages, consumers=args.max_workers, backends=args.backend
+    )
+
+    print(PyFunceble.cli.utils.ascii_logo.get_home_representation())
+
+    try:
+        for backend in utility.backends:
+            print(f"Benchmark of the {backend!r} backend:", end=" ")
+
+            print(
+                f"{colorama.Fore.CYAN}{utility.run_backend(backend):,.0f} "
+                f"messages/s {PyFunceble.cli.storage.DONE}"
+            )
+    except:  # pylint: disable=bare-except
+        print(PyFunceble.cli.storage.ERROR)
+        print(traceback.format_exc())
+        sys.exit(1)
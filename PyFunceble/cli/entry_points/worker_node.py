@@ -0,0 +1,126 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the CLI of our (remote) worker nodes.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import argparse
+import sys
+import traceback
+
+import colorama
+
+import PyFunceble.cli.storage
+import PyFunceble.cli.utils.ascii_logo
+from PyFunceble.cli.processes.remote import (
+    AUTHKEY_ENVIRONMENT_VARIABLE,
+    WorkerNode,
+    get_address,
+)
+
+
+def node() -> None:
+    """
+    Provides the CLI of our worker nodes.
+    """
+
+    colorama.init(autoreset=True)
+
+    description = (
+        f"{colorama.Style.BRIGHT}{colorama.Fore.GREEN}PyFunceble Worker Node"
+        f"{colorama.Style.RESET_ALL} - "
+        "Tests the subjects shared by a PyFunceble coordinator.\n\n"
+        f"The {AUTHKEY_ENVIRONMENT_VARIABLE} environment variable has to be "
+        "set to the same value as the one of the coordinator."
+    )
+
+    parser = argparse.ArgumentParser(
+        description=description,
+        epilog=PyFunceble.cli.storage.STD_EPILOG,
+        add_help=True,
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+
+    parser.add_argument(
+        "coordinator",
+        type=str,
+        help="Sets the address (HOST:PORT) of the coordinator to work for.",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--max-workers",
+        type=int,
+        help="Sets the number of maximal (tester) workers to use.\n"
+        "If not given, the configuration of the coordinator is applied.",
+        default=None,
+    )
+
+    args = parser.parse_args()
+
+    try:
+        address = get_address(args.coordinator)
+    except ValueError:
+        parser.error("coordinator must be given as HOST:PORT.")
+
+    if args.max_workers is not None and args.max_workers <= 0:
+        parser.error("--max-workers must be a positive digit.")
+
+    print(PyFunceble.cli.utils.ascii_logo.get_home_representation())
+
+    try:
+        print(f"Working for {args.coordinator}:", end=" ")
+
+        WorkerNode(address, max_workers=args.max_workers).start()
+
+        print(PyFunceble.cli.storage.DONE)
+    except:  # pylint: disable=bare-except
+        print(PyFunceble.cli.storage.ERROR)
+        print(traceback.format_exc())
+        sys.exit(1)
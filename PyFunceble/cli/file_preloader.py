@@ -54,7 +54,7 @@ import copy
 import functools
 import os
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Generator, Optional
 
 from domain2idna import domain2idna
 
@@ -339,6 +339,25 @@ class FilePreloader:
         Starts the pre-loading of the currently set file path.
         """
 
+        for _ in self.stream(print_dots=print_dots):
+            pass
+
+        return self
+
+    @execute_if_authorized(())
+    @ensure_protocol_is_given
+    def stream(self, print_dots: bool = False) -> Generator[str, None, None]:
+        """
+        Starts the pre-loading of the currently set file path and provides
+        each subject as soon as it was saved into the continue dataset.
+
+        This way, one can start to test while we are still preloading.
+
+        .. note::
+            What was preloaded by a previous run is not provided. Please use
+            the :code:`get_to_test` method of the continue dataset for that.
+        """
+
         self.__load_description()
 
         broken = False
@@ -404,7 +423,8 @@ class FilePreloader:
                             cidr2subject=self.cidr2subject,
                         ):
 
-                            to_send = copy.deepcopy(self.protocol)
+                            # Our protocol is flat: a shallow copy is enough.
+                            to_send = dict(self.protocol)
                             to_send["subject"] = subject
                             to_send["idna_subject"] = domain2idna(subject)
                             to_send["tested_at"] = datetime.utcnow() - timedelta(
@@ -421,14 +441,21 @@ class FilePreloader:
                                 print_single_line("X")
                                 continue
 
-                            self.continue_dataset.update(to_send, ignore_if_exist=True)
+                            is_new = not self.continue_dataset.exists(to_send)
+
+                            if is_new:
+                                self.continue_dataset.add(to_send)
 
                             if print_dots:
                                 print_single_line()
 
+                            if is_new:
+                                yield to_send["idna_subject"]
+
                         self.__description["line_number"] += 1
                         line_num += 1
-            except KeyboardInterrupt as exception:
+            except (KeyboardInterrupt, GeneratorExit) as exception:
+                # GeneratorExit: Our reader stopped reading us.
                 self.__save_description()
                 raise exception
 
@@ -436,5 +463,3 @@ class FilePreloader:
             self.__description["previous_hash"] = self.__description["hash"]
 
         self.__save_description()
-
-        return self
@@ -177,16 +177,24 @@ class FilesystemCounter(FilesystemDirBase):
         return self
 
     @fetch_dataset_beforehand
-    def get_dataset_for_printer(self) -> List[Dict[str, Union[str, int]]]:
+    def get_dataset_for_printer(
+        self, testing_mode: Optional[str] = None
+    ) -> List[Dict[str, Union[str, int]]]:
         """
         Provides the dataset that the printer may understand.
 
+        :param testing_mode:
+            The testing mode to provide the dataset for.
+            If not given, the current testing mode is used.
+
         :raise ValueError:
             When the current testing mode is not supported (yet?).
         """
 
         result = dict()
-        testing_mode = PyFunceble.cli.utils.testing.get_testing_mode()
+
+        if testing_mode is None:
+            testing_mode = PyFunceble.cli.utils.testing.get_testing_mode()
 
         if testing_mode not in self.PERCENTAGE_STATUSES:
             raise ValueError("<testing_mode> ({testing_mode!r}) is not supported.")
@@ -238,3 +246,41 @@ class FilesystemCounter(FilesystemDirBase):
         self.dataset["percentage"]["total"] = sum(
             [y for x, y in self.dataset["percentage"].items() if x != "total"]
         )
+
+    @update_source_file_beforehand
+    @fetch_dataset_beforehand
+    @save_dataset_afterwards
+    def merge_dataset(self, dataset: dict) -> "FilesystemCounter":
+        """
+        Merges the given dataset (from another counter) into ours.
+
+        :param dataset:
+            The dataset to merge.
+        """
+
+        for status, value in dataset["counter"].items():
+            if status == "total":
+                continue
+
+            if status not in self.dataset["counter"]:
+                self.dataset["counter"][status] = 0
+
+            self.dataset["counter"][status] += value
+            self.dataset["counter"]["total"] += value
+
+        for status, value in self.dataset["counter"].items():
+            if status == "total":
+                continue
+
+            if self.dataset["counter"]["total"]:
+                self.dataset["percentage"][status] = (
+                    value * 100
+                ) / self.dataset["counter"]["total"]
+            else:
+                self.dataset["percentage"][status] = 0
+
+        self.dataset["percentage"]["total"] = sum(
+            [y for x, y in self.dataset["percentage"].items() if x != "total"]
+        )
+
+        return self
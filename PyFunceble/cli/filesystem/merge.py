@@ -0,0 +1,400 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the interface for the merging of multiple output directories.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import concurrent.futures
+import contextlib
+import os
+from itertools import islice
+from typing import Dict, Generator, List, Optional, TextIO
+
+import PyFunceble.cli.storage
+import PyFunceble.facility
+import PyFunceble.storage
+from PyFunceble.cli.filesystem.cleanup import FilesystemCleanup
+from PyFunceble.cli.filesystem.counter import FilesystemCounter
+from PyFunceble.cli.filesystem.printer.file import FilePrinter
+from PyFunceble.cli.processes.workers.file_sorter_base import FileSorterWorkerBase
+from PyFunceble.cli.utils.testing import get_testing_mode
+from PyFunceble.helpers.dict import DictHelper
+from PyFunceble.helpers.directory import DirectoryHelper
+from PyFunceble.helpers.file import FileHelper
+
+
+class FilesystemMerger:
+    """
+    Provides the interface for the merging of multiple output directories
+    - like the ones of our shards - into a single one.
+
+    Our (sorted) status files are merged through a k-way merge. Therefore, we
+    never hold more than a line per source in memory.
+
+    :param sources:
+        The output directories to merge.
+    :param destination:
+        The output directory to write into.
+    :param max_workers:
+        The maximal number of files to merge concurrently.
+
+    :raise ValueError:
+        When the destination is one of the sources.
+    """
+
+    FILE_BUFFER_SIZE: int = FileSorterWorkerBase.FILE_BUFFER_SIZE
+
+    FILES_TO_IGNORE: List[str] = [
+        ".gitignore",
+        ".keep",
+        PyFunceble.cli.storage.TEST_RUNNING_FILE,
+        PyFunceble.cli.storage.CI_TRIGGER_FILE,
+        PyFunceble.cli.storage.AUTOCONTINUE_FILE,
+        PyFunceble.cli.storage.PRE_LOADER_FILE,
+        PyFunceble.cli.storage.COUNTER_FILE,
+    ]
+
+    sources: List[str] = []
+    destination: Optional[str] = None
+    max_workers: Optional[int] = None
+
+    def __init__(
+        self,
+        sources: List[str],
+        destination: str,
+        *,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.sources = [os.path.realpath(x) for x in sources]
+        self.destination = os.path.realpath(destination)
+
+        if self.destination in self.sources:
+            raise ValueError("<destination> should not be one of the <sources>.")
+
+        if max_workers is not None:
+            self.max_workers = max_workers
+        elif PyFunceble.facility.ConfigLoader.is_already_loaded():
+            self.max_workers = PyFunceble.storage.CONFIGURATION.cli_testing.cpu_workers
+
+    @staticmethod
+    def is_table_file(path: str) -> bool:
+        """
+        Checks if the given (relative) path is one of our table formatted
+        files. Those are not sorted.
+
+        :param path:
+            The path to check.
+        """
+
+        return path == PyFunceble.cli.storage.RESULTS_RAW_FILE or (
+            path.split(os.sep, 1)[0]
+            == PyFunceble.cli.storage.OUTPUTS.splitted.directory
+        )
+
+    def get_files_to_merge(self) -> Dict[str, List[str]]:
+        """
+        Provides the files to merge. The keys are the paths (relative to an
+        output directory) and the values the files (of our sources) to merge
+        into them.
+        """
+
+        percentage_directory = os.path.join(
+            PyFunceble.cli.storage.OUTPUTS.logs.directories.parent,
+            PyFunceble.cli.storage.OUTPUTS.logs.directories.percentage,
+        )
+
+        result = {}
+
+        for source in self.sources:
+            for root, _, files in os.walk(source):
+                for file in files:
+                    path = os.path.relpath(os.path.join(root, file), source)
+
+                    if file in self.FILES_TO_IGNORE or path.startswith(
+                        percentage_directory
+                    ):
+                        continue
+
+                    if path not in result:
+                        result[path] = []
+
+                    result[path].append(os.path.join(root, file))
+
+        PyFunceble.facility.Logger.debug("List of files to merge:\n%r.", result)
+
+        return result
+
+    @staticmethod
+    def write_lines(file_stream: TextIO, lines: Generator[str, None, bool]) -> bool:
+        """
+        Writes the given lines into the given stream.
+
+        :return:
+            What the given generator returned.
+        """
+
+        while True:
+            try:
+                file_stream.write(next(lines))
+            except StopIteration as exception:
+                return exception.value
+
+    @staticmethod
+    def skip_header(file_stream: TextIO) -> TextIO:
+        """
+        Moves the given stream after its header - if any. Otherwise, the
+        header of our sources would end up between their (sorted) lines.
+
+        :return:
+            The given stream.
+        """
+
+        position = file_stream.tell()
+        line = file_stream.readline()
+
+        while line and (line[0] == "#" or not line.strip()):
+            position = file_stream.tell()
+            line = file_stream.readline()
+
+        file_stream.seek(position)
+
+        return file_stream
+
+    def open_destination(self, path: str) -> TextIO:
+        """
+        Opens the given (relative) path of our destination and writes our
+        header into it.
+        """
+
+        destination = os.path.join(self.destination, path)
+        DirectoryHelper(os.path.dirname(destination)).create()
+
+        # pylint: disable=consider-using-with
+        file_stream = open(
+            destination, "w", encoding="utf-8", buffering=self.FILE_BUFFER_SIZE
+        )
+
+        file_stream.write(FilePrinter.STD_FILE_GENERATION)
+        file_stream.write(FilePrinter.get_generation_date_line())
+        file_stream.write("\n\n")
+
+        return file_stream
+
+    def merge_sorted_file(self, path: str, files: List[str]) -> "FilesystemMerger":
+        """
+        Merges the given (sorted) files into the given (relative) path of
+        our destination. Duplicates are removed along the way.
+
+        .. note::
+            When one of the given files is not sorted, we sort the merged
+            file afterwards.
+        """
+
+        with contextlib.ExitStack() as stack:
+            streams = [
+                self.skip_header(
+                    stack.enter_context(
+                        open(
+                            x, "r", encoding="utf-8", buffering=self.FILE_BUFFER_SIZE
+                        )
+                    )
+                )
+                for x in files
+            ]
+
+            with self.open_destination(path) as file_stream:
+                in_order = self.write_lines(
+                    file_stream, FileSorterWorkerBase.merge_sorted_files(streams)
+                )
+
+        if not in_order:
+            PyFunceble.facility.Logger.info(
+                "Some of %r are not sorted. Sorting merged file.", files
+            )
+
+            FileSorterWorkerBase.process_file_sorting(
+                os.path.join(self.destination, path)
+            )
+
+        return self
+
+    def merge_table_file(self, path: str, files: List[str]) -> "FilesystemMerger":
+        """
+        Merges the given table formatted files into the given (relative) path
+        of our destination. The rows are kept in their original order.
+        """
+
+        header = None
+
+        with self.open_destination(path) as file_stream:
+            for file in files:
+                with open(
+                    file, "r", encoding="utf-8", buffering=self.FILE_BUFFER_SIZE
+                ) as source_stream:
+                    rows = (x for x in source_stream if x[0] != "#" and x.strip())
+
+                    # The first 2 lines are the table header.
+                    table_header = list(islice(rows, 2))
+
+                    if header is None:
+                        header = table_header
+                        file_stream.writelines(header)
+
+                    file_stream.writelines(rows)
+
+        return self
+
+    def get_counter_files(self) -> List[str]:
+        """
+        Provides the counter files of our sources.
+        """
+
+        return [
+            os.path.join(x, PyFunceble.cli.storage.COUNTER_FILE)
+            for x in self.sources
+            if os.path.isfile(os.path.join(x, PyFunceble.cli.storage.COUNTER_FILE))
+        ]
+
+    @staticmethod
+    def guess_testing_mode(dataset: dict) -> str:
+        """
+        Given a counter dataset, we guess the testing mode it was generated
+        with.
+
+        :param dataset:
+            The dataset to work with.
+        """
+
+        counted = {x for x, y in dataset["counter"].items() if x != "total" and y}
+        candidates = [
+            x
+            for x, y in FilesystemCounter.PERCENTAGE_STATUSES.items()
+            if counted.issubset(y)
+        ]
+
+        testing_mode = get_testing_mode()
+
+        if testing_mode in candidates or not candidates:
+            return testing_mode
+        return candidates[0]
+
+    def merge_counters(self, files: List[str]) -> "FilesystemMerger":
+        """
+        Sums the given counter files into our destination and regenerates
+        the percentage file from the result.
+        """
+
+        counter = FilesystemCounter(self.destination)
+
+        for file in files:
+            counter.merge_dataset(DictHelper().from_json_file(file))
+
+        destination = os.path.join(
+            self.destination,
+            PyFunceble.cli.storage.OUTPUTS.logs.directories.parent,
+            PyFunceble.cli.storage.OUTPUTS.logs.directories.percentage,
+            PyFunceble.cli.storage.OUTPUTS.logs.filenames.percentage,
+        )
+
+        DirectoryHelper(os.path.dirname(destination)).create()
+        file_printer = FilePrinter("percentage", destination=destination)
+
+        for data in counter.get_dataset_for_printer(
+            self.guess_testing_mode(counter.dataset)
+        ):
+            file_printer.set_dataset(data).print_interpolated_line()
+
+        return self
+
+    def start(self) -> "FilesystemMerger":
+        """
+        Starts the merge of our sources into our destination.
+        """
+
+        PyFunceble.facility.Logger.info(
+            "Started merge of %r into %r.", self.sources, self.destination
+        )
+
+        # As our destination is an absolute path, it's used as it is.
+        FilesystemCleanup(self.destination).clean_output_files()
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            submitted_list = []
+
+            for path, files in self.get_files_to_merge().items():
+                if os.path.basename(path) == ".gitkeep":
+                    # We keep the structure of our output directories.
+                    FileHelper(os.path.join(self.destination, path)).write(
+                        "", overwrite=True
+                    )
+                    continue
+
+                if self.is_table_file(path):
+                    method = self.merge_table_file
+                else:
+                    method = self.merge_sorted_file
+
+                submitted_list.append(executor.submit(method, path, files))
+
+            for submitted in concurrent.futures.as_completed(submitted_list):
+                if submitted.exception():
+                    raise submitted.exception()
+
+        counter_files = self.get_counter_files()
+
+        if counter_files:
+            self.merge_counters(counter_files)
+
+        PyFunceble.facility.Logger.info(
+            "Finished merge of %r into %r.", self.sources, self.destination
+        )
+
+        return self
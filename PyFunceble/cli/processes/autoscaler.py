@@ -0,0 +1,452 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the tools we use to grow or shrink a pool of workers while it
+is running.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+
+import multiprocessing
+import os
+import threading
+from typing import Optional, Tuple
+
+import PyFunceble.facility
+import PyFunceble.storage
+
+
+class WorkerStats:
+    """
+    Provides some counters which are written by a worker and read by the
+    process which manages it.
+
+    :param slow_threshold:
+        The number of seconds after which a test is considered as slow (because
+        it most likely waited for a timeout).
+    """
+
+    TESTS: int = 0
+    WALL_TIME: int = 1
+    CPU_TIME: int = 2
+    SLOW: int = 3
+
+    slow_threshold: Optional[float] = None
+
+    def __init__(self, slow_threshold: Optional[float] = None) -> None:
+        self._counters = multiprocessing.Array("d", 4)
+
+        if slow_threshold is not None:
+            self.slow_threshold = slow_threshold
+        elif PyFunceble.facility.ConfigLoader.is_already_loaded():
+            self.slow_threshold = float(
+                PyFunceble.storage.CONFIGURATION.lookup.timeout
+            )
+        else:
+            self.slow_threshold = 5.0
+
+    def record(self, latency: float, cpu_time: float) -> "WorkerStats":
+        """
+        Records a finished test.
+
+        :param latency:
+            The number of seconds the test took.
+        :param cpu_time:
+            The number of CPU seconds the test took.
+        """
+
+        with self._counters.get_lock():
+            self._counters[self.TESTS] += 1
+            self._counters[self.WALL_TIME] += latency
+            self._counters[self.CPU_TIME] += cpu_time
+
+            if latency >= self.slow_threshold:
+                self._counters[self.SLOW] += 1
+
+        return self
+
+    def snapshot(self) -> Tuple[float, float, float, float]:
+        """
+        Provides the current state of our counters.
+
+        :return:
+            The number of tests, the wall time, the CPU time and the number of
+            slow tests.
+        """
+
+        with self._counters.get_lock():
+            return tuple(self._counters)
+
+
+def get_rss(pid: int) -> Optional[int]:
+    """
+    Provides the resident set size (in bytes) of the given process.
+
+    :return:
+        The RSS or :py:class:`None` if we can't read it (not Linux).
+    """
+
+    try:
+        with open(f"/proc/{pid}/statm", "r", encoding="utf-8") as file_stream:
+            return int(file_stream.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class Autoscaler:
+    """
+    Provides a way to grow or shrink the pool of workers of a manager while it
+    is running.
+
+    Every :code:`interval` seconds, we look at the depth of the input queue,
+    the latency of the tests, the rate of slow tests and the RSS of the
+    workers, then:
+
+    - we shrink when the RSS gets close to the configured cap or when too many
+      tests wait for a timeout (our resolvers are most likely struggling).
+    - we grow when the input queue backs up and the latency of the tests is
+      dominated by waiting (for the network) - unless the waiting comes from
+      the rate limiter of the manager.
+
+    Every decision is logged (info level).
+
+    :param manager:
+        The manager to scale. Its workers are expected to have a
+        :py:class:`WorkerStats` under their :code:`stats` attribute.
+    :param min_workers:
+        The minimum number of workers.
+    :param max_workers:
+        The maximum number of workers.
+    :param max_rss:
+        The maximum (total) RSS of our workers - in bytes.
+    :param interval:
+        The number of seconds between two decisions.
+    """
+
+    STD_INTERVAL: float = 5.0
+
+    RSS_HIGH_RATIO: float = 0.9
+    """
+    The ratio of the RSS cap from which we consider to be close to it.
+    """
+
+    MAX_SLOW_RATE: float = 0.25
+    """
+    The rate of slow tests from which we consider our resolvers to be
+    struggling.
+    """
+
+    MIN_WAIT_RATIO: float = 0.8
+    """
+    The ratio of the latency spent waiting from which we consider that the
+    latency is dominated by waiting.
+    """
+
+    BACKLOG_PER_WORKER: int = 2
+    """
+    The number of messages per worker waiting in the input queue from which we
+    consider that the input queue backs up.
+    """
+
+    manager = None
+    min_workers: Optional[int] = None
+    max_workers: Optional[int] = None
+    max_rss: Optional[int] = None
+    interval: Optional[float] = None
+
+    thread: Optional[threading.Thread] = None
+    stop_event: Optional[threading.Event] = None
+
+    last_snapshots: Optional[dict] = None
+    last_rate_limited: float = 0.0
+
+    def __init__(
+        self,
+        manager,
+        *,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        max_rss: Optional[int] = None,
+        interval: Optional[float] = None,
+    ) -> None:
+        self.manager = manager
+        self.min_workers = min_workers
+
+        if max_workers is not None:
+            self.max_workers = max_workers
+        else:
+            self.max_workers = manager.max_worker
+
+        self.max_rss = max_rss
+
+        if interval is not None:
+            self.interval = interval
+        else:
+            self.interval = self.STD_INTERVAL
+
+        self.last_snapshots = dict()
+        self.last_rate_limited = 0.0
+
+    def start(self) -> "Autoscaler":
+        """
+        Starts our thread.
+        """
+
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(
+            target=self.run, name="pyfunceble_autoscaler", daemon=True
+        )
+        self.thread.start()
+
+        PyFunceble.facility.Logger.info(
+            "Started autoscaler (min: %r, max: %r, max RSS: %r).",
+            self.min_workers,
+            self.max_workers,
+            self.max_rss,
+        )
+
+        return self
+
+    def stop(self) -> "Autoscaler":
+        """
+        Stops our thread.
+        """
+
+        if self.thread is not None:
+            self.stop_event.set()
+
+            if self.thread is not threading.current_thread():
+                self.thread.join()
+
+            self.thread = None
+            self.manager.prune_workers()
+
+            PyFunceble.facility.Logger.info("Stopped autoscaler.")
+
+        return self
+
+    def run(self) -> None:
+        """
+        Takes a decision every :code:`interval` seconds until we are stopped.
+        """
+
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.scale()
+            except Exception:  # pylint: disable=broad-except
+                PyFunceble.facility.Logger.exception("Could not scale.")
+
+    def get_queue_depth(self) -> Optional[int]:
+        """
+        Provides the number of messages waiting in the input queue.
+
+        :return:
+            The depth or :py:class:`None` if our queue can't tell us.
+        """
+
+        try:
+            return self.manager.input_queue.qsize()
+        except (AttributeError, NotImplementedError):
+            return None
+
+    def get_rss(self, workers) -> Optional[int]:
+        """
+        Provides the total RSS of the given workers.
+        """
+
+        total = 0
+
+        for worker in workers:
+            rss = get_rss(worker.pid)
+
+            if rss is None:
+                return None
+
+            total += rss
+
+        return total
+
+    def get_stats(self, workers) -> Tuple[float, float, float, float]:
+        """
+        Provides the sum of the stats of the given workers since our last
+        decision.
+        """
+
+        result = [0.0, 0.0, 0.0, 0.0]
+
+        for worker in workers:
+            snapshot = worker.stats.snapshot()
+            previous = self.last_snapshots.get(worker.name, (0.0, 0.0, 0.0, 0.0))
+
+            for index, value in enumerate(snapshot):
+                result[index] += value - previous[index]
+
+            self.last_snapshots[worker.name] = snapshot
+
+        return tuple(result)
+
+    def get_rate_limited_time(self) -> float:
+        """
+        Provides the number of seconds our workers spent waiting for the rate
+        limiter of the manager since our last decision.
+        """
+
+        rate_limiter = getattr(self.manager, "rate_limiter", None)
+
+        if rate_limiter is None:
+            return 0.0
+
+        waited = rate_limiter.waited.value
+        result = waited - self.last_rate_limited
+        self.last_rate_limited = waited
+
+        return result
+
+    def scale(self) -> "Autoscaler":
+        """
+        Decides whether we have to grow or shrink - and apply it.
+        """
+
+        self.manager.prune_workers()
+
+        workers = self.manager.get_active_workers()
+        active = len(workers)
+
+        depth = self.get_queue_depth()
+        rss = self.get_rss(workers)
+        tests, wall_time, cpu_time, slow = self.get_stats(workers)
+        rate_limited = self.get_rate_limited_time()
+
+        if tests:
+            latency = wall_time / tests
+            slow_rate = slow / tests
+        else:
+            latency = slow_rate = 0.0
+
+        if wall_time:
+            wait_ratio = max(0.0, 1 - cpu_time / wall_time)
+        else:
+            wait_ratio = 0.0
+
+        metrics = (
+            f"workers={active} depth={depth} tests={int(tests)} "
+            f"latency={latency:.3f}s wait_ratio={wait_ratio:.2f} "
+            f"slow_rate={slow_rate:.2f} rss={rss} "
+            f"rate_limited={rate_limited:.3f}s"
+        )
+
+        rss_cap = self.max_rss * self.RSS_HIGH_RATIO if self.max_rss else None
+
+        if active > self.min_workers:
+            if rss_cap is not None and rss is not None and rss >= rss_cap:
+                return self.shrink(f"RSS close to the cap ({metrics})")
+
+            if tests and slow_rate >= self.MAX_SLOW_RATE:
+                return self.shrink(f"too many tests timing out ({metrics})")
+
+        if (
+            active < self.max_workers
+            and depth is not None
+            and depth >= active * self.BACKLOG_PER_WORKER
+            and tests
+            and wait_ratio >= self.MIN_WAIT_RATIO
+            and slow_rate < self.MAX_SLOW_RATE
+        ):
+            if rate_limited > 0:
+                # More workers would only wait longer for their turn.
+                PyFunceble.facility.Logger.info(
+                    "Autoscaler: Not growing: we are rate limited (%s).", metrics
+                )
+                return self
+
+            if (
+                rss_cap is not None
+                and rss is not None
+                and active
+                and rss + rss / active >= rss_cap
+            ):
+                PyFunceble.facility.Logger.info(
+                    "Autoscaler: Not growing: RSS would get close to the cap (%s).",
+                    metrics,
+                )
+                return self
+
+            return self.grow(f"input queue backs up ({metrics})")
+
+        PyFunceble.facility.Logger.debug("Autoscaler: Holding (%s).", metrics)
+
+        return self
+
+    def grow(self, reason: str) -> "Autoscaler":
+        """
+        Adds a worker and logs our decision.
+        """
+
+        worker = self.manager.add_worker()
+
+        PyFunceble.facility.Logger.info(
+            "Autoscaler: Grew with %r: %s.", worker.name, reason
+        )
+
+        return self
+
+    def shrink(self, reason: str) -> "Autoscaler":
+        """
+        Retires a worker and logs our decision.
+        """
+
+        worker = self.manager.retire_worker()
+
+        if worker is not None:
+            self.last_snapshots.pop(worker.name, None)
+
+            PyFunceble.facility.Logger.info(
+                "Autoscaler: Shrank by retiring %r: %s.", worker.name, reason
+            )
+
+        return self
@@ -54,16 +54,26 @@ import functools
 import multiprocessing
 import os
 import queue
+import threading
 from typing import Any, List, Optional
 
 import PyFunceble.facility
+import PyFunceble.storage
 from PyFunceble.cli.continuous_integration.base import ContinuousIntegrationBase
+from PyFunceble.cli.processes.completion import CompletionTracker
+from PyFunceble.cli.processes.disk_queue import DiskQueue
+from PyFunceble.cli.processes.heartbeat import Heartbeat
+from PyFunceble.cli.processes.message_batch import MessageBatch
 from PyFunceble.cli.processes.workers.base import WorkerBase
 
 
 class ProcessesManagerBase:
     """
     Provides the base of all classes.
+
+    :param stall_timeout:
+        The maximal number of seconds a worker is allowed to spend on a single
+        message. When given, a watchdog replaces the workers which stalled.
     """
 
     CPU_COUNT = os.cpu_count()
@@ -73,8 +83,16 @@ class ProcessesManagerBase:
     else:
         STD_MAX_WORKER: int = 1
 
+    STD_QUEUE_BACKEND: str = "queue"
+    SUPPORTED_QUEUE_BACKENDS: List[str] = ["queue", "manager"]
+
     WORKER_OBJ: Optional[WorkerBase] = None
 
+    WATCHDOG_INTERVAL: float = 1.0
+    """
+    The number of seconds between two checks of the heartbeat of our workers.
+    """
+
     input_queue: Optional[queue.Queue] = None
     """
     The input queue. Dataset will be given through this.
@@ -92,11 +110,28 @@ class ProcessesManagerBase:
     global_exit_event: Optional[multiprocessing.Event] = None
     continuous_integration: Optional[ContinuousIntegrationBase] = None
 
+    completion_tracker: Optional[CompletionTracker] = None
+    """
+    The tracker of the work in flight through our pipeline. It is shared with
+    (and fed by) our workers.
+    """
+
+    stall_timeout: Optional[float] = None
+
+    watchdog: Optional[threading.Thread] = None
+    watchdog_stop_event: Optional[threading.Event] = None
+    watchdog_lock: Optional[threading.Lock] = None
+    """
+    Held while our watchdog replaces a worker. During that time, our pool of
+    workers may look empty.
+    """
+
     _created_workers: Optional[List[WorkerBase]] = None
     _running_workers: Optional[List[WorkerBase]] = None
     _output_workers_count: Optional[int] = None
 
     _max_worker: Optional[int] = None
+    _queue_backend: Optional[str] = None
 
     def __init__(
         self,
@@ -111,15 +146,23 @@ class ProcessesManagerBase:
         generate_output_queue: bool = True,
         output_queue_num: int = 1,
         output_workers_count: Optional[int] = None,
+        queue_backend: Optional[str] = None,
+        completion_tracker: Optional[CompletionTracker] = None,
+        stall_timeout: Optional[float] = None,
     ) -> None:
+        if queue_backend is not None:
+            self.queue_backend = queue_backend
+        else:
+            self.guess_and_set_queue_backend()
+
         if manager is not None:
             self.manager = manager
-        else:
+        elif self.queue_backend == "manager":
             self.manager = multiprocessing.Manager()
 
         if input_queue is None:
             if generate_input_queue:
-                self.input_queue = self.manager.Queue()
+                self.input_queue = self.generate_queue()
             else:
                 self.input_queue = None
         else:
@@ -128,7 +171,7 @@ class ProcessesManagerBase:
         if output_queue is None:
             if generate_output_queue:
                 self.output_queue = [
-                    self.manager.Queue() for _ in range(output_queue_num)
+                    self.generate_queue() for _ in range(output_queue_num)
                 ]
             else:
                 self.output_queue = None
@@ -146,6 +189,12 @@ class ProcessesManagerBase:
         if continuous_integration is not None:
             self.continuous_integration = continuous_integration
 
+        if completion_tracker is not None:
+            self.completion_tracker = completion_tracker
+
+        if stall_timeout is not None:
+            self.stall_timeout = float(stall_timeout)
+
         self.daemon = daemon
 
         self.global_exit_event = multiprocessing.Event()
@@ -246,6 +295,87 @@ class ProcessesManagerBase:
 
         return self
 
+    @property
+    def queue_backend(self) -> Optional[str]:
+        """
+        Provides the current state of the :code:`_queue_backend` attribute.
+        """
+
+        return self._queue_backend
+
+    @queue_backend.setter
+    def queue_backend(self, value: str) -> None:
+        """
+        Sets the backend to use when we generate our queues.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`str`.
+        :raise ValueError:
+            When the given :code:`value` is unknown or unsupported.
+        """
+
+        if not isinstance(value, str):
+            raise TypeError(f"<value> should be {str}, {type(value)} given.")
+
+        value = value.lower()
+
+        if value not in self.SUPPORTED_QUEUE_BACKENDS:
+            raise ValueError(
+                f"<value> ({value!r}) is unknown or unsupported "
+                f"(supported: {self.SUPPORTED_QUEUE_BACKENDS!r})."
+            )
+
+        self._queue_backend = value
+
+    def set_queue_backend(self, value: str) -> "ProcessesManagerBase":
+        """
+        Sets the backend to use when we generate our queues.
+
+        :param value:
+            The value to set.
+        """
+
+        self.queue_backend = value
+
+        return self
+
+    def guess_and_set_queue_backend(self) -> "ProcessesManagerBase":
+        """
+        Try to guess and set the queue backend to use.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and isinstance(
+            PyFunceble.storage.CONFIGURATION.cli_testing.queue_backend, str
+        ):
+            self.queue_backend = (
+                PyFunceble.storage.CONFIGURATION.cli_testing.queue_backend
+            )
+        else:
+            self.queue_backend = self.STD_QUEUE_BACKEND
+
+        return self
+
+    def generate_queue(self) -> queue.Queue:
+        """
+        Provides a new queue based on the currently set backend.
+
+        The :code:`queue` backend is a native pipe based queue which is shared
+        with our workers when they are started. The :code:`manager` backend
+        goes through the (proxy) server process of our manager and is kept as
+        fallback.
+        """
+
+        if self.queue_backend == "manager":
+            if self.manager is None:
+                self.manager = multiprocessing.Manager()
+
+            return self.manager.Queue()
+
+        return multiprocessing.Queue()
+
     def is_running(self) -> bool:
         """
         Checks if a worker is running.
@@ -282,6 +412,8 @@ class ProcessesManagerBase:
         else:
             workers = self._created_workers
 
+        self.stop_watchdog()
+
         if workers[0].global_exit_event:
             workers[0].global_exit_event.set()
 
@@ -299,7 +431,24 @@ class ProcessesManagerBase:
         Wait until all workers are done.
         """
 
-        for worker in self._running_workers:
+        if self.watchdog is not None:
+            # Our watchdog may replace our workers while we wait. Therefore,
+            # we keep an eye on our pool until it's empty.
+            while True:
+                with self.watchdog_lock:
+                    running_workers = [
+                        x for x in self._running_workers if x.is_alive()
+                    ]
+
+                if not running_workers:
+                    break
+
+                running_workers[0].join(self.WATCHDOG_INTERVAL)
+
+            self.stop_watchdog()
+
+        # We remove them while iterating. Hence the copy.
+        for worker in list(self._running_workers):
             PyFunceble.facility.Logger.info(
                 "Waiting for %r to finish.",
                 worker.name,
@@ -415,6 +564,43 @@ class ProcessesManagerBase:
 
         return self
 
+    def new_worker(self, name: str) -> WorkerBase:
+        """
+        Provides a new (not started) worker.
+
+        :param name:
+            The name of the worker.
+        """
+
+        worker = self.WORKER_OBJ(  # pylint: disable=not-callable
+            self.input_queue,
+            self.output_queue,
+            self.global_exit_event,
+            name=name,
+            daemon=self.daemon,
+            continuous_integration=self.continuous_integration,
+            configuration=PyFunceble.storage.CONFIGURATION.to_dict(),
+        )
+        worker.completion_tracker = self.completion_tracker
+
+        if self.stall_timeout:
+            worker.heartbeat = Heartbeat()
+
+        return worker
+
+    @create_workers_if_missing
+    def flush_input_batch(self) -> "ProcessesManagerBase":
+        """
+        Sends the messages we accumulated for the input queue - if any.
+        """
+
+        if self.is_running():
+            self._running_workers[0].flush_input_batch()
+        else:
+            self._created_workers[0].flush_input_batch()
+
+        return self
+
     def create(self) -> "ProcessesManagerBase":
         """
         Creates the defined amount of worker.
@@ -422,7 +608,8 @@ class ProcessesManagerBase:
 
         def share_concurrent_worker_names() -> None:
             """
-            Share the name of all concurrent worker to all workers.
+            Share the name (and control queue) of all concurrent worker to all
+            workers.
             """
 
             concurrent_names = [x.name for x in self._created_workers]
@@ -431,19 +618,17 @@ class ProcessesManagerBase:
                 worker.concurrent_worker_names = list(concurrent_names)
                 worker.concurrent_worker_names.remove(worker.name)
 
+                worker.concurrent_control_queues = {
+                    x.name: x.control_queue
+                    for x in self._created_workers
+                    if x is not worker
+                }
+
         for i in range(self.max_worker):
-            worker = self.WORKER_OBJ(  # pylint: disable=not-callable
-                self.input_queue,
-                self.output_queue,
-                self.global_exit_event,
-                name=f"{self.WORKER_OBJ.STD_NAME}_{i + 1}",
-                daemon=self.daemon,
-                continuous_integration=self.continuous_integration,
-                configuration=PyFunceble.storage.CONFIGURATION.to_dict(),
+            self._created_workers.append(
+                self.new_worker(f"{self.WORKER_OBJ.STD_NAME}_{i + 1}")
             )
 
-            self._created_workers.append(worker)
-
         share_concurrent_worker_names()
 
         PyFunceble.facility.Logger.info(
@@ -479,4 +664,273 @@ class ProcessesManagerBase:
             self._running_workers,
         )
 
+        if self.stall_timeout and self.watchdog is None:
+            self.watchdog_lock = threading.Lock()
+            self.watchdog_stop_event = threading.Event()
+            self.watchdog = threading.Thread(
+                target=self.run_watchdog, name="pyfunceble_watchdog", daemon=True
+            )
+            self.watchdog.start()
+
+        return self
+
+    def stop_watchdog(self) -> "ProcessesManagerBase":
+        """
+        Stops the thread which checks the heartbeat of our workers - if any.
+        """
+
+        if self.watchdog is not None:
+            self.watchdog_stop_event.set()
+
+            if self.watchdog is not threading.current_thread():
+                self.watchdog.join()
+
+            self.watchdog = None
+
+        return self
+
+    def run_watchdog(self) -> None:
+        """
+        Checks the heartbeat of our workers every :code:`WATCHDOG_INTERVAL`
+        seconds until we are stopped.
+        """
+
+        while not self.watchdog_stop_event.wait(self.WATCHDOG_INTERVAL):
+            try:
+                self.replace_stalled_workers()
+            except Exception:  # pylint: disable=broad-except
+                PyFunceble.facility.Logger.exception("Could not check heartbeats.")
+
+    def replace_stalled_workers(self) -> "ProcessesManagerBase":
+        """
+        Replaces the workers which spent more than :code:`stall_timeout`
+        seconds on a single message by fresh ones.
+
+        A stalled worker is killed. What it did not process yet is given back
+        to our input queue and the message it stalled on is given to
+        :py:meth:`handle_stalled_message`.
+        """
+
+        def kill(worker: WorkerBase) -> None:
+            # A killed worker won't stop by itself. Therefore, we mark it as
+            # recycled so that we can forget it.
+            worker.recycle_it.set()
+            worker.kill()
+            worker.join()
+
+        for worker in list(self._running_workers):
+            if worker.heartbeat is None or not worker.is_alive():
+                continue
+
+            with self.watchdog_lock:
+                stalled = worker.heartbeat.stop_if_stalled(
+                    self.stall_timeout, functools.partial(kill, worker)
+                )
+
+                if stalled is None:
+                    continue
+
+                self.replace_stalled_worker(worker, *stalled)
+
+        return self
+
+    def replace_stalled_worker(
+        self,
+        worker: WorkerBase,
+        current: Optional[Any],
+        remaining: Optional[List[Any]],
+    ) -> WorkerBase:
+        """
+        Replaces the given (killed) worker by a fresh one.
+
+        :param worker:
+            The worker to replace.
+        :param current:
+            The message the worker stalled on.
+        :param remaining:
+            The messages the worker did not process yet - or whose result it
+            did not send.
+
+        :return:
+            The new worker.
+        """
+
+        PyFunceble.facility.Logger.critical(
+            "Worker %r stalled (more than %rs) on: %r. Killed it.",
+            worker.name,
+            self.stall_timeout,
+            current,
+        )
+
+        if isinstance(self.input_queue, DiskQueue):
+            # What it read is either given back below or lost with it.
+            self.input_queue.forget_taken(worker.pid)
+
+        if current is None:
+            # It held more than its heartbeat could keep track of.
+            lost = worker.heartbeat.held_count.value - worker.heartbeat.sent.value
+
+            PyFunceble.facility.Logger.critical(
+                "Could not recover the %r message(s) held by %r.",
+                lost,
+                worker.name,
+            )
+
+            if self.completion_tracker is not None:
+                self.completion_tracker.done(lost)
+        else:
+            remaining = [
+                x for x in remaining if not WorkerBase.is_control_message(x[-1])
+            ]
+
+            if remaining:
+                # Those were already counted (by our completion tracker) while
+                # they were sent. Nothing to count again.
+                self.input_queue.put(MessageBatch(remaining))
+
+            if not WorkerBase.is_control_message(current[-1]):
+                self.handle_stalled_message(worker, current)
+
+        # What it did not process is given back before its replacement
+        # exists. Otherwise, the replacement may apply its stop message before
+        # reading it.
+        replacement = self.add_worker()
+
+        PyFunceble.facility.Logger.info(
+            "Replaced worker: %r. Replaced by: %r.", worker.name, replacement.name
+        )
+
+        return replacement
+
+    def handle_stalled_message(
+        self, worker: WorkerBase, message: Any
+    ) -> "ProcessesManagerBase":
+        """
+        Handles the message a (killed) worker stalled on.
+
+        By default, the message is dropped.
+
+        :param worker:
+            The worker which stalled.
+        :param message:
+            The message the worker stalled on. In the format of the messages
+            of our queues: :code:`(worker_name, destination_worker, data)`.
+        """
+
+        PyFunceble.facility.Logger.info(
+            "Dropped %r: %r stalled on it.", message[-1], worker.name
+        )
+
+        if self.completion_tracker is not None:
+            self.completion_tracker.done()
+
+        return self
+
+    def get_active_workers(self) -> List[WorkerBase]:
+        """
+        Provides the running workers which were not asked to retire (or to
+        recycle).
+        """
+
+        return [
+            x
+            for x in self._running_workers
+            if x.is_alive()
+            and not x.retire_it.is_set()
+            and not x.recycle_it.is_set()
+        ]
+
+    @ensure_worker_obj_is_given
+    def add_worker(self) -> WorkerBase:
+        """
+        Creates and starts a new worker while we are running.
+        """
+
+        worker = self.new_worker(
+            f"{self.WORKER_OBJ.STD_NAME}_{len(self._created_workers) + 1}"
+        )
+        worker.concurrent_worker_names = [x.name for x in self._created_workers]
+        worker.concurrent_control_queues = {
+            x.name: x.control_queue for x in self._created_workers
+        }
+
+        self._created_workers.append(worker)
+
+        worker.start()
+        self._running_workers.append(worker)
+
+        PyFunceble.facility.Logger.info("Added worker: %r.", worker.name)
+
+        return worker
+
+    def retire_worker(self) -> Optional[WorkerBase]:
+        """
+        Asks our latest active worker to stop as soon as it finished its current
+        work.
+
+        .. note::
+            The first worker is never retired, because it is the one we use
+            to send our messages.
+        """
+
+        active_workers = self.get_active_workers()
+
+        if len(active_workers) <= 1 or active_workers[-1] is self._running_workers[0]:
+            return None
+
+        worker = active_workers[-1]
+        worker.retire_it.set()
+
+        PyFunceble.facility.Logger.info("Retired worker: %r.", worker.name)
+
+        return worker
+
+    def recycle_worker(
+        self, worker: WorkerBase, *, reason: Optional[str] = None
+    ) -> WorkerBase:
+        """
+        Replaces the given worker by a fresh one.
+
+        The given worker stops as soon as it processed what it already took
+        from the input queue - or as soon as it woke up if it was waiting for
+        work.
+
+        :param worker:
+            The worker to replace.
+        :param reason:
+            The reason of the replacement (for the logs).
+
+        :return:
+            The new worker.
+        """
+
+        replacement = self.add_worker()
+        worker.recycle_it.set()
+
+        PyFunceble.facility.Logger.info(
+            "Recycled worker: %r (%s). Replaced by: %r.",
+            worker.name,
+            reason,
+            replacement.name,
+        )
+
+        return replacement
+
+    def prune_workers(self) -> "ProcessesManagerBase":
+        """
+        Forgets the retired (or recycled) workers which are already gone.
+
+        .. note::
+            The first worker is never forgotten, because it is the one we use
+            to send our messages.
+        """
+
+        self._running_workers = [
+            x
+            for i, x in enumerate(self._running_workers)
+            if not i
+            or x.is_alive()
+            or not (x.retire_it.is_set() or x.recycle_it.is_set())
+        ]
+
         return self
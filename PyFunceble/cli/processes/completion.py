@@ -0,0 +1,157 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the tracker of the work in flight through our processes.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+from typing import Optional
+
+
+class CompletionTracker:
+    """
+    Tracks the work in flight through a pipeline of processes - even when it is
+    cyclic (e.g. while mining).
+
+    Every message of work is added when it is sent to one of our queues, and
+    marked as done once it was fully processed - which is after the messages it
+    produced were added. Therefore, once the input of the pipeline is closed,
+    nothing is in flight anymore when we reach zero.
+    """
+
+    counter: Optional[multiprocessing.Value] = None
+    closed: Optional[multiprocessing.Event] = None
+    finished: Optional[multiprocessing.Event] = None
+
+    def __init__(self) -> None:
+        self.counter = multiprocessing.Value("q", 0)
+        self.closed = multiprocessing.Event()
+        self.finished = multiprocessing.Event()
+
+    @property
+    def inflight(self) -> int:
+        """
+        Provides the number of messages in flight.
+        """
+
+        return self.counter.value
+
+    def add(self, count: int = 1) -> "CompletionTracker":
+        """
+        Adds the given number of messages to the ones in flight.
+
+        :param count:
+            The number of messages to add.
+        """
+
+        with self.counter.get_lock():
+            self.counter.value += count
+
+        return self
+
+    def done(self, count: int = 1) -> "CompletionTracker":
+        """
+        Marks the given number of messages as done.
+
+        :param count:
+            The number of messages to mark.
+        """
+
+        with self.counter.get_lock():
+            self.counter.value -= count
+
+            if self.counter.value <= 0 and self.closed.is_set():
+                self.finished.set()
+
+        return self
+
+    def close(self) -> "CompletionTracker":
+        """
+        Tells us that the input of the pipeline is over: nothing but the
+        messages in flight can produce more work.
+        """
+
+        with self.counter.get_lock():
+            self.closed.set()
+
+            if self.counter.value <= 0:
+                self.finished.set()
+
+        return self
+
+    def abort(self) -> "CompletionTracker":
+        """
+        Stops the waiting for the work in flight. This is what we do when one
+        of our processes can't continue - and will never mark its messages as
+        done.
+        """
+
+        self.finished.set()
+
+        return self
+
+    def is_finished(self) -> bool:
+        """
+        Checks if all work is done.
+        """
+
+        return self.finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all work is done.
+
+        :param timeout:
+            The maximal number of seconds to wait.
+
+        :return:
+            :py:class:`True` when all work is done.
+        """
+
+        return self.finished.wait(timeout)
@@ -0,0 +1,341 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the tools we use to control (and tune) the number of subjects a
+worker keeps in flight.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+
+import threading
+import time
+from typing import Optional
+
+import PyFunceble.facility
+import PyFunceble.storage
+
+
+class ConcurrencyLimiter:
+    """
+    Provides a semaphore-like limiter whose limit can be changed while it is
+    in use.
+
+    :param limit:
+        The maximum number of holders at the same time.
+    """
+
+    _limit: Optional[int] = None
+
+    inflight: int = 0
+    """
+    The number of current holders.
+    """
+
+    saturated: bool = False
+    """
+    Whether we reached our limit since the last reset of this flag.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._condition = threading.Condition()
+        self.inflight = 0
+
+        self.limit = limit
+
+    @property
+    def limit(self) -> Optional[int]:
+        """
+        Provides the current state of the :code:`_limit` attribute.
+        """
+
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        """
+        Sets the maximum number of holders at the same time.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater or equal to one.")
+
+        with self._condition:
+            self._limit = value
+            self._condition.notify_all()
+
+    def acquire(self) -> None:
+        """
+        Waits until we are below our limit, then holds a slot.
+        """
+
+        with self._condition:
+            self._condition.wait_for(lambda: self.inflight < self._limit)
+            self.inflight += 1
+
+            if self.inflight >= self._limit:
+                self.saturated = True
+
+    def release(self) -> None:
+        """
+        Releases a slot.
+        """
+
+        with self._condition:
+            self.inflight -= 1
+            self._condition.notify_all()
+
+    def wait_idle(self) -> None:
+        """
+        Waits until nobody holds a slot.
+        """
+
+        with self._condition:
+            self._condition.wait_for(lambda: self.inflight <= 0)
+
+
+class ConcurrencyTuner:
+    """
+    Provides a way to look for the limit of a :py:class:`ConcurrencyLimiter`
+    which gives us the best throughput.
+
+    We start with a small limit and measure the throughput and the error rate
+    (the rate of tests which took longer than our lookup timeout) of
+    successive windows. As long as the throughput improves, we double the
+    limit. As soon as the throughput plateaus or the error rate climbs, we
+    settle on the best limit we have seen. Once settled, we halve the limit
+    whenever the error rate climbs again.
+
+    :param limiter:
+        The limiter to tune.
+    :param maximum:
+        The maximum limit we are allowed to set.
+    :param slow_threshold:
+        The number of seconds after which a test is considered as failed
+        (because it most likely waited for a timeout).
+    :param name:
+        The name to use in our logs.
+    """
+
+    STD_START: int = 4
+    STD_WINDOW: float = 2.0
+
+    MIN_GAIN: float = 1.1
+    """
+    The minimum throughput gain (ratio) to keep growing.
+    """
+
+    MAX_ERROR_RATE_INCREASE: float = 0.1
+    """
+    The maximum error rate increase we tolerate before backing off.
+    """
+
+    limiter: Optional[ConcurrencyLimiter] = None
+    maximum: Optional[int] = None
+    slow_threshold: Optional[float] = None
+    name: Optional[str] = None
+
+    settled: bool = False
+
+    best_limit: Optional[int] = None
+    best_throughput: Optional[float] = None
+    best_error_rate: Optional[float] = None
+
+    window_started_at: Optional[float] = None
+    completed: int = 0
+    failed: int = 0
+
+    def __init__(
+        self,
+        limiter: ConcurrencyLimiter,
+        maximum: int,
+        *,
+        slow_threshold: Optional[float] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        self._lock = threading.Lock()
+
+        self.limiter = limiter
+        self.maximum = maximum
+        self.name = name
+
+        if slow_threshold is not None:
+            self.slow_threshold = slow_threshold
+        elif PyFunceble.facility.ConfigLoader.is_already_loaded():
+            self.slow_threshold = float(
+                PyFunceble.storage.CONFIGURATION.lookup.timeout
+            )
+        else:
+            self.slow_threshold = 5.0
+
+        self.limiter.limit = min(self.STD_START, self.maximum)
+        self.reset_window()
+
+    def reset_window(self) -> "ConcurrencyTuner":
+        """
+        Starts a new measurement window.
+        """
+
+        self.window_started_at = time.monotonic()
+        self.completed = 0
+        self.failed = 0
+        self.limiter.saturated = self.limiter.inflight >= self.limiter.limit
+
+        return self
+
+    def set_limit(self, value: int, reason: str) -> "ConcurrencyTuner":
+        """
+        Sets the limit of our limiter and logs our decision.
+        """
+
+        value = max(1, min(value, self.maximum))
+
+        if value != self.limiter.limit:
+            PyFunceble.facility.Logger.info(
+                "%s: Concurrency limit %r -> %r (%s).",
+                self.name,
+                self.limiter.limit,
+                value,
+                reason,
+            )
+
+            self.limiter.limit = value
+
+        return self
+
+    def record(self, latency: float) -> "ConcurrencyTuner":
+        """
+        Records the latency of a finished test and - at the end of a window -
+        decides about the next limit.
+
+        :param latency:
+            The number of seconds the test took.
+        """
+
+        with self._lock:
+            self.completed += 1
+
+            if latency >= self.slow_threshold:
+                self.failed += 1
+
+            elapsed = time.monotonic() - self.window_started_at
+
+            if elapsed < self.STD_WINDOW or self.completed < self.limiter.limit:
+                return self
+
+            if not self.limiter.saturated and not self.settled:
+                # We were not the bottleneck: the measurement tells us nothing
+                # about our limit.
+                return self.reset_window()
+
+            self.evaluate(self.completed / elapsed, self.failed / self.completed)
+
+            return self.reset_window()
+
+    def evaluate(self, throughput: float, error_rate: float) -> "ConcurrencyTuner":
+        """
+        Decides about the next limit.
+
+        :param throughput:
+            The number of tests per second of the last window.
+        :param error_rate:
+            The error rate of the last window.
+        """
+
+        PyFunceble.facility.Logger.debug(
+            "%s: limit=%r throughput=%.2f/s error_rate=%.2f",
+            self.name,
+            self.limiter.limit,
+            throughput,
+            error_rate,
+        )
+
+        if self.best_throughput is None:
+            self.best_limit = self.limiter.limit
+            self.best_throughput = throughput
+            self.best_error_rate = error_rate
+        elif error_rate > self.best_error_rate + self.MAX_ERROR_RATE_INCREASE:
+            if self.settled:
+                self.best_error_rate = error_rate
+                return self.set_limit(
+                    self.limiter.limit // 2, f"error rate climbed to {error_rate:.2f}"
+                )
+
+            self.settled = True
+            return self.set_limit(
+                self.best_limit, f"error rate climbed to {error_rate:.2f}"
+            )
+        elif self.settled:
+            return self
+        elif throughput >= self.best_throughput * self.MIN_GAIN:
+            self.best_limit = self.limiter.limit
+            self.best_throughput = throughput
+            self.best_error_rate = min(self.best_error_rate, error_rate)
+        else:
+            self.settled = True
+            return self.set_limit(
+                self.best_limit, f"throughput plateaued at {throughput:.2f}/s"
+            )
+
+        if self.limiter.limit >= self.maximum:
+            self.settled = True
+            return self
+
+        return self.set_limit(
+            self.limiter.limit * 2, f"throughput improved to {throughput:.2f}/s"
+        )
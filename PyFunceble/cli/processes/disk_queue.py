@@ -0,0 +1,426 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides a queue which keeps what it holds on disk.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import collections
+import os
+import pickle
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Deque, List, Optional, Tuple
+
+from PyFunceble.cli.processes.message_batch import MessageBatch
+from PyFunceble.helpers.file import FileHelper
+
+
+class DiskQueue:
+    """
+    Provides a queue which keeps what it holds on disk - into a SQLite database
+    - instead of memory.
+
+    Unlike our (native) queues, what was put into it survives the end of our
+    processes. A message stays into the database until the process which read
+    it acknowledges it (see :py:meth:`task_done`). Therefore, what was read but
+    never acknowledged - because we were killed - can be given back through
+    :py:meth:`release_taken`.
+
+    It can be shared between processes: each of them opens its own connection
+    to the database.
+
+    :param path:
+        The path of the database to use.
+    """
+
+    POLL_INTERVAL: float = 0.05
+    BUSY_TIMEOUT: float = 60.0
+
+    ACKNOWLEDGED: bool = True
+    """
+    Tells our workers that what they read has to be acknowledged.
+    """
+
+    path: Optional[str] = None
+
+    _connection: Optional[sqlite3.Connection] = None
+    _connection_pid: Optional[int] = None
+    _lock: Optional[threading.RLock] = None
+
+    _taken: Optional[Deque[List[int]]] = None
+    """
+    The ID and size of the rows we read but did not acknowledge (yet) - in the
+    order we read them.
+    """
+
+    _done: int = 0
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+
+        # Ensures that everything is in place before we share it.
+        _ = self.connection
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+
+        # A connection (and its state) belongs to the process which opened it.
+        for attribute in ("_connection", "_connection_pid", "_lock", "_taken"):
+            state.pop(attribute, None)
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Provides the connection of the current process - and opens it if
+        necessary.
+        """
+
+        if self._connection_pid != os.getpid():
+            # We may have been forked: what we have belongs to our parent.
+            self._lock = threading.RLock()
+            self._taken = collections.deque()
+            self._done = 0
+
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=self.BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS queue ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "size INTEGER NOT NULL, "
+                "data BLOB NOT NULL, "
+                "taken_by INTEGER)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS pending ON queue(id) "
+                "WHERE taken_by IS NULL"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB)"
+            )
+            self._connection_pid = os.getpid()
+
+        return self._connection
+
+    def put(
+        self, item: Any, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Puts the given item into the queue.
+
+        .. note::
+            The :code:`block` and :code:`timeout` arguments are only there
+            for the compatibility with our other queues. We never block.
+
+        :param item:
+            The item to put.
+        """
+
+        # pylint: disable=unused-argument
+
+        size = len(item) if isinstance(item, MessageBatch) else 1
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT INTO queue (size, data) VALUES (?, ?)",
+                (size, pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+
+    def claim(self) -> Optional[Tuple[int, int, bytes]]:
+        """
+        Takes the oldest row nobody took yet.
+
+        :return:
+            The ID, size and (pickled) data of the row or :py:class:`None` when
+            nothing is waiting.
+        """
+
+        with self._lock:
+            connection = self.connection
+
+            if self.empty():
+                # We don't need to lock the database to know that.
+                return None
+
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                row = connection.execute(
+                    "SELECT id, size, data FROM queue WHERE taken_by IS NULL "
+                    "ORDER BY id LIMIT 1"
+                ).fetchone()
+
+                if row is not None:
+                    connection.execute(
+                        "UPDATE queue SET taken_by = ? WHERE id = ?",
+                        (os.getpid(), row[0]),
+                    )
+
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            if row is not None:
+                self._taken.append([row[0], row[1]])
+
+            return row
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Provides the oldest item of the queue.
+
+        :param block:
+            Whether we have to wait until an item is available.
+        :param timeout:
+            The maximal number of seconds to wait.
+
+        :raise queue.Empty:
+            When nothing is available.
+        """
+
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        else:
+            deadline = None
+
+        while True:
+            row = self.claim()
+
+            if row is not None:
+                return pickle.loads(row[2])
+
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Empty
+
+            time.sleep(self.POLL_INTERVAL)
+
+    def get_nowait(self) -> Any:
+        """
+        Provides the oldest item of the queue - without waiting.
+
+        :raise queue.Empty:
+            When nothing is available.
+        """
+
+        return self.get(block=False)
+
+    def task_done(self, count: int = 1) -> "DiskQueue":
+        """
+        Acknowledges the given number of messages we read. A row is deleted
+        from the database once all of its messages were acknowledged.
+
+        .. note::
+            Our rows are acknowledged in the order we read them. When our
+            messages are processed concurrently, a row may therefore be
+            deleted while one of its message is still being processed.
+
+        :param count:
+            The number of messages to acknowledge.
+        """
+
+        with self._lock:
+            connection = self.connection
+            self._done += count
+
+            to_delete = []
+
+            while self._taken and self._done >= self._taken[0][1]:
+                row_id, size = self._taken.popleft()
+                self._done -= size
+
+                to_delete.append((row_id,))
+
+            if to_delete:
+                connection.executemany("DELETE FROM queue WHERE id = ?", to_delete)
+
+        return self
+
+    def release_taken(self) -> int:
+        """
+        Gives back what was read but never acknowledged.
+
+        .. warning::
+            This should only be called while nobody reads the queue.
+
+        :return:
+            The number of rows we gave back.
+        """
+
+        with self._lock:
+            return self.connection.execute(
+                "UPDATE queue SET taken_by = NULL WHERE taken_by IS NOT NULL"
+            ).rowcount
+
+    def forget_taken(self, pid: int) -> int:
+        """
+        Deletes what was read - but never acknowledged - by the given process.
+
+        .. warning::
+            This should only be called once the given process is gone and
+            what it did not process was given back through :py:meth:`put`.
+
+        :param pid:
+            The ID of the process which read the rows to delete.
+
+        :return:
+            The number of rows we deleted.
+        """
+
+        with self._lock:
+            return self.connection.execute(
+                "DELETE FROM queue WHERE taken_by = ?", (pid,)
+            ).rowcount
+
+    def qsize(self) -> int:
+        """
+        Provides the (approximate) number of rows waiting to be read.
+        """
+
+        with self._lock:
+            minimum, maximum = self.connection.execute(
+                "SELECT min(id), max(id) FROM queue WHERE taken_by IS NULL"
+            ).fetchone()
+
+        if minimum is None:
+            return 0
+
+        # Our rows are read in order. Therefore, it is (mostly) the number of
+        # waiting rows - without having to count them.
+        return maximum - minimum + 1
+
+    def empty(self) -> bool:
+        """
+        Checks if nothing is waiting to be read.
+        """
+
+        with self._lock:
+            return (
+                self.connection.execute(
+                    "SELECT 1 FROM queue WHERE taken_by IS NULL LIMIT 1"
+                ).fetchone()
+                is None
+            )
+
+    def set_meta(self, key: str, value: Any) -> "DiskQueue":
+        """
+        Saves the given value alongside our rows.
+
+        :param key:
+            The key to save the value to.
+        :param value:
+            The value to save.
+        """
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+
+        return self
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """
+        Provides the value saved (through :py:meth:`set_meta`) under the given
+        key.
+
+        :param key:
+            The key to read.
+        :param default:
+            The value to return when nothing was saved.
+        """
+
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return default
+
+        return pickle.loads(row[0])
+
+    def close(self) -> "DiskQueue":
+        """
+        Closes the connection of the current process - if any.
+        """
+
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+
+        self._connection = self._connection_pid = None
+
+        return self
+
+    def delete(self) -> "DiskQueue":
+        """
+        Closes and deletes our database.
+        """
+
+        self.close()
+
+        for suffix in ("", "-wal", "-shm"):
+            FileHelper(f"{self.path}{suffix}").delete()
+
+        return self
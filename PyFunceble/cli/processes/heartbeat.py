@@ -0,0 +1,234 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the heartbeat of our workers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+import pickle
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class Heartbeat:
+    """
+    Provides the heartbeat of a worker. It is shared (through shared memory)
+    between the worker - which beats - and its manager - which checks that
+    the worker is still making progress.
+
+    The worker tells us what it holds (the messages it read but did not
+    process yet - or whose result it did not send yet), and beats everytime it
+    starts to process one of them. Therefore, when a worker stalls, its
+    manager knows which message is responsible and which ones have to be
+    processed again.
+    """
+
+    MAX_HELD_SIZE: int = 1024 * 1024
+    """
+    The maximal size (in bytes) of what we hold. When the (pickled) held
+    messages are bigger, we keep track of the beats only.
+    """
+
+    LOCK_TIMEOUT: float = 1.0
+
+    lock: Optional[multiprocessing.Lock] = None
+    started_at: Optional[multiprocessing.Value] = None
+    index: Optional[multiprocessing.Value] = None
+    sent: Optional[multiprocessing.Value] = None
+    held_count: Optional[multiprocessing.Value] = None
+    held_size: Optional[multiprocessing.Value] = None
+    held: Optional[multiprocessing.Array] = None
+
+    def __init__(self) -> None:
+        self.lock = multiprocessing.Lock()
+        self.started_at = multiprocessing.Value("d", 0.0, lock=False)
+        self.index = multiprocessing.Value("q", -1, lock=False)
+        self.sent = multiprocessing.Value("q", 0, lock=False)
+        self.held_count = multiprocessing.Value("q", 0, lock=False)
+        self.held_size = multiprocessing.Value("q", 0, lock=False)
+        self.held = multiprocessing.Array("c", self.MAX_HELD_SIZE, lock=False)
+
+    def hold(self, messages: List[Any]) -> "Heartbeat":
+        """
+        Tells us the messages the worker holds: the ones it just read -
+        preceded by the ones whose result it did not send yet.
+
+        :param messages:
+            The messages to hold.
+        """
+
+        messages = list(messages)
+        dumped = pickle.dumps(messages, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self.lock:
+            self.started_at.value = 0.0
+            self.index.value = -1
+            self.sent.value = 0
+            self.held_count.value = len(messages)
+
+            if len(dumped) > self.MAX_HELD_SIZE:
+                self.held_size.value = -1
+            else:
+                self.held[: len(dumped)] = dumped
+                self.held_size.value = len(dumped)
+
+        return self
+
+    def beat(self, remaining: int) -> "Heartbeat":
+        """
+        Tells us that the worker started to process one of the held messages.
+
+        :param remaining:
+            The number of held messages which are still to be processed after
+            the current one.
+        """
+
+        with self.lock:
+            self.index.value = remaining
+            self.started_at.value = time.monotonic()
+
+        return self
+
+    def release(self, remaining: int) -> "Heartbeat":
+        """
+        Tells us that the worker sent the result of every held message but
+        the given number of last ones. They don't have to be processed again.
+
+        :param remaining:
+            The number of held messages which are still to be processed.
+        """
+
+        with self.lock:
+            self.sent.value = self.held_count.value - remaining
+
+        return self
+
+    def refresh(self) -> "Heartbeat":
+        """
+        Tells us that the worker is still making progress with its current
+        message. For example, after it waited for its turn.
+        """
+
+        with self.lock:
+            if self.started_at.value:
+                self.started_at.value = time.monotonic()
+
+        return self
+
+    def rest(self) -> "Heartbeat":
+        """
+        Tells us that the worker is done with its current message.
+        """
+
+        with self.lock:
+            self.started_at.value = 0.0
+
+        return self
+
+    def get_busy_time(self) -> float:
+        """
+        Provides the number of seconds the worker spent on its current
+        message. :code:`0` means that the worker is not processing anything.
+        """
+
+        started_at = self.started_at.value
+
+        if not started_at:
+            return 0.0
+
+        return time.monotonic() - started_at
+
+    def stop_if_stalled(
+        self, timeout: float, stop: Callable[[], Any]
+    ) -> Optional[Tuple[Optional[Any], Optional[List[Any]]]]:
+        """
+        Stops the worker - through the given callable - when it spent more
+        than the given number of seconds on its current message.
+
+        .. note::
+            The worker can't beat (nor rest) while we check and stop it.
+            Therefore, what we provide is exactly what the worker left behind:
+            the current message was processed but nothing was produced from
+            it.
+
+        :param timeout:
+            The maximal number of seconds a worker is allowed to spend on a
+            single message.
+        :param stop:
+            The callable to call to stop the worker.
+
+        :return:
+            :py:class:`None` when the worker is not stalled. Otherwise, a tuple:
+            :code:`(current, remaining)` - the message the worker was
+            processing and the ones which have to be processed again: the ones
+            whose result was not sent and the ones it still had to process.
+            Both are :py:class:`None` when we don't know them.
+        """
+
+        if not self.lock.acquire(timeout=self.LOCK_TIMEOUT):
+            return None
+
+        try:
+            if not self.started_at.value or self.get_busy_time() < timeout:
+                return None
+
+            stop()
+
+            if self.held_size.value <= 0:
+                return None, None
+
+            messages = pickle.loads(self.held[: self.held_size.value])
+            current_index = len(messages) - self.index.value - 1
+
+            return messages[current_index], (
+                messages[self.sent.value : current_index]
+                + messages[current_index + 1 :]
+            )
+        finally:
+            self.lock.release()
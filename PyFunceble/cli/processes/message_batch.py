@@ -0,0 +1,303 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the envelope and the batcher we use to send multiple messages at
+once through our queues.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+
+import time
+from typing import Any, List, Optional, Tuple
+
+import PyFunceble.facility
+import PyFunceble.storage
+
+
+class MessageBatch(list):
+    """
+    Provides the envelope we use to send multiple messages at once through
+    our queues.
+
+    Each item of a batch is a :code:`(worker_name, destination_worker, data)`
+    tuple - the same format as a single message.
+    """
+
+
+class MessageBatcher:
+    """
+    Provides a way to accumulate messages until we have enough of them (or
+    until we waited long enough) to send them as a single
+    :py:class:`MessageBatch`.
+
+    :param size:
+        The maximum number of messages to accumulate into a batch.
+    :param timeout:
+        The maximum number of milliseconds a message is allowed to wait into
+        the batch before being sent.
+    """
+
+    STD_SIZE: int = 25
+    STD_TIMEOUT: float = 100.0
+
+    _size: Optional[int] = None
+    _timeout: Optional[float] = None
+
+    messages: Optional[List[Tuple[Optional[str], Optional[str], Any]]] = None
+    started_at: Optional[float] = None
+
+    def __init__(
+        self, size: Optional[int] = None, timeout: Optional[float] = None
+    ) -> None:
+        if size is not None:
+            self.size = size
+        else:
+            self.guess_and_set_size()
+
+        if timeout is not None:
+            self.timeout = timeout
+        else:
+            self.guess_and_set_timeout()
+
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    @property
+    def size(self) -> Optional[int]:
+        """
+        Provides the current state of the :code:`_size` attribute.
+        """
+
+        return self._size
+
+    @size.setter
+    def size(self, value: int) -> None:
+        """
+        Sets the maximum number of messages to accumulate into a batch.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`1`.
+        """
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {int}, {type(value)} given.")
+
+        if value < 1:
+            raise ValueError("<value> should be greater or equal to one.")
+
+        self._size = value
+
+    def set_size(self, value: int) -> "MessageBatcher":
+        """
+        Sets the maximum number of messages to accumulate into a batch.
+
+        :param value:
+            The value to set.
+        """
+
+        self.size = value
+
+        return self
+
+    def guess_and_set_size(self) -> "MessageBatcher":
+        """
+        Try to guess and set the size of our batches.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and isinstance(
+            PyFunceble.storage.CONFIGURATION.cli_testing.batch_size, int
+        ):
+            self.size = PyFunceble.storage.CONFIGURATION.cli_testing.batch_size
+        else:
+            self.size = self.STD_SIZE
+
+        return self
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """
+        Provides the current state of the :code:`_timeout` attribute.
+        """
+
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float) -> None:
+        """
+        Sets the maximum number of milliseconds a message is allowed to wait
+        into the batch.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`float` nor
+            :py:class:`int`.
+        :raise ValueError:
+            When the given :code:`value` is less than :code:`0`.
+        """
+
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise TypeError(f"<value> should be {float}, {type(value)} given.")
+
+        if value < 0:
+            raise ValueError("<value> should be greater or equal to zero.")
+
+        self._timeout = float(value)
+
+    def set_timeout(self, value: float) -> "MessageBatcher":
+        """
+        Sets the maximum number of milliseconds a message is allowed to wait
+        into the batch.
+
+        :param value:
+            The value to set.
+        """
+
+        self.timeout = value
+
+        return self
+
+    def guess_and_set_timeout(self) -> "MessageBatcher":
+        """
+        Try to guess and set the timeout of our batches.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and isinstance(
+            PyFunceble.storage.CONFIGURATION.cli_testing.batch_timeout, (int, float)
+        ):
+            self.timeout = PyFunceble.storage.CONFIGURATION.cli_testing.batch_timeout
+        else:
+            self.timeout = self.STD_TIMEOUT
+
+        return self
+
+    @property
+    def authorized(self) -> bool:
+        """
+        Provides the authorization to batch.
+
+        A batch of a single message is useless, therefore we are only
+        authorized when the size is greater than :code:`1`.
+        """
+
+        return self.size > 1
+
+    def reset(self) -> "MessageBatcher":
+        """
+        Drops all accumulated messages.
+        """
+
+        self.messages = []
+        self.started_at = None
+
+        return self
+
+    def is_full(self) -> bool:
+        """
+        Checks if the batch reached its maximal size.
+        """
+
+        return len(self.messages) >= self.size
+
+    def is_expired(self) -> bool:
+        """
+        Checks if the oldest message of the batch waited long enough.
+        """
+
+        if self.started_at is None:
+            return False
+
+        return (time.monotonic() - self.started_at) * 1000 >= self.timeout
+
+    def add(
+        self, message: Tuple[Optional[str], Optional[str], Any]
+    ) -> Optional[MessageBatch]:
+        """
+        Adds the given message to the batch.
+
+        :param message:
+            The :code:`(worker_name, destination_worker, data)` tuple to add.
+
+        :return:
+            The batch to send when it is full or expired, :py:class:`None`
+            otherwise.
+        """
+
+        if not self.messages:
+            self.started_at = time.monotonic()
+
+        self.messages.append(message)
+
+        if self.is_full() or self.is_expired():
+            return self.flush()
+
+        return None
+
+    def flush(self) -> Optional[MessageBatch]:
+        """
+        Provides the accumulated messages as a batch and starts a new one.
+
+        :return:
+            The batch to send, :py:class:`None` if nothing was accumulated.
+        """
+
+        if not self.messages:
+            return None
+
+        batch = MessageBatch(self.messages)
+        self.reset()
+
+        return batch
@@ -0,0 +1,148 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the adapters which let us read the queues of all our backends the
+same way.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+from typing import Any, Optional
+
+
+class QueueAdapter:
+    """
+    Provides a common way to read the queues of our backends.
+
+    Our queues are only read through their public :code:`get` method - with or
+    without timeout.
+
+    :param target_queue:
+        The queue to read.
+    """
+
+    target_queue: Optional[Any] = None
+
+    def __init__(self, target_queue: Any) -> None:
+        self.target_queue = target_queue
+
+    def get_nowait(self) -> Any:
+        """
+        Reads our queue without blocking.
+
+        :raise queue.Empty:
+            When there is nothing to read - or when someone else is already
+            reading.
+        """
+
+        return self.target_queue.get(block=False)
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        Reads our queue.
+
+        :param timeout:
+            The maximal number of seconds to wait.
+
+        :raise queue.Empty:
+            When there was nothing to read in time.
+        """
+
+        return self.target_queue.get(timeout=timeout)
+
+    def is_drained(self) -> bool:
+        """
+        Checks if everything that was sent through our queue was read.
+
+        .. note::
+            Unlike :code:`empty()`, the size of a :code:`queue` backend also
+            counts what its writers still buffer. Therefore, when it is
+            supported, we rely on it.
+        """
+
+        try:
+            return self.target_queue.qsize() <= 0
+        except (AttributeError, NotImplementedError):
+            return self.target_queue.empty()
+
+    def task_done(self, count: int = 1) -> "QueueAdapter":
+        """
+        Tells our queue that we are done with the given number of messages we
+        read from it.
+
+        Only the queues which keep a message until it is acknowledged care.
+        """
+
+        # pylint: disable=unused-argument
+        return self
+
+
+class AcknowledgedQueueAdapter(QueueAdapter):
+    """
+    Provides the adapter of the queues which keep a message until it is
+    acknowledged: our disk queue and the task queues our coordinator serves to
+    its worker nodes.
+    """
+
+    def task_done(self, count: int = 1) -> "AcknowledgedQueueAdapter":
+        self.target_queue.task_done(count)
+
+        return self
+
+
+def get_queue_adapter(target_queue: Any) -> QueueAdapter:
+    """
+    Provides the adapter of the given queue.
+
+    :param target_queue:
+        The queue to adapt.
+    """
+
+    if getattr(type(target_queue), "ACKNOWLEDGED", False):
+        return AcknowledgedQueueAdapter(target_queue)
+
+    return QueueAdapter(target_queue)
@@ -0,0 +1,183 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the rate limiter shared by our tester workers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+import time
+from typing import Dict, List, Optional
+
+import PyFunceble.facility
+import PyFunceble.storage
+
+
+class RateLimiter:
+    """
+    Provides a set of rate limits shared by all our processes.
+
+    Each limit is a bucket which delivers one token every :code:`1 / rate`
+    seconds. As the schedule of each bucket lives into shared memory, the
+    rate is respected whatever the number of processes (or threads) taking
+    tokens from it.
+
+    :param rates:
+        The maximal number of tokens (per second) of each bucket. A bucket
+        without rate is not limited.
+    """
+
+    SUPPORTED_BUCKETS: List[str] = [
+        "test",
+        "dns",
+        "http_status_code",
+        "netinfo",
+        "whois",
+    ]
+
+    rates: Optional[Dict[str, float]] = None
+    schedules: Optional[Dict[str, multiprocessing.Value]] = None
+
+    waited: Optional[multiprocessing.Value] = None
+    """
+    The total number of seconds spent waiting for our buckets.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, Optional[float]]] = None) -> None:
+        self.rates = dict()
+        self.schedules = dict()
+        self.waited = multiprocessing.Value("d", 0.0)
+
+        if rates is not None:
+            self.set_rates(rates)
+        else:
+            self.guess_and_set_rates()
+
+    def set_rates(self, value: Dict[str, Optional[float]]) -> "RateLimiter":
+        """
+        Sets the rate of our buckets.
+
+        :param value:
+            The rate of each bucket.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`dict` or when one
+            of its rates is not a :py:class:`int` or :py:class:`float`.
+        :raise ValueError:
+            When one of the given rates is not positive.
+        """
+
+        if not isinstance(value, dict):
+            raise TypeError(f"<value> should be {dict}, {type(value)} given.")
+
+        for bucket, rate in value.items():
+            if bucket not in self.SUPPORTED_BUCKETS or rate is None:
+                continue
+
+            if not isinstance(rate, (int, float)) or isinstance(rate, bool):
+                raise TypeError(
+                    f"<rate> ({bucket}) should be {int} or {float}, "
+                    f"{type(rate)} given."
+                )
+
+            if rate <= 0:
+                raise ValueError(f"<rate> ({bucket}) should be positive.")
+
+            self.rates[bucket] = float(rate)
+            self.schedules[bucket] = multiprocessing.Value("d", 0.0)
+
+        return self
+
+    def guess_and_set_rates(self) -> "RateLimiter":
+        """
+        Try to guess and set the rate of our buckets.
+        """
+
+        if not PyFunceble.facility.ConfigLoader.is_already_loaded():
+            return self
+
+        return self.set_rates(
+            dict(PyFunceble.storage.CONFIGURATION.cli_testing.rate_limit)
+        )
+
+    def acquire(self, bucket: str) -> float:
+        """
+        Takes a token from the given bucket. Blocks until it is delivered.
+
+        :param bucket:
+            The bucket to take from.
+
+        :return:
+            The number of seconds we waited.
+        """
+
+        if bucket not in self.rates:
+            return 0.0
+
+        schedule = self.schedules[bucket]
+
+        with schedule.get_lock():
+            now = time.monotonic()
+            # Our schedule never lags behind. Otherwise, an idle period would
+            # end up in a burst.
+            delivered_at = max(schedule.value, now)
+            schedule.value = delivered_at + 1 / self.rates[bucket]
+
+        waited = delivered_at - now
+
+        if waited > 0:
+            PyFunceble.facility.Logger.debug(
+                "Waiting %rs for a token of %r.", waited, bucket
+            )
+
+            time.sleep(waited)
+
+            with self.waited.get_lock():
+                self.waited.value += waited
+
+        return waited
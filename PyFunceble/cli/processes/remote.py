@@ -0,0 +1,861 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides everything needed to spread our tests across multiple hosts.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import collections
+import multiprocessing
+import multiprocessing.managers
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import PyFunceble.cli.facility
+import PyFunceble.cli.factory
+import PyFunceble.facility
+import PyFunceble.storage
+from PyFunceble.cli.processes.message_batch import MessageBatch
+from PyFunceble.cli.processes.tester import TesterProcessesManager
+from PyFunceble.helpers.environment_variable import EnvironmentVariableHelper
+
+AUTHKEY_ENVIRONMENT_VARIABLE: str = "PYFUNCEBLE_COORDINATOR_AUTHKEY"
+
+
+def get_address(value: str) -> Tuple[str, int]:
+    """
+    Provides the address described by the given :code:`HOST:PORT` string.
+
+    :raise ValueError:
+        When the given value is not a valid :code:`HOST:PORT` string.
+    """
+
+    host, _, port = value.rpartition(":")
+
+    if not host or not port.isdigit() or int(port) > 65535:
+        raise ValueError(f"<value> ({value!r}) should be given as HOST:PORT.")
+
+    return host.strip("[]"), int(port)
+
+
+def get_authkey() -> bytes:
+    """
+    Provides the key our coordinator and our worker nodes use to authenticate
+    each other.
+
+    :raise ValueError:
+        When the key is not given.
+    """
+
+    authkey = EnvironmentVariableHelper(AUTHKEY_ENVIRONMENT_VARIABLE).get_value()
+
+    if not authkey:
+        raise ValueError(
+            f"The {AUTHKEY_ENVIRONMENT_VARIABLE!r} environment variable should "
+            "be set (to the same value) on the coordinator and its worker nodes."
+        )
+
+    return authkey.encode()
+
+
+class RemoteQueue:
+    """
+    Exposes one of our (local) queues to our remote worker nodes.
+
+    :param target_queue:
+        The queue to expose.
+    :param on_get:
+        A function to call with every item read through us.
+    """
+
+    EXPOSED: Tuple[str, ...] = ("get", "put", "qsize", "empty")
+
+    def __init__(
+        self, target_queue: Any, *, on_get: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        self.target_queue = target_queue
+        self.on_get = on_get
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Reads our queue.
+        """
+
+        item = self.target_queue.get(block, timeout)
+
+        if self.on_get is not None:
+            self.on_get(item)
+
+        return item
+
+    def put(self, item: Any) -> None:
+        """
+        Writes into our queue.
+        """
+
+        self.target_queue.put(item)
+
+    def qsize(self) -> int:
+        """
+        Provides the size of our queue.
+        """
+
+        return self.target_queue.qsize()
+
+    def empty(self) -> bool:
+        """
+        Checks if our queue is empty.
+        """
+
+        return self.target_queue.empty()
+
+
+class NodeTaskQueue(RemoteQueue):
+    """
+    Exposes our (local) input queue to one of our remote worker nodes.
+
+    Like our disk queue, we keep what was read until it is acknowledged (see
+    :py:meth:`task_done`) so that what an unresponsive node held can be given
+    back to the others.
+
+    .. note::
+        Each (remote) reader talks to us through its own connection which is
+        served by its own thread. That's how we tell our readers apart.
+    """
+
+    EXPOSED: Tuple[str, ...] = RemoteQueue.EXPOSED + ("task_done",)
+
+    def __init__(
+        self, target_queue: Any, *, on_get: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        super().__init__(target_queue, on_get=on_get)
+
+        self.readers = threading.local()
+        self.taken_lock = threading.Lock()
+        self.taken = []
+
+    @property
+    def reader_taken(self) -> Deque[List[Any]]:
+        """
+        Provides what the current reader read but did not acknowledge (yet) -
+        in the order it was read. Each entry holds the item and its number of
+        messages.
+        """
+
+        taken = getattr(self.readers, "taken", None)
+
+        if taken is None:
+            taken = self.readers.taken = collections.deque()
+            self.readers.done = 0
+
+            with self.taken_lock:
+                self.taken.append(taken)
+
+        return taken
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        taken = self.reader_taken
+        item = super().get(block, timeout)
+
+        with self.taken_lock:
+            if isinstance(item, MessageBatch):
+                taken.append([item, len(item)])
+            else:
+                taken.append([item, 1])
+
+        return item
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Acknowledges the given number of messages the current reader read.
+
+        :param count:
+            The number of messages to acknowledge.
+        """
+
+        taken = self.reader_taken
+
+        with self.taken_lock:
+            self.readers.done += count
+
+            while taken and self.readers.done >= taken[0][1]:
+                self.readers.done -= taken.popleft()[1]
+
+    def release_taken(self) -> List[Any]:
+        """
+        Provides (and forgets) everything that was read but never
+        acknowledged.
+        """
+
+        with self.taken_lock:
+            result = [item for taken in self.taken for item, _ in taken]
+
+            for taken in self.taken:
+                taken.clear()
+
+        return result
+
+
+class NodeTaskQueueProxy(multiprocessing.managers.BaseProxy):
+    """
+    Provides the proxy of a :py:class:`NodeTaskQueue`.
+    """
+
+    _exposed_ = NodeTaskQueue.EXPOSED
+
+    ACKNOWLEDGED: bool = True
+    """
+    Tells our workers that what they read has to be acknowledged.
+    """
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Reads the queue.
+        """
+
+        return self._callmethod("get", (block, timeout))
+
+    def put(self, item: Any) -> None:
+        """
+        Writes into the queue.
+        """
+
+        return self._callmethod("put", (item,))
+
+    def qsize(self) -> int:
+        """
+        Provides the size of the queue.
+        """
+
+        return self._callmethod("qsize")
+
+    def empty(self) -> bool:
+        """
+        Checks if the queue is empty.
+        """
+
+        return self._callmethod("empty")
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Acknowledges the given number of messages we read.
+        """
+
+        return self._callmethod("task_done", (count,))
+
+
+class RemoteManager(multiprocessing.managers.BaseManager):
+    """
+    Provides the manager through which our worker nodes talk to our
+    coordinator.
+    """
+
+
+RemoteManager.register("get_coordinator")
+RemoteManager.register("get_tasks", proxytype=NodeTaskQueueProxy)
+RemoteManager.register("get_results")
+
+
+class Coordinator:
+    """
+    Serves the tasks of our tester manager to our remote worker nodes (over
+    TCP) and collects their results into the output queue of our tester
+    manager - which is read by our producer.
+
+    Our (local) tester workers keep working along our worker nodes.
+
+    Our worker nodes have to renew their lease (through :py:meth:`heartbeat`)
+    before it expires. A node whose lease expired is forgotten and what it
+    read but did not acknowledge is given back to our input queue.
+
+    :param tester_manager:
+        The tester manager to serve.
+    :param address:
+        The address to listen to.
+    :param authkey:
+        The key our worker nodes have to give.
+
+    :raise ValueError:
+        When our tester manager can't be served.
+    """
+
+    EXPOSED: Tuple[str, ...] = (
+        "get_configuration",
+        "register_node",
+        "unregister_node",
+        "heartbeat",
+        "get_protocols",
+        "is_closed",
+    )
+
+    NODE_LEASE: float = 30.0
+    """
+    The number of seconds a node is considered alive after its last
+    heartbeat.
+    """
+
+    NODE_CHECK_INTERVAL: float = 1.0
+    """
+    The number of seconds between two checks of the leases of our nodes while
+    we wait for them.
+    """
+
+    tester_manager: Optional[TesterProcessesManager] = None
+    address: Optional[Tuple[str, int]] = None
+    authkey: Optional[bytes] = None
+
+    configuration: Optional[dict] = None
+
+    nodes: Optional[Dict[int, str]] = None
+    node_leases: Optional[Dict[int, float]] = None
+    node_tasks: Optional[Dict[int, NodeTaskQueue]] = None
+    node_condition: Optional[threading.Condition] = None
+    closed: bool = False
+
+    server: Optional[multiprocessing.managers.Server] = None
+    thread: Optional[threading.Thread] = None
+
+    def __init__(
+        self,
+        tester_manager: TesterProcessesManager,
+        address: Tuple[str, int],
+        *,
+        authkey: Optional[bytes] = None,
+    ) -> None:
+        if tester_manager.completion_tracker is not None:
+            # What our worker nodes send and receive is not tracked.
+            raise ValueError("The mining can't be used with remote worker nodes.")
+
+        self.tester_manager = tester_manager
+        self.address = address
+
+        if authkey is not None:
+            self.authkey = authkey
+        else:
+            self.authkey = get_authkey()
+
+        self.configuration = PyFunceble.storage.CONFIGURATION.to_dict()
+
+        self.nodes = dict()
+        self.node_leases = dict()
+        self.node_tasks = dict()
+        self.node_condition = threading.Condition()
+        self.closed = False
+
+    def release_input_slots(self, item: Any) -> None:
+        """
+        Releases the input slots held by the given item. Our worker nodes can't
+        do it themselves.
+        """
+
+        if self.tester_manager.input_slots is None:
+            return None
+
+        if isinstance(item, MessageBatch):
+            messages = item
+        else:
+            messages = [item]
+
+        for _, _, data in messages:
+            if self.tester_manager.WORKER_OBJ.holds_input_slot(data):
+                self.tester_manager.input_slots.release()
+
+        return None
+
+    def acquire_input_slots(self, item: Any) -> None:
+        """
+        Takes back (when possible) the input slots the given item held before
+        it was read by a worker node. Its next reader releases them again.
+        """
+
+        if self.tester_manager.input_slots is None:
+            return None
+
+        if isinstance(item, MessageBatch):
+            messages = item
+        else:
+            messages = [item]
+
+        for _, _, data in messages:
+            if self.tester_manager.WORKER_OBJ.holds_input_slot(data):
+                # We never wait for the others: the high water mark may be
+                # exceeded for a while.
+                # pylint: disable=consider-using-with
+                self.tester_manager.input_slots.acquire(block=False)
+
+        return None
+
+    def get_node_tasks(self, node_id: int) -> NodeTaskQueue:
+        """
+        Provides the task queue of the given worker node.
+
+        :param node_id:
+            The ID of the node.
+
+        :raise ValueError:
+            When the given node is unknown.
+        """
+
+        with self.node_condition:
+            try:
+                return self.node_tasks[node_id]
+            except KeyError as exception:
+                raise ValueError(f"<node_id> ({node_id!r}) is unknown.") from exception
+
+    def new_manager(self) -> RemoteManager:
+        """
+        Provides a new manager serving our queues and ourself.
+        """
+
+        result_queue = RemoteQueue(self.tester_manager.output_queue[0])
+
+        # Our registrations are ours. Not the ones of every manager.
+        manager_class = type("CoordinatorManager", (RemoteManager,), {})
+        manager_class.register(
+            "get_coordinator", callable=lambda: self, exposed=self.EXPOSED
+        )
+        manager_class.register(
+            "get_tasks",
+            callable=self.get_node_tasks,
+            exposed=NodeTaskQueue.EXPOSED,
+            proxytype=NodeTaskQueueProxy,
+        )
+        manager_class.register(
+            "get_results", callable=lambda: result_queue, exposed=RemoteQueue.EXPOSED
+        )
+
+        return manager_class(address=self.address, authkey=self.authkey)
+
+    def start(self) -> "Coordinator":
+        """
+        Starts to serve our worker nodes.
+        """
+
+        self.server = self.new_manager().get_server()
+        # Useful when we were asked to listen to any (free) port.
+        self.address = self.server.address
+
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="pyfunceble_coordinator"
+        )
+        self.thread.daemon = True
+        self.thread.start()
+
+        PyFunceble.facility.Logger.info("Coordinator listening on %r.", self.address)
+
+        return self
+
+    def stop(self) -> "Coordinator":
+        """
+        Stops to serve our worker nodes.
+        """
+
+        if self.server is not None:
+            self.server.stop_event.set()
+            self.server.listener.close()
+
+        return self
+
+    def get_configuration(self) -> dict:
+        """
+        Provides the configuration our worker nodes have to apply.
+        """
+
+        return self.configuration
+
+    def register_node(self, name: str) -> Optional[int]:
+        """
+        Registers a new worker node.
+
+        :param name:
+            The name of the node.
+
+        :return:
+            The ID of the node or :py:class:`None` when we don't accept new
+            nodes anymore.
+        """
+
+        with self.node_condition:
+            if self.closed:
+                return None
+
+            node_id = len(self.nodes) + 1
+
+            while node_id in self.nodes:
+                node_id += 1
+
+            self.nodes[node_id] = name
+            self.node_leases[node_id] = time.monotonic() + self.NODE_LEASE
+            self.node_tasks[node_id] = NodeTaskQueue(
+                self.tester_manager.input_queue, on_get=self.release_input_slots
+            )
+
+        PyFunceble.facility.Logger.info("Registered node %r (%r).", node_id, name)
+
+        return node_id
+
+    def unregister_node(self, node_id: int) -> None:
+        """
+        Unregisters the given worker node. A node does it once its last result
+        was sent.
+
+        :param node_id:
+            The ID of the node.
+        """
+
+        with self.node_condition:
+            name = self.nodes.pop(node_id, None)
+            self.node_leases.pop(node_id, None)
+            self.node_tasks.pop(node_id, None)
+            self.node_condition.notify_all()
+
+        PyFunceble.facility.Logger.info("Unregistered node %r (%r).", node_id, name)
+
+    def heartbeat(self, node_id: int) -> bool:
+        """
+        Renews the lease of the given worker node.
+
+        :param node_id:
+            The ID of the node.
+
+        :return:
+            :py:class:`False` when the node is unknown - e.g. because its lease
+            already expired.
+        """
+
+        with self.node_condition:
+            if node_id not in self.nodes:
+                return False
+
+            self.node_leases[node_id] = time.monotonic() + self.NODE_LEASE
+
+        return True
+
+    def expire_nodes(self) -> List[int]:
+        """
+        Forgets the worker nodes whose lease expired and gives back to our
+        input queue what they read but did not acknowledge.
+
+        .. note::
+            As a node may have died while sending a result, what we give back
+            may be tested twice.
+
+        :return:
+            The IDs of the forgotten nodes.
+        """
+
+        now = time.monotonic()
+        expired = []
+
+        with self.node_condition:
+            for node_id, expires_at in list(self.node_leases.items()):
+                if expires_at > now:
+                    continue
+
+                name = self.nodes.pop(node_id, None)
+                del self.node_leases[node_id]
+                released = self.node_tasks.pop(node_id).release_taken()
+
+                for item in released:
+                    self.acquire_input_slots(item)
+                    self.tester_manager.input_queue.put(item)
+
+                PyFunceble.facility.Logger.critical(
+                    "Node %r (%r) did not renew its lease in %rs. Forgot it and "
+                    "gave back the %r message(s) it did not acknowledge.",
+                    node_id,
+                    name,
+                    self.NODE_LEASE,
+                    sum(len(x) if isinstance(x, MessageBatch) else 1 for x in released),
+                )
+
+                expired.append(node_id)
+
+            if expired:
+                self.node_condition.notify_all()
+
+        return expired
+
+    def get_protocols(self, start: int, timeout: Optional[float] = None) -> List[dict]:
+        """
+        Provides the protocols registered from the given ID - once there is at
+        least one of them or once we are closed.
+
+        :param start:
+            The ID of the first protocol to provide.
+        :param timeout:
+            The maximal number of seconds to wait.
+        """
+
+        protocols = self.tester_manager.protocols
+
+        with self.tester_manager.protocol_condition:
+            self.tester_manager.protocol_condition.wait_for(
+                lambda: len(protocols) > start or self.closed, timeout
+            )
+
+            return [protocols[x] for x in range(start, len(protocols))]
+
+    def is_closed(self) -> bool:
+        """
+        Checks if we are closed: no task will be added anymore.
+        """
+
+        return self.closed
+
+    def close(self) -> "Coordinator":
+        """
+        Tells our worker nodes that no task will be added anymore. They stop
+        once there is nothing left to test.
+
+        .. warning::
+            Everything should be sent to our tester manager first.
+        """
+
+        with self.node_condition:
+            self.closed = True
+
+        with self.tester_manager.protocol_condition:
+            self.tester_manager.protocol_condition.notify_all()
+
+        return self
+
+    def wait_for_nodes(self) -> "Coordinator":
+        """
+        Waits until all our worker nodes are done - or forgotten because their
+        lease expired.
+
+        .. warning::
+            What a forgotten node held is given back to our input queue.
+            Therefore, our (local) tester workers should still be reading it.
+        """
+
+        waiting_for = None
+
+        with self.node_condition:
+            while self.nodes:
+                if waiting_for != self.nodes:
+                    waiting_for = dict(self.nodes)
+
+                    PyFunceble.facility.Logger.info(
+                        "Waiting for the worker nodes: %r.", waiting_for
+                    )
+
+                self.node_condition.wait(self.NODE_CHECK_INTERVAL)
+                self.expire_nodes()
+
+        return self
+
+
+class WorkerNode:
+    """
+    Runs a stack of tester workers for a remote coordinator.
+
+    :param address:
+        The address of the coordinator.
+    :param authkey:
+        The key to give to the coordinator.
+    :param max_workers:
+        The number of tester workers to run. If not given, the configuration
+        of the coordinator is followed.
+    """
+
+    SYNC_WAIT_TIME: float = 1.0
+
+    HEARTBEAT_INTERVAL: float = 5.0
+    """
+    The number of seconds between two renewals of our lease. It should be
+    (way) lower than the lease of our coordinator.
+    """
+
+    address: Optional[Tuple[str, int]] = None
+    authkey: Optional[bytes] = None
+    max_workers: Optional[int] = None
+    name: Optional[str] = None
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        *,
+        authkey: Optional[bytes] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.address = address
+
+        if authkey is not None:
+            self.authkey = authkey
+        else:
+            self.authkey = get_authkey()
+
+        self.max_workers = max_workers
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+
+    def new_tester_manager(
+        self, manager: RemoteManager, node_id: int
+    ) -> TesterProcessesManager:
+        """
+        Provides a tester manager reading the tasks of our coordinator and
+        sending the results back to it.
+
+        :param manager:
+            The manager connected to our coordinator.
+        :param node_id:
+            The ID our coordinator gave us.
+        """
+
+        return TesterProcessesManager(
+            max_worker=self.max_workers
+            or PyFunceble.storage.CONFIGURATION.cli_testing.max_workers,
+            daemon=True,
+            input_queue=manager.get_tasks(node_id),
+            output_queue=manager.get_results(),
+            # Our coordinator decides when its producer stops.
+            output_workers_count=0,
+            # Our coordinator releases the input slots itself.
+            high_water_mark=0,
+        )
+
+    def sync_protocols(
+        self, coordinator: Any, tester_manager: TesterProcessesManager
+    ) -> "WorkerNode":
+        """
+        Registers the protocols our coordinator registered since our last
+        synchronization. As both sides register them in the same order, they
+        get the same IDs.
+        """
+
+        for protocol in coordinator.get_protocols(
+            len(tester_manager.protocols), self.SYNC_WAIT_TIME
+        ):
+            tester_manager.register_protocol(protocol)
+
+        return self
+
+    def beat(self, coordinator: Any, node_id: int, stop_event: threading.Event) -> None:
+        """
+        Renews our lease every :code:`HEARTBEAT_INTERVAL` seconds until the
+        given event is set.
+
+        .. warning::
+            This should be executed from its own thread.
+        """
+
+        while not stop_event.wait(self.HEARTBEAT_INTERVAL):
+            try:
+                known = coordinator.heartbeat(node_id)
+            except (OSError, EOFError):
+                PyFunceble.facility.Logger.exception("Could not renew our lease.")
+                continue
+
+            if not known:
+                PyFunceble.facility.Logger.critical(
+                    "Our coordinator forgot us (node %r): what we held was "
+                    "given to others.",
+                    node_id,
+                )
+                break
+
+    def start(self) -> "WorkerNode":
+        """
+        Connects to our coordinator and tests its tasks until there is nothing
+        left to test.
+        """
+
+        # Our workers connect to our coordinator too.
+        multiprocessing.current_process().authkey = self.authkey
+
+        manager = RemoteManager(address=self.address, authkey=self.authkey)
+        manager.connect()
+
+        coordinator = manager.get_coordinator()
+
+        PyFunceble.facility.ConfigLoader.set_custom_config(
+            coordinator.get_configuration()
+        ).start()
+        PyFunceble.cli.facility.CredentialLoader.start()
+        PyFunceble.cli.factory.DBSession.init_db_sessions()
+
+        node_id = coordinator.register_node(self.name)
+
+        if node_id is None:
+            PyFunceble.facility.Logger.info("Coordinator closed. Nothing to do.")
+            return self
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self.beat,
+            args=(coordinator, node_id, stop_heartbeat),
+            name="pyfunceble_node_heartbeat",
+        )
+        heartbeat.daemon = True
+        heartbeat.start()
+
+        try:
+            tester_manager = self.new_tester_manager(manager, node_id)
+            tester_manager.start()
+
+            while True:
+                closed = coordinator.is_closed()
+                self.sync_protocols(coordinator, tester_manager)
+
+                if closed:
+                    break
+
+            # Our workers stop once the queue of our coordinator is drained.
+            tester_manager.send_stop_signal(worker_name=self.name)
+            tester_manager.wait()
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+
+            coordinator.unregister_node(node_id)
+
+        return self
@@ -0,0 +1,110 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the compact record we send to our tester workers for each
+subject to test.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+
+from typing import Optional
+
+
+class Task:
+    """
+    Provides a compact record of a subject to test.
+
+    Everything which is common to all subjects of a file (or of an argument)
+    lives in a protocol which is registered once per worker. Therefore, a task
+    only carries the ID of its protocol and the subject itself.
+
+    :param protocol_id:
+        The ID of the (registered) protocol of the subject.
+    :param subject:
+        The subject to test.
+    :param idna_subject:
+        The IDNA formatted subject to test.
+    """
+
+    __slots__ = ("protocol_id", "subject", "idna_subject")
+
+    def __init__(
+        self, protocol_id: int, subject: str, idna_subject: Optional[str] = None
+    ) -> None:
+        self.protocol_id = protocol_id
+        self.subject = subject
+
+        if idna_subject is not None:
+            self.idna_subject = idna_subject
+        else:
+            self.idna_subject = subject
+
+    def __reduce__(self):
+        # Keeps our pickle as small as possible.
+        return (Task, (self.protocol_id, self.subject, self.idna_subject))
+
+    def __repr__(self) -> str:
+        return (
+            f"Task(protocol_id={self.protocol_id!r}, subject={self.subject!r}, "
+            f"idna_subject={self.idna_subject!r})"
+        )
+
+    def to_dict(self, protocol: dict) -> dict:
+        """
+        Provides the dataset (the one our workers used to get) of the current
+        task.
+
+        :param protocol:
+            The protocol the current task is attached to.
+        """
+
+        result = dict(protocol)
+        result["subject"] = self.subject
+        result["idna_subject"] = self.idna_subject
+
+        return result
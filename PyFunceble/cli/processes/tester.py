@@ -50,13 +50,580 @@ License:
     limitations under the License.
 """
 
+import datetime
+import multiprocessing
+import queue
+import threading
+from typing import Any, Dict, Optional
+
+import PyFunceble.facility
+import PyFunceble.storage
+from PyFunceble.checker.availability.base import AvailabilityCheckerBase
+from PyFunceble.cli.processes.autoscaler import Autoscaler, get_rss
 from PyFunceble.cli.processes.base import ProcessesManagerBase
+from PyFunceble.cli.processes.disk_queue import DiskQueue
+from PyFunceble.cli.processes.rate_limiter import RateLimiter
+from PyFunceble.cli.processes.task import Task
 from PyFunceble.cli.processes.workers.tester import TesterWorker
+from PyFunceble.cli.processes.workers.thread_tester import ThreadTesterWorker
 
 
 class TesterProcessesManager(ProcessesManagerBase):
     """
     Provides the tester manager.
+
+    :param engine:
+        The engine (type of worker) to use.
+    :param autoscale:
+        Whether we are allowed to grow and shrink our pool of workers while
+        running.
+    :param high_water_mark:
+        The maximum number of subjects (sent through :py:meth:`add_to_input_queue`)
+        allowed to wait for our workers. When reached, we block until our
+        workers consumed some of them.
+    :param rate_limiter:
+        The rate limiter to share between our workers.
+    :param max_tasks_per_worker:
+        The number of tests after which a worker is replaced by a fresh one.
+    :param max_rss_per_worker:
+        The RSS (in bytes) from which a worker is replaced by a fresh one.
+
+    .. note::
+        The subject a worker stalled on (see :code:`stall_timeout`) is
+        reported as :code:`INACTIVE` - with :code:`TIMEOUT` as source. As our
+        :code:`thread` engine tests multiple subjects at once, we can't tell
+        which one is responsible. Therefore, the stalls are only watched with
+        our :code:`standard` engine.
+
+    .. note::
+        When our input queue is a
+        :py:class:`~PyFunceble.cli.processes.disk_queue.DiskQueue`, our
+        protocols are saved into it. That way, what was left into it by a
+        previous run can still be tested.
+    """
+
+    # Our workers mostly wait for the network. Therefore, there is no reason
+    # to keep cores free for them.
+    STD_MAX_WORKER: int = max(ProcessesManagerBase.CPU_COUNT, 2)
+
+    STD_ENGINE: str = "standard"
+    SUPPORTED_ENGINES: Dict[str, TesterWorker] = {
+        "standard": TesterWorker,
+        "thread": ThreadTesterWorker,
+    }
+
+    SLOT_WAIT_TIME: float = 1.0
+
+    RECYCLE_INTERVAL: float = 1.0
+    """
+    The number of seconds between two checks of the limits of our workers.
     """
 
     WORKER_OBJ: TesterWorker = TesterWorker
+
+    _engine: Optional[str] = None
+
+    autoscaler: Optional[Autoscaler] = None
+    scaling_lock: Optional[threading.Lock] = None
+    stop_signal_sent: bool = False
+
+    input_slots: Optional[multiprocessing.Semaphore] = None
+
+    rate_limiter: Optional[RateLimiter] = None
+    """
+    The rate limiter shared by all our workers. Not set when nothing is
+    limited.
+    """
+
+    protocols: Optional[Dict[int, dict]] = None
+    """
+    The protocols we registered (and shared with our workers).
+    """
+
+    protocol_condition: Optional[threading.Condition] = None
+    """
+    Notified everytime we register a protocol.
+    """
+
+    max_tasks_per_worker: Optional[int] = None
+    max_rss_per_worker: Optional[int] = None
+
+    recycler: Optional[threading.Thread] = None
+    recycler_stop_event: Optional[threading.Event] = None
+
+    def __init__(
+        self,
+        *args,
+        engine: Optional[str] = None,
+        autoscale: Optional[bool] = None,
+        high_water_mark: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_tasks_per_worker: Optional[int] = None,
+        max_rss_per_worker: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        if engine is not None:
+            self.engine = engine
+        else:
+            self.guess_and_set_engine()
+
+        super().__init__(*args, **kwargs)
+
+        self.scaling_lock = threading.Lock()
+        self.stop_signal_sent = False
+
+        if isinstance(self.input_queue, DiskQueue):
+            self.protocols = self.input_queue.get_meta("protocols", dict())
+        else:
+            self.protocols = dict()
+
+        self.protocol_condition = threading.Condition(self.scaling_lock)
+
+        if autoscale is None:
+            autoscale = self.guess_autoscale()
+
+        if autoscale:
+            self.autoscaler = self.new_autoscaler()
+
+        if isinstance(self.input_queue, DiskQueue):
+            # Whatever waits for our workers is on disk. There is no need to
+            # bound it.
+            high_water_mark = 0
+        elif (
+            high_water_mark is None
+            and PyFunceble.facility.ConfigLoader.is_already_loaded()
+        ):
+            high_water_mark = (
+                PyFunceble.storage.CONFIGURATION.cli_testing.high_water_mark
+            )
+
+        if high_water_mark:
+            self.input_slots = multiprocessing.Semaphore(high_water_mark)
+
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+
+        if rate_limiter.rates:
+            self.rate_limiter = rate_limiter
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            if max_tasks_per_worker is None:
+                max_tasks_per_worker = (
+                    PyFunceble.storage.CONFIGURATION.cli_testing.max_tasks_per_worker
+                )
+
+            if (
+                max_rss_per_worker is None
+                and PyFunceble.storage.CONFIGURATION.cli_testing.max_rss_per_worker
+            ):
+                max_rss_per_worker = (
+                    PyFunceble.storage.CONFIGURATION.cli_testing.max_rss_per_worker
+                    * 1024
+                    * 1024
+                )
+
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_rss_per_worker = max_rss_per_worker
+
+        if (
+            self.stall_timeout is None
+            and PyFunceble.facility.ConfigLoader.is_already_loaded()
+            and PyFunceble.storage.CONFIGURATION.cli_testing.stall_timeout
+        ):
+            self.stall_timeout = float(
+                PyFunceble.storage.CONFIGURATION.cli_testing.stall_timeout
+            )
+
+        if self.stall_timeout and self.engine != "standard":
+            PyFunceble.facility.Logger.info(
+                "Not watching stalls: unsupported by the %r engine.", self.engine
+            )
+            self.stall_timeout = None
+
+    @staticmethod
+    def guess_autoscale() -> bool:
+        """
+        Try to guess whether we are allowed to autoscale.
+        """
+
+        if not PyFunceble.facility.ConfigLoader.is_already_loaded() or not bool(
+            PyFunceble.storage.CONFIGURATION.cli_testing.autoscale
+        ):
+            return False
+
+        if PyFunceble.storage.CONFIGURATION.cli_testing.mining:
+            # Our miner sends one stop message per tester worker. It has to
+            # know how many of them there are.
+            PyFunceble.facility.Logger.info(
+                "Autoscaling deactivated because of the mining."
+            )
+            return False
+
+        return True
+
+    def new_autoscaler(self) -> Autoscaler:
+        """
+        Provides a new autoscaler (based on the configuration) for our pool of
+        workers.
+        """
+
+        max_workers = max_rss = None
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            max_workers = (
+                PyFunceble.storage.CONFIGURATION.cli_testing.autoscale_max_workers
+            )
+
+            if PyFunceble.storage.CONFIGURATION.cli_testing.max_rss:
+                max_rss = (
+                    PyFunceble.storage.CONFIGURATION.cli_testing.max_rss * 1024 * 1024
+                )
+
+        if not max_workers:
+            max_workers = self.max_worker * 4
+
+        return Autoscaler(
+            self, max_workers=max(max_workers, self.max_worker), max_rss=max_rss
+        )
+
+    def generate_protocol_queue(self) -> queue.Queue:
+        """
+        Provides a new queue to share our protocols with a worker.
+        """
+
+        return self.generate_queue()
+
+    def new_worker(self, name: str) -> TesterWorker:
+        worker = super().new_worker(name)
+        worker.input_slots = self.input_slots
+        worker.rate_limiter = self.rate_limiter
+        worker.protocol_queue = self.generate_protocol_queue()
+
+        # A worker created while running has to know what was already
+        # registered.
+        for protocol_id, protocol in self.protocols.items():
+            worker.protocol_queue.put((protocol_id, protocol))
+
+        return worker
+
+    @ProcessesManagerBase.create_workers_if_missing
+    def register_protocol(self, protocol: dict) -> int:
+        """
+        Registers the given protocol and shares it with all our workers.
+
+        :param protocol:
+            The protocol to register.
+
+        :return:
+            The ID to give to the tasks of the given protocol.
+        """
+
+        with self.scaling_lock:
+            protocol_id = len(self.protocols)
+            self.protocols[protocol_id] = dict(protocol)
+
+            if isinstance(self.input_queue, DiskQueue):
+                self.input_queue.set_meta("protocols", self.protocols)
+
+            for worker in self._created_workers:
+                if worker.exitcode is None:
+                    worker.protocol_queue.put(
+                        (protocol_id, self.protocols[protocol_id])
+                    )
+
+            self.protocol_condition.notify_all()
+
+        PyFunceble.facility.Logger.debug(
+            "Registered protocol %r:\n%r", protocol_id, self.protocols[protocol_id]
+        )
+
+        return protocol_id
+
+    def add_to_input_queue(
+        self, data: Any, *, worker_name: Optional[str] = None
+    ) -> "TesterProcessesManager":
+        if self.input_slots is not None and self.WORKER_OBJ.holds_input_slot(data):
+            self.acquire_input_slot()
+
+        return super().add_to_input_queue(data, worker_name=worker_name)
+
+    def acquire_input_slot(self) -> "TesterProcessesManager":
+        """
+        Waits until our input queue is below its high-water mark, then takes
+        a slot.
+        """
+
+        if self.input_slots.acquire(block=False):  # pylint: disable=consider-using-with
+            return self
+
+        # What we accumulated has to reach our workers. Otherwise, we would
+        # wait for subjects we did not even send.
+        self.flush_input_batch()
+
+        PyFunceble.facility.Logger.debug("High-water mark reached. Waiting.")
+
+        while not self.input_slots.acquire(  # pylint: disable=consider-using-with
+            timeout=self.SLOT_WAIT_TIME
+        ):
+            if not self.is_running():
+                # Nobody is left to free a slot. Any error is raised once we
+                # wait for our workers.
+                PyFunceble.facility.Logger.info(
+                    "No worker running anymore. Stop bounding the input queue."
+                )
+                self.input_slots = None
+                break
+
+        return self
+
+    def start(self) -> "TesterProcessesManager":
+        super().start()
+
+        if self.autoscaler is not None and self.autoscaler.thread is None:
+            self.autoscaler.start()
+
+        if (
+            self.max_tasks_per_worker or self.max_rss_per_worker
+        ) and self.recycler is None:
+            self.recycler_stop_event = threading.Event()
+            self.recycler = threading.Thread(
+                target=self.run_recycler, name="pyfunceble_recycler", daemon=True
+            )
+            self.recycler.start()
+
+        return self
+
+    def stop_recycler(self) -> "TesterProcessesManager":
+        """
+        Stops the thread which recycles our workers - if any.
+        """
+
+        if self.recycler is not None:
+            self.recycler_stop_event.set()
+
+            if self.recycler is not threading.current_thread():
+                self.recycler.join()
+
+            self.recycler = None
+
+        return self
+
+    def run_recycler(self) -> None:
+        """
+        Checks the limits of our workers every :code:`RECYCLE_INTERVAL` seconds
+        until we are stopped.
+        """
+
+        while not self.recycler_stop_event.wait(self.RECYCLE_INTERVAL):
+            try:
+                self.recycle_workers()
+            except Exception:  # pylint: disable=broad-except
+                PyFunceble.facility.Logger.exception("Could not recycle.")
+
+    def recycle_workers(self) -> "TesterProcessesManager":
+        """
+        Replaces the workers which reached their number of tests or their RSS
+        by fresh ones.
+
+        .. note::
+            The first worker is never recycled, because it is the one we use
+            to send our messages.
+        """
+
+        for worker in self.get_active_workers():
+            if worker is self._running_workers[0]:
+                continue
+
+            tests = int(worker.stats.snapshot()[worker.stats.TESTS])
+
+            if self.max_tasks_per_worker and tests >= self.max_tasks_per_worker:
+                self.recycle_worker(worker, reason=f"{tests} tests")
+                continue
+
+            if self.max_rss_per_worker and tests:
+                # A worker which did not test anything yet is kept. Otherwise,
+                # a cap below the RSS of a fresh worker would have us replace
+                # our workers forever.
+                rss = get_rss(worker.pid)
+
+                if rss is not None and rss >= self.max_rss_per_worker:
+                    self.recycle_worker(worker, reason=f"RSS of {rss} bytes")
+
+        return self
+
+    def handle_stalled_message(
+        self, worker: TesterWorker, message: Any
+    ) -> "TesterProcessesManager":
+        """
+        Reports the subject a (killed) worker stalled on as :code:`INACTIVE` -
+        with :code:`TIMEOUT` as source.
+        """
+
+        consumed = message[-1]
+
+        if isinstance(consumed, Task):
+            consumed = consumed.to_dict(self.protocols[consumed.protocol_id])
+
+        if (
+            not isinstance(consumed, dict)
+            or consumed.get("checker_type") != "AVAILABILITY"
+        ):
+            return super().handle_stalled_message(worker, message)
+
+        # Just for human brain.
+        test_dataset = consumed
+
+        # The parent side of a worker never tests anything. Therefore, we can
+        # safely borrow its testing objects.
+        testing_object = worker.new_testing_object(
+            test_dataset["subject_type"], test_dataset["checker_type"]
+        )
+
+        if not isinstance(testing_object, AvailabilityCheckerBase):
+            return super().handle_stalled_message(worker, message)
+
+        # We don't want to query (again) the status. Hence, no get_status().
+        status = testing_object.set_subject(test_dataset["idna_subject"]).status
+        status.status = PyFunceble.storage.STATUS.down
+        status.status_source = "TIMEOUT"
+        status.tested_at = datetime.datetime.utcnow()
+
+        PyFunceble.facility.Logger.info(
+            "Reporting %r as %r: %r stalled on it.",
+            test_dataset["idna_subject"],
+            status.status,
+            worker.name,
+        )
+
+        if self.output_queue is not None:
+            if self.completion_tracker is not None:
+                self.completion_tracker.add(len(self.output_queue))
+
+            for output_queue in self.output_queue:
+                output_queue.put((worker.name, None, (test_dataset, status)))
+
+        if self.completion_tracker is not None:
+            self.completion_tracker.done()
+
+        return self
+
+    def add_worker(self) -> TesterWorker:
+        with self.scaling_lock:
+            worker = super().add_worker()
+
+            if self.stop_signal_sent:
+                # The stop signal was shared before the worker existed.
+                worker.add_to_input_queue(
+                    "stop", worker_name="main", destination_worker=worker.name
+                )
+
+            return worker
+
+    def send_stop_signal(
+        self, *, worker_name: Optional[str] = None
+    ) -> "TesterProcessesManager":
+        with self.scaling_lock:
+            self.stop_signal_sent = True
+
+            self.prune_workers()
+
+            return super().send_stop_signal(worker_name=worker_name)
+
+    def wait(self) -> "TesterProcessesManager":
+        if self.autoscaler is not None or self.recycler is not None:
+            # Our pool of workers may still change while the (remaining) tests
+            # are processed. Therefore, we keep an eye on it until it's empty.
+            while True:
+                running_workers = [x for x in self._running_workers if x.is_alive()]
+
+                if not running_workers:
+                    break
+
+                running_workers[0].join(self.RECYCLE_INTERVAL)
+
+            if self.autoscaler is not None:
+                self.autoscaler.stop()
+
+            self.stop_recycler()
+
+        return super().wait()
+
+    def terminate(self) -> "TesterProcessesManager":
+        self.stop_recycler()
+
+        if self.autoscaler is not None:
+            self.autoscaler.stop()
+
+        super().terminate()
+
+        for worker in self._created_workers:
+            if hasattr(worker.protocol_queue, "cancel_join_thread"):
+                # Nobody will read what is left.
+                worker.protocol_queue.cancel_join_thread()
+
+        return self
+
+    @property
+    def engine(self) -> Optional[str]:
+        """
+        Provides the current state of the :code:`_engine` attribute.
+        """
+
+        return self._engine
+
+    @engine.setter
+    def engine(self, value: str) -> None:
+        """
+        Sets the engine to use.
+
+        Side Effect:
+            Also updates the worker object to use.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`str`.
+        :raise ValueError:
+            When the given :code:`value` is unknown or unsupported.
+        """
+
+        if not isinstance(value, str):
+            raise TypeError(f"<value> should be {str}, {type(value)} given.")
+
+        value = value.lower()
+
+        if value not in self.SUPPORTED_ENGINES:
+            raise ValueError(
+                f"<value> ({value!r}) is unknown or unsupported "
+                f"(supported: {list(self.SUPPORTED_ENGINES)!r})."
+            )
+
+        self._engine = value
+        self.WORKER_OBJ = self.SUPPORTED_ENGINES[value]
+
+    def set_engine(self, value: str) -> "TesterProcessesManager":
+        """
+        Sets the engine to use.
+
+        :param value:
+            The value to set.
+        """
+
+        self.engine = value
+
+        return self
+
+    def guess_and_set_engine(self) -> "TesterProcessesManager":
+        """
+        Try to guess and set the engine to use.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and isinstance(
+            PyFunceble.storage.CONFIGURATION.cli_testing.tester_engine, str
+        ):
+            self.engine = PyFunceble.storage.CONFIGURATION.cli_testing.tester_engine
+        else:
+            self.engine = self.STD_ENGINE
+
+        return self
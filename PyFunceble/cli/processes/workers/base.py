@@ -50,19 +50,22 @@ License:
     limitations under the License.
 """
 
+import collections
 import multiprocessing
 import multiprocessing.connection
 import queue
-import time
 import traceback
-from datetime import datetime, timedelta
-from typing import Any, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import PyFunceble.cli.facility
 import PyFunceble.cli.factory
 import PyFunceble.facility
 import PyFunceble.sessions
 from PyFunceble.cli.continuous_integration.base import ContinuousIntegrationBase
+from PyFunceble.cli.processes.completion import CompletionTracker
+from PyFunceble.cli.processes.heartbeat import Heartbeat
+from PyFunceble.cli.processes.message_batch import MessageBatch, MessageBatcher
+from PyFunceble.cli.processes.queue_adapter import QueueAdapter, get_queue_adapter
 
 
 class WorkerBase(multiprocessing.Process):
@@ -77,23 +80,78 @@ class WorkerBase(multiprocessing.Process):
 
     STD_NAME: str = "pyfunceble_base_worker"
 
-    MINING_WAIT_TIME: int = 10
-    BREAKOFF: float = 0.5
+    INPUT_WAIT_TIME: float = 0.1
+
+    ACKNOWLEDGE_AFTER_TARGET: bool = True
+    """
+    Whether the messages we read are acknowledged (see :py:meth:`acknowledge`)
+    as soon as our target returns. A worker which processes them in the
+    background has to acknowledge them by itself.
+    """
 
     input_queue: Optional[queue.Queue] = None
     output_queue: Optional[queue.Queue] = None
 
+    control_queue: Optional[multiprocessing.Queue] = None
+    """
+    Our private queue. The messages addressed to us (e.g. :code:`stop`) are
+    given through this one - never through the (shared) input queue.
+    """
+
+    concurrent_control_queues: Optional[Dict[str, multiprocessing.Queue]] = None
+
     continuous_integration: ContinuousIntegrationBase = None
 
     global_exit_event: Optional[multiprocessing.Event] = None
     exit_it: Optional[multiprocessing.Event] = None
+    retire_it: Optional[multiprocessing.Event] = None
+    recycle_it: Optional[multiprocessing.Event] = None
 
     send_stop_message: Optional[bool] = None
-    accept_waiting_delay: Optional[bool] = None
+
+    completion_tracker: Optional[CompletionTracker] = None
+    """
+    The tracker of the work in flight through our pipeline - if any.
+    """
+
+    heartbeat: Optional[Heartbeat] = None
+    """
+    Our heartbeat - if our manager keeps an eye on us.
+    """
 
     concurrent_worker_names: Optional[List[str]] = None
+
+    input_batcher: Optional[MessageBatcher] = None
+    output_batcher: Optional[MessageBatcher] = None
+
     db_session: Optional[PyFunceble.cli.factory.db_session] = None
 
+    _pending_acknowledgements: int = 0
+    """
+    The number of messages we are done with but which can't be acknowledged
+    before our output batch is sent.
+    """
+
+    _pending_completions: int = 0
+    """
+    The number of messages we are done with but which can't be marked as done
+    before our output batch is sent.
+    """
+
+    _pending_messages: Optional[Deque[Tuple[Optional[str], Optional[str], Any]]] = None
+    """
+    The messages we read but did not process yet.
+    """
+
+    _unsent_messages: Optional[Deque[Tuple[Optional[str], Optional[str], Any]]] = None
+    """
+    The messages we processed but whose result still waits into our output
+    batch. They are given back (through our heartbeat) when we stall.
+    """
+
+    _input_queue_adapter: Optional[QueueAdapter] = None
+    _control_queue_adapter: Optional[QueueAdapter] = None
+
     _parent_connection: Optional[multiprocessing.connection.Connection] = None
     _child_connection: Optional[multiprocessing.connection.Connection] = None
     _exception: Optional[multiprocessing.Pipe] = None
@@ -112,18 +170,24 @@ class WorkerBase(multiprocessing.Process):
         self.configuration = configuration
         self.input_queue = input_queue
         self.output_queue = output_queue
+        self.control_queue = multiprocessing.Queue()
 
         self.continuous_integration = continuous_integration
 
         self.global_exit_event = global_exit_event
         self.exit_it = multiprocessing.Event()
+        self.retire_it = multiprocessing.Event()
+        self.recycle_it = multiprocessing.Event()
 
         self._parent_connection, self._child_connection = multiprocessing.Pipe()
         self._exception = None
 
         self.send_stop_message = True
-        self.accept_waiting_delay = True
         self.concurrent_worker_names = list()
+        self.concurrent_control_queues = dict()
+
+        self.input_batcher = MessageBatcher()
+        self.output_batcher = MessageBatcher()
 
         try:
             self.db_session = (
@@ -170,6 +234,8 @@ class WorkerBase(multiprocessing.Process):
             The data to add into the queue.
         :param destination_worker:
             The name of the worker which is supposed to read the message.
+            When given, the message is sent through the control queue of that
+            worker.
         """
 
         if worker_name:
@@ -177,7 +243,27 @@ class WorkerBase(multiprocessing.Process):
         else:
             to_send = (self.name, destination_worker, data)
 
-        self.input_queue.put(to_send)
+        if destination_worker:
+            # What was accumulated has to be sent first. Otherwise, a stop
+            # message may be applied before the work it follows.
+            self.flush_input_batch()
+            self.get_control_queue(destination_worker).put(to_send)
+        elif self.is_control_message(data):
+            # Keep the order: what was accumulated goes first.
+            self.flush_input_batch()
+            self.input_queue.put(to_send)
+        else:
+            if self.completion_tracker is not None:
+                self.completion_tracker.add()
+
+            if not self.input_batcher.authorized:
+                self.flush_input_batch()
+                self.input_queue.put(to_send)
+            else:
+                batch = self.input_batcher.add(to_send)
+
+                if batch:
+                    self.input_queue.put(batch)
 
         PyFunceble.facility.Logger.debug("Added to the (input) queue: %r", data)
 
@@ -201,13 +287,224 @@ class WorkerBase(multiprocessing.Process):
             to_send = (self.name, destination_worker, data)
 
         if self.output_queue is not None:
-            for output_queue in self.output_queue:
-                output_queue.put(to_send)
+            if self.is_control_message(data) or not self.output_batcher.authorized:
+                # Keep the order: what was accumulated goes first.
+                self.flush_output_batch()
+
+                if self.completion_tracker is not None and not self.is_control_message(
+                    data
+                ):
+                    self.completion_tracker.add(len(self.output_queue))
+
+                for output_queue in self.output_queue:
+                    output_queue.put(to_send)
+            else:
+                batch = self.output_batcher.add(to_send)
+
+                if batch:
+                    self.send_output_batch(batch)
 
         PyFunceble.facility.Logger.debug("Added to the (output) queue: %r", data)
 
         return self
 
+    def get_control_queue(self, worker_name: str) -> multiprocessing.Queue:
+        """
+        Provides the control queue of the given worker.
+
+        :param worker_name:
+            The name of the worker. It should be ourself or one of our
+            concurrent workers.
+
+        :raise ValueError:
+            When the given worker is unknown.
+        """
+
+        if worker_name == self.name:
+            return self.control_queue
+
+        try:
+            return self.concurrent_control_queues[worker_name]
+        except KeyError as exception:
+            raise ValueError(
+                f"<worker_name> ({worker_name!r}) is unknown."
+            ) from exception
+
+    @property
+    def input_queue_adapter(self) -> QueueAdapter:
+        """
+        Provides the adapter through which we read our input queue.
+        """
+
+        if (
+            self._input_queue_adapter is None
+            or self._input_queue_adapter.target_queue is not self.input_queue
+        ):
+            self._input_queue_adapter = get_queue_adapter(self.input_queue)
+
+        return self._input_queue_adapter
+
+    @property
+    def control_queue_adapter(self) -> QueueAdapter:
+        """
+        Provides the adapter through which we read our control queue.
+        """
+
+        if (
+            self._control_queue_adapter is None
+            or self._control_queue_adapter.target_queue is not self.control_queue
+        ):
+            self._control_queue_adapter = get_queue_adapter(self.control_queue)
+
+        return self._control_queue_adapter
+
+    def is_input_queue_drained(self) -> bool:
+        """
+        Checks if everything that was sent through the input queue was read.
+        """
+
+        return self.input_queue_adapter.is_drained()
+
+    def get_message(self) -> Optional[Any]:
+        """
+        Provides the next message to process.
+
+        The work (from the shared input queue) always comes first. The
+        messages addressed to us (from our control queue) are only given once
+        everything that was sent through the input queue was read.
+
+        :return:
+            The next message or :py:class:`None` when nothing was available
+            (yet).
+        """
+
+        try:
+            return self.input_queue_adapter.get_nowait()
+        except queue.Empty:
+            pass
+
+        if self.is_input_queue_drained():
+            try:
+                return self.control_queue_adapter.get_nowait()
+            except queue.Empty:
+                pass
+
+        # Some work may still be on its way - or someone else is reading it.
+        # We can't wait for our input and control queues at the same time.
+        # Therefore, we only wait (a bit) for our input queue and come back to
+        # our control queue afterwards.
+        try:
+            return self.input_queue_adapter.get(timeout=self.INPUT_WAIT_TIME)
+        except queue.Empty:
+            return None
+
+    @staticmethod
+    def is_control_message(data: Any) -> bool:
+        """
+        Checks if the given data is one of our control messages (e.g.
+        :code:`stop` or :code:`wait`).
+
+        Control messages are never batched.
+        """
+
+        return isinstance(data, str)
+
+    def flush_input_batch(self) -> "WorkerBase":
+        """
+        Sends the messages accumulated for the input queue - if any.
+        """
+
+        batch = self.input_batcher.flush()
+
+        if batch:
+            self.input_queue.put(batch)
+
+            PyFunceble.facility.Logger.debug(
+                "Flushed %r messages to the (input) queue.", len(batch)
+            )
+
+        return self
+
+    def flush_output_batch(self) -> "WorkerBase":
+        """
+        Sends the messages accumulated for the output queues - if any.
+        """
+
+        batch = self.output_batcher.flush()
+
+        if batch:
+            self.send_output_batch(batch)
+        else:
+            self.release_pending()
+
+        return self
+
+    def send_output_batch(self, batch: MessageBatch) -> "WorkerBase":
+        """
+        Sends the given batch to our output queues. Then, what we deferred
+        until it was sent is released.
+
+        :param batch:
+            The batch to send.
+        """
+
+        if self.output_queue is not None:
+            if self.completion_tracker is not None:
+                # The messages of a batch are only counted once sent: what
+                # we did not send dies with us.
+                self.completion_tracker.add(len(batch) * len(self.output_queue))
+
+            for output_queue in self.output_queue:
+                output_queue.put(batch)
+
+            PyFunceble.facility.Logger.debug(
+                "Flushed %r messages to the (output) queue.", len(batch)
+            )
+
+        if self._unsent_messages:
+            self._unsent_messages.clear()
+
+        if self.heartbeat is not None and self._pending_messages is not None:
+            # Nothing we processed has to be given back anymore.
+            self.heartbeat.release(len(self._pending_messages))
+
+        return self.release_pending()
+
+    def release_pending(self) -> "WorkerBase":
+        """
+        Marks as done and acknowledges the messages we deferred while our
+        output batch was not sent.
+        """
+
+        if self._pending_completions:
+            count, self._pending_completions = self._pending_completions, 0
+
+            if self.completion_tracker is not None:
+                self.completion_tracker.done(count)
+
+        if self._pending_acknowledgements:
+            count, self._pending_acknowledgements = self._pending_acknowledgements, 0
+            self.input_queue_adapter.task_done(count)
+
+        return self
+
+    def flush_batches_if_necessary(self) -> "WorkerBase":
+        """
+        Sends the accumulated messages when they waited long enough or when
+        there is nothing left to read from our input queue. The idea is to
+        never keep a message for us while we are waiting for work.
+        """
+
+        idle = self.input_queue.empty()
+
+        if idle or self.input_batcher.is_expired():
+            self.flush_input_batch()
+
+        if idle or self.output_batcher.is_expired():
+            self.flush_output_batch()
+
+        return self
+
     def target(self, consumed: Any) -> Optional[Tuple[Any, ...]]:
         """
         This the target that is run to process something.
@@ -217,58 +514,96 @@ class WorkerBase(multiprocessing.Process):
 
         raise NotImplementedError()
 
-    def share_waiting_message(
-        self,
-        *,
-        overall: bool = False,
-        ignore_current_worker: bool = False,
-        apply_breakoff: bool = False,
-    ) -> "WorkerBase":
+    def mark_as_done(self, count: int = 1) -> "WorkerBase":
+        """
+        Tells our completion tracker (if any) that we are done with the given
+        number of messages.
+
+        .. warning::
+            This should be called only once the messages produced from them
+            were added to our output queue.
+
+        .. note::
+            What we produced from them may still wait into our output batch.
+            As it is only counted once sent, they are only marked as done once
+            it was sent.
         """
-        Shares a waiting message to both input and output queues.
-        The idea is to keep our worker awake when necessary. This functionality
-        is really important when running the mining worker because sometime
-        the flow is so long, that we may need some time.
 
-        :param overall:
-            Shares the message multiple time to specific destination in our
-            current stack.
-        :param ignore_current_worker:
-            Doesn't share the message with ourself.
-        :param apply_breakoff:
-            Activates the breakoff (sleep) before starting to share the message.
+        if self.completion_tracker is None:
+            return self
+
+        if self.output_batcher is not None and self.output_batcher.messages:
+            self._pending_completions += count
+        else:
+            self.completion_tracker.done(count)
+
+        return self
+
+    def acknowledge(self, count: int = 1) -> "WorkerBase":
         """
+        Tells our input queue that we are done with the given number of
+        messages we read from it.
 
-        if overall:
-            for worker_name in self.concurrent_worker_names:
-                if apply_breakoff:
-                    time.sleep(self.BREAKOFF)
+        Only our disk queue and the task queues of our coordinator care: they
+        keep a message until it is acknowledged so that it can be given back
+        when we are killed before the end of its processing.
 
-                if not ignore_current_worker:
-                    # Give the whole stack a bit more of time.
-                    self.add_to_input_queue("wait", destination_worker=worker_name)
+        .. note::
+            What we produced from them may still wait into our output batch.
+            As it would be lost with us, they are only acknowledged once it
+            was sent. The order of our acknowledgements is kept.
+        """
 
-                self.add_to_output_queue("wait")
+        if self.output_batcher is not None and (
+            self.output_batcher.messages or self._pending_acknowledgements
+        ):
+            self._pending_acknowledgements += count
         else:
-            if apply_breakoff:
-                time.sleep(self.BREAKOFF)
+            self.input_queue_adapter.task_done(count)
 
-            if not ignore_current_worker:
-                self.add_to_input_queue("wait", destination_worker=self.name)
+        return self
+
+    def abort_completion_tracking(self) -> "WorkerBase":
+        """
+        Tells our completion tracker (if any) that we are stopping before the
+        end of the work in flight. Otherwise, nobody would stop waiting for it.
+        """
 
-            self.add_to_output_queue("wait")
+        if self.completion_tracker is not None:
+            self.completion_tracker.abort()
 
-    def run(self) -> None:  # pylint: disable=too-many-statements
-        def break_now() -> bool:
-            """
-            Checks if it is time to make a break.
-            """
+        return self
 
-            if not wait_for_stop or not self.accept_waiting_delay:
-                return True
+    def cancel_queues_join_thread(self) -> "WorkerBase":
+        """
+        Tells our (native) output queues to not wait for their buffered data
+        to be flushed when the current process exits.
+
+        This is necessary when we are stopping everything: otherwise, we may
+        block forever while trying to flush into a queue that nobody reads
+        anymore.
+        """
+
+        if self.output_queue is not None:
+            for output_queue in self.output_queue:
+                if hasattr(output_queue, "cancel_join_thread"):
+                    output_queue.cancel_join_thread()
+
+        return self
+
+    def finish(self) -> "WorkerBase":
+        """
+        A method which will be executed when we are about to (normally) exit.
+
+        Its objective is to send everything we still have in hands.
+        """
 
-            return datetime.utcnow() > break_time
+        self.flush_input_batch()
+        self.flush_output_batch()
 
+        return self
+
+    def run(self) -> None:  # pylint: disable=too-many-statements
         if self.configuration is not None:
             PyFunceble.facility.ConfigLoader.set_custom_config(self.configuration)
 
@@ -277,10 +612,13 @@ class WorkerBase(multiprocessing.Process):
             PyFunceble.cli.facility.CredentialLoader.start()
             PyFunceble.cli.factory.DBSession.init_db_sessions()
 
-        wait_for_stop = (
-            bool(PyFunceble.storage.CONFIGURATION.cli_testing.mining) is True
-        )
-        break_time = datetime.utcnow() + timedelta(seconds=self.MINING_WAIT_TIME)
+        # Whatever our parent accumulated before we were started is theirs to
+        # send. Not ours.
+        self.input_batcher.reset()
+        self.output_batcher.reset()
+        self._pending_completions = self._pending_acknowledgements = 0
+        pending_messages = self._pending_messages = collections.deque()
+        self._unsent_messages = collections.deque()
 
         try:  # pylint: disable=too-many-nested-blocks
             while True:
@@ -289,10 +627,54 @@ class WorkerBase(multiprocessing.Process):
                         "Got global exit event. Stopping worker."
                     )
 
+                    self.abort_completion_tracking()
+                    self.cancel_queues_join_thread()
                     break
 
                 if self.exit_it.is_set():
                     PyFunceble.facility.Logger.info("Got exit event. Stopping worker.")
+
+                    self.finish()
+                    break
+
+                if self.retire_it.is_set():
+                    PyFunceble.facility.Logger.info(
+                        "Got retire event. Stopping worker."
+                    )
+
+                    # What we took from the (shared) input queue but did not
+                    # process yet is given back to our concurrent workers.
+                    while pending_messages:
+                        worker_name, destination_worker, consumed = (
+                            pending_messages.popleft()
+                        )
+                        self.add_to_input_queue(
+                            consumed,
+                            worker_name=worker_name,
+                            destination_worker=destination_worker,
+                        )
+
+                        if not self.is_control_message(consumed):
+                            # It was counted again while given back.
+                            self.mark_as_done()
+
+                        if not destination_worker:
+                            # It was read from our input queue.
+                            self.acknowledge()
+
+                    self.finish()
+                    break
+
+                if self.recycle_it.is_set() and not pending_messages:
+                    # Unlike a retirement, we process what we took from the
+                    # (shared) input queue before stopping. That way, nothing
+                    # is given back to concurrent workers which may already
+                    # have applied their stop message.
+                    PyFunceble.facility.Logger.info(
+                        "Got recycle event. Stopping worker."
+                    )
+
+                    self.finish()
                     break
 
                 if (
@@ -303,26 +685,35 @@ class WorkerBase(multiprocessing.Process):
                         "CI time exceeded. Stopping worker."
                     )
 
-                    if break_now():
-                        self.exit_it.set()
+                    self.abort_completion_tracking()
+                    self.exit_it.set()
+                    continue
+
+                if not pending_messages:
+                    self.flush_batches_if_necessary()
+
+                    try:
+                        message = self.get_message()
+                    except EOFError:
+                        PyFunceble.facility.Logger.info(
+                            "Got EOFError. Stopping worker."
+                        )
+                        self.global_exit_event.set()
+                        break
+
+                    if message is None:
                         continue
 
-                    continue
+                    if isinstance(message, MessageBatch):
+                        pending_messages.extend(message)
+                    else:
+                        pending_messages.append(message)
 
-                try:
-                    worker_name, destination_worker, consumed = self.input_queue.get()
-                except EOFError:
-                    PyFunceble.facility.Logger.info("Got EOFError. Stopping worker.")
-                    self.global_exit_event.set()
-                    break
+                    if self.heartbeat is not None:
+                        self.heartbeat.hold([*self._unsent_messages, *pending_messages])
 
-                if destination_worker and destination_worker != self.name:
-                    self.add_to_input_queue(
-                        consumed,
-                        worker_name=worker_name,
-                        destination_worker=destination_worker,
-                    )
-                    continue
+                message = pending_messages.popleft()
+                worker_name, destination_worker, consumed = message
 
                 PyFunceble.facility.Logger.info(
                     "Got (from %r): %r",
@@ -330,41 +721,36 @@ class WorkerBase(multiprocessing.Process):
                     consumed,
                 )
 
-                if consumed == "stop":
-                    if break_now():
-                        PyFunceble.facility.Logger.info(
-                            "Got stop message from %r. Applying.",
-                            worker_name,
-                        )
+                if self.is_control_message(consumed) and not destination_worker:
+                    # Nothing will be processed from it. And a message with a
+                    # destination was read from our control queue.
+                    self.acknowledge()
 
-                        self.exit_it.set()
-                        continue
+                if consumed == "stop":
+                    PyFunceble.facility.Logger.info(
+                        "Got stop message from %r. Applying.",
+                        worker_name,
+                    )
 
-                    self.share_waiting_message(apply_breakoff=wait_for_stop)
+                    self.exit_it.set()
                     continue
 
-                if consumed == "wait":
-                    if not wait_for_stop:
-                        continue
-
-                    if break_now():
-                        PyFunceble.facility.Logger.debug(
-                            "Waited sufficiently. Stopping current worker."
-                        )
-
-                        # The real (break) action shouldn't be handled here.
-                        self.exit_it.set()
-                        continue
-
-                    PyFunceble.facility.Logger.debug(
-                        "We need to wait a bit more. Continue waiting."
-                    )
-
-                    self.share_waiting_message(apply_breakoff=wait_for_stop)
+                if self.is_control_message(consumed):
+                    # Nothing else is expected from our control messages.
                     continue
 
+                if self.heartbeat is not None:
+                    # When we stall, we are replaced (killed). What waits into
+                    # our output batch is given back through our heartbeat -
+                    # but not what waits into our input batch.
+                    self.flush_input_batch()
+                    self.heartbeat.beat(len(pending_messages))
+
                 result = self.target(consumed)
 
+                if self.heartbeat is not None:
+                    self.heartbeat.rest()
+
                 if result is not None:
                     self.add_to_output_queue(result)
 
@@ -373,9 +759,17 @@ class WorkerBase(multiprocessing.Process):
                         result,
                     )
 
-                break_time = datetime.utcnow() + timedelta(
-                    seconds=self.MINING_WAIT_TIME
-                )
+                self.mark_as_done()
+
+                if self.ACKNOWLEDGE_AFTER_TARGET:
+                    self.acknowledge()
+
+                if self.heartbeat is not None:
+                    if self.output_batcher.messages:
+                        # It was not marked as done (yet).
+                        self._unsent_messages.append(message)
+                    else:
+                        self.heartbeat.release(len(pending_messages))
 
         except Exception as exception:  # pylint: disable=broad-except
             PyFunceble.facility.Logger.critical(
@@ -384,6 +778,7 @@ class WorkerBase(multiprocessing.Process):
             trace = traceback.format_exc()
             self._child_connection.send((exception, trace))
 
+            self.abort_completion_tracking()
             self.exit_it.set()
             raise exception
 
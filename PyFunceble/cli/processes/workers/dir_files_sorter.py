@@ -155,7 +155,7 @@ class DireFileSorterWorker(FileSorterWorkerBase):
             write_header = True
 
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=PyFunceble.storage.CONFIGURATION.cli_testing.max_workers,
+            max_workers=PyFunceble.storage.CONFIGURATION.cli_testing.cpu_workers,
         ) as executor:
             submitted_list = []
 
@@ -54,9 +54,8 @@ import heapq
 import os
 import secrets
 import tempfile
-from io import TextIOWrapper
 from itertools import islice
-from typing import Any, Generator, List, Tuple
+from typing import Any, Generator, Iterator, List
 
 import PyFunceble.cli.storage
 import PyFunceble.facility
@@ -77,11 +76,89 @@ class FileSorterWorkerBase(WorkerBase):
     MAX_LINES: int = 32_000
     FILE_BUFFER_SIZE: int = 64 * 1024
 
-    def __post_init__(self) -> None:
-        # We don't need to wait for anything here :-)
-        self.accept_waiting_delay = False
+    @staticmethod
+    def merge_sorted_files(
+        files: List[Iterator[str]],
+        *,
+        remove_duplicates: bool = True,
+        write_header: bool = True,
+        sorting_key: Any = None,
+    ) -> Generator[str, None, bool]:
+        """
+        Merges the given (sorted) files and yield each "lines" of the merged
+        file.
+
+        :param files:
+            The files to merge. They are closed as soon as they are exhausted.
+        :param remove_duplicates:
+            Activates the deletion of duplicates.
+        :param write_header:
+            Activates the exclusion of the PyFunceble related header (which
+            the caller is expected to regenerate).
+        :param sorting_key:
+            The sorting key the given files were sorted with.
+
+        :return:
+            Whether the given files were actually sorted. When they were not,
+            the yielded lines are not sorted either.
+        """
+
+        if not sorting_key:
+            sorting_key = get_best_sorting_key()
+
+        result = []
+
+        for index, file in enumerate(files):
+            try:
+                iterator = iter(file)
+                value = next(iterator)
+
+                heapq.heappush(
+                    result, ((sorting_key(value), index, value, iterator, file))
+                )
+            except StopIteration:
+                file.close()
+
+        previous = None
+        previous_key = None
+        in_order = True
+        comment_count = 0
+        max_comment_count = 2
+
+        while result:
+            ignore = False
+
+            key, index, value, iterator, file = heapq.heappop(result)
+
+            if remove_duplicates and value == previous:
+                ignore = True
 
-        return super().__post_init__()
+            if (
+                write_header
+                and comment_count < max_comment_count
+                and value[0] == "#"
+            ):
+                ignore = True
+                max_comment_count += 1
+
+            if not ignore:
+                if previous_key is not None and key < previous_key:
+                    in_order = False
+
+                yield value
+                previous = value
+                previous_key = key
+
+            try:
+                value = next(iterator)
+
+                heapq.heappush(
+                    result, ((sorting_key(value), index, value, iterator, file))
+                )
+            except StopIteration:
+                file.close()
+
+        return in_order
 
     @classmethod
     def process_file_sorting(
@@ -116,64 +193,6 @@ class FileSorterWorkerBase(WorkerBase):
             of the :py:class:`sorted` function.
         """
 
-        # pylint: disable=too-many-locals,too-many-statements
-
-        def merge_files(
-            files: List[TextIOWrapper],
-        ) -> Generator[Tuple[List[TextIOWrapper]], str, None]:
-            """
-            Merges the given files and yield each "lines" of the merged file.
-
-            :param files:
-                The files to merge.
-            """
-
-            result = []
-
-            for index, file in enumerate(files):
-                try:
-                    iterator = iter(file)
-                    value = next(iterator)
-
-                    heapq.heappush(
-                        result, ((sorting_key(value), index, value, iterator, file))
-                    )
-                except StopIteration:
-                    file.close()
-
-            previous = None
-            comment_count = 0
-            max_comment_count = 2
-
-            while result:
-                ignore = False
-
-                _, index, value, iterator, file = heapq.heappop(result)
-
-                if remove_duplicates and value == previous:
-                    ignore = True
-
-                if (
-                    write_header
-                    and comment_count < max_comment_count
-                    and value[0] == "#"
-                ):
-                    ignore = True
-                    max_comment_count += 1
-
-                if not ignore:
-                    yield value
-                    previous = value
-
-                try:
-                    value = next(iterator)
-
-                    heapq.heappush(
-                        result, ((sorting_key(value), index, value, iterator, file))
-                    )
-                except StopIteration:
-                    file.close()
-
         temp_directory = tempfile.TemporaryDirectory()
         temporary_output_file = os.path.join(temp_directory.name, secrets.token_hex(6))
 
@@ -217,7 +236,14 @@ class FileSorterWorkerBase(WorkerBase):
                 file_stream.write(FilePrinter.get_generation_date_line())
                 file_stream.write("\n\n")
 
-            file_stream.writelines(merge_files(sorted_files))
+            file_stream.writelines(
+                cls.merge_sorted_files(
+                    sorted_files,
+                    remove_duplicates=remove_duplicates,
+                    write_header=write_header,
+                    sorting_key=sorting_key,
+                )
+            )
 
         FileHelper(temporary_output_file).move(file)
 
@@ -159,8 +159,6 @@ class MinerWorker(WorkerBase):
 
         print_single_line("M")
 
-        self.add_to_output_queue("pyfunceble")
-        self.share_waiting_message()
         mined = self.mine_from(subject)
 
         for url in mined:
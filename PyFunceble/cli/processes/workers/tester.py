@@ -50,25 +50,36 @@ License:
     limitations under the License.
 """
 
+import multiprocessing
+import queue
 import time
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
 
 import PyFunceble.cli.utils.testing
 import PyFunceble.facility
+from PyFunceble.checker.availability.base import AvailabilityCheckerBase
 from PyFunceble.checker.availability.domain_and_ip import DomainAndIPAvailabilityChecker
 from PyFunceble.checker.availability.url import URLAvailabilityChecker
 from PyFunceble.checker.base import CheckerBase
 from PyFunceble.checker.reputation.domain_and_ip import DomainAndIPReputationChecker
 from PyFunceble.checker.reputation.url import URLReputationChecker
+from PyFunceble.checker.status_base import CheckerStatusBase
 from PyFunceble.checker.syntax.domain import DomainSyntaxChecker
 from PyFunceble.checker.syntax.ip import IPSyntaxChecker
 from PyFunceble.checker.syntax.url import URLSyntaxChecker
+from PyFunceble.cli.processes.autoscaler import WorkerStats
+from PyFunceble.cli.processes.rate_limiter import RateLimiter
+from PyFunceble.cli.processes.task import Task
 from PyFunceble.cli.processes.workers.base import WorkerBase
 from PyFunceble.cli.utils.stdout import print_single_line
 from PyFunceble.dataset.autocontinue.base import ContinueDatasetBase
 from PyFunceble.dataset.autocontinue.csv import CSVContinueDataset
 from PyFunceble.dataset.inactive.base import InactiveDatasetBase
 from PyFunceble.helpers.regex import RegexHelper
+from PyFunceble.query.dns.query_tool import DNSQueryTool
+from PyFunceble.query.netinfo.base import NetInfoBase
 
 
 class TesterWorker(WorkerBase):
@@ -86,7 +97,31 @@ class TesterWorker(WorkerBase):
 
     known_testing_objects: dict = dict()
 
+    stats: Optional[WorkerStats] = None
+
+    input_slots: Optional[multiprocessing.Semaphore] = None
+    """
+    The slots of our (bounded) input queue. Each subject sent by the launcher
+    holds one until we consume it.
+    """
+
+    protocol_queue: Optional[queue.Queue] = None
+    """
+    The queue through which we receive the protocols of the tasks we may
+    have to test.
+    """
+
+    known_protocols: Optional[Dict[int, dict]] = None
+
+    rate_limiter: Optional[RateLimiter] = None
+    """
+    The rate limiter shared by all our tester workers.
+    """
+
     def __post_init__(self) -> None:
+        self.stats = WorkerStats()
+        self.known_protocols = dict()
+
         self.continue_dataset = (
             PyFunceble.cli.utils.testing.get_continue_databaset_object(
                 db_session=self.db_session
@@ -158,6 +193,102 @@ class TesterWorker(WorkerBase):
 
         return False
 
+    @staticmethod
+    def holds_input_slot(data: Any) -> bool:
+        """
+        Checks if the given data holds a slot of our (bounded) input queue.
+
+        .. note::
+            What our miner sends doesn't go through the launcher. Therefore,
+            it doesn't hold any slot.
+        """
+
+        return isinstance(data, Task) or (
+            isinstance(data, dict) and "from_miner" not in data
+        )
+
+    def get_protocol(self, protocol_id: int) -> dict:
+        """
+        Provides the protocol registered under the given ID.
+
+        .. note::
+            The protocol is always registered before its first task is sent.
+            Therefore, we can safely wait for it.
+
+        :param protocol_id:
+            The ID of the protocol to get.
+        """
+
+        while protocol_id not in self.known_protocols:
+            registered_id, protocol = self.protocol_queue.get()
+            self.known_protocols[registered_id] = protocol
+
+        return self.known_protocols[protocol_id]
+
+    def throttle(self, bucket: str) -> float:
+        """
+        Waits for our turn through the given bucket of our rate limiter.
+
+        .. note::
+            Waiting for our turn is not stalling. Therefore, our heartbeat
+            is refreshed once we got it.
+
+        :param bucket:
+            The bucket to take a token from.
+
+        :return:
+            The number of seconds we waited.
+        """
+
+        waited = self.rate_limiter.acquire(bucket)
+
+        if waited > 0 and self.heartbeat is not None:
+            self.heartbeat.refresh()
+
+        return waited
+
+    def new_testing_object(
+        self,
+        subject_type: str,
+        checker_type: str,
+        *,
+        db_session: Optional[Session] = None,
+    ) -> CheckerBase:
+        """
+        Provides a new object to use for testing.
+
+        :param subject_type:
+            The type of the subject to test.
+        :param checker_type:
+            The type of the checker to use.
+        :param db_session:
+            The database session the testing object should use.
+
+        :raise ValueError:
+            When the given subject type is unknown.
+        """
+
+        if checker_type in self.known_testing_objects:
+            if subject_type in self.known_testing_objects[checker_type]:
+                testing_object = self.known_testing_objects[checker_type][
+                    subject_type
+                ](db_session=db_session)
+
+                # We want to always check the syntax first (ONLY UNDER THE CLI)
+                testing_object.set_do_syntax_check_first(
+                    not bool(PyFunceble.storage.CONFIGURATION.cli_testing.local_network)
+                )
+
+                if self.rate_limiter and isinstance(
+                    testing_object, AvailabilityCheckerBase
+                ):
+                    testing_object.set_lookup_throttle(self.throttle)
+
+                return testing_object
+
+            raise ValueError(f"<subject_type> ({subject_type!r}) is unknown.")
+        raise ValueError(f"<testing_mode> ({checker_type!r}) is unknown.")
+
     def _init_testing_object(
         self, subject_type: str, checker_type: str
     ) -> Optional[CheckerBase]:
@@ -176,15 +307,8 @@ class TesterWorker(WorkerBase):
                     self.known_testing_objects[checker_type][subject_type],
                     type(self.testing_object),
                 ):
-                    self.testing_object = self.known_testing_objects[checker_type][
-                        subject_type
-                    ](db_session=self.db_session)
-
-                    # We want to always check the syntax first (ONLY UNDER THE CLI)
-                    self.testing_object.set_do_syntax_check_first(
-                        not bool(
-                            PyFunceble.storage.CONFIGURATION.cli_testing.local_network
-                        )
+                    self.testing_object = self.new_testing_object(
+                        subject_type, checker_type, db_session=self.db_session
                     )
 
                     return self.testing_object
@@ -194,13 +318,23 @@ class TesterWorker(WorkerBase):
             raise ValueError(f"<subject_type> ({subject_type!r}) is unknown.")
         raise ValueError(f"<testing_mode> ({checker_type!r}) is unknown.")
 
-    def target(self, consumed: dict) -> Optional[Tuple[Any, ...]]:
+    def pre_test(self, consumed: Any) -> Optional[dict]:
         """
-        This the target that is run to process something.
-        This method should return a result which will pu send to the output
-        queue.
+        Runs everything that has to be done before the actual test of the
+        given dataset.
+
+        :return:
+            The dataset to test or :py:class:`None` if there is nothing to
+            test.
         """
 
+        if self.input_slots is not None and self.holds_input_slot(consumed):
+            # The launcher is allowed to send a new subject.
+            self.input_slots.release()
+
+        if isinstance(consumed, Task):
+            consumed = consumed.to_dict(self.get_protocol(consumed.protocol_id))
+
         if not isinstance(consumed, dict):
             PyFunceble.facility.Logger.debug(
                 "Skipping latest dataset because consumed data was not "
@@ -228,6 +362,10 @@ class TesterWorker(WorkerBase):
                 PyFunceble.storage.CONFIGURATION.cli_testing.cooldown_time,
             )
 
+            if self.heartbeat is not None:
+                # Cooling down is not stalling.
+                self.heartbeat.refresh()
+
         if test_dataset["type"] != "single":
             if test_dataset["output_dir"] and "from_preload" not in test_dataset:
                 if isinstance(self.continue_dataset, CSVContinueDataset):
@@ -260,19 +398,41 @@ class TesterWorker(WorkerBase):
 
                 PyFunceble.cli.utils.stdout.print_single_line("I")
 
-                return test_dataset, "ignored_inactive"
+                self.add_to_output_queue((test_dataset, "ignored_inactive"))
+
+                return None
+
+        if self.rate_limiter:
+            # Only what we actually test has to wait for its turn.
+            waited = self.throttle("test")
+
+            if waited > 0:
+                PyFunceble.facility.Logger.info(
+                    "Waited: %rs for our own safety :-)", waited
+                )
+
+        return test_dataset
+
+    @staticmethod
+    def test(
+        test_dataset: dict, testing_object: CheckerBase
+    ) -> Tuple[dict, CheckerStatusBase]:
+        """
+        Tests the given dataset with the given testing object.
+
+        :param test_dataset:
+            The dataset to test.
+        :param testing_object:
+            The (initialized) testing object to use.
+        """
 
         PyFunceble.facility.Logger.info(
             "Started test of %r.",
             test_dataset["idna_subject"],
         )
 
-        self._init_testing_object(
-            test_dataset["subject_type"], test_dataset["checker_type"]
-        )
-
         result = (
-            self.testing_object.set_subject(test_dataset["idna_subject"])
+            testing_object.set_subject(test_dataset["idna_subject"])
             .query_status()
             .get_status()
         )
@@ -285,3 +445,77 @@ class TesterWorker(WorkerBase):
         PyFunceble.facility.Logger.debug("Got status:\n%r.", result)
 
         return test_dataset, result
+
+    def measured_test(
+        self, test_dataset: dict, testing_object: CheckerBase
+    ) -> Tuple[dict, CheckerStatusBase]:
+        """
+        Tests the given dataset (see :py:meth:`test`) and records how long it
+        took.
+        """
+
+        started_at = time.monotonic()
+        cpu_started_at = time.thread_time()
+
+        try:
+            return self.test(test_dataset, testing_object)
+        finally:
+            self.record_test(
+                time.monotonic() - started_at, time.thread_time() - cpu_started_at
+            )
+
+    def record_test(self, latency: float, cpu_time: float) -> "TesterWorker":
+        """
+        Records a finished test.
+
+        :param latency:
+            The number of seconds the test took.
+        :param cpu_time:
+            The number of CPU seconds the test took.
+        """
+
+        self.stats.record(latency, cpu_time)
+
+        return self
+
+    def target(self, consumed: dict) -> Optional[Tuple[Any, ...]]:
+        """
+        This the target that is run to process something.
+        This method should return a result which will pu send to the output
+        queue.
+        """
+
+        test_dataset = self.pre_test(consumed)
+
+        if test_dataset is None:
+            return None
+
+        self._init_testing_object(
+            test_dataset["subject_type"], test_dataset["checker_type"]
+        )
+
+        return self.measured_test(test_dataset, self.testing_object)
+
+    def tear_down(self) -> "TesterWorker":
+        """
+        Releases what our testing objects shared within the current process.
+
+        .. warning::
+            This should be executed from the worker (process) itself.
+        """
+
+        AvailabilityCheckerBase.dns_executor.shutdown()
+        DNSQueryTool.hedge_executor.shutdown()
+        NetInfoBase.executor.shutdown()
+
+        for dns_cache in DNSQueryTool.shared_caches.values():
+            # The hits and misses we counted are still in memory.
+            dns_cache.flush_counters()
+
+        return self
+
+    def run(self) -> None:
+        try:
+            super().run()
+        finally:
+            self.tear_down()
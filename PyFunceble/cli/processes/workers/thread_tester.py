@@ -0,0 +1,434 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides our thread tester worker. This is the description of a single
+worker which tests multiple subjects concurrently through a pool of threads.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+
+import concurrent.futures
+import contextlib
+import threading
+import traceback
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+import PyFunceble.cli.factory
+import PyFunceble.facility
+import PyFunceble.storage
+from PyFunceble.checker.base import CheckerBase
+from PyFunceble.checker.status_base import CheckerStatusBase
+from PyFunceble.cli.processes.concurrency import ConcurrencyLimiter, ConcurrencyTuner
+from PyFunceble.cli.processes.workers.tester import TesterWorker
+
+
+class ThreadTesterWorker(TesterWorker):
+    """
+    Provides our thread tester worker. The objective of this worker is to
+    provide a single worker (or process if you prefer) which keeps multiple
+    subjects in flight at the same time.
+
+    Our worker reads its input queue as usual, but instead of testing the
+    subject by itself, it hands it over to a (bounded) pool of threads which
+    keeps up to :code:`max_inflight` tests running concurrently.
+
+    When the auto-tuning is activated, :code:`max_inflight` becomes a ceiling
+    and the actual number of subjects in flight is tuned by a
+    :py:class:`~PyFunceble.cli.processes.concurrency.ConcurrencyTuner`.
+
+    .. note::
+        To avoid any shared state, each thread gets its own testing objects
+        (and database session).
+    """
+
+    STD_MAX_INFLIGHT: int = 50
+    STD_AUTOTUNE_INFLIGHT: bool = False
+
+    # Our threads acknowledge what they tested (in the order we read it).
+    ACKNOWLEDGE_AFTER_TARGET: bool = False
+
+    max_inflight: Optional[int] = None
+    autotune_inflight: Optional[bool] = None
+
+    executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    inflight: Optional[ConcurrencyLimiter] = None
+    tuner: Optional[ConcurrencyTuner] = None
+    output_lock: Optional[threading.RLock] = None
+
+    flusher: Optional[threading.Thread] = None
+    flusher_stop: Optional[threading.Event] = None
+
+    thread_data: Optional[threading.local] = None
+    db_sessions: Optional[List[Session]] = None
+
+    acknowledgement_lock: Optional[threading.Lock] = None
+    read_count: int = 0
+    acknowledged_count: int = 0
+    sequences: Optional[Dict[int, int]] = None
+    """
+    The position (in our reading order) of the datasets in flight - indexed by
+    their ID.
+    """
+    finished_sequences: Optional[Set[int]] = None
+
+    def __post_init__(self) -> None:
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and isinstance(
+            PyFunceble.storage.CONFIGURATION.cli_testing.max_inflight, int
+        ):
+            self.max_inflight = max(
+                1, PyFunceble.storage.CONFIGURATION.cli_testing.max_inflight
+            )
+        else:
+            self.max_inflight = self.STD_MAX_INFLIGHT
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and isinstance(
+            PyFunceble.storage.CONFIGURATION.cli_testing.autotune_inflight, bool
+        ):
+            self.autotune_inflight = (
+                PyFunceble.storage.CONFIGURATION.cli_testing.autotune_inflight
+            )
+        else:
+            self.autotune_inflight = self.STD_AUTOTUNE_INFLIGHT
+
+        return super().__post_init__()
+
+    def add_to_output_queue(
+        self,
+        data: Any,
+        *,
+        worker_name: Optional[str] = None,
+        destination_worker: Optional[str] = None,
+    ) -> "ThreadTesterWorker":
+        # Our results are produced from multiple threads.
+        with self.output_lock or contextlib.nullcontext():
+            return super().add_to_output_queue(
+                data, worker_name=worker_name, destination_worker=destination_worker
+            )
+
+    def flush_output_batch(self) -> "ThreadTesterWorker":
+        with self.output_lock or contextlib.nullcontext():
+            return super().flush_output_batch()
+
+    def acknowledge(self, count: int = 1) -> "ThreadTesterWorker":
+        # Whether it has to wait for our output batch depends on it.
+        with self.output_lock or contextlib.nullcontext():
+            return super().acknowledge(count)
+
+    def mark_as_done(self, count: int = 1) -> "ThreadTesterWorker":
+        # Whether it has to wait for our output batch depends on it.
+        with self.output_lock or contextlib.nullcontext():
+            return super().mark_as_done(count)
+
+    def start_threads(self) -> "ThreadTesterWorker":
+        """
+        Starts our pool of threads (and everything it needs).
+
+        .. warning::
+            This should be executed from the worker (process) itself.
+        """
+
+        self.inflight = ConcurrencyLimiter(self.max_inflight)
+
+        if self.autotune_inflight:
+            self.tuner = ConcurrencyTuner(
+                self.inflight, self.max_inflight, name=self.name
+            )
+
+        self.output_lock = threading.RLock()
+
+        self.acknowledgement_lock = threading.Lock()
+        self.read_count = self.acknowledged_count = 0
+        self.sequences = dict()
+        self.finished_sequences = set()
+
+        self.thread_data = threading.local()
+        self.db_sessions = list()
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_inflight, thread_name_prefix=self.name
+        )
+
+        self.flusher_stop = threading.Event()
+        self.flusher = threading.Thread(
+            target=self.flush_periodically, name=f"{self.name}_flusher", daemon=True
+        )
+        self.flusher.start()
+
+        PyFunceble.facility.Logger.info(
+            "Started threads of %r (max inflight: %r, auto-tuning: %r).",
+            self.name,
+            self.max_inflight,
+            self.autotune_inflight,
+        )
+
+        return self
+
+    def stop_threads(self) -> "ThreadTesterWorker":
+        """
+        Stops our pool of threads and closes everything it used.
+        """
+
+        if self.executor is not None:
+            self.flusher_stop.set()
+            self.flusher.join()
+
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+            for db_session in self.db_sessions:
+                db_session.close()
+
+            PyFunceble.facility.Logger.info("Stopped threads of %r.", self.name)
+
+        return self
+
+    def flush_periodically(self) -> None:
+        """
+        Flushes our output batch when it waited too long.
+
+        This is necessary because our results may be produced while our
+        worker is waiting for its next input.
+        """
+
+        interval = max(self.output_batcher.timeout, 10.0) / 1000
+
+        while not self.flusher_stop.wait(interval):
+            if self.output_batcher.is_expired():
+                self.flush_output_batch()
+
+    def get_new_db_session(self) -> Optional[Session]:
+        """
+        Provides a new database session - if possible.
+        """
+
+        try:
+            db_session = (
+                PyFunceble.cli.factory.DBSession.get_db_session().get_new_session()()
+            )
+        except TypeError:
+            return None
+
+        self.db_sessions.append(db_session)
+
+        return db_session
+
+    def get_testing_object(self, subject_type: str, checker_type: str) -> CheckerBase:
+        """
+        Provides the testing object of the current thread.
+
+        :param subject_type:
+            The type of the subject to test.
+        :param checker_type:
+            The type of the checker to use.
+        """
+
+        if not hasattr(self.thread_data, "testing_objects"):
+            self.thread_data.testing_objects = dict()
+            self.thread_data.db_session = self.get_new_db_session()
+
+        if (subject_type, checker_type) not in self.thread_data.testing_objects:
+            self.thread_data.testing_objects[
+                (subject_type, checker_type)
+            ] = self.new_testing_object(
+                subject_type, checker_type, db_session=self.thread_data.db_session
+            )
+
+        return self.thread_data.testing_objects[(subject_type, checker_type)]
+
+    def threaded_test(self, test_dataset: dict) -> Tuple[dict, CheckerStatusBase]:
+        """
+        Tests the given dataset with the testing object of the current thread.
+
+        :param test_dataset:
+            The dataset to test.
+        """
+
+        return self.measured_test(
+            test_dataset,
+            self.get_testing_object(
+                test_dataset["subject_type"], test_dataset["checker_type"]
+            ),
+        )
+
+    def record_test(self, latency: float, cpu_time: float) -> "ThreadTesterWorker":
+        if self.tuner is not None:
+            self.tuner.record(latency)
+
+        return super().record_test(latency, cpu_time)
+
+    def submit_result(self, result: Tuple[dict, CheckerStatusBase]) -> None:
+        """
+        Sends the given result to the output queue.
+        """
+
+        self.add_to_output_queue(result)
+
+        PyFunceble.facility.Logger.info(
+            "Produced: %r",
+            result,
+        )
+
+    def handle_exception(self, exception: Exception) -> None:
+        """
+        Shares the given exception (raised from one of our threads) and stops
+        our worker.
+
+        .. warning::
+            This should be executed from an :code:`except` block.
+        """
+
+        PyFunceble.facility.Logger.critical("Error while running target", exc_info=True)
+        trace = traceback.format_exc()
+        self._child_connection.send((exception, trace))
+
+        # Wake up our worker so that it can stop.
+        self.abort_completion_tracking()
+        self.exit_it.set()
+        self.add_to_input_queue("stop", destination_worker=self.name)
+
+    def acknowledge_in_order(self, sequence: int) -> "ThreadTesterWorker":
+        """
+        Acknowledges the message at the given position (in our reading order)
+        once everything we read before it is acknowledged too. That way, our
+        input queue never forgets a message which is still being tested.
+
+        :param sequence:
+            The position of the message.
+        """
+
+        with self.acknowledgement_lock:
+            self.finished_sequences.add(sequence)
+            count = 0
+
+            while self.acknowledged_count in self.finished_sequences:
+                self.finished_sequences.remove(self.acknowledged_count)
+                self.acknowledged_count += 1
+                count += 1
+
+        if count:
+            self.acknowledge(count)
+
+        return self
+
+    def run_test(self, test_dataset: dict) -> None:
+        """
+        Tests the given dataset and sends its result to the output queue.
+
+        .. warning::
+            This is executed from one of our threads.
+
+        :param test_dataset:
+            The dataset to test.
+        """
+
+        try:
+            self.submit_result(self.threaded_test(test_dataset))
+        except Exception as exception:  # pylint: disable=broad-except
+            self.handle_exception(exception)
+        finally:
+            self.inflight.release()
+            self.mark_as_done()
+            self.acknowledge_in_order(self.sequences.pop(id(test_dataset)))
+
+    def dispatch(self, test_dataset: dict) -> "ThreadTesterWorker":
+        """
+        Hands the given dataset over to our pool of threads.
+
+        :param test_dataset:
+            The dataset to test.
+        """
+
+        self.executor.submit(self.run_test, test_dataset)
+
+        return self
+
+    def target(self, consumed: dict) -> Optional[Tuple[Any, ...]]:
+        sequence = self.read_count
+        self.read_count += 1
+
+        test_dataset = self.pre_test(consumed)
+
+        if test_dataset is None:
+            self.acknowledge_in_order(sequence)
+            return None
+
+        # Blocks as long as we have too many subjects in flight.
+        self.inflight.acquire()
+
+        if self.completion_tracker is not None:
+            # We are not done before our thread is done.
+            self.completion_tracker.add()
+
+        self.sequences[id(test_dataset)] = sequence
+        self.dispatch(test_dataset)
+
+        # Returning None because our threads send the result themselves.
+        return None
+
+    def finish(self) -> "ThreadTesterWorker":
+        """
+        Waits until all subjects in flight are tested, then sends everything we
+        still have in hands.
+        """
+
+        if self.inflight is not None:
+            self.inflight.wait_idle()
+
+        return super().finish()
+
+    def tear_down(self) -> "ThreadTesterWorker":
+        # Our threads may still use what is shared within our process.
+        self.stop_threads()
+
+        return super().tear_down()
+
+    def run(self) -> None:
+        self.start_threads()
+
+        super().run()
@@ -0,0 +1,220 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the scheduler of the subjects we send to our tester workers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import itertools
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import PyFunceble.facility
+import PyFunceble.storage
+
+
+class SubjectScheduler:
+    """
+    Provides a way to interleave the subjects of multiple classes - e.g. the
+    subjects read from a file and the ones retested from our inactive dataset
+    - according to the weight of each class.
+
+    We follow a smooth weighted round-robin: over time, each class gets a
+    share of the output proportional to its weight - without long runs of a
+    single class. A class with a weight of :code:`0` only gets its turn once
+    all other classes are exhausted.
+
+    .. note::
+        The sources are read lazily: we only read a source when its class gets
+        its turn.
+
+    :param weights:
+        The weight of each class.
+    """
+
+    STD_WEIGHTS: Dict[str, int] = {"fresh": 4, "complements": 2, "inactive": 1}
+    SUPPORTED_CLASSES: List[str] = list(STD_WEIGHTS)
+
+    _weights: Optional[Dict[str, int]] = None
+
+    sources: Optional[Dict[str, List[Iterable[Any]]]] = None
+
+    def __init__(self, weights: Optional[Dict[str, int]] = None) -> None:
+        if weights is not None:
+            self.weights = weights
+        else:
+            self.guess_and_set_weights()
+
+        self.sources = dict()
+
+    def __iter__(self) -> Iterator[Any]:
+        sources = {
+            name: itertools.chain.from_iterable(sources)
+            for name, sources in self.sources.items()
+        }
+        current = {name: 0 for name in sources}
+
+        while sources:
+            candidates = [x for x in sources if self.weights[x] > 0]
+
+            if candidates:
+                total = sum(self.weights[x] for x in candidates)
+
+                for name in candidates:
+                    current[name] += self.weights[name]
+
+                chosen = max(candidates, key=lambda x: current[x])
+                current[chosen] -= total
+            else:
+                # Only the classes we test once everything else is done are
+                # left. They are given in the order they were added.
+                chosen = next(iter(sources))
+
+            try:
+                yield next(sources[chosen])
+            except StopIteration:
+                PyFunceble.facility.Logger.debug("Exhausted class: %r", chosen)
+
+                del sources[chosen]
+                del current[chosen]
+
+        self.sources = dict()
+
+    @property
+    def weights(self) -> Optional[Dict[str, int]]:
+        """
+        Provides the current state of the :code:`_weights` attribute.
+        """
+
+        return self._weights
+
+    @weights.setter
+    def weights(self, value: Dict[str, int]) -> None:
+        """
+        Sets the weight of each class.
+
+        :param value:
+            The value to set. The classes we don't know are ignored and the
+            missing ones get their default weight.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`dict` or when one
+            of the given weight is not an :py:class:`int`.
+        :raise ValueError:
+            When one of the given weight is negative.
+        """
+
+        if not isinstance(value, dict):
+            raise TypeError(f"<value> should be {dict}, {type(value)} given.")
+
+        weights = dict(self.STD_WEIGHTS)
+
+        for name, weight in value.items():
+            if name not in self.SUPPORTED_CLASSES:
+                continue
+
+            if not isinstance(weight, int) or isinstance(weight, bool):
+                raise TypeError(
+                    f"<value[{name!r}]> should be {int}, {type(weight)} given."
+                )
+
+            if weight < 0:
+                raise ValueError(f"<value[{name!r}]> should be zero or positive.")
+
+            weights[name] = weight
+
+        self._weights = weights
+
+    def set_weights(self, value: Dict[str, int]) -> "SubjectScheduler":
+        """
+        Sets the weight of each class.
+
+        :param value:
+            The value to set.
+        """
+
+        self.weights = value
+
+        return self
+
+    def guess_and_set_weights(self) -> "SubjectScheduler":
+        """
+        Try to guess and set the weight of each class.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded() and isinstance(
+            PyFunceble.storage.CONFIGURATION.cli_testing.weights, dict
+        ):
+            self.weights = dict(PyFunceble.storage.CONFIGURATION.cli_testing.weights)
+        else:
+            self.weights = dict(self.STD_WEIGHTS)
+
+        return self
+
+    def add_source(self, name: str, source: Iterable[Any]) -> "SubjectScheduler":
+        """
+        Adds a source of subjects of the given class. The sources of a single
+        class are read one after the other.
+
+        :param name:
+            The name of the class.
+        :param source:
+            The source to add.
+
+        :raise ValueError:
+            When the given class is unknown.
+        """
+
+        if name not in self.SUPPORTED_CLASSES:
+            raise ValueError(
+                f"<name> ({name!r}) is unknown "
+                f"(supported: {self.SUPPORTED_CLASSES!r})."
+            )
+
+        self.sources.setdefault(name, list()).append(source)
+
+        return self
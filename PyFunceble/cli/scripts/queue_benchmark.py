@@ -0,0 +1,199 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides our queue backends benchmark.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+
+import multiprocessing
+import time
+from typing import Dict, List, Optional
+
+import PyFunceble.facility
+from PyFunceble.cli.processes.base import ProcessesManagerBase
+
+
+class QueueBenchmark:
+    """
+    Provides an interface for the benchmark of the queue backends we support.
+
+    The idea is to push the same kind of message our launcher sends to the
+    testers through each backend and to measure how many messages per second
+    a set of consumer processes are able to read.
+
+    :param messages:
+        The number of messages to send through each backend.
+    :param consumers:
+        The number of consumer processes to start.
+    :param backends:
+        The backends to benchmark.
+    """
+
+    STD_MESSAGES: int = 100_000
+    STD_CONSUMERS: int = ProcessesManagerBase.STD_MAX_WORKER
+
+    STD_MESSAGE: dict = {
+        "type": "file",
+        "subject_type": "domain",
+        "destination": "example.list",
+        "subject": "example.org",
+        "idna_subject": "example.org",
+        "source": "example.list",
+        "output_dir": "output/example.list",
+        "checker_type": "AVAILABILITY",
+        "session_id": None,
+    }
+
+    messages: Optional[int] = None
+    consumers: Optional[int] = None
+    backends: Optional[List[str]] = None
+
+    def __init__(
+        self,
+        *,
+        messages: Optional[int] = None,
+        consumers: Optional[int] = None,
+        backends: Optional[List[str]] = None,
+    ) -> None:
+        if messages is not None:
+            self.messages = messages
+        else:
+            self.messages = self.STD_MESSAGES
+
+        if consumers is not None:
+            self.consumers = consumers
+        else:
+            self.consumers = self.STD_CONSUMERS
+
+        if backends is not None:
+            self.backends = backends
+        else:
+            self.backends = list(ProcessesManagerBase.SUPPORTED_QUEUE_BACKENDS)
+
+    @staticmethod
+    def consume(input_queue, output_queue) -> None:
+        """
+        Reads the given input queue until we get our stop message.
+        Once stopped, the number of read messages is sent to the output queue.
+
+        .. warning::
+            This method is expected to be run from a sub-process.
+        """
+
+        count = 0
+
+        while True:
+            _, _, consumed = input_queue.get()
+
+            if consumed == "stop":
+                break
+
+            count += 1
+
+        output_queue.put(count)
+
+    def run_backend(self, backend: str) -> float:
+        """
+        Runs the benchmark of the given backend.
+
+        :param backend:
+            The backend to benchmark.
+
+        :return:
+            The number of messages per second.
+        """
+
+        process_manager = ProcessesManagerBase(queue_backend=backend)
+
+        input_queue = process_manager.input_queue
+        output_queue = process_manager.output_queue[0]
+
+        processes = [
+            multiprocessing.Process(
+                target=self.consume, args=(input_queue, output_queue), daemon=True
+            )
+            for _ in range(self.consumers)
+        ]
+
+        for process in processes:
+            process.start()
+
+        start_time = time.perf_counter()
+
+        for _ in range(self.messages):
+            input_queue.put(("main", None, dict(self.STD_MESSAGE)))
+
+        for _ in range(self.consumers):
+            input_queue.put(("main", None, "stop"))
+
+        consumed = sum(output_queue.get() for _ in range(self.consumers))
+
+        elapsed = time.perf_counter() - start_time
+
+        for process in processes:
+            process.join()
+
+        if process_manager.manager is not None:
+            process_manager.manager.shutdown()
+
+        PyFunceble.facility.Logger.info(
+            "Backend %r: consumed %r messages in %rs.", backend, consumed, elapsed
+        )
+
+        return consumed / elapsed if elapsed else float(consumed)
+
+    def start(self) -> Dict[str, float]:
+        """
+        Starts the benchmark of all backends.
+
+        :return:
+            The number of messages per second of each backend.
+        """
+
+        return {x: self.run_backend(x) for x in self.backends}
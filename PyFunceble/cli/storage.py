@@ -116,6 +116,7 @@ COUNTER_FILE = "counter.json"
 TEST_RUNNING_FILE = ".running"
 
 PRE_LOADER_FILE = "preload.json"
+TESTER_QUEUE_FILE = "tester_queue.db"
 
 STD_PARENT_DIRNAME: str = "__pyfunceble_origin__"
 STD_LOGGING_DIRNAME: str = "__pyfunceble_loggging__"
@@ -52,14 +52,16 @@ License:
 """
 
 import argparse
-import copy
+import collections
+import concurrent.futures
 import datetime
 import multiprocessing
 import os
 import secrets
 import sys
+import threading
 import traceback
-from typing import List, Optional
+from typing import Dict, Generator, List, Optional
 
 import colorama
 import domain2idna
@@ -86,16 +88,22 @@ from PyFunceble.cli.filesystem.dir_structure.restore import (
 )
 from PyFunceble.cli.filesystem.printer.file import FilePrinter
 from PyFunceble.cli.filesystem.printer.stdout import StdoutPrinter
+from PyFunceble.cli.processes.completion import CompletionTracker
 from PyFunceble.cli.processes.dir_files_sorter import DirFileSorterProcessesManager
+from PyFunceble.cli.processes.disk_queue import DiskQueue
 from PyFunceble.cli.processes.migrator import MigratorProcessesManager
 from PyFunceble.cli.processes.miner import MinerProcessesManager
 from PyFunceble.cli.processes.producer import ProducerProcessesManager
+from PyFunceble.cli.processes.remote import Coordinator, get_address
+from PyFunceble.cli.processes.task import Task
 from PyFunceble.cli.processes.tester import TesterProcessesManager
+from PyFunceble.cli.scheduler import SubjectScheduler
 from PyFunceble.cli.system.base import SystemBase
 from PyFunceble.cli.utils.testing import (
     get_continue_databaset_object,
     get_destination_from_origin,
     get_inactive_dataset_object,
+    get_subjects_and_complements_from_line,
     get_subjects_from_line,
     get_testing_mode,
 )
@@ -113,6 +121,8 @@ from PyFunceble.dataset.autocontinue.csv import CSVContinueDataset
 from PyFunceble.dataset.inactive.base import InactiveDatasetBase
 from PyFunceble.helpers.download import DownloadHelper
 from PyFunceble.helpers.file import FileHelper
+from PyFunceble.query.dns.cache import DNSCache
+from PyFunceble.utils.sharding import get_shard_filename
 
 
 class SystemLauncher(SystemBase):
@@ -120,6 +130,18 @@ class SystemLauncher(SystemBase):
     Provides the system tests launcher.
     """
 
+    PROGRESS_SAVE_INTERVAL: int = 1000
+    """
+    The number of lines to read before saving how far we read a file. Only
+    used with our disk queue.
+    """
+
+    MAX_PENDING_TASKS: int = 10000
+    """
+    The maximal number of tasks (of a file) waiting for their class to get its
+    turn. Once reached, they are given along with the tasks of the other class.
+    """
+
     testing_protocol: List[dict] = []
     """
     Saves the protocol which we are going to generate.
@@ -143,30 +165,34 @@ class SystemLauncher(SystemBase):
     execution_time_holder: Optional[ExecutionTime] = None
     file_preloader: Optional[FilePreloader] = None
 
-    manager: Optional[multiprocessing.Manager]
+    manager: Optional[multiprocessing.Manager] = None
     tester_process_manager: Optional[TesterProcessesManager] = None
     producer_process_manager: Optional[ProducerProcessesManager] = None
     miner_process_manager: Optional[MinerProcessesManager] = None
     dir_files_sorter_process_manager: Optional[DirFileSorterProcessesManager] = None
     migrator_process_manager: Optional[MigratorProcessesManager] = None
 
+    completion_tracker: Optional[CompletionTracker] = None
+    disk_queue: Optional[DiskQueue] = None
+    dns_cache: Optional[DNSCache] = None
+    dns_cache_counters: Optional[dict] = None
+    coordinator: Optional[Coordinator] = None
+
     continue_dataset: Optional[ContinueDatasetBase] = None
     inactive_dataset: Optional[InactiveDatasetBase] = None
     continuous_integration: Optional[ContinuousIntegrationBase] = None
 
     db_session: Optional[Session] = None
 
+    input_lock: Optional[threading.Lock] = None
+
     checker_type: Optional[str] = None
 
     sessions_id: dict = dict()
 
     def __init__(self, args: Optional[argparse.Namespace] = None) -> None:
-        try:
-            self.db_session = (
-                PyFunceble.cli.factory.DBSession.get_db_session().get_new_session()()
-            )
-        except TypeError:
-            self.db_session = None
+        self.db_session = self.get_new_db_session()
+        self.input_lock = threading.Lock()
 
         self.execution_time_holder = ExecutionTime().set_start_time()
         self.checker_type = get_testing_mode()
@@ -181,14 +207,36 @@ class SystemLauncher(SystemBase):
 
         self.stdout_printer.guess_allow_coloration()
 
-        self.manager = multiprocessing.Manager()
+        if PyFunceble.storage.CONFIGURATION.cli_testing.queue_backend == "manager":
+            self.manager = multiprocessing.Manager()
+        else:
+            # Our native queues don't need any (proxy) server process.
+            self.manager = None
+
+        if PyFunceble.storage.CONFIGURATION.cli_testing.mining:
+            # Our testers, producer and miner form a loop. This is how we know
+            # when it's over.
+            self.completion_tracker = CompletionTracker()
+
+        if PyFunceble.storage.CONFIGURATION.cli_testing.disk_queue:
+            self.disk_queue = self.new_disk_queue()
+
+        if PyFunceble.storage.CONFIGURATION.dns.cache:
+            self.dns_cache = DNSCache()
+            PyFunceble.facility.Logger.debug(
+                "Deleted %r expired DNS response(s).", self.dns_cache.cleanup()
+            )
+            # The cache - and its counters - may be shared with concurrent runs.
+            self.dns_cache_counters = self.dns_cache.get_counters()
 
         self.tester_process_manager = TesterProcessesManager(
             self.manager,
             max_worker=PyFunceble.storage.CONFIGURATION.cli_testing.max_workers,
             continuous_integration=self.continuous_integration,
+            input_queue=self.disk_queue,
             daemon=True,
             output_workers_count=1,
+            completion_tracker=self.completion_tracker,
         )
         self.producer_process_manager = ProducerProcessesManager(
             self.manager,
@@ -196,11 +244,15 @@ class SystemLauncher(SystemBase):
             continuous_integration=self.continuous_integration,
             input_queue=self.tester_process_manager.output_queue[0],
             daemon=True,
+            # Nobody reads our output unless we are mining (see below). And a
+            # native queue that nobody reads ends up blocking its writer.
+            generate_output_queue=False,
             output_workers_count=1,
+            completion_tracker=self.completion_tracker,
         )
         self.dir_files_sorter_process_manager = DirFileSorterProcessesManager(
             self.manager,
-            max_worker=PyFunceble.storage.CONFIGURATION.cli_testing.max_workers,
+            max_worker=PyFunceble.storage.CONFIGURATION.cli_testing.cpu_workers,
             continuous_integration=self.continuous_integration,
             daemon=True,
             generate_output_queue=False,
@@ -223,10 +275,9 @@ class SystemLauncher(SystemBase):
                 output_queue=self.tester_process_manager.input_queue,
                 daemon=True,
                 output_workers_count=self.tester_process_manager.max_worker,
+                completion_tracker=self.completion_tracker,
             )
 
-            del self.producer_process_manager.output_queue
-
             self.producer_process_manager.output_queue = [
                 self.miner_process_manager.input_queue
             ]
@@ -254,6 +305,65 @@ class SystemLauncher(SystemBase):
         if self.db_session is not None:
             self.db_session.close()
 
+    @staticmethod
+    def get_new_db_session() -> Optional[Session]:
+        """
+        Provides a new database session - if possible.
+        """
+
+        try:
+            return PyFunceble.cli.factory.DBSession.get_db_session().get_new_session()()
+        except TypeError:
+            return None
+
+    @staticmethod
+    def new_converters() -> dict:
+        """
+        Provides a new set of converters.
+
+        Some of our converters keep a state (like the SOA of an RPZ file).
+        Therefore, each file we read concurrently gets its own set.
+        """
+
+        return {
+            "adblock_inputline2subject": AdblockInputLine2Subject(),
+            "wildcard2subject": Wildcard2Subject(),
+            "rpz_policy2subject": RPZPolicy2Subject(),
+            "rpz_inputline2subject": RPZInputLine2Subject(),
+            "inputline2subject": InputLine2Subject(),
+            "subject2complements": Subject2Complements(),
+            "url2netloc": Url2Netloc(),
+            "cidr2subject": CIDR2Subject(),
+        }
+
+    @staticmethod
+    def new_disk_queue() -> DiskQueue:
+        """
+        Provides the disk queue of our tester workers.
+
+        When we are allowed to continue, what a previous run left into it is
+        given back to our tester workers. Otherwise, it is deleted.
+        """
+
+        disk_queue = DiskQueue(
+            os.path.join(
+                PyFunceble.storage.CONFIG_DIRECTORY,
+                get_shard_filename(PyFunceble.cli.storage.TESTER_QUEUE_FILE),
+            )
+        )
+
+        if not PyFunceble.storage.CONFIGURATION.cli_testing.autocontinue:
+            disk_queue = DiskQueue(disk_queue.delete().path)
+
+        released = disk_queue.release_taken()
+
+        if released:
+            PyFunceble.facility.Logger.info(
+                "Gave back %r message(s) left by a previous run.", released
+            )
+
+        return disk_queue
+
     @staticmethod
     def print_home_ascii() -> None:
         """
@@ -318,7 +428,9 @@ class SystemLauncher(SystemBase):
                     "type": "file",
                     "subject_type": "domain",
                     # pylint: disable=line-too-long
-                    "destination": get_destination_from_origin(file),
+                    "destination": get_shard_filename(
+                        get_destination_from_origin(file)
+                    ),
                     "source": file,
                     "subject": file,
                     "checker_type": self.checker_type,
@@ -341,7 +453,9 @@ class SystemLauncher(SystemBase):
                     "type": "file",
                     "subject_type": "url",
                     # pylint: disable=line-too-long
-                    "destination": get_destination_from_origin(file),
+                    "destination": get_shard_filename(
+                        get_destination_from_origin(file)
+                    ),
                     "source": file,
                     "subject": file,
                     "checker_type": self.checker_type,
@@ -454,10 +568,257 @@ class SystemLauncher(SystemBase):
             if not PyFunceble.storage.CONFIGURATION.cli_testing.file_generation.no_file:
                 DirectoryStructureRestoration(parent_dirname).restore_from_backup()
 
+        def get_progress(protocol: dict, stage: str) -> dict:
+            """
+            Provides how far we went - through the given stage of the given
+            protocol - during our current session.
+
+            :param protocol:
+                The protocol to work with.
+            :param stage:
+                The stage to work with.
+            """
+
+            if self.disk_queue is None or not protocol["session_id"]:
+                return dict()
+
+            progress = self.disk_queue.get_meta(
+                f"{protocol['destination']}:{stage}", dict()
+            )
+
+            if progress.get("session_id") != protocol["session_id"]:
+                # A previous session. Not ours.
+                return dict()
+
+            return progress
+
+        def save_progress(protocol: dict, stage: str, **progress) -> None:
+            """
+            Saves how far we went through the given stage of the given
+            protocol. That way, we can restart from there.
+
+            :param protocol:
+                The protocol to work with.
+            :param stage:
+                The stage to work with.
+            """
+
+            if self.disk_queue is None or not protocol["session_id"]:
+                return None
+
+            with self.input_lock:
+                # What we read has to be into our queue before we say so.
+                self.tester_process_manager.flush_input_batch()
+
+                self.disk_queue.set_meta(
+                    f"{protocol['destination']}:{stage}",
+                    {"session_id": protocol["session_id"], **progress},
+                )
+
+            return None
+
+        def read_preloaded(
+            protocol: dict,
+            continue_dataset: ContinueDatasetBase,
+            file_preloader: FilePreloader,
+        ) -> Generator[Task, None, None]:
+            """
+            Provides the tasks of the subjects our preloader did not test yet.
+
+            What a previous run preloaded comes first. Then, we preload the file
+            and provide each subject as soon as it was saved. In other words,
+            we don't wait for the end of the preloading to start testing.
+
+            :param protocol:
+                The protocol to work with.
+            :param continue_dataset:
+                The continue dataset to read from.
+            :param file_preloader:
+                The preloader of the file of the given protocol.
+            """
+
+            if get_progress(protocol, "preload").get("complete"):
+                return None
+
+            display_mode = PyFunceble.storage.CONFIGURATION.cli_testing.display_mode
+            protocol_id = self.tester_process_manager.register_protocol(
+                {**protocol, "from_preload": True}
+            )
+
+            for subject in continue_dataset.get_to_test(protocol["session_id"]):
+                yield Task(protocol_id, subject, subject)
+
+            if not display_mode.quiet:
+                print(
+                    f"{colorama.Fore.MAGENTA}{colorama.Style.BRIGHT}"
+                    f"Started preloading of {protocol['source']}..."
+                )
+
+            for subject in file_preloader.stream(
+                print_dots=display_mode.quiet or bool(display_mode.dots)
+            ):
+                yield Task(protocol_id, subject, subject)
+
+            if not display_mode.quiet:
+                print(
+                    f"\n{colorama.Fore.GREEN}{colorama.Style.BRIGHT}"
+                    f"Finished preloading of {protocol['source']}."
+                )
+
+            save_progress(protocol, "preload", complete=True)
+
+            return None
+
+        def read_file(
+            protocol: dict, converters: dict, *, with_complements: bool = False
+        ) -> Dict[str, Generator[Task, None, None]]:
+            """
+            Provides the tasks of the subjects - and of their complements - of
+            the file of the given protocol.
+
+            The file is read once. What we read for a class which did not get
+            its turn yet waits for it - unless too much is already waiting.
+
+            :param protocol:
+                The protocol to work with.
+            :param converters:
+                The converters to use.
+            :param with_complements:
+                Whether we provide the complements of the subjects.
+
+            :return:
+                The tasks of each class: :code:`fresh` for the subjects,
+                :code:`complements` for their complements.
+            """
+
+            progress = get_progress(protocol, "file")
+
+            if progress.get("complete"):
+                return dict()
+
+            protocol_id = self.tester_process_manager.register_protocol(protocol)
+            rpz_policy2subject = converters["rpz_policy2subject"]
+
+            if progress.get("soa"):
+                rpz_policy2subject.set_soa(progress["soa"])
+
+            # Each task waits along with where its line starts (and the SOA at
+            # that point): that's where we restart from when it was not given.
+            pending = {"fresh": collections.deque(), "complements": collections.deque()}
+
+            def read_lines() -> Generator[bool, None, None]:
+                # We read bytes so that we always know where we are.
+                with FileHelper(protocol["subject"]).open("rb") as file_stream:
+                    file_stream.seek(progress.get("offset", 0))
+
+                    for index, line in enumerate(file_stream, start=1):
+                        start = (file_stream.tell() - len(line), rpz_policy2subject.soa)
+
+                        if index % self.PROGRESS_SAVE_INTERVAL == 0:
+                            offset, soa = min(
+                                [x[0][0] for x in pending.values() if x] + [start],
+                                key=lambda x: x[0],
+                            )
+                            save_progress(protocol, "file", offset=offset, soa=soa)
+
+                        line = line.decode("utf-8").strip()
+
+                        if "SOA" in line:
+                            rpz_policy2subject.set_soa(line.split()[0])
+
+                        subjects, complements = get_subjects_and_complements_from_line(
+                            line,
+                            self.checker_type,
+                            **converters,
+                        )
+
+                        for stage, stage_subjects in (
+                            ("fresh", subjects),
+                            ("complements", complements if with_complements else []),
+                        ):
+                            for subject in stage_subjects:
+                                pending[stage].append(
+                                    (
+                                        start,
+                                        Task(
+                                            protocol_id,
+                                            subject,
+                                            domain2idna.domain2idna(subject),
+                                        ),
+                                    )
+                                )
+
+                        yield True
+
+            lines = read_lines()
+
+            def read_stage(stage: str) -> Generator[Task, None, None]:
+                other = "complements" if stage == "fresh" else "fresh"
+
+                while True:
+                    if len(pending[other]) >= self.MAX_PENDING_TASKS:
+                        yield pending[other].popleft()[1]
+                    elif pending[stage]:
+                        yield pending[stage].popleft()[1]
+                    elif not next(lines, False):
+                        break
+
+                if not any(pending.values()):
+                    # Everything was given.
+                    save_progress(protocol, "file", complete=True)
+
+            result = {"fresh": read_stage("fresh")}
+
+            if with_complements:
+                result["complements"] = read_stage("complements")
+
+            return result
+
+        def read_inactive(
+            protocol: dict, inactive_dataset: InactiveDatasetBase
+        ) -> Generator[Task, None, None]:
+            """
+            Provides the tasks of the subjects of the given protocol we have
+            to retest from our inactive dataset.
+
+            :param protocol:
+                The protocol to work with.
+            :param inactive_dataset:
+                The inactive dataset to read from.
+            """
+
+            if get_progress(protocol, "inactive").get("complete"):
+                return None
+
+            protocol_id = self.tester_process_manager.register_protocol(
+                {**protocol, "from_inactive": True}
+            )
+
+            for dataset in inactive_dataset.get_to_retest(
+                protocol["destination"],
+                protocol["checker_type"],
+                # pylint: disable=line-too-long
+                min_days=PyFunceble.storage.CONFIGURATION.cli_testing.days_between.db_retest,
+            ):
+                # Note: Our test infrastructure need a subject
+                # but there is no subject in the table.
+                yield Task(
+                    protocol_id, dataset["idna_subject"], dataset["idna_subject"]
+                )
+
+            save_progress(protocol, "inactive", complete=True)
+
+            return None
+
         def handle_file(protocol: dict) -> None:
             """
             Given a protocol related to a given file, we handle every
             possible decoding case before submitting a new subject to the queue.
+
+            .. note::
+                As multiple files are handled concurrently, everything that
+                keeps a state (converters, datasets, database session and
+                preloader) is specific to the given file.
             """
 
             cleanup_if_necessary(protocol["destination"])
@@ -472,133 +833,117 @@ class SystemLauncher(SystemBase):
             protocol["source"] = os.path.relpath(protocol["destination"])
             protocol["session_id"] = self.sessions_id[protocol["destination"]]
 
-            if isinstance(self.continue_dataset, CSVContinueDataset):
-                self.continue_dataset.set_base_directory(protocol["output_dir"])
+            converters = self.new_converters()
+            db_session = self.get_new_db_session()
 
-            if self.file_preloader.authorized:
-                if not PyFunceble.storage.CONFIGURATION.cli_testing.display_mode.quiet:
-                    print(
-                        f"{colorama.Fore.MAGENTA}{colorama.Style.BRIGHT}"
-                        f"Started preloading of {protocol['source']}..."
-                    )
+            try:
+                continue_dataset = get_continue_databaset_object(db_session=db_session)
+                inactive_dataset = get_inactive_dataset_object(db_session=db_session)
 
-                self.file_preloader.set_protocol(protocol).start(
-                    # pylint: disable=line-too-long
-                    print_dots=(
-                        PyFunceble.storage.CONFIGURATION.cli_testing.display_mode.quiet
-                        or bool(
-                            PyFunceble.storage.CONFIGURATION.cli_testing.display_mode.dots
-                        )
-                    )
-                )
+                if isinstance(continue_dataset, CSVContinueDataset):
+                    continue_dataset.set_base_directory(protocol["output_dir"])
 
-                if not PyFunceble.storage.CONFIGURATION.cli_testing.display_mode.quiet:
-                    print(
-                        f"\n{colorama.Fore.GREEN}{colorama.Style.BRIGHT}"
-                        f"Finished preloading of {protocol['source']}."
-                    )
+                scheduler = SubjectScheduler()
 
-                self.__start_core_processes()
+                if self.file_preloader.authorized:
+                    file_preloader = FilePreloader(
+                        continuous_integration=self.continuous_integration,
+                        checker_type=self.checker_type,
+                        continue_dataset=continue_dataset,
+                        inactive_dataset=inactive_dataset,
+                        **converters,
+                    ).set_protocol(protocol)
 
-                for subject in self.continue_dataset.get_to_test(
-                    protocol["session_id"]
-                ):
+                    scheduler.add_source(
+                        "fresh",
+                        read_preloaded(protocol, continue_dataset, file_preloader),
+                    )
+                else:
+                    for stage, source in read_file(
+                        protocol,
+                        converters,
+                        with_complements=bool(
+                            PyFunceble.storage.CONFIGURATION.cli_testing.complements
+                        ),
+                    ).items():
+                        scheduler.add_source(stage, source)
+
+                # Now, let's handle the inactive one :-)
+                if bool(PyFunceble.storage.CONFIGURATION.cli_testing.inactive_db):
+                    scheduler.add_source(
+                        "inactive", read_inactive(protocol, inactive_dataset)
+                    )
 
-                    self.ci_stop_in_the_middle_if_time_exceeded()
+                for task in scheduler:
+                    if self.continuous_integration.is_time_exceeded():
+                        # We stop reading. Our main thread takes care of the
+                        # rest.
+                        return None
 
-                    to_send = copy.deepcopy(protocol)
-                    to_send["subject"], to_send["idna_subject"] = subject, subject
-                    to_send["from_preload"] = True
+                    with self.input_lock:
+                        self.tester_process_manager.add_to_input_queue(
+                            task, worker_name="main"
+                        )
+            finally:
+                if db_session is not None:
+                    db_session.close()
 
-                    self.tester_process_manager.add_to_input_queue(
-                        to_send, worker_name="main"
-                    )
+            with self.input_lock:
+                self.dir_files_sorter_process_manager.add_to_input_queue(
+                    {"directory": protocol["output_dir"]}
+                )
 
-            else:
-                with FileHelper(protocol["subject"]).open(
-                    "r", encoding="utf-8"
-                ) as file_stream:
-                    for line in file_stream:
-                        self.ci_stop_in_the_middle_if_time_exceeded()
+            return None
 
-                        line = line.strip()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=PyFunceble.storage.CONFIGURATION.cli_testing.file_workers,
+            thread_name_prefix="pyfunceble_file_reader",
+        ) as executor:
+            futures = []
 
-                        if "SOA" in line:
-                            self.rpz_policy2subject.set_soa(line.split()[0])
+            for protocol in self.testing_protocol:
+                self.ci_stop_in_the_middle_if_time_exceeded()
 
-                        for subject in get_subjects_from_line(
-                            line,
-                            self.checker_type,
-                            adblock_inputline2subject=self.adblock_inputline2subject,
-                            wildcard2subject=self.wildcard2subject,
-                            rpz_policy2subject=self.rpz_policy2subject,
-                            rpz_inputline2subject=self.rpz_inputline2subject,
-                            inputline2subject=self.inputline2subject,
-                            subject2complements=self.subject2complements,
-                            url2netloc=self.url2netloc,
-                            cidr2subject=self.cidr2subject,
-                        ):
-                            to_send = copy.deepcopy(protocol)
-                            to_send["subject"] = subject
-                            to_send["idna_subject"] = domain2idna.domain2idna(subject)
+                if protocol["type"] == "single":
+                    protocol_id = self.tester_process_manager.register_protocol(
+                        protocol
+                    )
 
+                    for subject in get_subjects_from_line(
+                        protocol["idna_subject"],
+                        self.checker_type,
+                        adblock_inputline2subject=self.adblock_inputline2subject,
+                        wildcard2subject=self.wildcard2subject,
+                        rpz_policy2subject=self.rpz_policy2subject,
+                        rpz_inputline2subject=self.rpz_inputline2subject,
+                        inputline2subject=self.inputline2subject,
+                        subject2complements=self.subject2complements,
+                        url2netloc=self.url2netloc,
+                        cidr2subject=self.cidr2subject,
+                    ):
+                        with self.input_lock:
                             self.tester_process_manager.add_to_input_queue(
-                                to_send, worker_name="main"
+                                Task(
+                                    protocol_id,
+                                    subject,
+                                    domain2idna.domain2idna(subject),
+                                ),
+                                worker_name="main",
                             )
+                elif protocol["type"] == "file":
+                    futures.append(executor.submit(handle_file, protocol))
 
-            # Now, let's handle the inactive one :-)
-            if bool(PyFunceble.storage.CONFIGURATION.cli_testing.inactive_db):
-                for dataset in self.inactive_dataset.get_to_retest(
-                    protocol["destination"],
-                    protocol["checker_type"],
-                    # pylint: disable=line-too-long
-                    min_days=PyFunceble.storage.CONFIGURATION.cli_testing.days_between.db_retest,
-                ):
-                    self.ci_stop_in_the_middle_if_time_exceeded()
-
-                    to_send = copy.deepcopy(protocol)
-                    to_send["from_inactive"] = True
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    # Let the errors of our readers surface.
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
 
-                    # Note: Our test infrastructure need a subject
-                    # but there is no subject in the table.
-                    to_send["subject"] = dataset["idna_subject"]
-                    to_send["idna_subject"] = dataset["idna_subject"]
+                raise
 
-                    self.tester_process_manager.add_to_input_queue(
-                        to_send, worker_name="main"
-                    )
-
-            self.dir_files_sorter_process_manager.add_to_input_queue(
-                {"directory": protocol["output_dir"]}
-            )
-
-        for protocol in self.testing_protocol:
-            self.ci_stop_in_the_middle_if_time_exceeded()
-
-            if protocol["type"] == "single":
-                for subject in get_subjects_from_line(
-                    protocol["idna_subject"],
-                    self.checker_type,
-                    adblock_inputline2subject=self.adblock_inputline2subject,
-                    wildcard2subject=self.wildcard2subject,
-                    rpz_policy2subject=self.rpz_policy2subject,
-                    rpz_inputline2subject=self.rpz_inputline2subject,
-                    inputline2subject=self.inputline2subject,
-                    subject2complements=self.subject2complements,
-                    url2netloc=self.url2netloc,
-                    cidr2subject=self.cidr2subject,
-                ):
-                    to_send = copy.deepcopy(protocol)
-                    to_send["subject"], to_send["idna_subject"] = (
-                        subject,
-                        domain2idna.domain2idna(subject),
-                    )
-
-                    self.tester_process_manager.add_to_input_queue(
-                        to_send, worker_name="main"
-                    )
-            elif protocol["type"] == "file":
-                handle_file(protocol)
+        self.ci_stop_in_the_middle_if_time_exceeded()
 
         return self
 
@@ -743,6 +1088,11 @@ class SystemLauncher(SystemBase):
                 remove_continue_dataset(protocol)
                 remove_preload_dataset(protocol)
 
+        if self.disk_queue is not None:
+            # Everything was tested. Nothing has to survive us.
+            self.disk_queue.delete()
+            PyFunceble.facility.Logger.debug("Deleted: %r.", self.disk_queue.path)
+
         return self
 
     def run_standard_end_instructions(self) -> "SystemLauncher":
@@ -817,16 +1167,44 @@ class SystemLauncher(SystemBase):
         Sends our stop signal and wait until all managers are finished.
         """
 
+        if self.completion_tracker is not None:
+            # What we mine goes back to our testers. Therefore, we can only
+            # stop them once nothing is in flight anymore.
+            self.tester_process_manager.flush_input_batch()
+            self.completion_tracker.close()
+            self.completion_tracker.wait()
+
+        if self.coordinator is not None:
+            # Our worker nodes stop once our queue is drained. So, everything
+            # has to be in it first.
+            self.tester_process_manager.flush_input_batch()
+            self.coordinator.close()
+
+            # Their results go to our producer. It can't stop before them.
+            # And what a lost node held is given back to our tester workers.
+            # So, they can't stop before them either.
+            self.coordinator.wait_for_nodes()
+            self.coordinator.stop()
+
         # The idea out here is to propate the stop signal.
         # Meaning that the tester will share it's stop signal to all
         # subsequencial queues after all submitted tasks are done.
         self.tester_process_manager.send_stop_signal(worker_name="main")
 
+        self.tester_process_manager.wait()
+        self.producer_process_manager.wait()
+
         if self.miner_process_manager:
             self.miner_process_manager.wait()
 
-        self.tester_process_manager.wait()
-        self.producer_process_manager.wait()
+        if self.dns_cache is not None:
+            counters = self.dns_cache.get_counters()
+
+            PyFunceble.facility.Logger.info(
+                "DNS cache: %r hit(s), %r miss(es).",
+                counters["hits"] - self.dns_cache_counters["hits"],
+                counters["misses"] - self.dns_cache_counters["misses"],
+            )
 
         try:
             # From here, we are sure that every test and files are produced.
@@ -860,6 +1238,15 @@ class SystemLauncher(SystemBase):
             if self.miner_process_manager:
                 self.miner_process_manager.start()
 
+            coordinator_address = (
+                PyFunceble.storage.CONFIGURATION.cli_testing.coordinator
+            )
+
+            if coordinator_address:
+                self.coordinator = Coordinator(
+                    self.tester_process_manager, get_address(coordinator_address)
+                ).start()
+
     @SystemBase.ensure_args_is_given
     def start(self) -> "SystemLauncher":
         try:
@@ -880,10 +1267,9 @@ class SystemLauncher(SystemBase):
 
             del self.migrator_process_manager
 
-            if not self.file_preloader.authorized or (
-                not self.args.files and not self.args.url_files
-            ):
-                self.__start_core_processes()
+            # Our preloader provides what it preloads while preloading.
+            # Therefore, nobody has to wait for it.
+            self.__start_core_processes()
 
             self.fill_protocol()
             self.fill_to_test_queue_from_protocol()
@@ -51,8 +51,9 @@ License:
 """
 
 import os
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
+import domain2idna
 from sqlalchemy.orm import Session
 
 import PyFunceble.storage
@@ -75,6 +76,7 @@ from PyFunceble.dataset.inactive.mariadb import MariaDBInactiveDataset
 from PyFunceble.dataset.inactive.mysql import MySQLInactiveDataset
 from PyFunceble.helpers.list import ListHelper
 from PyFunceble.helpers.regex import RegexHelper
+from PyFunceble.utils.sharding import get_shard, is_subject_of_shard
 
 
 def get_testing_mode() -> str:
@@ -176,7 +178,7 @@ def get_destination_from_origin(origin: str) -> str:
     return RegexHelper("[^a-zA-Z0-9._-]").replace_match(origin, "_")
 
 
-def get_subjects_from_line(
+def get_subjects_and_complements_from_line(
     line: str,
     checker_type: str,
     *,
@@ -188,9 +190,13 @@ def get_subjects_from_line(
     subject2complements: Optional[Subject2Complements] = None,
     url2netloc: Optional[Url2Netloc] = None,
     cidr2subject: Optional[CIDR2Subject] = None,
-) -> List[str]:
+) -> Tuple[List[str], List[str]]:
     """
-    Provides the list of subject to test.
+    Provides the list of subject to test and the list of their complements
+    (when the complements are activated).
+
+    .. note::
+        While sharding, we only provide the subjects of our shard.
     """
 
     result = []
@@ -241,13 +247,49 @@ def get_subjects_from_line(
         result.extend(inputline2subject.set_data_to_convert(line).get_converted())
 
     if PyFunceble.storage.CONFIGURATION.cli_testing.complements:
-        result.extend(
-            [
-                y
-                for x in result
-                for y in subject2complements.set_data_to_convert(x).get_converted()
-            ]
+        complements = [
+            y
+            for x in result
+            for y in subject2complements.set_data_to_convert(x).get_converted()
+        ]
+    else:
+        complements = []
+
+    result = normalize_subjects(
+        result, checker_type, url2netloc=url2netloc, cidr2subject=cidr2subject
+    )
+    complements = [
+        x
+        for x in normalize_subjects(
+            complements, checker_type, url2netloc=url2netloc, cidr2subject=cidr2subject
         )
+        if x not in result
+    ]
+
+    return result, complements
+
+
+def normalize_subjects(
+    subjects: List[str],
+    checker_type: str,
+    *,
+    url2netloc: Optional[Url2Netloc] = None,
+    cidr2subject: Optional[CIDR2Subject] = None,
+) -> List[str]:
+    """
+    Expands (CIDR), normalizes and deduplicates the given subjects.
+
+    .. note::
+        While sharding, we only provide the subjects of our shard.
+    """
+
+    if url2netloc is None:
+        url2netloc = Url2Netloc()
+
+    if cidr2subject is None:
+        cidr2subject = CIDR2Subject()
+
+    result = subjects
 
     if PyFunceble.storage.CONFIGURATION.cli_testing.cidr_expand:
         result = [
@@ -265,4 +307,49 @@ def get_subjects_from_line(
 
             result[index] = subject.replace(netloc, netloc.lower())
 
-    return ListHelper(result).remove_duplicates().remove_empty().subject
+    result = ListHelper(result).remove_duplicates().remove_empty().subject
+
+    shard = get_shard()
+
+    if shard is not None:
+        result = [
+            x for x in result if is_subject_of_shard(domain2idna.domain2idna(x), shard)
+        ]
+
+    return result
+
+
+def get_subjects_from_line(
+    line: str,
+    checker_type: str,
+    *,
+    adblock_inputline2subject: Optional[AdblockInputLine2Subject] = None,
+    wildcard2subject: Optional[Wildcard2Subject] = None,
+    rpz_policy2subject: Optional[RPZPolicy2Subject] = None,
+    rpz_inputline2subject: Optional[RPZInputLine2Subject] = None,
+    inputline2subject: Optional[InputLine2Subject] = None,
+    subject2complements: Optional[Subject2Complements] = None,
+    url2netloc: Optional[Url2Netloc] = None,
+    cidr2subject: Optional[CIDR2Subject] = None,
+) -> List[str]:
+    """
+    Provides the list of subject to test - followed by their complements.
+
+    .. note::
+        While sharding, we only provide the subjects of our shard.
+    """
+
+    subjects, complements = get_subjects_and_complements_from_line(
+        line,
+        checker_type,
+        adblock_inputline2subject=adblock_inputline2subject,
+        wildcard2subject=wildcard2subject,
+        rpz_policy2subject=rpz_policy2subject,
+        rpz_inputline2subject=rpz_inputline2subject,
+        inputline2subject=inputline2subject,
+        subject2complements=subject2complements,
+        url2netloc=url2netloc,
+        cidr2subject=cidr2subject,
+    )
+
+    return subjects + complements
@@ -58,6 +58,7 @@ import PyFunceble.cli.storage
 import PyFunceble.storage
 from PyFunceble.dataset.csv_base import CSVDatasetBase
 from PyFunceble.dataset.inactive.base import InactiveDatasetBase
+from PyFunceble.utils.sharding import get_shard_filename
 
 
 class CSVInactiveDataset(CSVDatasetBase, InactiveDatasetBase):
@@ -68,7 +69,8 @@ class CSVInactiveDataset(CSVDatasetBase, InactiveDatasetBase):
 
     def __post_init__(self) -> None:
         self.source_file = os.path.join(
-            PyFunceble.storage.CONFIG_DIRECTORY, PyFunceble.cli.storage.INACTIVE_DB_FILE
+            PyFunceble.storage.CONFIG_DIRECTORY,
+            get_shard_filename(PyFunceble.cli.storage.INACTIVE_DB_FILE),
         )
 
         return super().__post_init__()
@@ -0,0 +1,143 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the executor helpers
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import concurrent.futures
+import os
+import threading
+from typing import Any, Callable, Optional
+
+
+class ExecutorHelper:
+    """
+    Provides a pool of threads which can be shared by everything that runs in
+    the current process. It is started on first use and can be shut down at
+    any time - it is started again on next use.
+
+    :param max_workers:
+        The maximal number of threads of the pool.
+    :param thread_name_prefix:
+        The prefix of the name of our threads.
+    """
+
+    max_workers: Optional[int] = None
+    thread_name_prefix: str = ""
+
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    _pid: Optional[int] = None
+    _lock: Optional[threading.Lock] = None
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Provides the pool of threads of the current process - and starts it if
+        necessary.
+        """
+
+        if self._pid != os.getpid():
+            # We may have been forked: the threads of our parent are not ours.
+            self._lock = threading.Lock()
+            self._executor = None
+            self._pid = os.getpid()
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix,
+                )
+
+            return self._executor
+
+    def submit(
+        self, func: Callable[..., Any], *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """
+        Runs the given function into our pool of threads.
+
+        :return:
+            The future which holds the outcome of the given function.
+        """
+
+        return self.executor.submit(func, *args, **kwargs)
+
+    def is_started(self) -> bool:
+        """
+        Checks if our pool of threads is started (in the current process).
+        """
+
+        return self._executor is not None and self._pid == os.getpid()
+
+    def shutdown(self, *, wait: bool = False) -> "ExecutorHelper":
+        """
+        Shuts our pool of threads down. What did not start yet is cancelled.
+
+        :param wait:
+            Whether we wait for what is running to end.
+        """
+
+        if not self.is_started():
+            return self
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+        return self
@@ -0,0 +1,347 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides our DNS cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+import PyFunceble.storage
+from PyFunceble.helpers.file import FileHelper
+
+
+class DNSCache:
+    """
+    Provides a cache of the responses of our DNS queries. It keeps what it
+    holds into a SQLite database. Therefore, it is shared by all our processes.
+
+    A response is kept as long as the TTL of its record(s). When nothing was
+    found, it is kept as long as the negative-caching TTL of the SOA of the zone.
+
+    It also counts the number of times we found (hits) or did not find (misses)
+    a response into it. Those counters are kept in memory and only written
+    into the database every :code:`FLUSH_COUNTERS_EVERY` lookups - or when
+    flushed or closed.
+
+    :param path:
+        The path of the database to use.
+    """
+
+    BUSY_TIMEOUT: float = 60.0
+    MAX_TTL: int = 86400
+    FLUSH_COUNTERS_EVERY: int = 1000
+
+    path: Optional[str] = None
+
+    _connection: Optional[sqlite3.Connection] = None
+    _connection_pid: Optional[int] = None
+    _lock: Optional[threading.RLock] = None
+    _pending_counters: Optional[Dict[str, int]] = None
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        if path is None:
+            path = os.path.join(
+                PyFunceble.storage.CONFIG_DIRECTORY,
+                PyFunceble.storage.DNS_CACHE_FILENAME,
+            )
+
+        self.path = path
+        self._lock = threading.RLock()
+        self._pending_counters = {"hits": 0, "misses": 0}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+
+        # A connection (and what it did not write yet) belongs to the process
+        # which opened it.
+        for attribute in (
+            "_connection",
+            "_connection_pid",
+            "_lock",
+            "_pending_counters",
+        ):
+            state.pop(attribute, None)
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._pending_counters = {"hits": 0, "misses": 0}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Provides the connection of the current process - and opens it if
+        necessary.
+        """
+
+        if self._connection_pid != os.getpid():
+            # We may have been forked: what we have belongs to our parent.
+            self._lock = threading.RLock()
+            self._pending_counters = {"hits": 0, "misses": 0}
+
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=self.BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # Losing the last responses - when the system crashes - is harmless.
+            self._connection.execute("PRAGMA synchronous=OFF")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "name TEXT NOT NULL, "
+                "rdtype INTEGER NOT NULL, "
+                "nameservers TEXT NOT NULL, "
+                "response TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, "
+                "PRIMARY KEY (name, rdtype, nameservers)) WITHOUT ROWID"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS counters ("
+                "name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO counters (name, value) "
+                "VALUES ('hits', 0), ('misses', 0)"
+            )
+            self._connection_pid = os.getpid()
+
+        return self._connection
+
+    @staticmethod
+    def get_nameservers_key(nameservers: List[str]) -> str:
+        """
+        Provides the key which represents the given set of nameservers.
+
+        :param nameservers:
+            The nameservers (and their port) we query.
+        """
+
+        return ",".join(sorted(set(nameservers)))
+
+    def get(
+        self, name: str, rdtype: int, nameservers: List[str]
+    ) -> Optional[List[str]]:
+        """
+        Provides the cached response of the given query.
+
+        :param name:
+            The queried name.
+        :param rdtype:
+            The queried record type.
+        :param nameservers:
+            The nameservers (and their port) we query.
+
+        :return:
+            :py:class:`None` when nothing (alive) was cached.
+        """
+
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT response FROM cache "
+                "WHERE name = ? AND rdtype = ? AND nameservers = ? "
+                "AND expires_at > ?",
+                (
+                    str(name),
+                    int(rdtype),
+                    self.get_nameservers_key(nameservers),
+                    time.time(),
+                ),
+            ).fetchone()
+
+            self._pending_counters["hits" if row is not None else "misses"] += 1
+
+            if sum(self._pending_counters.values()) >= self.FLUSH_COUNTERS_EVERY:
+                self.flush_counters()
+
+        if row is None:
+            return None
+
+        return json.loads(row[0])
+
+    def set(
+        self,
+        name: str,
+        rdtype: int,
+        nameservers: List[str],
+        response: List[str],
+        ttl: int,
+    ) -> "DNSCache":
+        """
+        Caches the response of the given query.
+
+        :param name:
+            The queried name.
+        :param rdtype:
+            The queried record type.
+        :param nameservers:
+            The nameservers (and their port) we query.
+        :param response:
+            The response to cache.
+        :param ttl:
+            The number of seconds the response is allowed to be cached.
+            Nothing is cached when it is not positive.
+        """
+
+        if ttl <= 0:
+            return self
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(name, rdtype, nameservers, response, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(name),
+                    int(rdtype),
+                    self.get_nameservers_key(nameservers),
+                    json.dumps(response),
+                    time.time() + min(ttl, self.MAX_TTL),
+                ),
+            )
+
+        return self
+
+    def cleanup(self) -> int:
+        """
+        Deletes the expired responses.
+
+        :return:
+            The number of deleted responses.
+        """
+
+        with self._lock:
+            return self.connection.execute(
+                "DELETE FROM cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+    def flush_counters(self) -> "DNSCache":
+        """
+        Writes the hits and misses counted by the current process into the
+        database.
+        """
+
+        with self._lock:
+            if self._connection_pid != os.getpid():
+                # Nothing was counted by the current process.
+                return self
+
+            if any(self._pending_counters.values()):
+                self.connection.execute(
+                    "UPDATE counters SET value = value + "
+                    "CASE name WHEN 'hits' THEN ? ELSE ? END",
+                    (self._pending_counters["hits"], self._pending_counters["misses"]),
+                )
+
+            self._pending_counters = {"hits": 0, "misses": 0}
+
+        return self
+
+    def get_counters(self) -> Dict[str, int]:
+        """
+        Provides the number of hits and misses since the creation (or the last
+        reset) of the cache.
+
+        .. note::
+            What was counted by the current process is flushed first. What was
+            counted (and not flushed yet) by other processes is not included.
+        """
+
+        with self._lock:
+            self.flush_counters()
+
+            return dict(
+                self.connection.execute("SELECT name, value FROM counters").fetchall()
+            )
+
+    def reset_counters(self) -> "DNSCache":
+        """
+        Resets the number of hits and misses.
+        """
+
+        with self._lock:
+            self.connection.execute("UPDATE counters SET value = 0")
+            self._pending_counters = {"hits": 0, "misses": 0}
+
+        return self
+
+    def close(self) -> "DNSCache":
+        """
+        Closes the connection of the current process - once our counters
+        are flushed.
+        """
+
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self.flush_counters()
+                self._connection.close()
+
+            self._connection = self._connection_pid = None
+
+        return self
+
+    def delete(self) -> "DNSCache":
+        """
+        Closes and deletes the database.
+        """
+
+        self.close()
+
+        for suffix in ("", "-wal", "-shm"):
+            FileHelper(f"{self.path}{suffix}").delete()
+
+        return self
@@ -0,0 +1,401 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the pool of the (persistent) connections to our nameservers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import socket
+import ssl
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import dns.exception
+import dns.message
+import dns.query
+
+import PyFunceble.facility
+
+
+class DNSConnectionPool:
+    """
+    Provides a pool of persistent connections to our nameservers.
+
+    Instead of opening - and closing - a new connection (and for TLS, a new
+    TLS session) for each query, the connections to our nameservers are kept
+    open and reused by the next query. A TLS connection which has to be opened
+    again resumes the last session we had with the nameserver. For HTTPS, all
+    queries go through the same HTTP(S) client.
+
+    It is shared by all the query tools (and threads) of the current process.
+    A connection is only used by a single query at a time.
+    """
+
+    MAX_IDLE_CONNECTIONS: int = 4
+    IDLE_TIMEOUT: float = 10.0
+
+    _idle: Optional[
+        Dict[Tuple[str, str, int], List[Tuple[socket.socket, float]]]
+    ] = None
+    _tls_sessions: Optional[Dict[Tuple[str, int], ssl.SSLSession]] = None
+    _ssl_context: Optional[ssl.SSLContext] = None
+    _https_session: Optional[Any] = None
+    _lock: Optional[threading.Lock] = None
+    _pid: Optional[int] = None
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> "DNSConnectionPool":
+        """
+        Forgets our connections - without closing them.
+        """
+
+        self._idle = dict()
+        self._tls_sessions = dict()
+        self._ssl_context = None
+        self._https_session = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+        return self
+
+    def ensure_process(self) -> "DNSConnectionPool":
+        """
+        Ensures that we are not working with the connections of our parent.
+        """
+
+        if self._pid != os.getpid():
+            # We may have been forked: what we have belongs to our parent.
+            self.reset()
+
+        return self
+
+    def close(self) -> "DNSConnectionPool":
+        """
+        Closes all our idle connections and our HTTP(S) client.
+        """
+
+        self.ensure_process()
+
+        with self._lock:
+            for connections in self._idle.values():
+                for sock, _ in connections:
+                    sock.close()
+
+            self._idle.clear()
+
+            if self._https_session is not None:
+                self._https_session.close()
+                self._https_session = None
+
+        return self
+
+    def get_ssl_context(self) -> ssl.SSLContext:
+        """
+        Provides the SSL context of our TLS connections.
+        """
+
+        self.ensure_process()
+
+        with self._lock:
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+                # Our nameservers are given as IP: there is no hostname to check.
+                self._ssl_context.check_hostname = False
+
+            return self._ssl_context
+
+    def get_https_session(self) -> Optional[Any]:
+        """
+        Provides the HTTP(S) client to give to :code:`dns.query.https`.
+
+        :return:
+            :py:class:`None` when the installed version of :code:`dnspython`
+            can't work with one.
+        """
+
+        self.ensure_process()
+
+        with self._lock:
+            if self._https_session is None:
+                # The client dnspython works with depends on its version.
+                if getattr(dns.query, "httpx2", None):
+                    self._https_session = dns.query.httpx2.Client()
+                elif getattr(dns.query, "httpx", None):
+                    self._https_session = dns.query.httpx.Client()
+                elif getattr(dns.query, "requests", None):
+                    self._https_session = dns.query.requests.Session()
+
+            return self._https_session
+
+    @staticmethod
+    def is_usable(sock: socket.socket) -> bool:
+        """
+        Checks if the given idle connection can still be used.
+
+        :param sock:
+            The (non-blocking) socket to check.
+        """
+
+        try:
+            sock.recv(1)
+        except (BlockingIOError, ssl.SSLWantReadError):
+            # Nothing to read: still open.
+            return True
+        except OSError:
+            return False
+
+        # Either closed by the nameserver or something we did not ask for.
+        return False
+
+    def connect(
+        self, protocol: str, nameserver: str, port: int, timeout: Optional[float]
+    ) -> socket.socket:
+        """
+        Opens a new connection to the given nameserver.
+
+        :param protocol:
+            The protocol to use. Example: :code:`TLS`.
+        :param nameserver:
+            The nameserver to connect to.
+        :param port:
+            The port to connect to.
+        :param timeout:
+            The maximal number of seconds we are allowed to wait.
+        """
+
+        sock = socket.create_connection((nameserver, port), timeout=timeout)
+
+        if protocol == "TLS":
+            with self._lock:
+                tls_session = self._tls_sessions.get((nameserver, port))
+
+            try:
+                sock = self.get_ssl_context().wrap_socket(sock, session=tls_session)
+            except Exception:
+                sock.close()
+                raise
+
+            PyFunceble.facility.Logger.debug(
+                "Opened TLS connection to %r:%r (session resumed: %r).",
+                nameserver,
+                port,
+                sock.session_reused,
+            )
+
+        # dnspython waits for our (non-blocking) socket to be ready by itself.
+        sock.setblocking(False)
+
+        return sock
+
+    def acquire(
+        self, protocol: str, nameserver: str, port: int, timeout: Optional[float]
+    ) -> Tuple[socket.socket, bool]:
+        """
+        Provides a connection to the given nameserver. An idle connection is
+        reused when possible.
+
+        :param protocol:
+            The protocol to use. Example: :code:`TCP`.
+        :param nameserver:
+            The nameserver to connect to.
+        :param port:
+            The port to connect to.
+        :param timeout:
+            The maximal number of seconds we are allowed to wait.
+
+        :return:
+            The connection and whether it was reused.
+        """
+
+        self.ensure_process()
+
+        with self._lock:
+            connections = self._idle.get((protocol, nameserver, port), [])
+
+            while connections:
+                sock, released_at = connections.pop()
+
+                if (
+                    time.monotonic() - released_at < self.IDLE_TIMEOUT
+                    and self.is_usable(sock)
+                ):
+                    return sock, True
+
+                sock.close()
+
+        return self.connect(protocol, nameserver, port, timeout), False
+
+    def release(
+        self, protocol: str, nameserver: str, port: int, sock: socket.socket
+    ) -> "DNSConnectionPool":
+        """
+        Gives back the given connection so that it can be reused.
+
+        :param protocol:
+            The protocol of the connection.
+        :param nameserver:
+            The nameserver of the connection.
+        :param port:
+            The port of the connection.
+        :param sock:
+            The connection to give back.
+        """
+
+        self.ensure_process()
+
+        with self._lock:
+            if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+                self._tls_sessions[(nameserver, port)] = sock.session
+
+            connections = self._idle.setdefault((protocol, nameserver, port), [])
+            connections.append((sock, time.monotonic()))
+
+            while len(connections) > self.MAX_IDLE_CONNECTIONS:
+                connections.pop(0)[0].close()
+
+        return self
+
+    def _query(
+        self,
+        func: Callable[..., dns.message.Message],
+        protocol: str,
+        q: dns.message.Message,
+        where: str,
+        timeout: Optional[float],
+        port: int,
+    ) -> dns.message.Message:
+        """
+        Sends the given query through a connection of our pool.
+
+        When a reused connection fails - because our nameserver closed it in
+        the meantime - the query is sent again through another connection.
+        """
+
+        expiration = time.monotonic() + timeout if timeout is not None else None
+
+        def get_remaining_time() -> Optional[float]:
+            if expiration is None:
+                return None
+
+            remaining_time = expiration - time.monotonic()
+
+            if remaining_time <= 0:
+                raise dns.exception.Timeout
+
+            return remaining_time
+
+        while True:
+            sock, reused = self.acquire(protocol, where, port, get_remaining_time())
+
+            try:
+                response = func(
+                    q, where, timeout=get_remaining_time(), port=port, sock=sock
+                )
+            except (EOFError, OSError):
+                sock.close()
+
+                if reused:
+                    PyFunceble.facility.Logger.debug(
+                        "Reused connection to %r:%r is gone. Retrying.", where, port
+                    )
+                    continue
+
+                raise
+            except Exception:
+                # We don't know what is left to read.
+                sock.close()
+                raise
+
+            self.release(protocol, where, port, sock)
+
+            return response
+
+    def tcp(
+        self,
+        q: dns.message.Message,
+        where: str,
+        timeout: Optional[float] = None,
+        port: int = 53,
+    ) -> dns.message.Message:
+        """
+        Counterpart of :code:`dns.query.tcp` which works with our pool.
+        """
+
+        return self._query(dns.query.tcp, "TCP", q, where, timeout, port)
+
+    def tls(
+        self,
+        q: dns.message.Message,
+        where: str,
+        timeout: Optional[float] = None,
+        port: int = 853,
+    ) -> dns.message.Message:
+        """
+        Counterpart of :code:`dns.query.tls` which works with our pool.
+        """
+
+        return self._query(dns.query.tls, "TLS", q, where, timeout, port)
+
+    def https(
+        self,
+        q: dns.message.Message,
+        where: str,
+        timeout: Optional[float] = None,
+    ) -> dns.message.Message:
+        """
+        Counterpart of :code:`dns.query.https` which works with our HTTP(S)
+        client.
+        """
+
+        return dns.query.https(
+            q, where, timeout=timeout, session=self.get_https_session()
+        )
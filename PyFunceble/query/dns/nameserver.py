@@ -58,7 +58,6 @@ import dns.resolver
 import PyFunceble.facility
 import PyFunceble.storage
 from PyFunceble.checker.syntax.domain import DomainSyntaxChecker
-from PyFunceble.checker.syntax.url import URLSyntaxChecker
 from PyFunceble.converter.url2netloc import Url2Netloc
 
 
@@ -72,14 +71,13 @@ class Nameservers:
 
     protocol: Optional[str] = None
 
-    domain_syntax_checker: DomainSyntaxChecker = DomainSyntaxChecker()
-    url_syntax_checker: URLSyntaxChecker = URLSyntaxChecker()
-    url2netloc: Url2Netloc = Url2Netloc()
+    url2netloc: Optional[Url2Netloc] = None
 
     def __init__(
         self, nameserver: Optional[List[str]] = None, protocol: str = "TCP"
     ) -> None:
         self.protocol = protocol
+        self.url2netloc = Url2Netloc()
 
         if nameserver is not None:
             self.set_nameservers(nameserver)
@@ -124,7 +122,7 @@ class Nameservers:
 
         result = []
 
-        if cls.domain_syntax_checker.set_subject(nameserver).is_valid():
+        if DomainSyntaxChecker(nameserver).is_valid():
             try:
                 result.extend(
                     [
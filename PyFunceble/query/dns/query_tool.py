@@ -50,25 +50,32 @@ License:
     limitations under the License.
 """
 
+import concurrent.futures
 import copy
 import functools
 import ipaddress
 import random
 import socket
+import threading
 import time
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import dns.exception
 import dns.message
 import dns.name
 import dns.query
+import dns.rcode
 import dns.rdataclass
 import dns.rdatatype
 
 import PyFunceble.facility
 import PyFunceble.storage
+from PyFunceble.helpers.executor import ExecutorHelper
 from PyFunceble.helpers.list import ListHelper
+from PyFunceble.query.dns.cache import DNSCache
+from PyFunceble.query.dns.connection_pool import DNSConnectionPool
 from PyFunceble.query.dns.nameserver import Nameservers
+from PyFunceble.query.dns.scoreboard import NameserverScoreboard
 from PyFunceble.query.record.dns import DNSQueryToolRecord
 
 
@@ -83,9 +90,15 @@ class DNSQueryTool:
     STD_TIMEOUT: float = 5.0
     STD_FOLLOW_NAMESERVER_ORDER: bool = True
     STD_TRUST_SERVER: bool = False
+    STD_USE_CACHE: bool = False
+    STD_HEDGE: bool = False
+    STD_PERSISTENT_CONNECTIONS: bool = False
 
     SUPPORTED_PROTOCOL: List[str] = ["TCP", "UDP", "HTTPS", "TLS"]
     BREAKOFF: float = 0.2
+    HEDGE_TIMEOUT_RATIO: float = 0.2
+    HEDGE_MIN_DELAY: float = 0.01
+    HEDGE_MAX_WORKERS: int = 16
 
     value2rdata_type: Dict[int, str] = {
         x.value: x.name for x in dns.rdatatype.RdataType
@@ -94,7 +107,7 @@ class DNSQueryTool:
         x.name: x.value for x in dns.rdatatype.RdataType
     }
 
-    nameservers: Nameservers = Nameservers()
+    nameservers: Optional[Nameservers] = None
     _query_record_type: int = dns.rdatatype.RdataType.ANY
 
     _subject: Optional[str] = None
@@ -102,6 +115,21 @@ class DNSQueryTool:
     _preferred_protocol: str = "UDP"
     _query_timeout: float = 5.0
     _trust_server: bool = False
+    _hedge: bool = False
+    _persistent_connections: bool = False
+
+    cache: Optional[DNSCache] = None
+    shared_caches: Dict[str, DNSCache] = dict()
+    shared_caches_lock: threading.Lock = threading.Lock()
+    _response_ttl: Optional[int] = None
+
+    cancel_event: Optional[threading.Event] = None
+
+    scoreboard: NameserverScoreboard = NameserverScoreboard()
+    connection_pool: DNSConnectionPool = DNSConnectionPool()
+    hedge_executor: ExecutorHelper = ExecutorHelper(
+        HEDGE_MAX_WORKERS, thread_name_prefix="pyfunceble_dns_hedge"
+    )
 
     dns_name: Optional[str] = None
 
@@ -115,17 +143,25 @@ class DNSQueryTool:
         follow_nameserver_order: Optional[bool] = None,
         preferred_protocol: Optional[str] = None,
         trust_server: Optional[bool] = None,
+        use_cache: Optional[bool] = None,
+        hedge: Optional[bool] = None,
+        persistent_connections: Optional[bool] = None,
     ) -> None:
-        if nameservers is not None:
-            self.nameservers.set_nameservers(nameservers)
-        else:  # pragma: no cover ## I'm not playing with system resolver.
-            self.nameservers.guess_and_set_nameservers()
+        # Never shared: some of us may run concurrently (threads).
+        self.nameservers = Nameservers()
 
+        # The protocol has to be known before the nameservers as it affects
+        # their format.
         if preferred_protocol is not None:
             self.preferred_protocol = preferred_protocol
         else:
             self.guess_and_set_preferred_protocol()
 
+        if nameservers is not None:
+            self.nameservers.set_nameservers(nameservers)
+        else:  # pragma: no cover ## I'm not playing with system resolver.
+            self.nameservers.guess_and_set_nameservers()
+
         if follow_nameserver_order is not None:
             self.follow_nameserver_order = follow_nameserver_order
         else:
@@ -136,6 +172,21 @@ class DNSQueryTool:
         else:
             self.guess_and_set_trust_server()
 
+        if use_cache is not None:
+            self.use_cache = use_cache
+        else:
+            self.guess_and_set_use_cache()
+
+        if hedge is not None:
+            self.hedge = hedge
+        else:
+            self.guess_and_set_hedge()
+
+        if persistent_connections is not None:
+            self.persistent_connections = persistent_connections
+        else:
+            self.guess_and_set_persistent_connections()
+
     def prepare_query(func):  # pylint: disable=no-self-argument
         """
         Prepare the query after running the decorated method.
@@ -612,6 +663,214 @@ class DNSQueryTool:
 
         return self
 
+    @property
+    def use_cache(self) -> bool:
+        """
+        Provides the current state of the usage of our cache.
+        """
+
+        return self.cache is not None
+
+    @use_cache.setter
+    def use_cache(self, value: bool) -> None:
+        """
+        Activates or deactivates the usage of our cache.
+
+        :param value:
+            The value to apply.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`bool`.
+        """
+
+        if not isinstance(value, bool):
+            raise TypeError(f"<value> should be {bool}, {type(value)} given.")
+
+        self.cache = self.get_shared_cache() if value else None
+
+    def set_use_cache(self, value: bool) -> "DNSQueryTool":
+        """
+        Activates or deactivates the usage of our cache.
+
+        :param value:
+            The value to apply.
+        """
+
+        self.use_cache = value
+
+        return self
+
+    def guess_and_set_use_cache(self) -> "DNSQueryTool":
+        """
+        Try to guess and set the usage of our cache.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            if isinstance(PyFunceble.storage.CONFIGURATION.dns.cache, bool):
+                self.use_cache = PyFunceble.storage.CONFIGURATION.dns.cache
+            else:
+                self.use_cache = self.STD_USE_CACHE
+        else:
+            self.use_cache = self.STD_USE_CACHE
+
+        return self
+
+    @property
+    def hedge(self) -> bool:
+        """
+        Provides the current state of the :code:`_hedge` attribute.
+        """
+
+        return self._hedge
+
+    @hedge.setter
+    def hedge(self, value: bool) -> None:
+        """
+        Activates or deactivates the hedging of our queries. When activated,
+        we send the same query to the next nameserver as soon as the current
+        one is slower than usual (p90 of its round-trip time).
+
+        :param value:
+            The value to apply.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`bool`.
+        """
+
+        if not isinstance(value, bool):
+            raise TypeError(f"<value> should be {bool}, {type(value)} given.")
+
+        self._hedge = value
+
+    def set_hedge(self, value: bool) -> "DNSQueryTool":
+        """
+        Activates or deactivates the hedging of our queries.
+
+        :param value:
+            The value to apply.
+        """
+
+        self.hedge = value
+
+        return self
+
+    def guess_and_set_hedge(self) -> "DNSQueryTool":
+        """
+        Try to guess and set the hedging of our queries.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            if isinstance(PyFunceble.storage.CONFIGURATION.dns.hedge, bool):
+                self.hedge = PyFunceble.storage.CONFIGURATION.dns.hedge
+            else:
+                self.hedge = self.STD_HEDGE
+        else:
+            self.hedge = self.STD_HEDGE
+
+        return self
+
+    @property
+    def persistent_connections(self) -> bool:
+        """
+        Provides the current state of the :code:`_persistent_connections`
+        attribute.
+        """
+
+        return self._persistent_connections
+
+    @persistent_connections.setter
+    def persistent_connections(self, value: bool) -> None:
+        """
+        Activates or deactivates the usage of persistent connections. When
+        activated, our TCP, TLS and HTTPS queries reuse the connections of our
+        connection pool instead of opening a new one for each query.
+
+        :param value:
+            The value to apply.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`bool`.
+        """
+
+        if not isinstance(value, bool):
+            raise TypeError(f"<value> should be {bool}, {type(value)} given.")
+
+        self._persistent_connections = value
+
+    def set_persistent_connections(self, value: bool) -> "DNSQueryTool":
+        """
+        Activates or deactivates the usage of persistent connections.
+
+        :param value:
+            The value to apply.
+        """
+
+        self.persistent_connections = value
+
+        return self
+
+    def guess_and_set_persistent_connections(self) -> "DNSQueryTool":
+        """
+        Try to guess and set the usage of persistent connections.
+        """
+
+        if PyFunceble.facility.ConfigLoader.is_already_loaded():
+            if isinstance(
+                PyFunceble.storage.CONFIGURATION.dns.persistent_connections, bool
+            ):
+                self.persistent_connections = (
+                    PyFunceble.storage.CONFIGURATION.dns.persistent_connections
+                )
+            else:
+                self.persistent_connections = self.STD_PERSISTENT_CONNECTIONS
+        else:
+            self.persistent_connections = self.STD_PERSISTENT_CONNECTIONS
+
+        return self
+
+    @classmethod
+    def get_shared_cache(cls) -> DNSCache:
+        """
+        Provides the cache shared by all query tools of the current process.
+        """
+
+        with cls.shared_caches_lock:
+            if PyFunceble.storage.CONFIG_DIRECTORY not in cls.shared_caches:
+                cls.shared_caches[PyFunceble.storage.CONFIG_DIRECTORY] = DNSCache()
+
+            return cls.shared_caches[PyFunceble.storage.CONFIG_DIRECTORY]
+
+    def clone(self) -> "DNSQueryTool":
+        """
+        Provides a copy of the current query tool. It shares our settings but
+        not the state of our queries. Therefore, it can query concurrently with
+        us.
+        """
+
+        result = copy.copy(self)
+        result.lookup_record = result.query_message = result.cancel_event = None
+
+        return result
+
+    def is_cancelled(self) -> bool:
+        """
+        Checks if our current query was cancelled - through our
+        :code:`cancel_event`.
+        """
+
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def get_cache_nameservers(self) -> List[str]:
+        """
+        Provides the nameservers (and their port) our cache entries are bound
+        to.
+        """
+
+        return [
+            f"{nameserver}:{port}"
+            for nameserver, port in self.nameservers.get_nameserver_ports().items()
+        ]
+
     def guess_all_settings(
         self,
     ) -> "DNSQueryTool":  # pragma: no cover ## Method themselves are more important
@@ -657,134 +916,292 @@ class DNSQueryTool:
         if rrset:
             result.extend([x.to_text() for x in rrset])
 
+        ttl = self._get_ttl_from_response(response)
+
+        if ttl is not None and (self._response_ttl is None or ttl < self._response_ttl):
+            self._response_ttl = ttl
+
         PyFunceble.facility.Logger.debug("Result from response:\r%r", result)
 
         return result
 
-    def _mix_order(
-        self, data: Union[dict, List[str]]
-    ) -> Union[dict, List[str]]:  # pragma: no cover ## Just a shuffle :-)
+    def _get_ttl_from_response(self, response: dns.message.Message) -> Optional[int]:
         """
-        Given a dataset, we mix its order.
+        Given a response, we return the number of seconds it can be cached.
+
+        When the answer goes through a CNAME chain, the response can't be
+        cached longer than any of its links. When nothing was found (at the end
+        of the chain), we return the negative-caching TTL given by the SOA of
+        the zone (see RFC 2308).
+
+        :return:
+            :py:class:`None` when it can't be cached.
         """
 
-        dataset = copy.deepcopy(data)
+        name = self.dns_name
+        ttls = []
+
+        if self.query_record_type != dns.rdatatype.RdataType.CNAME:
+            # The length of the answer is our limit: a loop never ends otherwise.
+            for _ in range(len(response.answer)):
+                cname = response.get_rrset(
+                    response.answer,
+                    name,
+                    dns.rdataclass.RdataClass.IN,
+                    dns.rdatatype.RdataType.CNAME,
+                )
 
-        if not self.follow_nameserver_order:
-            if isinstance(dataset, list):
-                random.shuffle(dataset)
+                if not cname:
+                    break
 
-                return dataset
+                ttls.append(cname.ttl)
+                name = cname[0].target
 
-            if isinstance(dataset, dict):
-                temp = list(dataset.items())
-                random.shuffle(temp)
+        rrset = response.get_rrset(
+            response.answer,
+            name,
+            dns.rdataclass.RdataClass.IN,
+            self.query_record_type,
+        )
+
+        if rrset:
+            return min(ttls + [rrset.ttl])
+
+        if len(response.answer) > len(ttls):
+            # Example: Something we did not ask for.
+            return None
 
-                return dict(temp)
+        for authority in response.authority:
+            if authority.rdtype == dns.rdatatype.RdataType.SOA and authority:
+                return min(ttls + [authority.ttl, authority[0].minimum])
+
+        return None
+
+    def _mix_order(self, data: Union[dict, List[str]]) -> Union[dict, List[str]]:
+        """
+        Given a dataset, we provide its nameservers in the order we should
+        query them.
+
+        When we follow the order of our nameservers, it is kept as it is.
+        Otherwise, the healthiest (cheapest) ones come first. In any case, the
+        nameservers which are backed off are left out - unless all of them are.
+        """
+
+        nameservers = list(data)
+
+        if self.follow_nameserver_order:
+            nameservers = self.scoreboard.drop_backed_off(nameservers)
+        else:
+            # Spreads our queries between the nameservers of equal cost.
+            random.shuffle(nameservers)
+            nameservers = self.scoreboard.sort(nameservers, self.query_timeout)
+
+        if isinstance(data, dict):
+            dataset = {x: data[x] for x in nameservers}
+        else:
+            dataset = nameservers
 
         PyFunceble.facility.Logger.debug("Mixed data:\n%r", dataset)
         return dataset
 
-    @ensure_subject_is_given
-    @ignore_if_query_message_is_missing
-    @update_lookup_record_response
-    def tcp(
+    def scored_query(
         self,
-    ) -> Optional[List[str]]:
+        nameserver: str,
+        func: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> dns.message.Message:
         """
-        Request the chosen record through the TCP protocol.
+        Runs the given query function and records its outcome into our
+        scoreboard.
+
+        :param nameserver:
+            The queried nameserver.
+        :param func:
+            The query function to run. Example: :code:`dns.query.udp`.
         """
 
-        self.lookup_record.used_protocol = "TCP"
+        started_at = time.monotonic()
 
-        result = []
+        try:
+            response = func(*args, **kwargs)
+        except (dns.exception.Timeout, socket.error):
+            self.scoreboard.record_timeout(nameserver)
+            raise
+
+        self.scoreboard.record_response(
+            nameserver,
+            time.monotonic() - started_at,
+            servfail=response.rcode() == dns.rcode.SERVFAIL,
+        )
 
-        for nameserver, port in self._mix_order(
-            self.nameservers.get_nameserver_ports()
-        ).items():
-            PyFunceble.facility.Logger.debug(
-                "Started to query information of %r from %r", self.subject, nameserver
-            )
+        return response
 
-            try:
-                response = dns.query.tcp(
-                    self.query_message,
-                    nameserver,
-                    port=port,
-                    timeout=self.query_timeout,
-                )
+    def get_hedge_delay(self, nameserver: str) -> float:
+        """
+        Provides the number of seconds we wait for the response of the given
+        nameserver before sending the same query to the next one.
 
-                local_result = self._get_result_from_response(response)
+        It is the 90th percentile of the round-trip time of the nameserver - or
+        a fraction of our timeout while we don't know it well enough.
 
-                if local_result:
-                    result.extend(local_result)
+        :param nameserver:
+            The nameserver to work with.
+        """
 
-                    self.lookup_record.nameserver = nameserver
-                    self.lookup_record.port = port
+        delay = self.scoreboard.get_rtt_percentile(nameserver, 90)
 
-                    PyFunceble.facility.Logger.debug(
-                        "Successfully queried information of %r from %r.",
-                        self.subject,
-                        nameserver,
-                    )
+        if delay is None:
+            delay = self.query_timeout * self.HEDGE_TIMEOUT_RATIO
 
-                    if not self.trust_server:  # pragma: no cover: Per case.
-                        break
-                if self.trust_server:  # pragma: no cover: Per case.
-                    break
-            except (dns.exception.Timeout, socket.error):
-                # Example: Resource temporarily unavailable.
-                pass
-            except dns.query.UnexpectedSource:
-                # Example: got a response from XXX instead of XXX.
-                pass
-            except dns.query.BadResponse:
-                # Example: A DNS query response does not respond to the question
-                # asked.
-                pass
-            except ValueError:
-                # Example: Input is malformed.
-                break
+        return min(max(delay, self.HEDGE_MIN_DELAY), self.query_timeout)
 
-            PyFunceble.facility.Logger.debug(
-                "Unsuccessfully queried information of %r from %r. Sleeping %fs.",
-                self.subject,
-                nameserver,
-                self.BREAKOFF,
+    def _get_response(
+        self,
+        send: Callable[[str], dns.message.Message],
+        nameservers: List[str],
+        index: int,
+        in_flight: Dict[str, concurrent.futures.Future],
+    ) -> Tuple[str, dns.message.Message]:
+        """
+        Provides the response of the nameserver at the given index.
+
+        When we hedge, the query is sent through our (shared) hedge executor
+        and we wait for its response until the hedge delay. When the
+        nameserver does not respond in time, the same query is sent to the
+        next nameserver - while the first one keeps waiting for its response.
+        The first response wins.
+
+        We never hedge while our hedge executor is saturated (the query did not
+        even start): more queries would only wait longer for a thread.
+
+        :param send:
+            The function which sends our query to the given nameserver.
+        :param nameservers:
+            The nameservers we are working with.
+        :param index:
+            The index of the nameserver to query.
+        :param in_flight:
+            The (hedged) queries which did not deliver their response yet. It
+            is updated along the way.
+
+        :return:
+            The nameserver which responded and its response.
+        """
+
+        nameserver = nameservers[index]
+
+        if nameserver in in_flight:
+            # Already sent while hedging.
+            return nameserver, in_flight.pop(nameserver).result()
+
+        if not self.hedge or index + 1 >= len(nameservers):
+            return nameserver, send(nameserver)
+
+        delay = self.get_hedge_delay(nameserver)
+
+        if delay >= self.query_timeout:
+            return nameserver, send(nameserver)
+
+        primary = self.hedge_executor.submit(send, nameserver)
+
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+
+        if done or not primary.running():
+            return nameserver, primary.result()
+
+        hedge_nameserver = nameservers[index + 1]
+
+        PyFunceble.facility.Logger.debug(
+            "No response from %r yet. Hedging with %r.",
+            nameserver,
+            hedge_nameserver,
+        )
+
+        in_flight[hedge_nameserver] = self.hedge_executor.submit(
+            send, hedge_nameserver
+        )
+
+        race = {primary: 0, in_flight[hedge_nameserver]: 1}
+        pending = list(race)
+
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
             )
 
-            time.sleep(self.BREAKOFF)
+            for future in sorted(done, key=lambda x: race[x]):
+                if future.exception() is None:
+                    winner = nameservers[index + race[future]]
+                    in_flight.pop(winner, None)
 
-        return ListHelper(result).remove_duplicates().subject
+                    return winner, future.result()
 
-    @ensure_subject_is_given
-    @ignore_if_query_message_is_missing
-    @update_lookup_record_response
-    def udp(
+        # Nobody responded. The outcome of the hedge stays in flight: it is
+        # given back once we reach its nameserver.
+        raise primary.exception()
+
+    def _query_nameservers(
         self,
-    ) -> Optional[List[str]]:
+        func: Callable[..., dns.message.Message],
+        nameserver_ports: Dict[str, int],
+        *,
+        with_port: bool = True,
+    ) -> List[str]:
         """
-        Request the chosen record through the UTP protocol.
+        Request the chosen record from our nameservers - one after the other
+        (unless we hedge).
+
+        :param func:
+            The query function of the protocol to use.
+            Example: :code:`dns.query.udp`.
+        :param nameserver_ports:
+            The nameservers to query and their port.
+        :param with_port:
+            Whether the query function has to be given the port to use.
         """
 
-        self.lookup_record.used_protocol = "UDP"
+        def send(nameserver: str) -> dns.message.Message:
+            if with_port:
+                return self.scored_query(
+                    nameserver,
+                    func,
+                    self.query_message,
+                    nameserver,
+                    port=nameserver_ports[nameserver],
+                    timeout=self.query_timeout,
+                )
+
+            return self.scored_query(
+                nameserver,
+                func,
+                self.query_message,
+                nameserver,
+                timeout=self.query_timeout,
+            )
 
         result = []
+        nameservers = list(self._mix_order(nameserver_ports))
+        in_flight = dict()
+        responded = set()
+
+        for index, nameserver in enumerate(nameservers):
+            if self.is_cancelled():
+                break
+
+            if nameserver in responded:
+                # Already responded to our hedge.
+                continue
 
-        for nameserver, port in self._mix_order(
-            self.nameservers.get_nameserver_ports()
-        ).items():
             PyFunceble.facility.Logger.debug(
                 "Started to query information of %r from %r", self.subject, nameserver
             )
 
             try:
-                response = dns.query.udp(
-                    self.query_message,
-                    nameserver,
-                    port=port,
-                    timeout=self.query_timeout,
+                nameserver, response = self._get_response(
+                    send, nameservers, index, in_flight
                 )
+                responded.add(nameserver)
 
                 local_result = self._get_result_from_response(response)
 
@@ -792,7 +1209,9 @@ class DNSQueryTool:
                     result.extend(local_result)
 
                     self.lookup_record.nameserver = nameserver
-                    self.lookup_record.port = port
+
+                    if with_port:
+                        self.lookup_record.port = nameserver_ports[nameserver]
 
                     PyFunceble.facility.Logger.debug(
                         "Successfully queried information of %r from %r.",
@@ -804,7 +1223,15 @@ class DNSQueryTool:
                         break
                 if self.trust_server:  # pragma: no cover: Per case.
                     break
-            except (dns.exception.Timeout, socket.error):
+            except dns.exception.Timeout:
+                PyFunceble.facility.Logger.debug(
+                    "Timeout while querying information of %r from %r.",
+                    self.subject,
+                    nameserver,
+                )
+
+                continue
+            except socket.error:
                 # Example: Resource temporarily unavailable.
                 pass
             except dns.query.UnexpectedSource:
@@ -818,82 +1245,73 @@ class DNSQueryTool:
                 # Example: Input is malformed.
                 break
 
+            # No need to breakoff: a failing nameserver is backed off by our
+            # scoreboard.
             PyFunceble.facility.Logger.debug(
-                "Unsuccessfully queried information of %r from %r. Sleeping %fs.",
+                "Unsuccessfully queried information of %r from %r.",
                 self.subject,
                 nameserver,
-                self.BREAKOFF,
             )
 
-            time.sleep(self.BREAKOFF)
+        for future in in_flight.values():
+            # The hedges we did not need. Those which did not start yet never
+            # will.
+            future.cancel()
 
         return ListHelper(result).remove_duplicates().subject
 
     @ensure_subject_is_given
     @ignore_if_query_message_is_missing
     @update_lookup_record_response
-    def https(
+    def tcp(
         self,
     ) -> Optional[List[str]]:
         """
-        Request the chosen record through the https protocol.
+        Request the chosen record through the TCP protocol.
         """
 
-        self.lookup_record.used_protocol = "HTTPS"
-
-        result = []
-
-        for nameserver in self._mix_order(self.nameservers.get_nameservers()):
-            PyFunceble.facility.Logger.debug(
-                "Started to query information of %r from %r", self.subject, nameserver
-            )
-
-            try:
-                response = dns.query.https(
-                    self.query_message, nameserver, timeout=self.query_timeout
-                )
-
-                local_result = self._get_result_from_response(response)
+        self.lookup_record.used_protocol = "TCP"
 
-                if local_result:
-                    result.extend(local_result)
+        return self._query_nameservers(
+            self.connection_pool.tcp if self.persistent_connections else dns.query.tcp,
+            self.nameservers.get_nameserver_ports(),
+        )
 
-                    self.lookup_record.nameserver = nameserver
+    @ensure_subject_is_given
+    @ignore_if_query_message_is_missing
+    @update_lookup_record_response
+    def udp(
+        self,
+    ) -> Optional[List[str]]:
+        """
+        Request the chosen record through the UTP protocol.
+        """
 
-                    PyFunceble.facility.Logger.debug(
-                        "Successfully queried information of %r from %r.",
-                        self.subject,
-                        nameserver,
-                    )
+        self.lookup_record.used_protocol = "UDP"
 
-                    if not self.trust_server:  # pragma: no cover: Per case.
-                        break
-                if self.trust_server:  # pragma: no cover: Per case.
-                    break
-            except (dns.exception.Timeout, socket.error):
-                # Example: Resource temporarily unavailable.
-                pass
-            except dns.query.UnexpectedSource:
-                # Example: got a response from XXX instead of XXX.
-                pass
-            except dns.query.BadResponse:
-                # Example: A DNS query response does not respond to the question
-                # asked.
-                pass
-            except ValueError:
-                # Example: Input is malformed.
-                break
+        return self._query_nameservers(
+            dns.query.udp, self.nameservers.get_nameserver_ports()
+        )
 
-            PyFunceble.facility.Logger.debug(
-                "Unsuccessfully queried information of %r from %r. Sleeping %fs.",
-                self.subject,
-                nameserver,
-                self.BREAKOFF,
-            )
+    @ensure_subject_is_given
+    @ignore_if_query_message_is_missing
+    @update_lookup_record_response
+    def https(
+        self,
+    ) -> Optional[List[str]]:
+        """
+        Request the chosen record through the https protocol.
+        """
 
-            time.sleep(self.BREAKOFF)
+        self.lookup_record.used_protocol = "HTTPS"
 
-        return ListHelper(result).remove_duplicates().subject
+        return self._query_nameservers(
+            self.connection_pool.https
+            if self.persistent_connections
+            else dns.query.https,
+            self.nameservers.get_nameserver_ports(),
+            with_port=False,
+        )
 
     @ensure_subject_is_given
     @ignore_if_query_message_is_missing
@@ -907,76 +1325,52 @@ class DNSQueryTool:
 
         self.lookup_record.used_protocol = "TLS"
 
-        result = []
-
-        for nameserver, port in self._mix_order(
-            self.nameservers.get_nameserver_ports()
-        ).items():
-            PyFunceble.facility.Logger.debug(
-                "Started to query information of %r from %r", self.subject, nameserver
-            )
-
-            if port == 53:
+        return self._query_nameservers(
+            self.connection_pool.tls if self.persistent_connections else dns.query.tls,
+            {
                 # Default port for nameserver class is 53. So we ensure we
                 # overwrite with our own default.
-                port = 853
+                x: 853 if y == 53 else y
+                for x, y in self.nameservers.get_nameserver_ports().items()
+            },
+        )
 
-            try:
-                response = dns.query.tls(
-                    self.query_message,
-                    nameserver,
-                    port=port,
-                    timeout=self.query_timeout,
-                )
+    def query(
+        self,
+    ) -> Optional[List[str]]:
+        """
+        Process the query based on the preferred protocol.
 
-                local_result = self._get_result_from_response(response)
+        When our cache is activated, we first look into it. What our
+        nameservers respond is then cached - as long as its TTL allows it.
+        """
 
-                if local_result:
-                    result.extend(local_result)
+        if self.cache is None or not self.query_message:
+            return getattr(self, self.preferred_protocol.lower())()
 
-                    self.lookup_record.nameserver = nameserver
-                    self.lookup_record.port = port
+        cache_key = (
+            self.dns_name,
+            self.query_record_type,
+            self.get_cache_nameservers(),
+        )
 
-                    PyFunceble.facility.Logger.debug(
-                        "Successfully queried information of %r from %r.",
-                        self.subject,
-                        nameserver,
-                    )
+        result = self.cache.get(*cache_key)
 
-                    if not self.trust_server:  # pragma: no cover: Per case.
-                        break
-                if self.trust_server:  # pragma: no cover: Per case.
-                    break
-            except (dns.exception.Timeout, socket.error):
-                # Example: Resource temporarily unavailable.
-                pass
-            except dns.query.UnexpectedSource:
-                # Example: got a response from XXX instead of XXX.
-                pass
-            except dns.query.BadResponse:
-                # Example: A DNS query response does not respond to the question
-                # asked.
-                pass
-            except ValueError:
-                # Example: Input is malformed.
-                break
+        if result is not None:
+            self.lookup_record.response = result
+            self.lookup_record.from_cache = True
 
             PyFunceble.facility.Logger.debug(
-                "Unsuccessfully queried information of %r from %r. Sleeping %fs.",
-                self.subject,
-                nameserver,
-                self.BREAKOFF,
+                "Got information of %r from cache: %r", self.subject, result
             )
 
-            time.sleep(self.BREAKOFF)
+            return result
 
-        return ListHelper(result).remove_duplicates().subject
+        self._response_ttl = None
+        result = getattr(self, self.preferred_protocol.lower())()
+        self.lookup_record.from_cache = False
 
-    def query(
-        self,
-    ) -> Optional[List[str]]:
-        """
-        Process the query based on the preferred protocol.
-        """
+        if self._response_ttl is not None:
+            self.cache.set(*cache_key, result, self._response_ttl)
 
-        return getattr(self, self.preferred_protocol.lower())()
+        return result
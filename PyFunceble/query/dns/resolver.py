@@ -72,12 +72,14 @@ class Resolver:
 
     timeout: float = 3.0
 
-    nameservers: Nameservers = Nameservers()
+    nameservers: Optional[Nameservers] = None
     internal_resolver: Optional[dns.resolver.Resolver] = None
 
     def __init__(
         self, nameservers: Optional[List[str]] = None, timeout: Optional[float] = None
     ) -> None:
+        self.nameservers = Nameservers()
+
         if nameservers is not None:
             self.set_nameservers(nameservers)
         else:
@@ -0,0 +1,277 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the scoreboard of our nameservers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import collections
+import math
+import os
+import threading
+import time
+from typing import Deque, Dict, List, Optional
+
+
+class NameserverScoreboard:
+    """
+    Provides a scoreboard which keeps track of the health of our nameservers.
+
+    For each nameserver, we keep an exponentially weighted moving average
+    (EWMA) of its round-trip time (RTT), of its timeout rate and of its
+    SERVFAIL rate. A nameserver which keeps failing is backed off: it is not
+    queried until its (exponentially growing) backoff expires.
+
+    It is shared by all the query tools (and threads) of the current process.
+    """
+
+    EWMA_WEIGHT: float = 0.3
+    BACKOFF_BASE: float = 1.0
+    BACKOFF_MAX: float = 60.0
+    RTT_SAMPLES: int = 100
+    MIN_RTT_SAMPLES: int = 10
+
+    _scores: Optional[Dict[str, dict]] = None
+    _rtt_samples: Optional[Dict[str, Deque[float]]] = None
+    _lock: Optional[threading.Lock] = None
+    _pid: Optional[int] = None
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> "NameserverScoreboard":
+        """
+        Forgets everything we know about our nameservers.
+        """
+
+        self._scores = dict()
+        self._rtt_samples = collections.defaultdict(
+            lambda: collections.deque(maxlen=self.RTT_SAMPLES)
+        )
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+        return self
+
+    def get(self, nameserver: str) -> dict:
+        """
+        Provides the score of the given nameserver.
+
+        :param nameserver:
+            The nameserver to work with.
+        """
+
+        if self._pid != os.getpid():
+            # We may have been forked: what we have belongs to our parent.
+            self.reset()
+
+        with self._lock:
+            if nameserver not in self._scores:
+                self._scores[nameserver] = {
+                    "rtt": None,
+                    "timeout_rate": 0.0,
+                    "servfail_rate": 0.0,
+                    "failures": 0,
+                    "backoff_until": 0.0,
+                }
+
+            return self._scores[nameserver]
+
+    def _update(
+        self,
+        nameserver: str,
+        *,
+        rtt: Optional[float] = None,
+        timeout: bool = False,
+        servfail: bool = False,
+    ) -> "NameserverScoreboard":
+        """
+        Updates the score of the given nameserver with the outcome of a query.
+        """
+
+        score = self.get(nameserver)
+
+        with self._lock:
+            if rtt is not None:
+                self._rtt_samples[nameserver].append(rtt)
+
+                if score["rtt"] is None:
+                    score["rtt"] = rtt
+                else:
+                    score["rtt"] += self.EWMA_WEIGHT * (rtt - score["rtt"])
+
+            score["timeout_rate"] += self.EWMA_WEIGHT * (
+                float(timeout) - score["timeout_rate"]
+            )
+            score["servfail_rate"] += self.EWMA_WEIGHT * (
+                float(servfail) - score["servfail_rate"]
+            )
+
+            if timeout or servfail:
+                score["failures"] += 1
+                score["backoff_until"] = time.monotonic() + min(
+                    self.BACKOFF_BASE * 2 ** (score["failures"] - 1), self.BACKOFF_MAX
+                )
+            else:
+                score["failures"] = 0
+                score["backoff_until"] = 0.0
+
+        return self
+
+    def record_response(
+        self, nameserver: str, rtt: float, *, servfail: bool = False
+    ) -> "NameserverScoreboard":
+        """
+        Records that the given nameserver responded.
+
+        :param nameserver:
+            The nameserver to work with.
+        :param rtt:
+            The number of seconds it took to respond.
+        :param servfail:
+            Whether it responded with a SERVFAIL.
+        """
+
+        return self._update(nameserver, rtt=rtt, servfail=servfail)
+
+    def record_timeout(self, nameserver: str) -> "NameserverScoreboard":
+        """
+        Records that the given nameserver did not respond (in time).
+
+        :param nameserver:
+            The nameserver to work with.
+        """
+
+        return self._update(nameserver, timeout=True)
+
+    def get_rtt_percentile(
+        self, nameserver: str, percentile: float
+    ) -> Optional[float]:
+        """
+        Provides the given percentile of the (last) round-trip times of the
+        given nameserver.
+
+        :param nameserver:
+            The nameserver to work with.
+        :param percentile:
+            The percentile to provide. Example: :code:`90`.
+
+        :return:
+            :py:class:`None` when we don't know enough about it (yet).
+        """
+
+        # Ensures that we are not working with the samples of our parent.
+        self.get(nameserver)
+
+        with self._lock:
+            samples = sorted(self._rtt_samples[nameserver])
+
+        if len(samples) < self.MIN_RTT_SAMPLES:
+            return None
+
+        return samples[max(math.ceil(len(samples) * percentile / 100) - 1, 0)]
+
+    def is_backed_off(self, nameserver: str) -> bool:
+        """
+        Checks if the given nameserver is backed off.
+
+        :param nameserver:
+            The nameserver to work with.
+        """
+
+        return self.get(nameserver)["backoff_until"] > time.monotonic()
+
+    def get_cost(self, nameserver: str, timeout: float) -> float:
+        """
+        Provides the expected cost - in seconds - of a query to the given
+        nameserver. A nameserver we know nothing about costs nothing: this way,
+        it gets its chance.
+
+        :param nameserver:
+            The nameserver to work with.
+        :param timeout:
+            The timeout of our queries.
+        """
+
+        score = self.get(nameserver)
+
+        return (score["rtt"] or 0.0) + timeout * (
+            score["timeout_rate"] + score["servfail_rate"]
+        )
+
+    def drop_backed_off(self, nameservers: List[str]) -> List[str]:
+        """
+        Provides the given nameservers - in the given order - without the ones
+        which are backed off. Unless all of them are.
+
+        :param nameservers:
+            The nameservers to work with.
+        """
+
+        return [x for x in nameservers if not self.is_backed_off(x)] or list(
+            nameservers
+        )
+
+    def sort(self, nameservers: List[str], timeout: float) -> List[str]:
+        """
+        Provides the given nameservers in the order we should query them: the
+        cheapest first.
+
+        The nameservers which are backed off are left out - unless all of
+        them are.
+
+        :param nameservers:
+            The nameservers to sort.
+        :param timeout:
+            The timeout of our queries.
+        """
+
+        return sorted(
+            self.drop_backed_off(nameservers),
+            key=lambda x: self.get_cost(x, timeout),
+        )
@@ -337,30 +337,38 @@ class HTTPStatusCode:
         """  # pylint: disable=line-too-long
 
         try:
+            # We only need the status code. Therefore, we don't download the
+            # body which an endpoint could send (or never finish to send).
             req = PyFunceble.factory.Requester.get(
                 self.subject,
                 timeout=self.timeout,
                 verify=self.verify_certificate,
                 allow_redirects=True,
+                stream=True,
             )
 
-            first_origin = self._url2netloc.set_data_to_convert(
-                self.subject
-            ).get_converted()
-
-            if len(req.history) > 1:
-                final_origin = self._url2netloc.set_data_to_convert(
-                    req.history[1].url
-                ).get_converted()
-            else:
-                final_origin = self._url2netloc.set_data_to_convert(
-                    req.url
+            try:
+                first_origin = self._url2netloc.set_data_to_convert(
+                    self.subject
                 ).get_converted()
 
-            if not self.allow_redirects and first_origin != final_origin:
-                return req.history[0].status_code
-
-            return req.status_code
+                if len(req.history) > 1:
+                    final_origin = self._url2netloc.set_data_to_convert(
+                        req.history[1].url
+                    ).get_converted()
+                else:
+                    final_origin = self._url2netloc.set_data_to_convert(
+                        req.url
+                    ).get_converted()
+
+                if not self.allow_redirects and first_origin != final_origin:
+                    return req.history[0].status_code
+
+                return req.status_code
+            finally:
+                # The body was not read: our connection has to be given back
+                # to the pool explicitly.
+                req.close()
         except (
             PyFunceble.factory.Requester.exceptions.RequestException,
             PyFunceble.factory.Requester.exceptions.InvalidSchema,
@@ -73,9 +73,11 @@ class AddressInfo(NetInfoBase):
         try:
             return [
                 x[-1][0]
-                for x in socket.getaddrinfo(self.subject, 80, proto=socket.IPPROTO_TCP)
+                for x in self.call(
+                    socket.getaddrinfo, self.subject, 80, proto=socket.IPPROTO_TCP
+                )
             ]
-        except (socket.gaierror, socket.herror, UnicodeError):
+        except (socket.gaierror, socket.herror, socket.timeout, UnicodeError):
             pass
 
         return []
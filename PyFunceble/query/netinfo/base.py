@@ -50,8 +50,14 @@ License:
     limitations under the License.
 """
 
+import concurrent.futures
 import functools
-from typing import Any, Optional
+import socket
+import threading
+from typing import Any, Callable, Optional, Union
+
+import PyFunceble.facility
+from PyFunceble.helpers.executor import ExecutorHelper
 
 
 class NetInfoBase:
@@ -59,13 +65,36 @@ class NetInfoBase:
     Provides the base of network information classes.
     """
 
+    MAX_WORKERS: int = 32
+
+    executor: ExecutorHelper = ExecutorHelper(
+        MAX_WORKERS, thread_name_prefix="pyfunceble_netinfo"
+    )
+    """
+    The pool of threads (shared by all network information classes of the
+    current process) our calls are run from when a timeout is set.
+    """
+
+    abandoned_calls: int = 0
+    """
+    The number of calls we stopped waiting for while they were still running.
+    """
+
+    _abandoned_calls_lock: threading.Lock = threading.Lock()
+
     _subject: Optional[str] = None
+    _timeout: Optional[float] = None
     base: Optional[str] = None
 
-    def __init__(self, subject: Optional[str] = None) -> None:
+    def __init__(
+        self, subject: Optional[str] = None, *, timeout: Optional[float] = None
+    ) -> None:
         if subject is not None:
             self.subject = subject
 
+        if timeout is not None:
+            self.timeout = timeout
+
     def ensure_subject_is_given(func):  # pylint: disable=no-self-argument
         """
         Ensures that the subject is given before running the decorated method.
@@ -127,6 +156,94 @@ class NetInfoBase:
 
         return self
 
+    @property
+    def timeout(self) -> Optional[float]:
+        """
+        Provides the current state of the :code:`_timeout` attribute.
+        """
+
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: Optional[Union[float, int]]) -> None:
+        """
+        Sets the timeout to apply.
+
+        :param value:
+            The timeout to apply. :code:`None` means no timeout.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`int`
+            nor :py:class:`float`.
+        :raise ValueError:
+            When the given :code:`value` is not greater than :code:`0`.
+        """
+
+        if value is not None:
+            if not isinstance(value, (int, float)):
+                raise TypeError(
+                    f"<value> should be {int} or {float}, {type(value)} given."
+                )
+
+            if value <= 0:
+                raise ValueError(f"<value> ({value!r}) should be greater than 0.")
+
+            value = float(value)
+
+        self._timeout = value
+
+    def set_timeout(self, value: Optional[Union[float, int]]) -> "NetInfoBase":
+        """
+        Sets the timeout to apply.
+
+        :param value:
+            The timeout to apply.
+        """
+
+        self.timeout = value
+
+        return self
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Calls the given function while respecting our timeout.
+
+        .. note::
+            The functions of the socket module we rely on can't be interrupted.
+            Therefore, when a timeout is set, the given function is called
+            from our (bounded) pool of threads and we stop waiting for it once
+            the timeout expired. Such abandoned calls keep their thread until
+            they end, they are counted into :py:attr:`abandoned_calls`.
+
+        :raise socket.timeout:
+            When the given function did not return in time.
+        """
+
+        if self.timeout is None:
+            return func(*args, **kwargs)
+
+        future = self.executor.submit(func, *args, **kwargs)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            if not future.cancel():
+                with self._abandoned_calls_lock:
+                    NetInfoBase.abandoned_calls += 1
+                    abandoned_calls = NetInfoBase.abandoned_calls
+
+                PyFunceble.facility.Logger.warning(
+                    "Abandoned call of %r for %r after %ss (abandoned calls: %d).",
+                    func,
+                    self.subject,
+                    self.timeout,
+                    abandoned_calls,
+                )
+
+            raise socket.timeout(  # pylint: disable=raise-missing-from
+                f"{self.subject!r}: no answer in {self.timeout}s."
+            )
+
     @ensure_subject_is_given
     def get_info(self) -> Any:
         """
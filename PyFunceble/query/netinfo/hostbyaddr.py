@@ -80,10 +80,10 @@ class HostByAddrInfo(NetInfoBase):
         """
 
         try:
-            request = socket.gethostbyaddr(self.subject)
+            request = self.call(socket.gethostbyaddr, self.subject)
 
             return {"hostname": request[0], "aliases": request[1], "ips": request[2]}
-        except (socket.gaierror, socket.herror):
+        except (socket.gaierror, socket.herror, socket.timeout):
             pass
 
         return dict()
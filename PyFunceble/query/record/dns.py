@@ -69,6 +69,7 @@ class DNSQueryToolRecord(RecordBase):
     follow_nameserver_order: Optional[bool] = None
     preferred_protocol: Optional[str] = None
     used_protocol: Optional[str] = None
+    from_cache: Optional[bool] = None
 
     query_record_type: Optional[str] = None
     query_timeout: Optional[float] = None
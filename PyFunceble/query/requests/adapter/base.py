@@ -50,6 +50,7 @@ License:
     limitations under the License.
 """
 
+import threading
 import time
 from typing import Optional
 
@@ -68,9 +69,13 @@ class RequestAdapterBase(requests.adapters.HTTPAdapter):
     """
 
     resolving_cache: dict = dict()
+    resolving_cache_lock: threading.Lock = threading.Lock()
     resolving_use_cache: bool = False
     timeout: float = 5.0
 
+    _dns_query_tools: Optional[threading.local] = None
+    _pool_lock: Optional[threading.RLock] = None
+
     def __init__(self, *args, **kwargs):
         if "timeout" in kwargs:
             self.timeout = float(kwargs["timeout"])
@@ -81,10 +86,41 @@ class RequestAdapterBase(requests.adapters.HTTPAdapter):
                 total=kwargs["max_retries"], respect_retry_after_header=False
             )
 
-        self.dns_query_tool = DNSQueryTool().guess_all_settings()
+        self._dns_query_tools = threading.local()
+        self._pool_lock = threading.RLock()
 
         super().__init__(*args, **kwargs)
 
+    @property
+    def dns_query_tool(self) -> DNSQueryTool:
+        """
+        Provides the DNS query tool of the current thread.
+
+        .. note::
+            Our query tool keeps the state of the current query. Therefore, it
+            is never shared between threads.
+        """
+
+        if self._dns_query_tools is None:
+            self._dns_query_tools = threading.local()
+
+        if not hasattr(self._dns_query_tools, "query_tool"):
+            self._dns_query_tools.query_tool = DNSQueryTool().guess_all_settings()
+
+        return self._dns_query_tools.query_tool
+
+    @property
+    def pool_lock(self) -> threading.RLock:
+        """
+        Provides the lock to hold while we are playing with the settings of our
+        pool manager.
+        """
+
+        if self._pool_lock is None:
+            self._pool_lock = threading.RLock()
+
+        return self._pool_lock
+
     @staticmethod
     def fake_response() -> requests.models.Response:
         """
@@ -101,10 +137,14 @@ class RequestAdapterBase(requests.adapters.HTTPAdapter):
         Try to resolve using an internal cache.
         """
 
-        if hostname not in self.resolving_cache:
-            self.resolving_cache[hostname] = self.resolve_without_cache(hostname)
+        with self.resolving_cache_lock:
+            if hostname in self.resolving_cache:
+                return self.resolving_cache[hostname]
+
+        result = self.resolve_without_cache(hostname)
 
-        return self.resolving_cache[hostname]
+        with self.resolving_cache_lock:
+            return self.resolving_cache.setdefault(hostname, result)
 
     def resolve_without_cache(self, hostname: str) -> Optional[str]:
         """
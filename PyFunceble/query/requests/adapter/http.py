@@ -108,12 +108,13 @@ class RequestHTTPAdapter(RequestAdapterBase):
             # not work.
             request.headers["Host"] = parsed_url.hostname
         else:
-            self.poolmanager.connection_pool_kw.pop(
-                "server_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
-            )
-            self.poolmanager.connection_pool_kw.pop(
-                "assert_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
-            )
+            with self.pool_lock:
+                self.poolmanager.connection_pool_kw.pop(
+                    "server_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
+                )
+                self.poolmanager.connection_pool_kw.pop(
+                    "assert_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
+                )
 
             return self.fake_response()
 
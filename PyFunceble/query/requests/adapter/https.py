@@ -98,41 +98,45 @@ class RequestHTTPSAdapter(RequestAdapterBase):
             "Pool Manager: %r", self.poolmanager.connection_pool_kw
         )
 
-        if hostname_ip:
-            request.url = request.url.replace(
-                f"{parsed_url.scheme}://{parsed_url.hostname}",
-                f"{parsed_url.scheme}://{hostname_ip}",
-            )
-
-            if parsed_url.scheme == "https":
-                self.poolmanager.connection_pool_kw[
-                    "server_hostname"
-                ] = parsed_url.hostname
-                self.poolmanager.connection_pool_kw[
-                    "assert_hostname"
-                ] = parsed_url.hostname
-
-            # Ensure that the Hosts header is present. Otherwise, connection might
-            # not work.
-            request.headers["Host"] = parsed_url.hostname
-        else:
-            self.poolmanager.connection_pool_kw.pop(
-                "server_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
-            )
-            self.poolmanager.connection_pool_kw.pop(
-                "assert_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
-            )
-
-            self.poolmanager.connection_pool_kw.pop(
-                "server_hostname", parsed_url.hostname
-            )
-            self.poolmanager.connection_pool_kw.pop(
-                "assert_hostname", parsed_url.hostname
-            )
-
-            return self.fake_response()
-
-        response = super().send(request, **kwargs)
+        # Our pool manager settings are shared by all requests going through
+        # this adapter.
+        with self.pool_lock:
+            if hostname_ip:
+                request.url = request.url.replace(
+                    f"{parsed_url.scheme}://{parsed_url.hostname}",
+                    f"{parsed_url.scheme}://{hostname_ip}",
+                )
+
+                if parsed_url.scheme == "https":
+                    self.poolmanager.connection_pool_kw[
+                        "server_hostname"
+                    ] = parsed_url.hostname
+                    self.poolmanager.connection_pool_kw[
+                        "assert_hostname"
+                    ] = parsed_url.hostname
+
+                # Ensure that the Hosts header is present. Otherwise, connection
+                # might not work.
+                request.headers["Host"] = parsed_url.hostname
+            else:
+                self.poolmanager.connection_pool_kw.pop(
+                    "server_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
+                )
+                self.poolmanager.connection_pool_kw.pop(
+                    "assert_hostname", PyFunceble.storage.NOT_RESOLVED_STD_HOSTNAME
+                )
+
+                self.poolmanager.connection_pool_kw.pop(
+                    "server_hostname", parsed_url.hostname
+                )
+                self.poolmanager.connection_pool_kw.pop(
+                    "assert_hostname", parsed_url.hostname
+                )
+
+                return self.fake_response()
+
+            response = super().send(request, **kwargs)
+
         response.url = response.url.replace(hostname_ip, parsed_url.hostname)
 
         return response
@@ -51,6 +51,7 @@ License:
 """
 
 import functools
+import threading
 import warnings
 from typing import Optional, Union
 
@@ -90,7 +91,8 @@ class Requester:
     _verify_certificate: bool = True
     _max_redirects: int = 60
 
-    session: Optional[requests.Session] = None
+    _sessions: Optional[threading.local] = None
+    _sessions_generation: int = 0
 
     def __init__(
         self,
@@ -100,6 +102,8 @@ class Requester:
         timeout: Optional[float] = None,
         max_redirects: Optional[int] = None,
     ) -> None:
+        self._sessions = threading.local()
+
         if max_retries is not None:
             self.max_retries = max_retries
 
@@ -129,8 +133,8 @@ class Requester:
         def wrapper(self, *args, **kwargs):
             result = func(self, *args, **kwargs)  # pylint: disable=not-callable
 
-            if hasattr(self, "session") and isinstance(self.session, requests.Session):
-                self.session = self.get_session()
+            # Sessions (of all threads) are recreated when they are needed.
+            self._sessions_generation += 1
 
             return result
 
@@ -169,6 +173,41 @@ class Requester:
 
         return request_method
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        Provides the session of the current thread.
+
+        .. note::
+            Our adapters are stateful. Therefore, a session is never shared
+            between threads.
+        """
+
+        if getattr(self._sessions, "generation", None) != self._sessions_generation:
+            self.session = self.get_session()
+
+        return self._sessions.session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        """
+        Sets the session of the current thread.
+
+        :param value:
+            The value to set.
+
+        :raise TypeError:
+            When the given :code:`value` is not a :py:class:`requests.Session`.
+        """
+
+        if not isinstance(value, requests.Session):
+            raise TypeError(
+                f"<value> should be {requests.Session}, {type(value)} given."
+            )
+
+        self._sessions.session = value
+        self._sessions.generation = self._sessions_generation
+
     @property
     def max_retries(self) -> int:
         """
@@ -52,6 +52,7 @@ License:
 
 import functools
 import socket
+import time
 from typing import Optional, Union
 
 from PyFunceble.dataset.iana import IanaDataset
@@ -366,6 +367,10 @@ class WhoisQueryTool:
                 req = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 req.settimeout(self.query_timeout)
 
+                # The timeout bounds the whole exchange. Otherwise, a server
+                # sending its response byte after byte could hold us forever.
+                deadline = time.monotonic() + self.query_timeout
+
                 try:
                     req.connect((whois_server, self.STD_PORT))
                     req.send(f"{self.subject}\r\n".encode())
@@ -373,6 +378,13 @@ class WhoisQueryTool:
                     response = "".encode()
 
                     while True:
+                        remaining_time = deadline - time.monotonic()
+
+                        if remaining_time <= 0:
+                            break
+
+                        req.settimeout(remaining_time)
+
                         try:
                             data = req.recv(self.BUFFER_SIZE)
                         except (ConnectionResetError, socket.timeout):
@@ -74,6 +74,7 @@ ENV_FILENAME: str = ".pyfunceble-env"
 DOWN_FILENAME: str = ".pyfunceble_intern_downtime.json"
 USER_AGENT_FILENAME: str = "user_agents.json"
 IPV4_REPUTATION_FILENAME: str = "ipv4_reputation.data"
+DNS_CACHE_FILENAME: str = "dns_cache.db"
 
 # pylint: disable=line-too-long
 IANA_DUMP_LINK: str = (
@@ -0,0 +1,155 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides some utilities related to the sharding of our tests.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import hashlib
+import os
+from typing import Optional, Tuple
+
+import PyFunceble.facility
+import PyFunceble.storage
+
+
+def get_shard() -> Optional[Tuple[int, int]]:
+    """
+    Provides the shard (index, count) we are supposed to test.
+
+    :return:
+        :py:class:`None` when we are not sharding.
+
+    :raise ValueError:
+        When the configured index is not in the configured count.
+    """
+
+    if not PyFunceble.facility.ConfigLoader.is_already_loaded():
+        return None
+
+    shard_count = PyFunceble.storage.CONFIGURATION.cli_testing.shard_count
+    shard_index = PyFunceble.storage.CONFIGURATION.cli_testing.shard_index
+
+    if not shard_count or shard_count <= 1:
+        return None
+
+    if shard_index is None:
+        shard_index = 0
+
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(
+            f"<shard_index> ({shard_index!r}) should be between 0 and "
+            f"{shard_count - 1!r}."
+        )
+
+    return shard_index, shard_count
+
+
+def get_shard_of_subject(idna_subject: str, shard_count: int) -> int:
+    """
+    Provides the shard the given subject belongs to.
+
+    .. note::
+        Unlike :py:func:`hash`, the hash we use is not salted. Therefore, a
+        subject always ends up into the same shard - whatever the host or
+        the run.
+
+    :param idna_subject:
+        The subject to work with.
+    :param shard_count:
+        The number of shards.
+    """
+
+    digest = hashlib.sha256(idna_subject.encode("utf-8")).digest()
+
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def is_subject_of_shard(
+    idna_subject: str, shard: Optional[Tuple[int, int]] = None
+) -> bool:
+    """
+    Checks if the given subject belongs to the given (or configured) shard.
+
+    :param idna_subject:
+        The subject to check.
+    :param shard:
+        The shard (index, count) to check against.
+    """
+
+    if shard is None:
+        shard = get_shard()
+
+        if shard is None:
+            return True
+
+    shard_index, shard_count = shard
+
+    return get_shard_of_subject(idna_subject, shard_count) == shard_index
+
+
+def get_shard_filename(filename: str) -> str:
+    """
+    Provides the name of the given file (or directory) for the configured
+    shard. This way, our shards never write into the same files.
+
+    :param filename:
+        The name to work with.
+
+    :return:
+        The given name when we are not sharding.
+    """
+
+    shard = get_shard()
+
+    if shard is None:
+        return filename
+
+    name, extension = os.path.splitext(filename)
+
+    return f"{name}_shard_{shard[0]}_of_{shard[1]}{extension}"
@@ -201,6 +201,9 @@ if __name__ == "__main__":
                 "iana-pyfunceble=PyFunceble.cli.entry_points.iana:generator",
                 "production-pyfunceble=PyFunceble.cli.entry_points.production:producer",
                 "clean-pyfunceble=PyFunceble.cli.entry_points.clean:cleaner",
+                "queue-benchmark-pyfunceble=PyFunceble.cli.entry_points.queue_benchmark:benchmarker",
+                "node-pyfunceble=PyFunceble.cli.entry_points.worker_node:node",
+                "merge-pyfunceble=PyFunceble.cli.entry_points.merge:merger",
             ]
         },
     )
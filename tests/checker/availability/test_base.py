@@ -52,6 +52,8 @@ License:
 
 # pylint: disable=too-many-lines
 
+import threading
+import time
 import unittest
 import unittest.mock
 
@@ -59,6 +61,7 @@ from PyFunceble.checker.availability.base import AvailabilityCheckerBase
 from PyFunceble.checker.availability.status import AvailabilityCheckerStatus
 from PyFunceble.checker.base import CheckerBase
 from PyFunceble.config.loader import ConfigLoader
+from PyFunceble.helpers.executor import ExecutorHelper
 from PyFunceble.query.dns.query_tool import DNSQueryTool
 
 
@@ -790,6 +793,243 @@ class TestAvailabilityCheckerBase(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_set_lookup_throttle_return(self) -> None:
+        """
+        Tests the response of the method which let us set the lookup throttle.
+        """
+
+        actual = self.checker.set_lookup_throttle(print)
+
+        self.assertIsInstance(actual, CheckerBase)
+
+    def test_set_lookup_throttle_not_callable(self) -> None:
+        """
+        Tests the method which let us set the lookup throttle.
+
+        Here we check the case that the inputted value is not callable.
+        """
+
+        given = ["Hello", "World!"]
+
+        self.assertRaises(TypeError, lambda: self.checker.set_lookup_throttle(given))
+
+    def test_throttle(self) -> None:
+        """
+        Tests the method which let our lookup throttle hold our lookups.
+        """
+
+        given = []
+        expected = ["dns", "whois"]
+
+        self.checker.set_lookup_throttle(given.append)
+
+        self.checker.throttle("dns").throttle("whois")
+
+        self.assertEqual(expected, given)
+
+    def test_throttle_not_set(self) -> None:
+        """
+        Tests the method which let our lookup throttle hold our lookups; but
+        for the case that no throttle is set.
+        """
+
+        actual = self.checker.throttle("dns")
+
+        self.assertIsInstance(actual, CheckerBase)
+
+    def test_set_deadline_return(self) -> None:
+        """
+        Tests the response of the method which let us set the deadline.
+        """
+
+        given = 10
+
+        actual = self.checker.set_deadline(given)
+
+        self.assertIsInstance(actual, CheckerBase)
+
+    def test_set_deadline_method(self) -> None:
+        """
+        Tests the method which let us set the deadline.
+        """
+
+        given = 10
+        expected = 10.0
+
+        self.checker.set_deadline(given)
+
+        actual = self.checker.deadline
+
+        self.assertEqual(expected, actual)
+
+    def test_set_deadline_init(self) -> None:
+        """
+        Tests the method which let us set the deadline through the class
+        constructor.
+        """
+
+        given = 10.0
+        expected = 10.0
+
+        checker = AvailabilityCheckerBase(deadline=given)
+        actual = checker.deadline
+
+        self.assertEqual(expected, actual)
+
+    def test_set_deadline_not_int_nor_float(self) -> None:
+        """
+        Tests the method which let us set the deadline for the case that the
+        given value is not an integer nor a float.
+        """
+
+        given = "10"
+
+        self.assertRaises(TypeError, lambda: self.checker.set_deadline(given))
+
+    def test_set_deadline_not_positive(self) -> None:
+        """
+        Tests the method which let us set the deadline for the case that the
+        given value is not greater than 0.
+        """
+
+        given = 0
+
+        self.assertRaises(ValueError, lambda: self.checker.set_deadline(given))
+
+    def test_guess_and_set_deadline(self) -> None:
+        """
+        Tests the method which let us guess and set the value of the
+        :code:`deadline` attribute.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.custom_config = {"lookup": {"deadline": 3.0}}
+
+        config_loader.start()
+
+        self.checker.guess_and_set_deadline()
+
+        expected = 3.0
+        actual = self.checker.deadline
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_guess_and_set_deadline_config_not_loaded(self) -> None:
+        """
+        Tests the method which let us guess and set the value of the
+        :code:`deadline` attribute; but for the case that the configuration
+        is not loaded.
+        """
+
+        self.checker.guess_and_set_deadline()
+
+        expected = self.checker.STD_DEADLINE
+        actual = self.checker.deadline
+
+        self.assertEqual(expected, actual)
+
+    def test_get_remaining_time(self) -> None:
+        """
+        Tests the method which let us get the time left before our deadline.
+        """
+
+        self.checker.deadline = 10
+        self.checker.subject = "example.org"
+
+        actual = self.checker.get_remaining_time()
+
+        self.assertGreater(actual, 9)
+        self.assertLessEqual(actual, 10)
+
+    def test_get_remaining_time_no_deadline(self) -> None:
+        """
+        Tests the method which let us get the time left before our deadline;
+        but for the case that no deadline is set.
+        """
+
+        self.checker.deadline = None
+        self.checker.subject = "example.org"
+
+        expected = None
+        actual = self.checker.get_remaining_time()
+
+        self.assertEqual(expected, actual)
+
+    def test_is_deadline_exceeded(self) -> None:
+        """
+        Tests the method which let us check if we reached our deadline.
+        """
+
+        self.checker.deadline = 2
+        self.checker.subject = "example.org"
+
+        self.assertFalse(self.checker.is_deadline_exceeded())
+
+        self.checker.started_at -= 3
+
+        self.assertTrue(self.checker.is_deadline_exceeded())
+
+    def test_cap_timeouts(self) -> None:
+        """
+        Tests the method which let us cap the timeout of our lookup tools to
+        the time left before our deadline.
+        """
+
+        self.checker.dns_query_tool.set_timeout(5.0)
+        self.checker.deadline = 10
+        self.checker.subject = "example.org"
+        self.checker.started_at -= 8
+
+        self.checker.cap_timeouts("dns").cap_timeouts("netinfo")
+
+        self.assertLessEqual(self.checker.dns_query_tool.query_timeout, 2.0)
+        self.assertLessEqual(self.checker.addressinfo_query_tool.timeout, 2.0)
+        self.assertLessEqual(self.checker.hostbyaddr_query_tool.timeout, 2.0)
+
+        # Now, we check that they are restored with the next subject.
+        self.checker.subject = "example.net"
+
+        self.assertEqual(5.0, self.checker.dns_query_tool.query_timeout)
+        self.assertIsNone(self.checker.addressinfo_query_tool.timeout)
+        self.assertIsNone(self.checker.hostbyaddr_query_tool.timeout)
+
+    def test_cap_timeouts_no_deadline(self) -> None:
+        """
+        Tests the method which let us cap the timeout of our lookup tools; but
+        for the case that no deadline is set.
+        """
+
+        self.checker.dns_query_tool.set_timeout(5.0)
+        self.checker.deadline = None
+        self.checker.subject = "example.org"
+
+        self.checker.cap_timeouts("dns")
+
+        expected = 5.0
+        actual = self.checker.dns_query_tool.query_timeout
+
+        self.assertEqual(expected, actual)
+
+    def test_before_lookup(self) -> None:
+        """
+        Tests the method which let us prepare a lookup.
+        """
+
+        given = []
+        expected = ["whois"]
+
+        self.checker.set_lookup_throttle(given.append)
+        self.checker.deadline = 10
+        self.checker.subject = "example.org"
+        self.checker.started_at -= 8
+
+        self.checker.before_lookup("whois")
+
+        self.assertEqual(expected, given)
+        self.assertLessEqual(self.checker.whois_query_tool.query_timeout, 2.0)
+
     def test_subject_propagator(self) -> None:
         """
         Tests that the subjects and its IDNA counterpart are correctly
@@ -876,14 +1116,34 @@ class TestAvailabilityCheckerBase(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
-    @unittest.mock.patch.object(DNSQueryTool, "query")
+    def test_should_we_continue_test_deadline_exceeded(self) -> None:
+        """
+        Tests the method which let us check if we should continue to another
+        test method; but for the case that we reached our deadline.
+        """
+
+        self.checker.deadline = 2
+        self.checker.subject = "example.org"
+        self.checker.started_at -= 3
+
+        given = None
+        self.checker.status.status = None
+
+        expected = False
+        actual = self.checker.should_we_continue_test(given)
+
+        self.assertEqual(expected, actual)
+
+    @unittest.mock.patch.object(DNSQueryTool, "query", autospec=True)
     def test_query_dns_record(self, dns_query_patch: unittest.mock.MagicMock) -> None:
         """
         Tests the method that let us query the (right) DNS record of the given
         subject.
         """
 
-        dns_query_patch.return_value = ["192.168.1.1"]
+        dns_query_patch.side_effect = lambda x: (
+            ["192.168.1.1"] if x.get_human_query_record_type() == "NS" else []
+        )
         given = "example.org"
         expected = {"NS": ["192.168.1.1"]}
 
@@ -914,7 +1174,7 @@ class TestAvailabilityCheckerBase(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
-    @unittest.mock.patch.object(DNSQueryTool, "query")
+    @unittest.mock.patch.object(DNSQueryTool, "query", autospec=True)
     def test_query_dns_record_subdomain(
         self, dns_query_patch: unittest.mock.MagicMock
     ) -> None:
@@ -923,15 +1183,191 @@ class TestAvailabilityCheckerBase(unittest.TestCase):
         subject.
         """
 
-        dns_query_patch.return_value = ["192.168.1.2"]
+        dns_query_patch.side_effect = lambda x: (
+            ["192.168.1.2"] if x.get_human_query_record_type() == "A" else []
+        )
         given = "test.example.org"
-        expected = {"NS": ["192.168.1.2"]}
+        expected = {"A": ["192.168.1.2"]}
+
+        self.checker.subject = given
+
+        actual = self.checker.query_dns_record()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual("A", self.checker.status.dns_lookup_record.query_record_type)
+
+    def test_dns_executor_shared(self) -> None:
+        """
+        Tests that the pool of threads which runs our DNS queries is shared by
+        all our checkers.
+        """
+
+        other_checker = AvailabilityCheckerBase()
+
+        self.assertIs(
+            self.checker.dns_executor.executor, other_checker.dns_executor.executor
+        )
+
+    @unittest.mock.patch.object(DNSQueryTool, "query", autospec=True)
+    def test_query_dns_record_concurrently(
+        self, dns_query_patch: unittest.mock.MagicMock
+    ) -> None:
+        """
+        Tests the method that let us query the (right) DNS record of the given
+        subject.
+
+        In this test, we check that the record types are queried concurrently
+        and that the first answer wins.
+        """
+
+        def fake_query(query_tool: DNSQueryTool) -> list:
+            if query_tool.get_human_query_record_type() == "NS":
+                # Slower than the others.
+                query_tool.cancel_event.wait(2.0)
+                return ["ns1.example.org"]
+
+            if query_tool.get_human_query_record_type() == "A":
+                return ["192.168.1.2"]
+
+            return []
+
+        dns_query_patch.side_effect = fake_query
+        given = "example.org"
+        expected = {"A": ["192.168.1.2"]}
+
+        self.checker.subject = given
+
+        start_time = time.monotonic()
+        actual = self.checker.query_dns_record()
+
+        self.assertEqual(expected, actual)
+        self.assertLess(time.monotonic() - start_time, 1.0)
+
+    @unittest.mock.patch.object(DNSQueryTool, "query", autospec=True)
+    def test_query_dns_record_fan_out(
+        self, dns_query_patch: unittest.mock.MagicMock
+    ) -> None:
+        """
+        Tests the method that let us query the (right) DNS record of the given
+        subject.
+
+        In this test, we check that a subject never runs more than
+        :code:`DNS_MAX_QUERIES_PER_SUBJECT` queries at once and that the next
+        record type is queried once one of them came back empty.
+        """
+
+        lock = threading.Lock()
+        running = []
+        concurrency = []
+
+        def fake_query(query_tool: DNSQueryTool) -> list:
+            with lock:
+                running.append(query_tool)
+                concurrency.append(len(running))
+
+            time.sleep(0.05)
+
+            with lock:
+                running.remove(query_tool)
+
+            return []
+
+        dns_query_patch.side_effect = fake_query
+        given = "example.org"
+        expected = dict()
+
+        self.checker.subject = given
+
+        actual = self.checker.query_dns_record()
+
+        self.assertEqual(expected, actual)
+
+        expected = ["NS", "CNAME", "A", "AAAA", "DNAME"]
+        actual = [
+            x.args[0].get_human_query_record_type()
+            for x in dns_query_patch.call_args_list
+        ]
+
+        self.assertEqual(sorted(expected), sorted(actual))
+        self.assertEqual(
+            AvailabilityCheckerBase.DNS_MAX_QUERIES_PER_SUBJECT, max(concurrency)
+        )
+
+    @unittest.mock.patch.object(DNSQueryTool, "query", autospec=True)
+    def test_query_dns_record_cancel_pending(
+        self, dns_query_patch: unittest.mock.MagicMock
+    ) -> None:
+        """
+        Tests the method that let us query the (right) DNS record of the given
+        subject.
+
+        In this test, we check that the queries which are still waiting for a
+        thread are cancelled once we are done.
+        """
+
+        def fake_query(query_tool: DNSQueryTool) -> list:
+            query_tool.cancel_event.wait(2.0)
+            return []
+
+        executor = ExecutorHelper(1)
+        futures = []
+
+        def submit(func, *args, **kwargs):
+            futures.append(ExecutorHelper.submit(executor, func, *args, **kwargs))
+            return futures[-1]
+
+        executor.submit = submit
+
+        dns_query_patch.side_effect = fake_query
+        given = "example.org"
+        expected = dict()
+
+        self.checker.deadline = 0.2
+        self.checker.subject = given
+
+        with unittest.mock.patch.object(self.checker, "dns_executor", executor):
+            actual = self.checker.query_dns_record()
+
+        executor.shutdown(wait=True)
+
+        self.assertEqual(expected, actual)
+
+        expected = [False, True]
+        actual = [x.cancelled() for x in futures]
+
+        self.assertEqual(expected, actual)
+
+        # Only the query which got the (single) thread ran.
+        self.assertEqual(1, dns_query_patch.call_count)
+
+    @unittest.mock.patch.object(DNSQueryTool, "query", autospec=True)
+    def test_query_dns_record_deadline_exceeded(
+        self, dns_query_patch: unittest.mock.MagicMock
+    ) -> None:
+        """
+        Tests the method that let us query the (right) DNS record of the given
+        subject.
+
+        In this test, we check that we don't wait for our queries once the
+        deadline is exceeded.
+        """
+
+        def fake_query(query_tool: DNSQueryTool) -> list:
+            query_tool.cancel_event.wait(2.0)
+            return ["192.168.1.2"]
+
+        dns_query_patch.side_effect = fake_query
+        given = "example.org"
+        expected = dict()
 
+        self.checker.deadline = 0.2
         self.checker.subject = given
 
+        start_time = time.monotonic()
         actual = self.checker.query_dns_record()
 
         self.assertEqual(expected, actual)
+        self.assertLess(time.monotonic() - start_time, 1.0)
 
     @unittest.mock.patch.object(DNSQueryTool, "query")
     def test_query_dns_record_ptr(
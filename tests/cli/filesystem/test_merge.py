@@ -0,0 +1,288 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our output directories merger.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.filesystem.merge import FilesystemMerger
+from PyFunceble.cli.filesystem.printer.file import FilePrinter
+from PyFunceble.cli.processes.workers.file_sorter_base import FileSorterWorkerBase
+
+
+class TestFilesystemMerger(unittest.TestCase):
+    """
+    Tests of our output directories merger.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+
+        self.sources = [
+            os.path.join(self.temp_directory.name, "shard_0"),
+            os.path.join(self.temp_directory.name, "shard_1"),
+        ]
+        self.destination = os.path.join(self.temp_directory.name, "merged")
+
+        for source in self.sources:
+            os.makedirs(source)
+
+        self.merger = FilesystemMerger(self.sources, self.destination)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.temp_directory.cleanup()
+
+        del self.merger
+        del self.temp_directory
+
+    @staticmethod
+    def write_file(path: str, lines: list) -> str:
+        """
+        Writes the given lines - after our header - into the given file.
+        """
+
+        with open(path, "w", encoding="utf-8") as file_stream:
+            file_stream.write(FilePrinter.STD_FILE_GENERATION)
+            file_stream.write(FilePrinter.get_generation_date_line())
+            file_stream.write("\n\n")
+            file_stream.writelines(f"{x}\n" for x in lines)
+
+        return path
+
+    @staticmethod
+    def read_file(path: str) -> list:
+        """
+        Reads the given file and provides its lines - without our header.
+        """
+
+        with open(path, "r", encoding="utf-8") as file_stream:
+            return [x.strip() for x in file_stream if x.strip() and x[0] != "#"]
+
+    def test_destination_in_sources(self) -> None:
+        """
+        Tests the constructor for the case that the destination is one of
+        the sources.
+        """
+
+        self.assertRaises(
+            ValueError,
+            lambda: FilesystemMerger(self.sources, self.sources[0]),
+        )
+
+    def test_skip_header(self) -> None:
+        """
+        Tests the method which moves a stream after its header.
+        """
+
+        path = self.write_file(
+            os.path.join(self.sources[0], "list"), ["a.example.org", "b.example.org"]
+        )
+
+        with open(path, "r", encoding="utf-8") as file_stream:
+            expected = ["a.example.org\n", "b.example.org\n"]
+            actual = list(self.merger.skip_header(file_stream))
+
+        self.assertEqual(expected, actual)
+
+    def test_skip_header_no_header(self) -> None:
+        """
+        Tests the method which moves a stream after its header for the case
+        that there is no header.
+        """
+
+        path = os.path.join(self.sources[0], "list")
+
+        with open(path, "w", encoding="utf-8") as file_stream:
+            file_stream.write("a.example.org\n")
+
+        with open(path, "r", encoding="utf-8") as file_stream:
+            expected = ["a.example.org\n"]
+            actual = list(self.merger.skip_header(file_stream))
+
+        self.assertEqual(expected, actual)
+
+    def test_merge_sorted_file(self) -> None:
+        """
+        Tests the method which merges sorted files.
+        """
+
+        files = [
+            self.write_file(
+                os.path.join(self.sources[0], "list"),
+                ["a.example.org", "c.example.org", "e.example.org"],
+            ),
+            self.write_file(
+                os.path.join(self.sources[1], "list"),
+                ["b.example.org", "c.example.org", "d.example.org"],
+            ),
+        ]
+
+        with unittest.mock.patch.object(
+            FileSorterWorkerBase, "process_file_sorting"
+        ) as sorting_patch:
+            self.merger.merge_sorted_file(os.path.join("INACTIVE", "list"), files)
+
+            sorting_patch.assert_not_called()
+
+        expected = [
+            "a.example.org",
+            "b.example.org",
+            "c.example.org",
+            "d.example.org",
+            "e.example.org",
+        ]
+        actual = self.read_file(os.path.join(self.destination, "INACTIVE", "list"))
+
+        self.assertEqual(expected, actual)
+
+    def test_merge_sorted_file_header(self) -> None:
+        """
+        Tests that the method which merges sorted files writes a single
+        header.
+        """
+
+        files = [
+            self.write_file(os.path.join(x, "list"), ["example.org"])
+            for x in self.sources
+        ]
+
+        self.merger.merge_sorted_file("list", files)
+
+        with open(
+            os.path.join(self.destination, "list"), "r", encoding="utf-8"
+        ) as file_stream:
+            lines = file_stream.readlines()
+
+        expected = FilePrinter.STD_FILE_GENERATION
+        actual = lines[0]
+
+        self.assertEqual(expected, actual)
+
+        expected = 2
+        actual = len([x for x in lines if x[0] == "#"])
+
+        self.assertEqual(expected, actual)
+
+    def test_merge_sorted_file_not_sorted(self) -> None:
+        """
+        Tests the method which merges sorted files for the case that one of
+        the given files is not sorted.
+        """
+
+        files = [
+            self.write_file(
+                os.path.join(self.sources[0], "list"),
+                ["z.example.org", "b.example.org"],
+            ),
+            self.write_file(
+                os.path.join(self.sources[1], "list"),
+                ["a.example.org", "b.example.org"],
+            ),
+        ]
+
+        with unittest.mock.patch.object(
+            FileSorterWorkerBase,
+            "process_file_sorting",
+            wraps=FileSorterWorkerBase.process_file_sorting,
+        ) as sorting_patch:
+            self.merger.merge_sorted_file("list", files)
+
+            sorting_patch.assert_called_once_with(
+                os.path.join(self.destination, "list")
+            )
+
+        expected = ["a.example.org", "b.example.org", "z.example.org"]
+        actual = self.read_file(os.path.join(self.destination, "list"))
+
+        self.assertEqual(expected, actual)
+
+    def test_merge_table_file(self) -> None:
+        """
+        Tests the method which merges table formatted files.
+        """
+
+        table_header = ["Subject    Status", "---------- ------"]
+
+        files = [
+            self.write_file(
+                os.path.join(self.sources[0], "results.txt"),
+                table_header + ["z.org      ACTIVE", "a.org      ACTIVE"],
+            ),
+            self.write_file(
+                os.path.join(self.sources[1], "results.txt"),
+                table_header + ["b.org      INACTIVE"],
+            ),
+        ]
+
+        self.merger.merge_table_file("results.txt", files)
+
+        expected = table_header + [
+            "z.org      ACTIVE",
+            "a.org      ACTIVE",
+            "b.org      INACTIVE",
+        ]
+        actual = self.read_file(os.path.join(self.destination, "results.txt"))
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,362 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our autoscaler.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.autoscaler import Autoscaler, WorkerStats
+from PyFunceble.cli.processes.rate_limiter import RateLimiter
+
+
+class TestWorkerStats(unittest.TestCase):
+    """
+    Tests of the counters of our workers.
+    """
+
+    def test_record(self) -> None:
+        """
+        Tests the method which records a finished test.
+        """
+
+        stats = WorkerStats(slow_threshold=2.0)
+
+        stats.record(0.5, 0.1).record(3.0, 0.2)
+
+        expected = (2.0, 3.5, 0.3, 1.0)
+        actual = stats.snapshot()
+
+        self.assertEqual(expected, tuple(round(x, 6) for x in actual))
+
+    def test_slow_threshold_config_not_loaded(self) -> None:
+        """
+        Tests the default threshold for the case that the configuration was not
+        loaded.
+        """
+
+        expected = 5.0
+        actual = WorkerStats().slow_threshold
+
+        self.assertEqual(expected, actual)
+
+
+class TestAutoscaler(unittest.TestCase):
+    """
+    Tests of our autoscaler.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.depth = 0
+        self.workers = []
+
+        self.manager = unittest.mock.MagicMock()
+        self.manager.max_worker = 4
+        self.manager.rate_limiter = None
+        self.manager.input_queue.qsize.side_effect = lambda: self.depth
+        self.manager.get_active_workers.side_effect = lambda: list(self.workers)
+        self.manager.add_worker.side_effect = self.add_worker
+        self.manager.retire_worker.side_effect = lambda: self.workers.pop()
+
+        self.get_rss_patch = unittest.mock.patch(
+            "PyFunceble.cli.processes.autoscaler.get_rss", return_value=100
+        )
+        self.get_rss_mock = self.get_rss_patch.start()
+
+        self.autoscaler = Autoscaler(self.manager, min_workers=1)
+
+        self.add_worker()
+        self.add_worker()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.get_rss_patch.stop()
+
+        del self.autoscaler
+        del self.manager
+        del self.workers
+
+    def add_worker(self) -> unittest.mock.MagicMock:
+        """
+        Provides a new (fake) worker.
+        """
+
+        worker = unittest.mock.MagicMock()
+        worker.name = f"pyfunceble_worker_{len(self.workers) + 1}"
+        worker.pid = os.getpid()
+        worker.stats = WorkerStats(slow_threshold=5.0)
+
+        self.workers.append(worker)
+
+        return worker
+
+    def record(self, latency: float, cpu_time: float, count: int = 10) -> None:
+        """
+        Records the given number of tests into each of our workers.
+        """
+
+        for worker in self.workers:
+            for _ in range(count):
+                worker.stats.record(latency, cpu_time)
+
+    def test_max_workers(self) -> None:
+        """
+        Tests that the maximum number of workers is the one of the manager
+        when none is given.
+        """
+
+        expected = 4
+        actual = self.autoscaler.max_workers
+
+        self.assertEqual(expected, actual)
+
+    def test_grow(self) -> None:
+        """
+        Tests that we grow when the input queue backs up and the tests mostly
+        wait for the network.
+        """
+
+        self.depth = 10
+        self.record(1.0, 0.01)
+
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_called_once_with()
+        self.manager.retire_worker.assert_not_called()
+
+        expected = 3
+        actual = len(self.workers)
+
+        self.assertEqual(expected, actual)
+
+    def test_grow_until_max_workers(self) -> None:
+        """
+        Tests that we never grow over the maximum number of workers.
+        """
+
+        self.depth = 100
+
+        for _ in range(5):
+            self.record(1.0, 0.01)
+            self.autoscaler.scale()
+
+        expected = 4
+        actual = len(self.workers)
+
+        self.assertEqual(expected, actual)
+
+    def test_hold_no_backlog(self) -> None:
+        """
+        Tests that we don't grow while the input queue does not back up.
+        """
+
+        self.depth = 3
+        self.record(1.0, 0.01)
+
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_not_called()
+        self.manager.retire_worker.assert_not_called()
+
+    def test_hold_unknown_depth(self) -> None:
+        """
+        Tests that we don't grow when our input queue can't tell us its depth.
+        """
+
+        self.manager.input_queue.qsize.side_effect = NotImplementedError
+        self.record(1.0, 0.01)
+
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_not_called()
+
+    def test_hold_no_tests(self) -> None:
+        """
+        Tests that we don't grow when nothing was tested since our last
+        decision.
+        """
+
+        self.depth = 10
+        self.record(1.0, 0.01)
+
+        self.autoscaler.scale()
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_called_once_with()
+
+    def test_hold_cpu_bound(self) -> None:
+        """
+        Tests that we don't grow when the tests don't wait for the network.
+        """
+
+        self.depth = 10
+        self.record(1.0, 0.9)
+
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_not_called()
+
+    def test_hold_rate_limited(self) -> None:
+        """
+        Tests that we don't grow while our workers wait for the rate limiter.
+        """
+
+        self.manager.rate_limiter = RateLimiter({"dns": 1})
+
+        self.depth = 10
+        self.record(1.0, 0.01)
+        self.manager.rate_limiter.waited.value = 1.5
+
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_not_called()
+
+        # The rate limiter was not used since our last decision.
+        self.record(1.0, 0.01)
+
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_called_once_with()
+
+    def test_hold_rss_would_reach_cap(self) -> None:
+        """
+        Tests that we don't grow when a new worker would bring us close to the
+        RSS cap.
+        """
+
+        self.autoscaler.max_rss = 300
+
+        self.depth = 10
+        self.record(1.0, 0.01)
+
+        self.autoscaler.scale()
+
+        self.manager.add_worker.assert_not_called()
+        self.manager.retire_worker.assert_not_called()
+
+    def test_shrink_slow(self) -> None:
+        """
+        Tests that we shrink when too many tests wait for a timeout.
+        """
+
+        self.depth = 10
+        self.record(6.0, 0.01)
+
+        self.autoscaler.scale()
+
+        self.manager.retire_worker.assert_called_once_with()
+        self.manager.add_worker.assert_not_called()
+
+        expected = ["pyfunceble_worker_1"]
+        actual = list(self.autoscaler.last_snapshots)
+
+        self.assertEqual(expected, actual)
+
+    def test_shrink_rss(self) -> None:
+        """
+        Tests that we shrink when the RSS gets close to the cap.
+        """
+
+        self.autoscaler.max_rss = 200
+
+        self.depth = 10
+        self.record(1.0, 0.01)
+
+        self.autoscaler.scale()
+
+        self.manager.retire_worker.assert_called_once_with()
+        self.manager.add_worker.assert_not_called()
+
+    def test_shrink_until_min_workers(self) -> None:
+        """
+        Tests that we never shrink under the minimum number of workers.
+        """
+
+        for _ in range(3):
+            self.record(6.0, 0.01)
+            self.autoscaler.scale()
+
+        expected = 1
+        actual = len(self.workers)
+
+        self.assertEqual(expected, actual)
+
+        self.manager.retire_worker.assert_called_once_with()
+
+    def test_get_stats(self) -> None:
+        """
+        Tests that we only consider the tests since our last decision.
+        """
+
+        self.record(1.0, 0.5, count=2)
+
+        expected = (4.0, 4.0, 2.0, 0.0)
+        actual = self.autoscaler.get_stats(self.workers)
+
+        self.assertEqual(expected, actual)
+
+        self.record(6.0, 0.5, count=1)
+
+        expected = (2.0, 12.0, 1.0, 2.0)
+        actual = self.autoscaler.get_stats(self.workers)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
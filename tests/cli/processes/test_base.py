@@ -0,0 +1,378 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our processes manager base.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import queue
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.base import ProcessesManagerBase
+from PyFunceble.cli.processes.completion import CompletionTracker
+from PyFunceble.cli.processes.disk_queue import DiskQueue
+from PyFunceble.cli.processes.heartbeat import Heartbeat
+from PyFunceble.cli.processes.message_batch import MessageBatch
+
+
+class TestProcessesManagerBase(unittest.TestCase):
+    """
+    Tests of our processes manager base.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.input_queue = DiskQueue(os.path.join(self.temp_directory.name, "q.db"))
+
+        self.manager = ProcessesManagerBase(
+            max_worker=1,
+            input_queue=self.input_queue,
+            queue_backend="queue",
+            completion_tracker=CompletionTracker(),
+            stall_timeout=0.01,
+        )
+        self.manager.watchdog_lock = threading.Lock()
+
+        self.add_worker_patch = unittest.mock.patch.object(
+            self.manager, "add_worker"
+        )
+        self.add_worker_mock = self.add_worker_patch.start()
+
+        self.messages = [("worker", None, {"subject": x}) for x in "abcd"]
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.add_worker_patch.stop()
+
+        self.input_queue.close()
+        self.temp_directory.cleanup()
+
+        del self.manager
+        del self.input_queue
+        del self.temp_directory
+
+    def get_worker(self) -> unittest.mock.MagicMock:
+        """
+        Provides a (fake) worker which took our messages from the input queue.
+        """
+
+        for message in self.messages:
+            self.manager.completion_tracker.add()
+            self.input_queue.put(message)
+
+        for _ in self.messages:
+            self.input_queue.get_nowait()
+
+        worker = unittest.mock.MagicMock()
+        worker.name = "pyfunceble_worker_1"
+        worker.pid = os.getpid()
+        worker.heartbeat = Heartbeat()
+        worker.is_alive.return_value = True
+
+        self.manager._running_workers.append(worker)
+
+        return worker
+
+    def get_queued(self) -> list:
+        """
+        Provides what is waiting into our input queue.
+        """
+
+        result = []
+
+        while True:
+            try:
+                result.append(self.input_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return result
+
+    def test_replace_stalled_worker(self) -> None:
+        """
+        Tests the method which replaces a stalled worker.
+        """
+
+        worker = self.get_worker()
+
+        self.manager.replace_stalled_worker(
+            worker, self.messages[1], [self.messages[0], "wait"] + self.messages[2:]
+        )
+
+        expected = [MessageBatch([self.messages[0]] + self.messages[2:])]
+        actual = self.get_queued()
+
+        self.assertEqual(expected, actual)
+
+        # Only the message it stalled on was dropped (and marked as done).
+        expected = 3
+        actual = self.manager.completion_tracker.inflight
+
+        self.assertEqual(expected, actual)
+
+        # What it took was forgotten: only what we gave back is left.
+        expected = 1
+        actual = self.input_queue.release_taken()
+
+        self.assertEqual(expected, actual)
+
+        self.add_worker_mock.assert_called_once_with()
+
+    def test_replace_stalled_worker_unknown(self) -> None:
+        """
+        Tests the method which replaces a stalled worker for the case that we
+        don't know what it held.
+        """
+
+        worker = self.get_worker()
+        worker.heartbeat.hold([]).held_count.value = len(self.messages)
+
+        self.manager.replace_stalled_worker(worker, None, None)
+
+        expected = []
+        actual = self.get_queued()
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = self.manager.completion_tracker.inflight
+
+        self.assertEqual(expected, actual)
+
+        # What it took is not left taken forever.
+        expected = 0
+        actual = self.input_queue.release_taken()
+
+        self.assertEqual(expected, actual)
+
+        self.add_worker_mock.assert_called_once_with()
+
+    def test_replace_stalled_workers(self) -> None:
+        """
+        Tests the method which checks the heartbeat of our workers and
+        replaces the stalled ones.
+        """
+
+        worker = self.get_worker()
+
+        worker.heartbeat.hold(self.messages)
+        worker.heartbeat.beat(3).rest()
+        worker.heartbeat.release(3)
+        worker.heartbeat.beat(2)
+
+        time.sleep(0.05)
+
+        self.manager.replace_stalled_workers()
+
+        worker.kill.assert_called_once_with()
+
+        expected = True
+        actual = worker.recycle_it.set.called
+
+        self.assertEqual(expected, actual)
+
+        expected = [MessageBatch(self.messages[2:])]
+        actual = self.get_queued()
+
+        self.assertEqual(expected, actual)
+
+        self.add_worker_mock.assert_called_once_with()
+
+    def test_replace_stalled_workers_not_stalled(self) -> None:
+        """
+        Tests the method which checks the heartbeat of our workers for the
+        case that nobody stalled.
+        """
+
+        worker = self.get_worker()
+
+        worker.heartbeat.hold(self.messages)
+        self.manager.stall_timeout = 60.0
+        worker.heartbeat.beat(3)
+
+        self.manager.replace_stalled_workers()
+
+        worker.kill.assert_not_called()
+        self.add_worker_mock.assert_not_called()
+
+    def get_running_workers(self, count: int) -> list:
+        """
+        Provides the given number of (fake) running workers.
+        """
+
+        workers = []
+
+        for index in range(count):
+            worker = unittest.mock.MagicMock()
+            worker.name = f"pyfunceble_worker_{index + 1}"
+            worker.is_alive.return_value = True
+            worker.retire_it = threading.Event()
+            worker.recycle_it = threading.Event()
+
+            workers.append(worker)
+
+        self.manager._running_workers.extend(workers)
+
+        return workers
+
+    def test_retire_worker(self) -> None:
+        """
+        Tests the method which retires a worker.
+        """
+
+        workers = self.get_running_workers(3)
+
+        expected = workers[2]
+        actual = self.manager.retire_worker()
+
+        self.assertIs(expected, actual)
+        self.assertTrue(workers[2].retire_it.is_set())
+
+        expected = workers[:2]
+        actual = self.manager.get_active_workers()
+
+        self.assertEqual(expected, actual)
+
+    def test_retire_worker_skip_first(self) -> None:
+        """
+        Tests the method which retires a worker for the case that only the
+        first worker is left.
+        """
+
+        workers = self.get_running_workers(3)
+
+        self.manager.retire_worker()
+        self.manager.retire_worker()
+
+        expected = None
+        actual = self.manager.retire_worker()
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(workers[0].retire_it.is_set())
+
+    def test_retire_worker_first_left_active(self) -> None:
+        """
+        Tests the method which retires a worker for the case that the first
+        worker is the latest active one.
+        """
+
+        workers = self.get_running_workers(3)
+
+        # The first worker is the only active one.
+        workers[1].is_alive.return_value = False
+        workers[2].recycle_it.set()
+
+        expected = None
+        actual = self.manager.retire_worker()
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(workers[0].retire_it.is_set())
+
+    def test_prune_workers(self) -> None:
+        """
+        Tests the method which forgets the retired (or recycled) workers which
+        are already gone.
+        """
+
+        workers = self.get_running_workers(5)
+
+        # Retired, but still finishing its work.
+        workers[1].retire_it.set()
+
+        # Retired and gone.
+        workers[2].retire_it.set()
+        workers[2].is_alive.return_value = False
+
+        # Recycled and gone.
+        workers[3].recycle_it.set()
+        workers[3].is_alive.return_value = False
+
+        # Gone, but not by our will.
+        workers[4].is_alive.return_value = False
+
+        self.manager.prune_workers()
+
+        expected = [workers[0], workers[1], workers[4]]
+        actual = self.manager._running_workers
+
+        self.assertEqual(expected, actual)
+
+    def test_prune_workers_keep_first(self) -> None:
+        """
+        Tests the method which forgets the retired (or recycled) workers for
+        the case that the first one is gone.
+        """
+
+        workers = self.get_running_workers(2)
+
+        for worker in workers:
+            worker.recycle_it.set()
+            worker.is_alive.return_value = False
+
+        self.manager.prune_workers()
+
+        expected = [workers[0]]
+        actual = self.manager._running_workers
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our completion tracker.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+import threading
+import time
+import unittest
+
+from PyFunceble.cli.processes.completion import CompletionTracker
+
+
+def process_messages(tracker: CompletionTracker, count: int) -> None:
+    """
+    Processes the given number of messages - each of them producing a new
+    one until there is nothing left.
+    """
+
+    for produced in reversed(range(count)):
+        if produced:
+            tracker.add()
+
+        tracker.done()
+
+
+class TestCompletionTracker(unittest.TestCase):
+    """
+    Tests of our completion tracker.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.tracker = CompletionTracker()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.tracker
+
+    def test_add_done(self) -> None:
+        """
+        Tests the methods which let us add and mark messages.
+        """
+
+        self.tracker.add(3).add()
+
+        expected = 4
+        actual = self.tracker.inflight
+
+        self.assertEqual(expected, actual)
+
+        self.tracker.done(2)
+
+        expected = 2
+        actual = self.tracker.inflight
+
+        self.assertEqual(expected, actual)
+
+    def test_reach_zero_not_closed(self) -> None:
+        """
+        Tests that reaching zero is not enough while the input of the
+        pipeline is still open.
+        """
+
+        self.tracker.add(2).done(2)
+
+        self.assertFalse(self.tracker.is_finished())
+
+    def test_reach_zero_closed(self) -> None:
+        """
+        Tests that we are finished once we reach zero after the input of the
+        pipeline was closed.
+        """
+
+        self.tracker.add(2).close()
+
+        self.assertFalse(self.tracker.is_finished())
+
+        self.tracker.done()
+
+        self.assertFalse(self.tracker.is_finished())
+
+        self.tracker.done()
+
+        self.assertTrue(self.tracker.is_finished())
+        self.assertTrue(self.tracker.wait(0))
+
+    def test_close_nothing_inflight(self) -> None:
+        """
+        Tests that we are finished right away when we close while nothing is
+        in flight.
+        """
+
+        self.tracker.close()
+
+        self.assertTrue(self.tracker.is_finished())
+
+    def test_reach_zero_across_processes(self) -> None:
+        """
+        Tests that we reach zero when our messages are processed - and
+        produce more work - into other processes.
+        """
+
+        self.tracker.add(3)
+
+        processes = [
+            multiprocessing.Process(target=process_messages, args=(self.tracker, 50))
+            for _ in range(3)
+        ]
+
+        for process in processes:
+            process.start()
+
+        self.tracker.close()
+
+        self.assertTrue(self.tracker.wait(5.0))
+
+        for process in processes:
+            process.join(5.0)
+
+        expected = 0
+        actual = self.tracker.inflight
+
+        self.assertEqual(expected, actual)
+
+    def test_abort(self) -> None:
+        """
+        Tests that an abort stops the waiting even with messages in flight.
+        """
+
+        self.tracker.add(5)
+
+        thread = threading.Thread(target=self.tracker.wait, daemon=True)
+        thread.start()
+
+        self.tracker.abort()
+        thread.join(1.0)
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(self.tracker.is_finished())
+
+        expected = 5
+        actual = self.tracker.inflight
+
+        self.assertEqual(expected, actual)
+
+    def test_wait_timeout(self) -> None:
+        """
+        Tests that we give up waiting once the given timeout is over.
+        """
+
+        self.tracker.add().close()
+
+        start = time.monotonic()
+
+        self.assertFalse(self.tracker.wait(0.2))
+
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 1.0)
+        self.assertFalse(self.tracker.is_finished())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,375 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our concurrency limiter and tuner.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import threading
+import time
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.concurrency import ConcurrencyLimiter, ConcurrencyTuner
+
+
+class TestConcurrencyLimiter(unittest.TestCase):
+    """
+    Tests of our concurrency limiter.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.limiter = ConcurrencyLimiter(2)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.limiter
+
+    def test_set_limit_not_int(self) -> None:
+        """
+        Tests the method which let us set the limit for the case that the
+        given value is not an integer.
+        """
+
+        for given in ["1", 1.0, True, None]:
+            self.assertRaises(TypeError, setattr, self.limiter, "limit", given)
+
+    def test_set_limit_less_than_one(self) -> None:
+        """
+        Tests the method which let us set the limit for the case that the
+        given value is less than one.
+        """
+
+        for given in [0, -1]:
+            self.assertRaises(ValueError, setattr, self.limiter, "limit", given)
+
+    def test_acquire_saturated(self) -> None:
+        """
+        Tests that we flag the limiter as saturated once we reach its limit.
+        """
+
+        self.limiter.acquire()
+
+        self.assertFalse(self.limiter.saturated)
+
+        self.limiter.acquire()
+
+        expected = 2
+        actual = self.limiter.inflight
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(self.limiter.saturated)
+
+    def test_acquire_blocks_until_release(self) -> None:
+        """
+        Tests that we wait for a slot when the limit is reached.
+        """
+
+        self.limiter.acquire()
+        self.limiter.acquire()
+
+        thread = threading.Thread(target=self.limiter.acquire, daemon=True)
+        thread.start()
+        thread.join(0.1)
+
+        self.assertTrue(thread.is_alive())
+
+        self.limiter.release()
+        thread.join(1.0)
+
+        self.assertFalse(thread.is_alive())
+
+        expected = 2
+        actual = self.limiter.inflight
+
+        self.assertEqual(expected, actual)
+
+    def test_raise_limit_wakes_up(self) -> None:
+        """
+        Tests that raising the limit lets a waiting holder in.
+        """
+
+        self.limiter.acquire()
+        self.limiter.acquire()
+
+        thread = threading.Thread(target=self.limiter.acquire, daemon=True)
+        thread.start()
+        thread.join(0.1)
+
+        self.assertTrue(thread.is_alive())
+
+        self.limiter.limit = 3
+        thread.join(1.0)
+
+        self.assertFalse(thread.is_alive())
+
+    def test_wait_idle(self) -> None:
+        """
+        Tests that we wait until nobody holds a slot.
+        """
+
+        self.limiter.acquire()
+
+        thread = threading.Thread(target=self.limiter.wait_idle, daemon=True)
+        thread.start()
+        thread.join(0.1)
+
+        self.assertTrue(thread.is_alive())
+
+        self.limiter.release()
+        thread.join(1.0)
+
+        self.assertFalse(thread.is_alive())
+
+
+class TestConcurrencyTuner(unittest.TestCase):
+    """
+    Tests of our concurrency tuner.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.limiter = ConcurrencyLimiter(1)
+        self.tuner = ConcurrencyTuner(self.limiter, 64, slow_threshold=5.0, name="test")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.tuner
+        del self.limiter
+
+    def test_start(self) -> None:
+        """
+        Tests that we start with a small limit.
+        """
+
+        expected = ConcurrencyTuner.STD_START
+        actual = self.limiter.limit
+
+        self.assertEqual(expected, actual)
+
+    def test_start_maximum(self) -> None:
+        """
+        Tests that we never start above the maximum.
+        """
+
+        tuner = ConcurrencyTuner(self.limiter, 2, slow_threshold=5.0)
+
+        expected = 2
+        actual = tuner.limiter.limit
+
+        self.assertEqual(expected, actual)
+
+    def test_evaluate_doubles_then_plateau(self) -> None:
+        """
+        Tests that we double the limit as long as the throughput improves and
+        that we settle on the best limit once it plateaus.
+        """
+
+        expected = [8, 16, 8, 8]
+        actual = []
+
+        for throughput in [10.0, 20.0, 21.0, 40.0]:
+            self.tuner.evaluate(throughput, 0.0)
+            actual.append(self.limiter.limit)
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(self.tuner.settled)
+
+        expected = 20.0
+        actual = self.tuner.best_throughput
+
+        self.assertEqual(expected, actual)
+
+    def test_evaluate_error_rate_climbs(self) -> None:
+        """
+        Tests that we settle on the best limit as soon as the error rate
+        climbs.
+        """
+
+        self.tuner.evaluate(10.0, 0.0)
+        self.tuner.evaluate(20.0, 0.0)
+        self.tuner.evaluate(40.0, 0.5)
+
+        expected = 8
+        actual = self.limiter.limit
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(self.tuner.settled)
+
+    def test_evaluate_error_rate_climbs_settled(self) -> None:
+        """
+        Tests that we halve the limit when the error rate climbs after we
+        settled.
+        """
+
+        self.tuner.evaluate(10.0, 0.0)
+        self.tuner.evaluate(20.0, 0.0)
+        self.tuner.evaluate(21.0, 0.0)
+
+        self.tuner.evaluate(20.0, 0.5)
+
+        expected = 4
+        actual = self.limiter.limit
+
+        self.assertEqual(expected, actual)
+
+        # The new error rate is our new reference.
+        self.tuner.evaluate(20.0, 0.5)
+
+        expected = 4
+        actual = self.limiter.limit
+
+        self.assertEqual(expected, actual)
+
+    def test_evaluate_never_below_one(self) -> None:
+        """
+        Tests that halving never brings the limit below one.
+        """
+
+        self.limiter.limit = 1
+        self.tuner.settled = True
+        self.tuner.best_throughput = 10.0
+        self.tuner.best_error_rate = 0.0
+
+        self.tuner.evaluate(10.0, 0.5)
+
+        expected = 1
+        actual = self.limiter.limit
+
+        self.assertEqual(expected, actual)
+
+    def test_evaluate_maximum(self) -> None:
+        """
+        Tests that we settle once we reach the maximum.
+        """
+
+        tuner = ConcurrencyTuner(self.limiter, 10, slow_threshold=5.0)
+
+        expected = [8, 10, 10]
+        actual = []
+
+        for throughput in [10.0, 20.0, 40.0]:
+            tuner.evaluate(throughput, 0.0)
+            actual.append(self.limiter.limit)
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(tuner.settled)
+
+    def test_record(self) -> None:
+        """
+        Tests that we evaluate the throughput and the error rate of a window
+        once it is over.
+        """
+
+        with unittest.mock.patch.object(time, "monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            self.tuner.reset_window()
+
+            for _ in range(self.limiter.limit):
+                self.limiter.acquire()
+
+            with unittest.mock.patch.object(self.tuner, "evaluate") as evaluate:
+                monotonic.return_value = 101.0
+                self.tuner.record(0.1)
+
+                evaluate.assert_not_called()
+
+                monotonic.return_value = 102.0
+
+                for _ in range(2):
+                    self.tuner.record(0.1)
+
+                evaluate.assert_not_called()
+
+                self.tuner.record(5.0)
+
+                evaluate.assert_called_once_with(2.0, 0.25)
+
+        expected = 0
+        actual = self.tuner.completed
+
+        self.assertEqual(expected, actual)
+
+    def test_record_not_saturated(self) -> None:
+        """
+        Tests that we ignore the windows where we did not reach our limit.
+        """
+
+        with unittest.mock.patch.object(time, "monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            self.tuner.reset_window()
+
+            with unittest.mock.patch.object(self.tuner, "evaluate") as evaluate:
+                monotonic.return_value = 102.0
+
+                for _ in range(8):
+                    self.tuner.record(0.1)
+
+                evaluate.assert_not_called()
+
+        expected = 4
+        actual = self.limiter.limit
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
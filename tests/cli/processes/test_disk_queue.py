@@ -0,0 +1,291 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our disk-backed queue.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import pickle
+import queue
+import tempfile
+import unittest
+
+from PyFunceble.cli.processes.disk_queue import DiskQueue
+from PyFunceble.cli.processes.message_batch import MessageBatch
+
+
+class TestDiskQueue(unittest.TestCase):
+    """
+    Tests of our disk-backed queue.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_directory.name, "queue.db")
+
+        self.queue = DiskQueue(self.path)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.queue.close()
+        self.temp_directory.cleanup()
+
+        del self.queue
+        del self.temp_directory
+
+    def test_put_get(self) -> None:
+        """
+        Tests that what we put is given back in order.
+        """
+
+        given = [("worker", None, f"example-{x}.org") for x in range(3)]
+
+        for item in given:
+            self.queue.put(item)
+
+        expected = given
+        actual = [self.queue.get_nowait() for _ in given]
+
+        self.assertEqual(expected, actual)
+
+    def test_get_empty(self) -> None:
+        """
+        Tests the method which provides the oldest item for the case that
+        nothing is waiting.
+        """
+
+        self.assertRaises(queue.Empty, self.queue.get_nowait)
+        self.assertRaises(queue.Empty, lambda: self.queue.get(timeout=0.1))
+
+    def test_qsize_empty(self) -> None:
+        """
+        Tests the methods which provide the state of the queue.
+        """
+
+        expected = (0, True)
+        actual = (self.queue.qsize(), self.queue.empty())
+
+        self.assertEqual(expected, actual)
+
+        self.queue.put("example.org")
+        self.queue.put("example.net")
+
+        expected = (2, False)
+        actual = (self.queue.qsize(), self.queue.empty())
+
+        self.assertEqual(expected, actual)
+
+        self.queue.get_nowait()
+
+        expected = (1, False)
+        actual = (self.queue.qsize(), self.queue.empty())
+
+        self.assertEqual(expected, actual)
+
+    def test_persistence(self) -> None:
+        """
+        Tests that what we put survives the end of the queue.
+        """
+
+        self.queue.put("example.org")
+        self.queue.put("example.net")
+        self.queue.close()
+
+        resumed_queue = DiskQueue(self.path)
+
+        expected = ["example.org", "example.net"]
+        actual = [resumed_queue.get_nowait(), resumed_queue.get_nowait()]
+
+        self.assertEqual(expected, actual)
+
+        resumed_queue.close()
+
+    def test_resume_not_acknowledged(self) -> None:
+        """
+        Tests that what was read but never acknowledged can be given back -
+        and that what was acknowledged is gone.
+        """
+
+        self.queue.put("example.org")
+        self.queue.put("example.net")
+        self.queue.put("example.com")
+
+        self.queue.get_nowait()
+        self.queue.task_done()
+        self.queue.get_nowait()
+
+        # We were "killed" before acknowledging our second message.
+        self.queue.close()
+
+        resumed_queue = DiskQueue(self.path)
+
+        expected = 1
+        actual = resumed_queue.release_taken()
+
+        self.assertEqual(expected, actual)
+
+        expected = ["example.net", "example.com"]
+        actual = [resumed_queue.get_nowait(), resumed_queue.get_nowait()]
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(queue.Empty, resumed_queue.get_nowait)
+
+        resumed_queue.close()
+
+    def test_task_done_batch(self) -> None:
+        """
+        Tests that a batch is only deleted once all of its messages were
+        acknowledged.
+        """
+
+        self.queue.put(MessageBatch(["example.org", "example.net"]))
+        self.queue.get_nowait()
+
+        self.queue.task_done()
+
+        expected = 1
+        actual = self.queue.release_taken()
+
+        self.assertEqual(expected, actual)
+
+        self.queue.get_nowait()
+        self.queue.task_done(2)
+
+        expected = 0
+        actual = self.queue.release_taken()
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(queue.Empty, self.queue.get_nowait)
+
+    def test_forget_taken(self) -> None:
+        """
+        Tests the method which deletes what was read by a given process.
+        """
+
+        self.queue.put("example.org")
+        self.queue.get_nowait()
+
+        expected = 1
+        actual = self.queue.forget_taken(os.getpid())
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = self.queue.release_taken()
+
+        self.assertEqual(expected, actual)
+
+    def test_meta(self) -> None:
+        """
+        Tests the methods which save and read a value alongside our rows.
+        """
+
+        expected = "hello"
+        actual = self.queue.get_meta("world", "hello")
+
+        self.assertEqual(expected, actual)
+
+        self.queue.set_meta("world", {"hello": "world"})
+        self.queue.close()
+
+        resumed_queue = DiskQueue(self.path)
+
+        expected = {"hello": "world"}
+        actual = resumed_queue.get_meta("world")
+
+        self.assertEqual(expected, actual)
+
+        resumed_queue.close()
+
+    def test_pickle(self) -> None:
+        """
+        Tests that our queue can be shared (pickled) with another process.
+        """
+
+        self.queue.put("example.org")
+
+        unpickled = pickle.loads(pickle.dumps(self.queue))
+
+        expected = None
+        actual = unpickled.__dict__.get("_connection")
+
+        self.assertEqual(expected, actual)
+
+        expected = "example.org"
+        actual = unpickled.get_nowait()
+
+        self.assertEqual(expected, actual)
+
+        unpickled.close()
+
+    def test_delete(self) -> None:
+        """
+        Tests the method which deletes our database.
+        """
+
+        self.queue.put("example.org")
+        self.queue.delete()
+
+        expected = False
+        actual = os.path.isfile(self.path)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
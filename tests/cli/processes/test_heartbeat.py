@@ -0,0 +1,216 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our worker heartbeat.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import time
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.heartbeat import Heartbeat
+
+
+class TestHeartbeat(unittest.TestCase):
+    """
+    Tests of our worker heartbeat.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.heartbeat = Heartbeat()
+        self.stop = unittest.mock.MagicMock()
+
+        self.messages = [("worker", None, {"subject": x}) for x in "abcde"]
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.heartbeat
+        del self.stop
+
+    def test_get_busy_time_resting(self) -> None:
+        """
+        Tests the method which provides the time spent on the current message
+        for the case that nothing is processed.
+        """
+
+        self.heartbeat.hold(self.messages)
+
+        expected = 0.0
+        actual = self.heartbeat.get_busy_time()
+
+        self.assertEqual(expected, actual)
+
+        self.heartbeat.beat(4)
+        self.heartbeat.rest()
+
+        actual = self.heartbeat.get_busy_time()
+
+        self.assertEqual(expected, actual)
+
+    def test_stop_if_stalled_not_stalled(self) -> None:
+        """
+        Tests the method which stops a stalled worker for the case that the
+        worker is not stalled.
+        """
+
+        self.heartbeat.hold(self.messages).beat(4)
+
+        expected = None
+        actual = self.heartbeat.stop_if_stalled(60.0, self.stop)
+
+        self.assertEqual(expected, actual)
+
+        self.stop.assert_not_called()
+
+    def test_stop_if_stalled_resting(self) -> None:
+        """
+        Tests the method which stops a stalled worker for the case that the
+        worker is waiting for work.
+        """
+
+        self.heartbeat.hold(self.messages)
+
+        expected = None
+        actual = self.heartbeat.stop_if_stalled(0.0, self.stop)
+
+        self.assertEqual(expected, actual)
+
+        self.stop.assert_not_called()
+
+    def test_stop_if_stalled(self) -> None:
+        """
+        Tests the method which stops a stalled worker.
+        """
+
+        self.heartbeat.hold(self.messages)
+
+        # a and b were sent, c is stuck.
+        self.heartbeat.beat(4).rest()
+        self.heartbeat.beat(3).rest()
+        self.heartbeat.release(3)
+        self.heartbeat.beat(2)
+
+        time.sleep(0.05)
+
+        expected = (self.messages[2], self.messages[3:])
+        actual = self.heartbeat.stop_if_stalled(0.01, self.stop)
+
+        self.assertEqual(expected, actual)
+
+        self.stop.assert_called_once_with()
+
+    def test_stop_if_stalled_unsent(self) -> None:
+        """
+        Tests the method which stops a stalled worker for the case that the
+        result of some processed messages was not sent.
+        """
+
+        self.heartbeat.hold(self.messages)
+
+        # a was sent, b is waiting into the output batch, c is stuck.
+        self.heartbeat.beat(4).rest()
+        self.heartbeat.release(4)
+        self.heartbeat.beat(3).rest()
+        self.heartbeat.beat(2)
+
+        expected = (self.messages[2], [self.messages[1]] + self.messages[3:])
+        actual = self.heartbeat.stop_if_stalled(0.0, self.stop)
+
+        self.assertEqual(expected, actual)
+
+        self.stop.assert_called_once_with()
+
+    def test_stop_if_stalled_too_big(self) -> None:
+        """
+        Tests the method which stops a stalled worker for the case that the
+        worker held more than we can keep track of.
+        """
+
+        self.heartbeat.MAX_HELD_SIZE = 10
+
+        self.heartbeat.hold(self.messages).beat(4)
+
+        expected = (None, None)
+        actual = self.heartbeat.stop_if_stalled(0.0, self.stop)
+
+        self.assertEqual(expected, actual)
+
+        self.stop.assert_called_once_with()
+
+        expected = 5
+        actual = self.heartbeat.held_count.value - self.heartbeat.sent.value
+
+        self.assertEqual(expected, actual)
+
+    def test_hold_resets(self) -> None:
+        """
+        Tests that what was sent is forgotten when new messages are held.
+        """
+
+        self.heartbeat.hold(self.messages[:2])
+        self.heartbeat.beat(1).rest()
+        self.heartbeat.release(1)
+
+        self.heartbeat.hold(self.messages[2:]).beat(2)
+
+        expected = (self.messages[2], self.messages[3:])
+        actual = self.heartbeat.stop_if_stalled(0.0, self.stop)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,290 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our message batcher.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import time
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.message_batch import MessageBatch, MessageBatcher
+from PyFunceble.config.loader import ConfigLoader
+
+
+class TestMessageBatcher(unittest.TestCase):
+    """
+    Tests of our message batcher.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.config_loader = ConfigLoader()
+        self.batcher = MessageBatcher(size=3, timeout=100.0)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.batcher
+        del self.config_loader
+
+    def test_set_size(self) -> None:
+        """
+        Tests the method which sets the size of our batches.
+        """
+
+        self.batcher.size = 10
+
+        expected = 10
+        actual = self.batcher.size
+
+        self.assertEqual(expected, actual)
+
+    def test_set_size_not_int(self) -> None:
+        """
+        Tests the method which sets the size of our batches for the case that
+        the given value is not an int.
+        """
+
+        for given in ("10", 10.0, True):
+            self.assertRaises(TypeError, self.batcher.set_size, given)
+
+    def test_set_size_less_than_one(self) -> None:
+        """
+        Tests the method which sets the size of our batches for the case that
+        the given value is less than one.
+        """
+
+        self.assertRaises(ValueError, self.batcher.set_size, 0)
+
+    def test_set_timeout(self) -> None:
+        """
+        Tests the method which sets the timeout of our batches.
+        """
+
+        self.batcher.timeout = 5
+
+        expected = 5.0
+        actual = self.batcher.timeout
+
+        self.assertEqual(expected, actual)
+
+    def test_set_timeout_not_number(self) -> None:
+        """
+        Tests the method which sets the timeout of our batches for the case
+        that the given value is not a number.
+        """
+
+        for given in ("5", None, False):
+            self.assertRaises(TypeError, self.batcher.set_timeout, given)
+
+    def test_set_timeout_negative(self) -> None:
+        """
+        Tests the method which sets the timeout of our batches for the case
+        that the given value is negative.
+        """
+
+        self.assertRaises(ValueError, self.batcher.set_timeout, -1)
+
+    def test_guess_and_set(self) -> None:
+        """
+        Tests the methods which guess the size and timeout of our batches.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"batch_size": 50, "batch_timeout": 10}}
+        ).start()
+
+        batcher = MessageBatcher()
+
+        expected = (50, 10.0)
+        actual = (batcher.size, batcher.timeout)
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_config_not_loaded(self) -> None:
+        """
+        Tests the methods which guess the size and timeout of our batches for
+        the case that the configuration was not loaded.
+        """
+
+        batcher = MessageBatcher()
+
+        expected = (MessageBatcher.STD_SIZE, MessageBatcher.STD_TIMEOUT)
+        actual = (batcher.size, batcher.timeout)
+
+        self.assertEqual(expected, actual)
+
+    def test_authorized(self) -> None:
+        """
+        Tests the authorization to batch.
+        """
+
+        expected = True
+        actual = self.batcher.authorized
+
+        self.assertEqual(expected, actual)
+
+        self.batcher.size = 1
+
+        expected = False
+        actual = self.batcher.authorized
+
+        self.assertEqual(expected, actual)
+
+    def test_add_flush_when_full(self) -> None:
+        """
+        Tests that a batch is given back once it is full.
+        """
+
+        given = [("worker", None, f"example-{x}.org") for x in range(3)]
+
+        expected = [None, None]
+        actual = [self.batcher.add(x) for x in given[:2]]
+
+        self.assertEqual(expected, actual)
+
+        actual = self.batcher.add(given[2])
+
+        self.assertIsInstance(actual, MessageBatch)
+
+        expected = given
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = len(self.batcher)
+
+        self.assertEqual(expected, actual)
+
+    def test_add_flush_when_expired(self) -> None:
+        """
+        Tests that a batch is given back once its oldest message waited long
+        enough.
+        """
+
+        given = [("worker", None, f"example-{x}.org") for x in range(2)]
+
+        with unittest.mock.patch.object(time, "monotonic") as monotonic_patch:
+            monotonic_patch.return_value = 1000.0
+
+            expected = None
+            actual = self.batcher.add(given[0])
+
+            self.assertEqual(expected, actual)
+
+            expected = False
+            actual = self.batcher.is_expired()
+
+            self.assertEqual(expected, actual)
+
+            # 200ms later.
+            monotonic_patch.return_value = 1000.2
+
+            expected = True
+            actual = self.batcher.is_expired()
+
+            self.assertEqual(expected, actual)
+
+            expected = given
+            actual = self.batcher.add(given[1])
+
+            self.assertEqual(expected, actual)
+
+    def test_flush(self) -> None:
+        """
+        Tests the method which provides the accumulated messages.
+        """
+
+        given = ("worker", None, "example.org")
+
+        self.batcher.add(given)
+
+        expected = [given]
+        actual = self.batcher.flush()
+
+        self.assertEqual(expected, actual)
+
+        expected = (0, None)
+        actual = (len(self.batcher), self.batcher.started_at)
+
+        self.assertEqual(expected, actual)
+
+    def test_flush_empty(self) -> None:
+        """
+        Tests the method which provides the accumulated messages for the case
+        that nothing was accumulated.
+        """
+
+        expected = None
+        actual = self.batcher.flush()
+
+        self.assertEqual(expected, actual)
+
+    def test_is_expired_empty(self) -> None:
+        """
+        Tests the method which checks if a batch expired for the case that
+        nothing was accumulated.
+        """
+
+        self.batcher.timeout = 0
+
+        expected = False
+        actual = self.batcher.is_expired()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
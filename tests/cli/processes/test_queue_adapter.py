@@ -0,0 +1,240 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our queue adapters.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+import os
+import queue
+import tempfile
+import time
+import unittest
+
+from PyFunceble.cli.processes.base import ProcessesManagerBase
+from PyFunceble.cli.processes.disk_queue import DiskQueue
+from PyFunceble.cli.processes.queue_adapter import (
+    AcknowledgedQueueAdapter,
+    QueueAdapter,
+    get_queue_adapter,
+)
+
+
+class QueueAdapterTestsBase:
+    """
+    Provides the tests which every backend has to pass.
+    """
+
+    # pylint: disable=no-member
+
+    ADAPTER_OBJ: type = QueueAdapter
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.target_queue = self.generate_queue()
+        self.adapter = get_queue_adapter(self.target_queue)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.adapter
+        del self.target_queue
+
+    def generate_queue(self):
+        """
+        Provides the queue to adapt.
+        """
+
+        raise NotImplementedError()
+
+    def test_get_queue_adapter(self) -> None:
+        """
+        Tests the function which provides the adapter of a queue.
+        """
+
+        expected = self.ADAPTER_OBJ
+        actual = type(self.adapter)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_nowait(self) -> None:
+        """
+        Tests the method which reads our queue without blocking.
+        """
+
+        self.target_queue.put("hello")
+        self.target_queue.put("world")
+
+        self.adapter.get(timeout=1.0)
+
+        # A native queue writes its messages from a background thread.
+        time.sleep(0.1)
+
+        expected = "world"
+        actual = self.adapter.get_nowait()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_nowait_empty(self) -> None:
+        """
+        Tests the method which reads our queue without blocking for the case
+        that there is nothing to read.
+        """
+
+        start = time.monotonic()
+
+        self.assertRaises(queue.Empty, self.adapter.get_nowait)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_get_timeout(self) -> None:
+        """
+        Tests the method which reads our queue for the case that there was
+        nothing to read in time.
+        """
+
+        start = time.monotonic()
+
+        self.assertRaises(queue.Empty, self.adapter.get, 0.2)
+
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertLess(elapsed, 1.0)
+
+    def test_is_drained(self) -> None:
+        """
+        Tests the method which checks if everything that was sent through our
+        queue was read.
+        """
+
+        self.assertTrue(self.adapter.is_drained())
+
+        self.target_queue.put("hello")
+
+        self.assertFalse(self.adapter.is_drained())
+
+        self.adapter.get(timeout=1.0)
+
+        self.assertTrue(self.adapter.is_drained())
+
+
+class TestNativeQueueAdapter(QueueAdapterTestsBase, unittest.TestCase):
+    """
+    Tests of the adapter of the queue of our :code:`queue` backend.
+    """
+
+    def generate_queue(self):
+        return ProcessesManagerBase(queue_backend="queue").generate_queue()
+
+
+class TestManagerQueueAdapter(QueueAdapterTestsBase, unittest.TestCase):
+    """
+    Tests of the adapter of the queue of our :code:`manager` backend.
+    """
+
+    def generate_queue(self):
+        self.manager = multiprocessing.Manager()
+
+        return ProcessesManagerBase(
+            queue_backend="manager", manager=self.manager
+        ).generate_queue()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        self.manager.shutdown()
+        del self.manager
+
+
+class TestDiskQueueAdapter(QueueAdapterTestsBase, unittest.TestCase):
+    """
+    Tests of the adapter of our disk queue.
+    """
+
+    ADAPTER_OBJ: type = AcknowledgedQueueAdapter
+
+    def generate_queue(self):
+        self.temp_directory = tempfile.TemporaryDirectory()
+
+        return DiskQueue(os.path.join(self.temp_directory.name, "q.db"))
+
+    def tearDown(self) -> None:
+        self.target_queue.close()
+
+        super().tearDown()
+
+        self.temp_directory.cleanup()
+        del self.temp_directory
+
+    def test_task_done(self) -> None:
+        """
+        Tests the method which acknowledges what we read.
+        """
+
+        self.target_queue.put("hello")
+        self.target_queue.put("world")
+
+        self.adapter.get(timeout=1.0)
+        self.adapter.get(timeout=1.0)
+        self.adapter.task_done(2)
+
+        # Nothing is left to give back.
+        expected = 0
+        actual = self.target_queue.release_taken()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our shared rate limiter.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+import time
+import unittest
+
+from PyFunceble.cli.processes.rate_limiter import RateLimiter
+from PyFunceble.config.loader import ConfigLoader
+
+
+def take_tokens(rate_limiter: RateLimiter, bucket: str, count: int) -> None:
+    """
+    Takes the given number of tokens from the given bucket.
+    """
+
+    for _ in range(count):
+        rate_limiter.acquire(bucket)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Tests of our shared rate limiter.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.config_loader = ConfigLoader()
+        self.rate_limiter = RateLimiter({"dns": 20, "whois": 20})
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.rate_limiter
+        del self.config_loader
+
+    def test_set_rates(self) -> None:
+        """
+        Tests the method which let us set the rate of our buckets.
+        """
+
+        rate_limiter = RateLimiter({"test": 1, "dns": 2.5, "netinfo": None, "hello": 4})
+
+        expected = {"test": 1.0, "dns": 2.5}
+        actual = rate_limiter.rates
+
+        self.assertEqual(expected, actual)
+
+        expected = ["dns", "test"]
+        actual = sorted(rate_limiter.schedules)
+
+        self.assertEqual(expected, actual)
+
+    def test_set_rates_not_dict(self) -> None:
+        """
+        Tests the method which let us set the rate of our buckets for the
+        case that the given value is not a dict.
+        """
+
+        for given in ["dns", 1, None, ["dns"]]:
+            self.assertRaises(TypeError, self.rate_limiter.set_rates, given)
+
+    def test_set_rates_not_number(self) -> None:
+        """
+        Tests the method which let us set the rate of our buckets for the
+        case that one of the given rates is not a number.
+        """
+
+        for given in ["1", True, [1]]:
+            self.assertRaises(TypeError, self.rate_limiter.set_rates, {"dns": given})
+
+    def test_set_rates_not_positive(self) -> None:
+        """
+        Tests the method which let us set the rate of our buckets for the
+        case that one of the given rates is not positive.
+        """
+
+        for given in [0, -1, -0.5]:
+            self.assertRaises(ValueError, self.rate_limiter.set_rates, {"dns": given})
+
+    def test_guess_and_set_rates(self) -> None:
+        """
+        Tests the method which guesses the rate of our buckets.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"rate_limit": {"http_status_code": 3, "whois": 1}}}
+        ).start()
+
+        rate_limiter = RateLimiter()
+
+        expected = {"http_status_code": 3.0, "whois": 1.0}
+        actual = rate_limiter.rates
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_rates_config_not_loaded(self) -> None:
+        """
+        Tests the method which guesses the rate of our buckets for the case
+        that the configuration was not loaded.
+        """
+
+        rate_limiter = RateLimiter()
+
+        expected = {}
+        actual = rate_limiter.rates
+
+        self.assertEqual(expected, actual)
+
+    def test_acquire_not_limited(self) -> None:
+        """
+        Tests that we never wait for a bucket without rate.
+        """
+
+        start = time.monotonic()
+
+        for _ in range(100):
+            self.rate_limiter.acquire("test")
+
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_acquire_rate(self) -> None:
+        """
+        Tests that N tokens of a bucket delivering R tokens per second take
+        about N / R seconds to be delivered.
+        """
+
+        start = time.monotonic()
+
+        # The first token is delivered right away.
+        take_tokens(self.rate_limiter, "dns", 11)
+
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.5)
+        self.assertLess(elapsed, 0.8)
+
+        self.assertAlmostEqual(0.5, self.rate_limiter.waited.value, delta=0.05)
+
+    def test_acquire_supported_buckets(self) -> None:
+        """
+        Tests that each of our buckets can be limited.
+        """
+
+        rate_limiter = RateLimiter({x: 10 for x in RateLimiter.SUPPORTED_BUCKETS})
+
+        for bucket in RateLimiter.SUPPORTED_BUCKETS:
+            self.assertEqual(0.0, rate_limiter.acquire(bucket))
+            self.assertGreater(rate_limiter.acquire(bucket), 0.0)
+
+    def test_acquire_no_burst(self) -> None:
+        """
+        Tests that an idle period does not end up in a burst.
+        """
+
+        self.rate_limiter.acquire("dns")
+
+        time.sleep(0.2)
+
+        expected = 0.0
+        actual = self.rate_limiter.acquire("dns")
+
+        self.assertEqual(expected, actual)
+
+        self.assertGreater(self.rate_limiter.acquire("dns"), 0.0)
+
+    def test_acquire_independent_buckets(self) -> None:
+        """
+        Tests that taking from a bucket does not delay the others.
+        """
+
+        take_tokens(self.rate_limiter, "dns", 5)
+
+        start = time.monotonic()
+
+        self.rate_limiter.acquire("whois")
+
+        self.assertLess(time.monotonic() - start, 0.03)
+
+        start = time.monotonic()
+
+        self.rate_limiter.acquire("dns")
+
+        self.assertGreater(time.monotonic() - start, 0.02)
+
+    def test_acquire_across_processes(self) -> None:
+        """
+        Tests that the rate of a bucket is respected whatever the number of
+        processes taking tokens from it.
+        """
+
+        processes = [
+            multiprocessing.Process(
+                target=take_tokens, args=(self.rate_limiter, "dns", 4)
+            )
+            for _ in range(3)
+        ]
+
+        start = time.monotonic()
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join(5.0)
+
+        elapsed = time.monotonic() - start
+
+        expected = [0, 0, 0]
+        actual = [x.exitcode for x in processes]
+
+        self.assertEqual(expected, actual)
+
+        # 12 tokens at 20 tokens per second: the last one is delivered after
+        # 0.55 seconds.
+        self.assertGreaterEqual(elapsed, 0.55)
+        self.assertLess(elapsed, 1.5)
+
+        # Our waits are accounted into shared memory too.
+        self.assertGreater(self.rate_limiter.waited.value, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,468 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our coordinator and worker nodes.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+import unittest
+import unittest.mock
+from typing import Any
+
+from PyFunceble.cli.processes.message_batch import MessageBatch
+from PyFunceble.cli.processes.remote import (
+    Coordinator,
+    NodeTaskQueue,
+    RemoteManager,
+    WorkerNode,
+)
+from PyFunceble.cli.processes.tester import TesterProcessesManager
+from PyFunceble.config.loader import ConfigLoader
+
+
+class FakeTesterManager:
+    """
+    Provides the tester manager of a worker node. Instead of testing, it
+    sends back what it reads from the tasks of our coordinator.
+    """
+
+    def __init__(self, manager: RemoteManager, node_id: int) -> None:
+        self.manager = manager
+        self.node_id = node_id
+
+        self.protocols = dict()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self) -> None:
+        """
+        Sends back what we read until there is nothing left to read.
+        """
+
+        tasks = self.manager.get_tasks(self.node_id)
+        results = self.manager.get_results()
+
+        while True:
+            try:
+                item = tasks.get(True, 0.5)
+            except queue.Empty:
+                break
+
+            if isinstance(item, MessageBatch):
+                messages = item
+            else:
+                messages = [item]
+
+            for worker_name, _, data in messages:
+                results.put((worker_name, None, (data, "ACTIVE")))
+
+            tasks.task_done(len(messages))
+
+    def register_protocol(self, protocol: dict) -> int:
+        """
+        Registers the given protocol.
+        """
+
+        self.protocols[len(self.protocols)] = protocol
+
+        return len(self.protocols) - 1
+
+    def start(self) -> "FakeTesterManager":
+        """
+        Starts to read our tasks.
+        """
+
+        self.thread.start()
+
+        return self
+
+    def send_stop_signal(self, **kwargs: Any) -> "FakeTesterManager":
+        """
+        Does nothing: we stop once everything was read.
+        """
+
+        # pylint: disable=unused-argument
+        return self
+
+    def wait(self) -> "FakeTesterManager":
+        """
+        Waits until everything was read.
+        """
+
+        self.thread.join()
+
+        return self
+
+
+class TestCoordinator(unittest.TestCase):
+    """
+    Tests of our coordinator and worker nodes - over the loopback.
+    """
+
+    AUTHKEY: bytes = b"pyfunceble"
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.config_loader = ConfigLoader()
+        self.config_loader.start()
+
+        self.authkey = multiprocessing.current_process().authkey
+
+        self.tester_manager = TesterProcessesManager(
+            max_worker=1, queue_backend="queue", autoscale=False, high_water_mark=0
+        )
+        self.input_queue = self.tester_manager.input_queue
+        self.output_queue = self.tester_manager.output_queue[0]
+
+        self.coordinator = Coordinator(
+            self.tester_manager, ("127.0.0.1", 0), authkey=self.AUTHKEY
+        ).start()
+
+        self.messages = [
+            ("pyfunceble_launcher", None, {"idna_subject": f"example-{x}.org"})
+            for x in range(5)
+        ]
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.coordinator.stop()
+
+        multiprocessing.current_process().authkey = self.authkey
+
+        del self.coordinator
+        del self.tester_manager
+        del self.config_loader
+
+    def connect(self) -> RemoteManager:
+        """
+        Provides a manager connected to our coordinator.
+        """
+
+        manager = RemoteManager(address=self.coordinator.address, authkey=self.AUTHKEY)
+        manager.connect()
+
+        return manager
+
+    @staticmethod
+    def get_queued(target_queue: Any, timeout: float = 0.1) -> list:
+        """
+        Provides what is waiting into the given queue.
+
+        .. note::
+            What is put into a (native) queue is sent by a background thread.
+            Hence the timeout.
+        """
+
+        result = []
+
+        while True:
+            try:
+                result.append(target_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        return result
+
+    def test_worker_node(self) -> None:
+        """
+        Tests that our tasks are handed out to a worker node and that its
+        results come back.
+        """
+
+        self.input_queue.put(MessageBatch(self.messages[:3]))
+
+        for message in self.messages[3:]:
+            self.input_queue.put(message)
+
+        node = WorkerNode(self.coordinator.address, authkey=self.AUTHKEY)
+
+        with unittest.mock.patch.object(
+            WorkerNode, "new_tester_manager", side_effect=FakeTesterManager
+        ):
+            node_thread = threading.Thread(target=node.start, daemon=True)
+            node_thread.start()
+
+            while not self.coordinator.nodes and node_thread.is_alive():
+                time.sleep(0.01)
+
+            # Everything was sent: the node stops once it read everything.
+            self.coordinator.close()
+
+            node_thread.join(10)
+
+        expected = False
+        actual = node_thread.is_alive()
+
+        self.assertEqual(expected, actual)
+
+        expected = [(x[-1], "ACTIVE") for x in self.messages]
+        actual = [x[-1] for x in self.get_queued(self.output_queue)]
+
+        self.assertEqual(expected, actual)
+
+        # The node unregistered itself once done.
+        expected = {}
+        actual = self.coordinator.nodes
+
+        self.assertEqual(expected, actual)
+
+        expected = True
+        actual = self.input_queue.empty()
+
+        self.assertEqual(expected, actual)
+
+    def test_worker_node_coordinator_closed(self) -> None:
+        """
+        Tests that a worker node does nothing when our coordinator does not
+        accept new nodes anymore.
+        """
+
+        self.coordinator.close()
+
+        node = WorkerNode(self.coordinator.address, authkey=self.AUTHKEY)
+
+        with unittest.mock.patch.object(
+            WorkerNode, "new_tester_manager"
+        ) as new_tester_manager_patch:
+            node.start()
+
+            new_tester_manager_patch.assert_not_called()
+
+    def test_expire_nodes(self) -> None:
+        """
+        Tests that what a node read - but did not acknowledge - is given back
+        once its lease expired.
+        """
+
+        self.coordinator.NODE_LEASE = 0.2
+
+        self.input_queue.put(self.messages[0])
+        self.input_queue.put(MessageBatch(self.messages[1:3]))
+        self.input_queue.put(self.messages[3])
+
+        manager = self.connect()
+        coordinator = manager.get_coordinator()
+
+        node_id = coordinator.register_node("pyfunceble_node")
+        tasks = manager.get_tasks(node_id)
+
+        # The first one is done, the batch is only partially done.
+        tasks.get(True, 1)
+        tasks.task_done(1)
+        tasks.get(True, 1)
+        tasks.task_done(1)
+
+        expected = []
+        actual = self.coordinator.expire_nodes()
+
+        self.assertEqual(expected, actual)
+
+        time.sleep(0.3)
+
+        expected = [node_id]
+        actual = self.coordinator.expire_nodes()
+
+        self.assertEqual(expected, actual)
+
+        expected = [self.messages[3], MessageBatch(self.messages[1:3])]
+        actual = self.get_queued(self.input_queue)
+
+        self.assertEqual(expected, actual)
+
+        # The node is told that it was forgotten.
+        expected = False
+        actual = coordinator.heartbeat(node_id)
+
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(ValueError, lambda: self.coordinator.get_node_tasks(node_id))
+
+    def test_heartbeat_renews_lease(self) -> None:
+        """
+        Tests that the heartbeat of a worker node keeps its lease alive.
+        """
+
+        self.coordinator.NODE_LEASE = 0.3
+
+        node = WorkerNode(self.coordinator.address, authkey=self.AUTHKEY)
+        node.HEARTBEAT_INTERVAL = 0.05
+
+        manager = self.connect()
+        coordinator = manager.get_coordinator()
+        node_id = coordinator.register_node(node.name)
+
+        stop_event = threading.Event()
+        heartbeat = threading.Thread(
+            target=node.beat, args=(coordinator, node_id, stop_event), daemon=True
+        )
+        heartbeat.start()
+
+        time.sleep(0.6)
+
+        expected = []
+        actual = self.coordinator.expire_nodes()
+
+        self.assertEqual(expected, actual)
+
+        stop_event.set()
+        heartbeat.join()
+
+        time.sleep(0.4)
+
+        expected = [node_id]
+        actual = self.coordinator.expire_nodes()
+
+        self.assertEqual(expected, actual)
+
+    def test_wait_for_nodes_expired(self) -> None:
+        """
+        Tests that we stop to wait for a node whose lease expired - and that
+        what it held is given back.
+        """
+
+        self.coordinator.NODE_LEASE = 0.2
+        self.coordinator.NODE_CHECK_INTERVAL = 0.05
+
+        self.input_queue.put(self.messages[0])
+
+        manager = self.connect()
+        node_id = manager.get_coordinator().register_node("pyfunceble_node")
+        manager.get_tasks(node_id).get(True, 1)
+
+        self.coordinator.wait_for_nodes()
+
+        expected = {}
+        actual = self.coordinator.nodes
+
+        self.assertEqual(expected, actual)
+
+        expected = [self.messages[0]]
+        actual = self.get_queued(self.input_queue)
+
+        self.assertEqual(expected, actual)
+
+
+class TestNodeTaskQueue(unittest.TestCase):
+    """
+    Tests of the task queue of our worker nodes.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.input_queue = queue.Queue()
+        self.tasks = NodeTaskQueue(self.input_queue)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.tasks
+        del self.input_queue
+
+    def test_release_taken(self) -> None:
+        """
+        Tests the method which gives back what was not acknowledged.
+        """
+
+        batch = MessageBatch([("a", None, {}), ("b", None, {})])
+
+        self.input_queue.put("hello")
+        self.input_queue.put(batch)
+
+        self.tasks.get()
+        self.tasks.get()
+        self.tasks.task_done(2)
+
+        expected = [batch]
+        actual = self.tasks.release_taken()
+
+        self.assertEqual(expected, actual)
+
+        expected = []
+        actual = self.tasks.release_taken()
+
+        self.assertEqual(expected, actual)
+
+    def test_release_taken_per_reader(self) -> None:
+        """
+        Tests that the acknowledgements of a reader don't acknowledge what
+        another reader read.
+        """
+
+        self.input_queue.put("hello")
+        self.input_queue.put("world")
+
+        self.tasks.get()
+
+        reader = threading.Thread(target=self.tasks.get)
+        reader.start()
+        reader.join()
+
+        self.tasks.task_done()
+
+        expected = ["world"]
+        actual = self.tasks.release_taken()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our tester processes manager.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import threading
+import unittest
+import unittest.mock
+
+from PyFunceble.cli.processes.autoscaler import WorkerStats
+from PyFunceble.cli.processes.tester import TesterProcessesManager
+from PyFunceble.config.loader import ConfigLoader
+
+
+class TestTesterProcessesManager(unittest.TestCase):
+    """
+    Tests of our tester processes manager.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.config_loader = ConfigLoader()
+        self.config_loader.start()
+
+        self.manager = TesterProcessesManager(
+            max_worker=1,
+            queue_backend="queue",
+            autoscale=False,
+            high_water_mark=0,
+            max_tasks_per_worker=10,
+            max_rss_per_worker=1000,
+        )
+
+        self.recycle_worker_patch = unittest.mock.patch.object(
+            self.manager, "recycle_worker"
+        )
+        self.recycle_worker_mock = self.recycle_worker_patch.start()
+
+        self.get_rss_patch = unittest.mock.patch(
+            "PyFunceble.cli.processes.tester.get_rss", return_value=100
+        )
+        self.get_rss_mock = self.get_rss_patch.start()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        self.get_rss_patch.stop()
+        self.recycle_worker_patch.stop()
+
+        del self.manager
+        del self.config_loader
+
+    def get_running_workers(self, tests: list) -> list:
+        """
+        Provides a (fake) running worker for each of the given number of
+        tests.
+        """
+
+        workers = []
+
+        for index, count in enumerate(tests):
+            worker = unittest.mock.MagicMock()
+            worker.name = f"pyfunceble_tester_{index + 1}"
+            worker.pid = 1000 + index
+            worker.is_alive.return_value = True
+            worker.retire_it = threading.Event()
+            worker.recycle_it = threading.Event()
+            worker.stats = WorkerStats(slow_threshold=5.0)
+
+            for _ in range(count):
+                worker.stats.record(0.1, 0.01)
+
+            workers.append(worker)
+
+        self.manager._running_workers.extend(workers)
+
+        return workers
+
+    def test_recycle_workers_tests(self) -> None:
+        """
+        Tests the method which recycles our workers for the case that they
+        reached their number of tests.
+        """
+
+        workers = self.get_running_workers([0, 9, 10, 11])
+
+        self.manager.recycle_workers()
+
+        expected = [
+            unittest.mock.call(workers[2], reason="10 tests"),
+            unittest.mock.call(workers[3], reason="11 tests"),
+        ]
+        actual = self.recycle_worker_mock.call_args_list
+
+        self.assertEqual(expected, actual)
+
+    def test_recycle_workers_rss(self) -> None:
+        """
+        Tests the method which recycles our workers for the case that they
+        reached their RSS.
+        """
+
+        workers = self.get_running_workers([0, 1, 1, 0])
+
+        self.get_rss_mock.side_effect = lambda pid: {1001: 999}.get(pid, 1000)
+
+        self.manager.recycle_workers()
+
+        # The one which did not test anything yet is kept.
+        expected = [unittest.mock.call(workers[2], reason="RSS of 1000 bytes")]
+        actual = self.recycle_worker_mock.call_args_list
+
+        self.assertEqual(expected, actual)
+
+    def test_recycle_workers_rss_unknown(self) -> None:
+        """
+        Tests the method which recycles our workers for the case that we
+        can't read their RSS.
+        """
+
+        self.get_running_workers([0, 1])
+
+        self.get_rss_mock.return_value = None
+
+        self.manager.recycle_workers()
+
+        self.recycle_worker_mock.assert_not_called()
+
+    def test_recycle_workers_skip_first(self) -> None:
+        """
+        Tests the method which recycles our workers for the case that the
+        first worker reached its limits.
+        """
+
+        workers = self.get_running_workers([20, 20])
+
+        self.get_rss_mock.return_value = 2000
+
+        self.manager.recycle_workers()
+
+        expected = [unittest.mock.call(workers[1], reason="20 tests")]
+        actual = self.recycle_worker_mock.call_args_list
+
+        self.assertEqual(expected, actual)
+
+    def test_recycle_workers_skip_inactive(self) -> None:
+        """
+        Tests the method which recycles our workers for the case that they
+        were already asked to stop.
+        """
+
+        workers = self.get_running_workers([0, 20, 20])
+
+        workers[1].retire_it.set()
+        workers[2].recycle_it.set()
+
+        self.manager.recycle_workers()
+
+        self.recycle_worker_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
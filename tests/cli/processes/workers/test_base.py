@@ -0,0 +1,301 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our worker base.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import multiprocessing
+import queue
+import unittest
+from typing import Any
+
+from PyFunceble.cli.processes.completion import CompletionTracker
+from PyFunceble.cli.processes.heartbeat import Heartbeat
+from PyFunceble.cli.processes.message_batch import MessageBatch
+from PyFunceble.cli.processes.workers.base import WorkerBase
+
+
+class EchoWorker(WorkerBase):
+    """
+    Provides a worker which sends back what it reads.
+    """
+
+    stalled: Any = None
+
+    def target(self, consumed: Any) -> Any:
+        if consumed["subject"] == "stall" and self.heartbeat is not None:
+            # We simulate what our manager does when we stall.
+            self.stalled = self.heartbeat.stop_if_stalled(0.0, lambda: None)
+
+        return consumed
+
+
+class TestWorkerBase(unittest.TestCase):
+    """
+    Tests of our worker base.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.input_queue = queue.Queue()
+        self.output_queue = queue.Queue()
+
+        self.worker = EchoWorker(
+            self.input_queue,
+            [self.output_queue],
+            multiprocessing.Event(),
+            name="pyfunceble_echo",
+        )
+        self.worker.completion_tracker = CompletionTracker()
+        self.worker.output_batcher.set_size(5).set_timeout(60000)
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.worker
+        del self.input_queue
+        del self.output_queue
+
+    def run_worker(self, subjects: list) -> list:
+        """
+        Runs our worker (within the current process) until it read all the
+        given subjects, then provides what it sent.
+        """
+
+        for subject in subjects:
+            self.worker.add_to_input_queue({"subject": subject})
+
+        self.worker.flush_input_batch()
+        self.worker.add_to_input_queue("stop", destination_worker=self.worker.name)
+
+        self.worker.run()
+
+        result = []
+
+        while not self.output_queue.empty():
+            result.append(self.output_queue.get_nowait())
+
+        return result
+
+    @staticmethod
+    def get_subjects(messages: list) -> list:
+        """
+        Provides the subjects of the given messages.
+        """
+
+        return [x[-1]["subject"] for x in messages]
+
+    def test_batching(self) -> None:
+        """
+        Tests that our results are sent in batches.
+        """
+
+        given = [f"example-{x}.org" for x in range(7)]
+
+        actual = self.run_worker(given)
+
+        expected = [MessageBatch, MessageBatch]
+        self.assertEqual(expected, [type(x) for x in actual])
+
+        expected = given
+        self.assertEqual(
+            expected, self.get_subjects([x for y in actual for x in y])
+        )
+
+        # Our messages are done, what we sent is (still) in flight.
+        expected = len(given)
+        self.assertEqual(expected, self.worker.completion_tracker.inflight)
+
+    def test_batching_with_heartbeat(self) -> None:
+        """
+        Tests that our results are still sent in batches when our manager
+        keeps an eye on us.
+        """
+
+        self.worker.heartbeat = Heartbeat()
+
+        given = [f"example-{x}.org" for x in range(7)]
+
+        actual = self.run_worker(given)
+
+        expected = [5, 2]
+        self.assertEqual(expected, [len(x) for x in actual])
+
+        expected = given
+        self.assertEqual(
+            expected, self.get_subjects([x for y in actual for x in y])
+        )
+
+        # Our messages are done, what we sent is (still) in flight.
+        expected = len(given)
+        self.assertEqual(expected, self.worker.completion_tracker.inflight)
+
+    def test_stall_gives_back_unsent(self) -> None:
+        """
+        Tests that what waits into our output batch is given back (through our
+        heartbeat) when we stall.
+        """
+
+        self.worker.heartbeat = Heartbeat()
+
+        given = ["example.org", "example.net", "stall", "example.com"]
+
+        self.run_worker(given)
+
+        current, remaining = self.worker.stalled
+
+        expected = "stall"
+        actual = current[-1]["subject"]
+
+        self.assertEqual(expected, actual)
+
+        expected = ["example.org", "example.net", "example.com"]
+        actual = self.get_subjects(remaining)
+
+        self.assertEqual(expected, actual)
+
+    def test_stall_does_not_give_back_sent(self) -> None:
+        """
+        Tests that what was sent is not given back when we stall.
+        """
+
+        self.worker.heartbeat = Heartbeat()
+        self.worker.output_batcher.set_size(2)
+
+        given = ["example.org", "example.net", "example.com", "stall", "example.de"]
+
+        actual = self.run_worker(given)
+
+        current, remaining = self.worker.stalled
+
+        expected = "stall"
+        self.assertEqual(expected, current[-1]["subject"])
+
+        # example.org and example.net were sent before we stalled.
+        expected = ["example.com", "example.de"]
+        self.assertEqual(expected, self.get_subjects(remaining))
+
+        expected = given
+        self.assertEqual(
+            expected, self.get_subjects([x for y in actual for x in y])
+        )
+
+
+    def get_messages(self, count: int) -> list:
+        """
+        Provides the given number of messages - as our worker reads them.
+        """
+
+        result = []
+
+        for _ in range(10):
+            message = self.worker.get_message()
+
+            if message is not None:
+                result.append(message)
+
+            if len(result) >= count:
+                break
+
+        return result
+
+    def test_get_message_work_first(self) -> None:
+        """
+        Tests the method which provides the next message for the case that
+        some work and a control message are waiting.
+        """
+
+        self.worker.add_to_input_queue("stop", destination_worker=self.worker.name)
+        self.input_queue.put(("pyfunceble_launcher", None, {"subject": "a"}))
+
+        expected = [
+            ("pyfunceble_launcher", None, {"subject": "a"}),
+            (self.worker.name, self.worker.name, "stop"),
+        ]
+        actual = self.get_messages(2)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_message_nothing(self) -> None:
+        """
+        Tests the method which provides the next message for the case that
+        nothing is waiting.
+        """
+
+        expected = None
+        actual = self.worker.get_message()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_message_native_queue(self) -> None:
+        """
+        Tests the method which provides the next message for the case that
+        our input queue is a native queue.
+        """
+
+        self.worker.input_queue = multiprocessing.Queue()
+        self.worker.add_to_input_queue("stop", destination_worker=self.worker.name)
+        self.worker.input_queue.put(("pyfunceble_launcher", None, {"subject": "a"}))
+
+        expected = [
+            ("pyfunceble_launcher", None, {"subject": "a"}),
+            (self.worker.name, self.worker.name, "stop"),
+        ]
+        actual = self.get_messages(2)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
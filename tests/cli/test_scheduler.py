@@ -0,0 +1,276 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our subject scheduler.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import unittest
+
+from PyFunceble.cli.scheduler import SubjectScheduler
+from PyFunceble.config.loader import ConfigLoader
+
+
+class TestSubjectScheduler(unittest.TestCase):
+    """
+    Tests of our subject scheduler.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.config_loader = ConfigLoader()
+        self.scheduler = SubjectScheduler()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.scheduler
+        del self.config_loader
+
+    def test_set_weights(self) -> None:
+        """
+        Tests the method which sets the weight of each class.
+        """
+
+        self.scheduler.weights = {"fresh": 10, "hello": 3}
+
+        expected = {"fresh": 10, "complements": 2, "inactive": 1}
+        actual = self.scheduler.weights
+
+        self.assertEqual(expected, actual)
+
+    def test_set_weights_not_dict(self) -> None:
+        """
+        Tests the method which sets the weight of each class for the case
+        that the given value is not a dict.
+        """
+
+        given = [("fresh", 4)]
+
+        self.assertRaises(TypeError, lambda: self.scheduler.set_weights(given))
+
+    def test_set_weights_not_int(self) -> None:
+        """
+        Tests the method which sets the weight of each class for the case
+        that a given weight is not an int.
+        """
+
+        for given in ({"fresh": "4"}, {"fresh": 4.0}, {"fresh": True}):
+            self.assertRaises(TypeError, self.scheduler.set_weights, given)
+
+    def test_set_weights_negative(self) -> None:
+        """
+        Tests the method which sets the weight of each class for the case
+        that a given weight is negative.
+        """
+
+        given = {"inactive": -1}
+
+        self.assertRaises(ValueError, lambda: self.scheduler.set_weights(given))
+
+    def test_guess_and_set_weights(self) -> None:
+        """
+        Tests the method which guesses the weight of each class.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"weights": {"fresh": 1, "inactive": 5}}}
+        ).start()
+
+        self.scheduler.guess_and_set_weights()
+
+        expected = {"fresh": 1, "complements": 2, "inactive": 5}
+        actual = self.scheduler.weights
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_weights_config_not_loaded(self) -> None:
+        """
+        Tests the method which guesses the weight of each class for the case
+        that the configuration was not loaded.
+        """
+
+        self.scheduler.guess_and_set_weights()
+
+        expected = SubjectScheduler.STD_WEIGHTS
+        actual = self.scheduler.weights
+
+        self.assertEqual(expected, actual)
+
+    def test_add_source_unknown(self) -> None:
+        """
+        Tests the method which adds a source for the case that the given
+        class is unknown.
+        """
+
+        self.assertRaises(
+            ValueError, lambda: self.scheduler.add_source("hello", ["example.org"])
+        )
+
+    def test_iter(self) -> None:
+        """
+        Tests that our classes are interleaved according to their weight.
+        """
+
+        self.scheduler.set_weights({"fresh": 4, "complements": 2, "inactive": 1})
+
+        self.scheduler.add_source("fresh", (f"f{x}" for x in range(8)))
+        self.scheduler.add_source("complements", [f"c{x}" for x in range(4)])
+        self.scheduler.add_source("inactive", [f"i{x}" for x in range(2)])
+
+        expected = [
+            "f0",
+            "c0",
+            "f1",
+            "i0",
+            "f2",
+            "c1",
+            "f3",
+            "f4",
+            "c2",
+            "f5",
+            "i1",
+            "f6",
+            "c3",
+            "f7",
+        ]
+        actual = list(self.scheduler)
+
+        self.assertEqual(expected, actual)
+
+    def test_iter_proportions(self) -> None:
+        """
+        Tests that each class gets a share of the output proportional to its
+        weight.
+        """
+
+        self.scheduler.set_weights({"fresh": 4, "complements": 2, "inactive": 1})
+
+        for name in SubjectScheduler.SUPPORTED_CLASSES:
+            self.scheduler.add_source(name, [name] * 1000)
+
+        actual = list(self.scheduler)[:700]
+
+        for name, weight in self.scheduler.weights.items():
+            expected = weight * 100
+
+            self.assertEqual(expected, actual.count(name))
+
+    def test_iter_exhausted_class(self) -> None:
+        """
+        Tests that the remaining classes keep going once a class is exhausted.
+        """
+
+        self.scheduler.add_source("fresh", ["f0"])
+        self.scheduler.add_source("inactive", ["i0", "i1", "i2"])
+
+        expected = ["f0", "i0", "i1", "i2"]
+        actual = list(self.scheduler)
+
+        self.assertEqual(expected, actual)
+
+    def test_iter_multiple_sources(self) -> None:
+        """
+        Tests that the sources of a single class are read one after the other.
+        """
+
+        self.scheduler.add_source("fresh", ["f0", "f1"])
+        self.scheduler.add_source("fresh", ["f2"])
+
+        expected = ["f0", "f1", "f2"]
+        actual = list(self.scheduler)
+
+        self.assertEqual(expected, actual)
+
+    def test_iter_zero_weight(self) -> None:
+        """
+        Tests that a class with a weight of zero only gets its turn once all
+        other classes are exhausted.
+        """
+
+        self.scheduler.set_weights({"inactive": 0})
+
+        self.scheduler.add_source("inactive", ["i0", "i1"])
+        self.scheduler.add_source("fresh", ["f0"])
+        self.scheduler.add_source("complements", ["c0"])
+
+        expected = ["f0", "c0", "i0", "i1"]
+        actual = list(self.scheduler)
+
+        self.assertEqual(expected, actual)
+
+    def test_iter_lazy(self) -> None:
+        """
+        Tests that our sources are only read when their class gets its turn.
+        """
+
+        read = []
+
+        def source():
+            for index in range(3):
+                read.append(index)
+                yield index
+
+        self.scheduler.add_source("fresh", source())
+        iterator = iter(self.scheduler)
+
+        next(iterator)
+
+        expected = [0]
+        actual = read
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of the executor helpers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import threading
+import unittest
+
+from PyFunceble.helpers.executor import ExecutorHelper
+
+
+class TestExecutorHelper(unittest.TestCase):
+    """
+    Tests of the executor helpers.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.helper = ExecutorHelper(2, thread_name_prefix="pyfunceble_test")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        self.helper.shutdown(wait=True)
+
+        del self.helper
+
+    def test_not_started(self) -> None:
+        """
+        Tests that nothing is started until it is needed.
+        """
+
+        self.assertFalse(self.helper.is_started())
+
+    def test_submit(self) -> None:
+        """
+        Tests the method which let us run a function into our pool.
+        """
+
+        future = self.helper.submit(lambda x: threading.current_thread().name + x, "!")
+
+        actual = future.result(timeout=5)
+
+        self.assertTrue(actual.startswith("pyfunceble_test"))
+        self.assertTrue(actual.endswith("!"))
+        self.assertTrue(self.helper.is_started())
+
+    def test_shared(self) -> None:
+        """
+        Tests that the same pool is used until it is shut down.
+        """
+
+        executor = self.helper.executor
+
+        self.assertIs(executor, self.helper.executor)
+
+    def test_shutdown(self) -> None:
+        """
+        Tests the method which let us shut our pool down.
+        """
+
+        release = threading.Event()
+
+        running = self.helper.submit(release.wait, 5)
+        self.helper.submit(release.wait, 5)
+        waiting = self.helper.submit(release.wait, 5)
+
+        executor = self.helper.executor
+        self.helper.shutdown()
+
+        self.assertFalse(self.helper.is_started())
+        self.assertTrue(waiting.cancelled())
+
+        release.set()
+
+        self.assertTrue(running.result(timeout=5))
+        self.assertIsNot(executor, self.helper.executor)
+
+    def test_shutdown_not_started(self) -> None:
+        """
+        Tests the method which let us shut our pool down.
+
+        In this test, we check the case that it was never started.
+        """
+
+        self.helper.shutdown()
+
+        self.assertFalse(self.helper.is_started())
+
+    def test_forked(self) -> None:
+        """
+        Tests that we don't reuse the pool of our parent.
+        """
+
+        executor = self.helper.executor
+
+        self.helper._pid = os.getpid() + 1
+
+        self.assertFalse(self.helper.is_started())
+        self.assertIsNot(executor, self.helper.executor)
+
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
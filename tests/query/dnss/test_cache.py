@@ -0,0 +1,314 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our DNS cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+import unittest
+import unittest.mock
+
+from PyFunceble.query.dns.cache import DNSCache
+
+
+class TestDNSCache(unittest.TestCase):
+    """
+    Tests our DNS cache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dns_cache = DNSCache(os.path.join(self.temp_dir.name, "dns_cache.db"))
+
+        self.nameservers = ["192.168.1.1:53", "10.0.0.1:53"]
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        self.dns_cache.delete()
+        self.temp_dir.cleanup()
+
+        del self.dns_cache
+        del self.temp_dir
+
+    def test_get_nameservers_key(self) -> None:
+        """
+        Tests the method which let us get the key which represents a set of
+        nameservers.
+        """
+
+        expected = "10.0.0.1:53,192.168.1.1:53"
+        actual = self.dns_cache.get_nameservers_key(
+            ["192.168.1.1:53", "10.0.0.1:53", "192.168.1.1:53"]
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_get_not_cached(self) -> None:
+        """
+        Tests the method which let us get a cached response.
+
+        In this test, we check the case that nothing was cached.
+        """
+
+        actual = self.dns_cache.get("example.org.", 1, self.nameservers)
+
+        self.assertIsNone(actual)
+
+        expected = {"hits": 0, "misses": 1}
+        actual = self.dns_cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+    def test_set_and_get(self) -> None:
+        """
+        Tests the method which let us cache a response and get it back.
+        """
+
+        given = ["93.184.216.34"]
+        expected = ["93.184.216.34"]
+
+        self.dns_cache.set("example.org.", 1, self.nameservers, given, 60)
+        actual = self.dns_cache.get("example.org.", 1, self.nameservers[::-1])
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 1, "misses": 0}
+        actual = self.dns_cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+    def test_set_and_get_negative(self) -> None:
+        """
+        Tests the method which let us cache a response and get it back.
+
+        In this test, we check that an empty (negative) response is given back.
+        """
+
+        self.dns_cache.set("example.org.", 1, self.nameservers, [], 60)
+
+        expected = []
+        actual = self.dns_cache.get("example.org.", 1, self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_other_key(self) -> None:
+        """
+        Tests the method which let us get a cached response.
+
+        In this test, we check that the record type and the nameservers are
+        part of the key.
+        """
+
+        self.dns_cache.set("example.org.", 1, self.nameservers, ["1.1.1.1"], 60)
+
+        self.assertIsNone(self.dns_cache.get("example.org.", 28, self.nameservers))
+        self.assertIsNone(self.dns_cache.get("example.org.", 1, ["9.9.9.9:53"]))
+
+    def test_set_not_positive_ttl(self) -> None:
+        """
+        Tests the method which let us cache a response.
+
+        In this test, we check that nothing is cached when the TTL is not
+        positive.
+        """
+
+        self.dns_cache.set("example.org.", 1, self.nameservers, ["1.1.1.1"], 0)
+
+        actual = self.dns_cache.get("example.org.", 1, self.nameservers)
+
+        self.assertIsNone(actual)
+
+    def test_get_expired(self) -> None:
+        """
+        Tests the method which let us get a cached response.
+
+        In this test, we check that an expired response is not given back.
+        """
+
+        self.dns_cache.set("example.org.", 1, self.nameservers, ["1.1.1.1"], 60)
+
+        with unittest.mock.patch.object(time, "time", return_value=time.time() + 61):
+            actual = self.dns_cache.get("example.org.", 1, self.nameservers)
+
+        self.assertIsNone(actual)
+
+    def test_set_max_ttl(self) -> None:
+        """
+        Tests the method which let us cache a response.
+
+        In this test, we check that the TTL is capped.
+        """
+
+        self.dns_cache.set(
+            "example.org.",
+            1,
+            self.nameservers,
+            ["1.1.1.1"],
+            self.dns_cache.MAX_TTL * 2,
+        )
+
+        with unittest.mock.patch.object(
+            time, "time", return_value=time.time() + self.dns_cache.MAX_TTL + 1
+        ):
+            actual = self.dns_cache.get("example.org.", 1, self.nameservers)
+
+        self.assertIsNone(actual)
+
+    def test_cleanup(self) -> None:
+        """
+        Tests the method which let us delete the expired responses.
+        """
+
+        self.dns_cache.set("example.org.", 1, self.nameservers, ["1.1.1.1"], 60)
+        self.dns_cache.set("example.net.", 1, self.nameservers, ["1.1.1.1"], 3600)
+
+        with unittest.mock.patch.object(time, "time", return_value=time.time() + 61):
+            expected = 1
+            actual = self.dns_cache.cleanup()
+
+        self.assertEqual(expected, actual)
+
+        expected = ["1.1.1.1"]
+        actual = self.dns_cache.get("example.net.", 1, self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+    def test_counters_kept_in_memory(self) -> None:
+        """
+        Tests that our counters are not written into the database on each
+        lookup.
+        """
+
+        other_cache = pickle.loads(pickle.dumps(self.dns_cache))
+
+        self.dns_cache.get("example.org.", 1, self.nameservers)
+
+        expected = {"hits": 0, "misses": 0}
+        actual = other_cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+        self.dns_cache.flush_counters()
+
+        expected = {"hits": 0, "misses": 1}
+        actual = other_cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+        other_cache.close()
+
+    def test_counters_flushed_periodically(self) -> None:
+        """
+        Tests that our counters are written into the database every
+        :code:`FLUSH_COUNTERS_EVERY` lookups.
+        """
+
+        self.dns_cache.FLUSH_COUNTERS_EVERY = 3
+
+        other_cache = pickle.loads(pickle.dumps(self.dns_cache))
+
+        for _ in range(4):
+            self.dns_cache.get("example.org.", 1, self.nameservers)
+
+        expected = {"hits": 0, "misses": 3}
+        actual = other_cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+        other_cache.close()
+
+    def test_reset_counters(self) -> None:
+        """
+        Tests the method which let us reset our counters.
+        """
+
+        self.dns_cache.get("example.org.", 1, self.nameservers)
+        self.dns_cache.reset_counters()
+
+        expected = {"hits": 0, "misses": 0}
+        actual = self.dns_cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+    def test_shared_between_instances(self) -> None:
+        """
+        Tests that what is cached is visible by another instance using the
+        same database - as another process would.
+        """
+
+        self.dns_cache.set("example.org.", 1, self.nameservers, ["1.1.1.1"], 60)
+
+        other_cache = pickle.loads(pickle.dumps(self.dns_cache))
+
+        expected = ["1.1.1.1"]
+        actual = other_cache.get("example.org.", 1, self.nameservers)
+
+        self.assertEqual(expected, actual)
+
+        # The counters of the other instance are written once closed.
+        other_cache.close()
+
+        expected = {"hits": 1, "misses": 0}
+        actual = self.dns_cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
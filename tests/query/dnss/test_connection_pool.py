@@ -0,0 +1,331 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our DNS connection pool.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import socketserver
+import ssl
+import struct
+import threading
+import unittest
+import unittest.mock
+
+import dns.message
+import dns.query
+
+from PyFunceble.query.dns.connection_pool import DNSConnectionPool
+
+
+class DNSHandler(socketserver.BaseRequestHandler):
+    """
+    Answers the DNS queries sent over TCP - until the connection is closed.
+    """
+
+    def handle(self) -> None:
+        self.server.connections += 1
+
+        while True:
+            length = self.request.recv(2)
+
+            if len(length) < 2:
+                break
+
+            query = dns.message.from_wire(
+                self.request.recv(struct.unpack("!H", length)[0])
+            )
+            wire = dns.message.make_response(query).to_wire()
+
+            self.request.sendall(struct.pack("!H", len(wire)) + wire)
+
+            if self.server.close_after_response:
+                break
+
+
+class TestDNSConnectionPool(unittest.TestCase):
+    """
+    Tests our DNS connection pool.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), DNSHandler)
+        self.server.daemon_threads = True
+        self.server.connections = 0
+        self.server.close_after_response = False
+
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.port = self.server.server_address[1]
+        self.pool = DNSConnectionPool()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        self.pool.close()
+
+        self.server.shutdown()
+        self.server.server_close()
+
+        del self.server
+        del self.pool
+
+    def test_tcp(self) -> None:
+        """
+        Tests the method which let us query through TCP.
+        """
+
+        query = dns.message.make_query("example.org", "A")
+
+        response = self.pool.tcp(query, "127.0.0.1", timeout=5.0, port=self.port)
+
+        self.assertTrue(query.is_response(response))
+
+    def test_tcp_reuse(self) -> None:
+        """
+        Tests the method which let us query through TCP.
+
+        In this test, we check that the connection is reused by the next
+        queries.
+        """
+
+        for _ in range(3):
+            self.pool.tcp(
+                dns.message.make_query("example.org", "A"),
+                "127.0.0.1",
+                timeout=5.0,
+                port=self.port,
+            )
+
+        expected = 1
+        actual = self.server.connections
+
+        self.assertEqual(expected, actual)
+
+    def test_tcp_closed_by_nameserver(self) -> None:
+        """
+        Tests the method which let us query through TCP.
+
+        In this test, we check the case that the nameserver closes the
+        connection after each response.
+        """
+
+        self.server.close_after_response = True
+
+        for _ in range(3):
+            query = dns.message.make_query("example.org", "A")
+
+            response = self.pool.tcp(query, "127.0.0.1", timeout=5.0, port=self.port)
+
+            self.assertTrue(query.is_response(response))
+
+        expected = 3
+        actual = self.server.connections
+
+        self.assertEqual(expected, actual)
+
+    def test_tcp_reused_connection_gone(self) -> None:
+        """
+        Tests the method which let us query through TCP.
+
+        In this test, we check that the query is sent again through a new
+        connection when the reused one fails.
+        """
+
+        query = dns.message.make_query("example.org", "A")
+        self.pool.tcp(query, "127.0.0.1", timeout=5.0, port=self.port)
+
+        with unittest.mock.patch.object(dns.query, "tcp") as mock_tcp:
+            mock_tcp.side_effect = [
+                EOFError(),
+                dns.message.make_response(query),
+            ]
+
+            response = self.pool.tcp(query, "127.0.0.1", timeout=5.0, port=self.port)
+
+        self.assertTrue(query.is_response(response))
+        self.assertEqual(2, mock_tcp.call_count)
+
+        reused_connection = mock_tcp.call_args_list[0].kwargs["sock"]
+        new_connection = mock_tcp.call_args_list[1].kwargs["sock"]
+
+        self.assertIsNot(reused_connection, new_connection)
+        self.assertEqual(-1, reused_connection.fileno())
+        self.assertNotEqual(-1, new_connection.fileno())
+
+    def test_tcp_fresh_connection_fails(self) -> None:
+        """
+        Tests the method which let us query through TCP.
+
+        In this test, we check that the failure of a new connection is not
+        retried.
+        """
+
+        query = dns.message.make_query("example.org", "A")
+
+        with unittest.mock.patch.object(dns.query, "tcp") as mock_tcp:
+            mock_tcp.side_effect = EOFError()
+
+            self.assertRaises(
+                EOFError,
+                lambda: self.pool.tcp(
+                    query, "127.0.0.1", timeout=5.0, port=self.port
+                ),
+            )
+
+        self.assertEqual(1, mock_tcp.call_count)
+
+    def test_max_idle_connections(self) -> None:
+        """
+        Tests the method which let us give back a connection.
+
+        In this test, we check that we don't keep more idle connections than
+        allowed.
+        """
+
+        connections = [
+            self.pool.acquire("TCP", "127.0.0.1", self.port, 5.0)[0]
+            for _ in range(self.pool.MAX_IDLE_CONNECTIONS + 2)
+        ]
+
+        for connection in connections:
+            self.pool.release("TCP", "127.0.0.1", self.port, connection)
+
+        expected = self.pool.MAX_IDLE_CONNECTIONS
+        actual = len(self.pool._idle[("TCP", "127.0.0.1", self.port)])
+
+        self.assertEqual(expected, actual)
+
+        self.assertEqual(-1, connections[0].fileno())
+        self.assertNotEqual(-1, connections[-1].fileno())
+
+    def test_idle_timeout(self) -> None:
+        """
+        Tests the method which let us get a connection.
+
+        In this test, we check that a connection which was idle for too long
+        is not reused.
+        """
+
+        connection, reused = self.pool.acquire("TCP", "127.0.0.1", self.port, 5.0)
+
+        self.assertFalse(reused)
+
+        self.pool.release("TCP", "127.0.0.1", self.port, connection)
+
+        self.pool.IDLE_TIMEOUT = 0.0
+
+        new_connection, reused = self.pool.acquire("TCP", "127.0.0.1", self.port, 5.0)
+
+        self.assertFalse(reused)
+        self.assertEqual(-1, connection.fileno())
+
+        new_connection.close()
+
+    def test_release_keeps_tls_session(self) -> None:
+        """
+        Tests the method which let us give back a connection.
+
+        In this test, we check that the TLS session is kept for the next
+        connection.
+        """
+
+        connection = unittest.mock.MagicMock(spec=ssl.SSLSocket)
+
+        self.pool.release("TLS", "127.0.0.1", 853, connection)
+
+        expected = connection.session
+        actual = self.pool._tls_sessions[("127.0.0.1", 853)]
+
+        self.assertEqual(expected, actual)
+
+    def test_https(self) -> None:
+        """
+        Tests the method which let us query through HTTPS.
+
+        In this test, we check that our HTTP(S) client is given - and shared.
+        """
+
+        query = dns.message.make_query("example.org", "A")
+
+        with unittest.mock.patch.object(dns.query, "https") as mock_https:
+            self.pool.https(query, "https://example.org/dns-query", timeout=5.0)
+            self.pool.https(query, "https://example.org/dns-query", timeout=5.0)
+
+        first_session = mock_https.call_args_list[0].kwargs["session"]
+        second_session = mock_https.call_args_list[1].kwargs["session"]
+
+        self.assertIs(first_session, second_session)
+        self.assertIs(self.pool.get_https_session(), first_session)
+
+    def test_forked(self) -> None:
+        """
+        Tests that we don't reuse the connections of our parent.
+        """
+
+        connection, _ = self.pool.acquire("TCP", "127.0.0.1", self.port, 5.0)
+        self.pool.release("TCP", "127.0.0.1", self.port, connection)
+
+        self.pool._pid = -1
+
+        new_connection, reused = self.pool.acquire("TCP", "127.0.0.1", self.port, 5.0)
+
+        self.assertFalse(reused)
+
+        connection.close()
+        new_connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
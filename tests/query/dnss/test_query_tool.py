@@ -52,16 +52,23 @@ License:
 
 
 import dataclasses
+import os
 import secrets
 import socket
+import tempfile
+import time
 import unittest
 import unittest.mock
 
 import dns.exception
+import dns.message
 import dns.name
 import dns.query
+import dns.rrset
 
 from PyFunceble.config.loader import ConfigLoader
+from PyFunceble.helpers.executor import ExecutorHelper
+from PyFunceble.query.dns.cache import DNSCache
 from PyFunceble.query.dns.query_tool import DNSQueryTool, DNSQueryToolRecord
 
 # pylint: disable=protected-access, too-many-lines
@@ -111,6 +118,7 @@ class TestDNSQueryTool(unittest.TestCase):
         self.mock_tls_query = self.tls_query_patch.start()
 
         self.query_tool = DNSQueryTool(nameservers=["example.org"])
+        self.query_tool.scoreboard.reset()
 
         self.query_tool._get_result_from_response = lambda _: []
 
@@ -603,6 +611,502 @@ class TestDNSQueryTool(unittest.TestCase):
 
         del config_loader
 
+    def test_get_shared_cache(self) -> None:
+        """
+        Tests the method which let us get the cache shared by all our query
+        tools.
+
+        In this test, we check that a single cache is built.
+        """
+
+        with unittest.mock.patch.object(
+            DNSQueryTool, "shared_caches", dict()
+        ), unittest.mock.patch(
+            "PyFunceble.query.dns.query_tool.DNSCache"
+        ) as dns_cache_patch:
+            first_cache = DNSQueryTool.get_shared_cache()
+            second_cache = DNSQueryTool.get_shared_cache()
+
+        self.assertIs(first_cache, second_cache)
+        dns_cache_patch.assert_called_once_with()
+
+    def test_set_use_cache(self) -> None:
+        """
+        Tests the method which let us activate the usage of our cache.
+        """
+
+        given = True
+        expected = True
+
+        self.query_tool.set_use_cache(given)
+        actual = self.query_tool.use_cache
+
+        self.assertEqual(expected, actual)
+        self.assertIs(self.query_tool.cache, DNSQueryTool.get_shared_cache())
+
+        self.query_tool.set_use_cache(False)
+
+        self.assertIsNone(self.query_tool.cache)
+
+    def test_set_use_cache_not_bool(self) -> None:
+        """
+        Tests the method which let us activate the usage of our cache.
+
+        In this test we check the case that a non-boolean value is given.
+        """
+
+        given = ["Hello", "World"]
+
+        self.assertRaises(TypeError, lambda: self.query_tool.set_use_cache(given))
+
+    def test_set_use_cache_through_init(self) -> None:
+        """
+        Tests the overwritting of the `use_cache` attribute through the class
+        constructor.
+        """
+
+        given = True
+        expected = True
+
+        query_tool = DNSQueryTool(use_cache=given)
+
+        actual = query_tool.use_cache
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_use_cache(self) -> None:
+        """
+        Tests the method which let us guess and set the usage of our cache from
+        the configuration file.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config({"dns": {"cache": True}}).start()
+
+        self.query_tool.guess_and_set_use_cache()
+
+        expected = True
+        actual = self.query_tool.use_cache
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_guess_and_set_use_cache_none(self) -> None:
+        """
+        Tests the method which let us guess and set the usage of our cache from
+        the configuration file.
+
+        In this case, we test the case that None or implicitly a non boolean
+        value is given.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config({"dns": {"cache": None}}).start()
+
+        self.query_tool.guess_and_set_use_cache()
+
+        expected = self.query_tool.STD_USE_CACHE
+        actual = self.query_tool.use_cache
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_set_hedge(self) -> None:
+        """
+        Tests the method which let us activate the hedging of our queries.
+        """
+
+        given = True
+        expected = True
+
+        self.query_tool.set_hedge(given)
+        actual = self.query_tool.hedge
+
+        self.assertEqual(expected, actual)
+
+    def test_set_hedge_not_bool(self) -> None:
+        """
+        Tests the method which let us activate the hedging of our queries.
+
+        In this test we check the case that a non-boolean value is given.
+        """
+
+        given = ["Hello", "World"]
+
+        self.assertRaises(TypeError, lambda: self.query_tool.set_hedge(given))
+
+    def test_set_hedge_through_init(self) -> None:
+        """
+        Tests the overwritting of the `hedge` attribute through the class
+        constructor.
+        """
+
+        given = True
+        expected = True
+
+        query_tool = DNSQueryTool(hedge=given)
+
+        actual = query_tool.hedge
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_hedge(self) -> None:
+        """
+        Tests the method which let us guess and set the hedging of our queries
+        from the configuration file.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config({"dns": {"hedge": True}}).start()
+
+        self.query_tool.guess_and_set_hedge()
+
+        expected = True
+        actual = self.query_tool.hedge
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_guess_and_set_hedge_none(self) -> None:
+        """
+        Tests the method which let us guess and set the hedging of our queries
+        from the configuration file.
+
+        In this case, we test the case that None or implicitly a non boolean
+        value is given.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config({"dns": {"hedge": None}}).start()
+
+        self.query_tool.guess_and_set_hedge()
+
+        expected = self.query_tool.STD_HEDGE
+        actual = self.query_tool.hedge
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_set_persistent_connections(self) -> None:
+        """
+        Tests the method which let us activate the usage of persistent
+        connections.
+        """
+
+        given = True
+        expected = True
+
+        self.query_tool.set_persistent_connections(given)
+        actual = self.query_tool.persistent_connections
+
+        self.assertEqual(expected, actual)
+
+    def test_set_persistent_connections_not_bool(self) -> None:
+        """
+        Tests the method which let us activate the usage of persistent
+        connections.
+
+        In this test we check the case that a non-boolean value is given.
+        """
+
+        given = ["Hello", "World"]
+
+        self.assertRaises(
+            TypeError, lambda: self.query_tool.set_persistent_connections(given)
+        )
+
+    def test_set_persistent_connections_through_init(self) -> None:
+        """
+        Tests the overwritting of the `persistent_connections` attribute
+        through the class constructor.
+        """
+
+        given = True
+        expected = True
+
+        query_tool = DNSQueryTool(persistent_connections=given)
+
+        actual = query_tool.persistent_connections
+
+        self.assertEqual(expected, actual)
+
+    def test_guess_and_set_persistent_connections(self) -> None:
+        """
+        Tests the method which let us guess and set the usage of persistent
+        connections from the configuration file.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config(
+            {"dns": {"persistent_connections": True}}
+        ).start()
+
+        self.query_tool.guess_and_set_persistent_connections()
+
+        expected = True
+        actual = self.query_tool.persistent_connections
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_guess_and_set_persistent_connections_none(self) -> None:
+        """
+        Tests the method which let us guess and set the usage of persistent
+        connections from the configuration file.
+
+        In this case, we test the case that None or implicitly a non boolean
+        value is given.
+        """
+
+        config_loader = ConfigLoader()
+        config_loader.set_custom_config(
+            {"dns": {"persistent_connections": None}}
+        ).start()
+
+        self.query_tool.guess_and_set_persistent_connections()
+
+        expected = self.query_tool.STD_PERSISTENT_CONNECTIONS
+        actual = self.query_tool.persistent_connections
+
+        self.assertEqual(expected, actual)
+
+        del config_loader
+
+    def test_get_hedge_delay(self) -> None:
+        """
+        Tests the method which let us get the number of seconds we wait before
+        hedging.
+        """
+
+        self.query_tool.query_timeout = 5.0
+
+        expected = 5.0 * self.query_tool.HEDGE_TIMEOUT_RATIO
+        actual = self.query_tool.get_hedge_delay("192.168.1.1")
+
+        self.assertEqual(expected, actual)
+
+        for _ in range(self.query_tool.scoreboard.MIN_RTT_SAMPLES):
+            self.query_tool.scoreboard.record_response("192.168.1.1", 0.05)
+
+        expected = 0.05
+        actual = self.query_tool.get_hedge_delay("192.168.1.1")
+
+        self.assertEqual(expected, actual)
+
+    def test_udp_query_hedge_failure(self) -> None:
+        """
+        Tests the method which let us query through the UDP protocol.
+
+        In this case we check that a nameserver which fails (without timing
+        out) is not queried again while hedging.
+        """
+
+        def fake_udp(_, nameserver, **__):
+            if nameserver == "192.168.1.1":
+                raise socket.error("Resource temporarily unavailable.")
+
+            return unittest.mock.MagicMock(nameserver=nameserver)
+
+        self.mock_udp_query.side_effect = fake_udp
+
+        self.query_tool.nameservers.set_nameservers(["192.168.1.1", "10.0.0.1"])
+        self.query_tool.follow_nameserver_order = True
+        self.query_tool.hedge = True
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool._get_result_from_response = lambda x: [
+            f"from {x.nameserver}"
+        ]
+
+        expected = ["from 10.0.0.1"]
+        actual = self.query_tool.query()
+
+        self.assertEqual(expected, actual)
+
+        queried = [x.args[1] for x in self.mock_udp_query.call_args_list]
+
+        self.assertEqual(["192.168.1.1", "10.0.0.1"], queried)
+        self.assertTrue(self.query_tool.scoreboard.is_backed_off("192.168.1.1"))
+
+    def test_get_ttl_from_response(self) -> None:
+        """
+        Tests the method which let us get the number of seconds a response can
+        be cached.
+        """
+
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        response = dns.message.make_response(self.query_tool.query_message)
+        response.answer.append(
+            dns.rrset.from_text("example.org.", 300, "IN", "A", "93.184.216.34")
+        )
+        # As it would come from the network.
+        response = dns.message.from_wire(response.to_wire())
+
+        expected = 300
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_ttl_from_response_negative(self) -> None:
+        """
+        Tests the method which let us get the number of seconds a response can
+        be cached.
+
+        In this test, we check that the negative-caching TTL of the SOA is
+        given when nothing was found.
+        """
+
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        response = dns.message.make_response(self.query_tool.query_message)
+        response.authority.append(
+            dns.rrset.from_text(
+                "example.org.",
+                3600,
+                "IN",
+                "SOA",
+                "ns.example.org. noc.example.org. 2021 7200 3600 1209600 600",
+            )
+        )
+        response = dns.message.from_wire(response.to_wire())
+
+        expected = 600
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_ttl_from_response_cname(self) -> None:
+        """
+        Tests the method which let us get the number of seconds a response can
+        be cached.
+
+        In this test, we check that the minimum TTL of the CNAME chain and the
+        final record is given.
+        """
+
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "www.example.org"
+
+        response = dns.message.make_response(self.query_tool.query_message)
+        response.answer.append(
+            dns.rrset.from_text(
+                "www.example.org.", 300, "IN", "CNAME", "edge.example.net."
+            )
+        )
+        response.answer.append(
+            dns.rrset.from_text(
+                "edge.example.net.", 60, "IN", "CNAME", "a.cdn.example.com."
+            )
+        )
+        response.answer.append(
+            dns.rrset.from_text("a.cdn.example.com.", 3600, "IN", "A", "192.0.2.1")
+        )
+        response = dns.message.from_wire(response.to_wire())
+
+        expected = 60
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertEqual(expected, actual)
+
+        response.answer[-1].ttl = 20
+
+        expected = 20
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_ttl_from_response_cname_negative(self) -> None:
+        """
+        Tests the method which let us get the number of seconds a response can
+        be cached.
+
+        In this test, we check that the negative-caching TTL of the SOA is
+        bounded by the CNAME chain when nothing was found at its end.
+        """
+
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "www.example.org"
+
+        response = dns.message.make_response(self.query_tool.query_message)
+        response.answer.append(
+            dns.rrset.from_text("www.example.org.", 30, "IN", "CNAME", "example.net.")
+        )
+        response.authority.append(
+            dns.rrset.from_text(
+                "example.net.",
+                3600,
+                "IN",
+                "SOA",
+                "ns.example.net. noc.example.net. 2021 7200 3600 1209600 600",
+            )
+        )
+        response = dns.message.from_wire(response.to_wire())
+
+        expected = 30
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_ttl_from_response_cname_queried(self) -> None:
+        """
+        Tests the method which let us get the number of seconds a response can
+        be cached.
+
+        In this test, we check that we don't follow the CNAME we asked for.
+        """
+
+        self.query_tool.query_record_type = "CNAME"
+        self.query_tool.subject = "www.example.org"
+
+        response = dns.message.make_response(self.query_tool.query_message)
+        response.answer.append(
+            dns.rrset.from_text("www.example.org.", 300, "IN", "CNAME", "example.net.")
+        )
+        response = dns.message.from_wire(response.to_wire())
+
+        expected = 300
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_ttl_from_response_not_cacheable(self) -> None:
+        """
+        Tests the method which let us get the number of seconds a response can
+        be cached.
+
+        In this test, we check the case that the answer holds something else
+        or that the zone didn't give us its SOA.
+        """
+
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        response = dns.message.make_response(self.query_tool.query_message)
+
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertIsNone(actual)
+
+        response.answer.append(
+            dns.rrset.from_text("example.org.", 300, "IN", "CNAME", "example.net.")
+        )
+        response = dns.message.from_wire(response.to_wire())
+
+        actual = self.query_tool._get_ttl_from_response(response)
+
+        self.assertIsNone(actual)
+
     def test_set_preferred_protocol(self) -> None:
         """
         Tests the method which let us set the preferred protocol.
@@ -871,6 +1375,307 @@ class TestDNSQueryTool(unittest.TestCase):
 
         self.assertEqual(expected, self.query_tool.lookup_record.response)
 
+    def test_udp_query_backoff(self) -> None:
+        """
+        Tests the method which let us query through the UDP protocol.
+
+        In this case we check that a nameserver which timed out is not queried
+        until its backoff expired.
+        """
+
+        def fake_udp(_, nameserver, **__):
+            if nameserver == "192.168.1.1":
+                raise dns.exception.Timeout()
+
+            return unittest.mock.MagicMock()
+
+        self.mock_udp_query.side_effect = fake_udp
+
+        # Independent of the resolution of our nameservers.
+        self.query_tool.nameservers.set_nameservers(["192.168.1.1", "10.0.0.1"])
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool.query()
+
+        queried = [x.args[1] for x in self.mock_udp_query.call_args_list]
+
+        self.assertIn("192.168.1.1", queried)
+        self.assertTrue(self.query_tool.scoreboard.is_backed_off("192.168.1.1"))
+
+        self.mock_udp_query.reset_mock()
+        self.query_tool.query()
+
+        queried = [x.args[1] for x in self.mock_udp_query.call_args_list]
+
+        self.assertNotIn("192.168.1.1", queried)
+        self.assertTrue(queried)
+
+    def test_udp_query_follow_order_backoff(self) -> None:
+        """
+        Tests the method which let us query through the UDP protocol.
+
+        In this case we check that the order of our nameservers is kept when we
+        follow it - even if the first one is slower - and that only the backed
+        off nameservers are left out.
+        """
+
+        self.mock_udp_query.side_effect = lambda *_, **__: unittest.mock.MagicMock()
+
+        self.query_tool.nameservers.set_nameservers(
+            ["192.168.1.1", "10.0.0.1", "10.0.0.2"]
+        )
+        self.query_tool.follow_nameserver_order = True
+
+        self.query_tool.scoreboard.record_response("192.168.1.1", 0.5)
+        self.query_tool.scoreboard.record_response("10.0.0.2", 0.1)
+        self.query_tool.scoreboard.record_timeout("10.0.0.1")
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool.query()
+
+        expected = ["192.168.1.1", "10.0.0.2"]
+        actual = [x.args[1] for x in self.mock_udp_query.call_args_list]
+
+        self.assertEqual(expected, actual)
+
+    def test_udp_query_hedge(self) -> None:
+        """
+        Tests the method which let us query through the UDP protocol.
+
+        In this case we check that the query is sent to the next nameserver
+        when the first one is too slow, and that the first response wins.
+        """
+
+        def fake_udp(_, nameserver, **__):
+            if nameserver == "192.168.1.1":
+                time.sleep(1.0)
+
+            return unittest.mock.MagicMock(nameserver=nameserver)
+
+        self.mock_udp_query.side_effect = fake_udp
+
+        self.query_tool.nameservers.set_nameservers(["192.168.1.1", "10.0.0.1"])
+        self.query_tool.follow_nameserver_order = True
+        self.query_tool.query_timeout = 1.0
+        self.query_tool.hedge = True
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool._get_result_from_response = lambda x: [
+            f"from {x.nameserver}"
+        ]
+
+        start_time = time.monotonic()
+
+        expected = ["from 10.0.0.1"]
+        actual = self.query_tool.query()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual("10.0.0.1", self.query_tool.lookup_record.nameserver)
+        self.assertLess(time.monotonic() - start_time, 0.9)
+
+        # The first query is sent once: we keep waiting for its response
+        # while hedging.
+        expected = [("192.168.1.1", 1.0), ("10.0.0.1", 1.0)]
+        actual = [
+            (x.args[1], x.kwargs["timeout"])
+            for x in self.mock_udp_query.call_args_list
+        ]
+
+        self.assertEqual(expected, actual)
+
+    def test_udp_query_hedge_cancel_unneeded(self) -> None:
+        """
+        Tests the method which let us query through the UDP protocol.
+
+        In this case we check that a hedge which did not start yet is
+        cancelled once the first nameserver responded.
+        """
+
+        # A single thread: our hedge waits for it.
+        executor = ExecutorHelper(1)
+
+        def fake_udp(_, nameserver, **__):
+            # Someone else gets the thread after us.
+            executor.submit(time.sleep, 0.4)
+            time.sleep(0.4)
+
+            return unittest.mock.MagicMock(nameserver=nameserver)
+
+        self.mock_udp_query.side_effect = fake_udp
+
+        self.query_tool.nameservers.set_nameservers(["192.168.1.1", "10.0.0.1"])
+        self.query_tool.follow_nameserver_order = True
+        self.query_tool.query_timeout = 1.0
+        self.query_tool.hedge = True
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool._get_result_from_response = lambda x: [
+            f"from {x.nameserver}"
+        ]
+
+        with unittest.mock.patch.object(self.query_tool, "hedge_executor", executor):
+            expected = ["from 192.168.1.1"]
+            actual = self.query_tool.query()
+
+        executor.shutdown(wait=True)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, self.mock_udp_query.call_count)
+
+    def test_udp_query_hedge_saturated(self) -> None:
+        """
+        Tests the method which let us query through the UDP protocol.
+
+        In this case we check that nothing is hedged while our hedge executor
+        is saturated.
+        """
+
+        self.mock_udp_query.side_effect = (
+            lambda _, nameserver, **__: unittest.mock.MagicMock(nameserver=nameserver)
+        )
+
+        self.query_tool.nameservers.set_nameservers(["192.168.1.1", "10.0.0.1"])
+        self.query_tool.follow_nameserver_order = True
+        self.query_tool.query_timeout = 1.0
+        self.query_tool.hedge = True
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool._get_result_from_response = lambda x: [
+            f"from {x.nameserver}"
+        ]
+
+        executor = ExecutorHelper(1)
+        # Someone else holds the (single) thread for longer than our delay.
+        executor.submit(time.sleep, 0.4)
+
+        with unittest.mock.patch.object(self.query_tool, "hedge_executor", executor):
+            expected = ["from 192.168.1.1"]
+            actual = self.query_tool.query()
+
+        executor.shutdown(wait=True)
+
+        self.assertEqual(expected, actual)
+
+        expected = ["192.168.1.1"]
+        actual = [x.args[1] for x in self.mock_udp_query.call_args_list]
+
+        self.assertEqual(expected, actual)
+
+    def test_udp_query_hedge_not_needed(self) -> None:
+        """
+        Tests the method which let us query through the UDP protocol.
+
+        In this case we check that nothing is hedged when the first nameserver
+        responds in time.
+        """
+
+        self.mock_udp_query.side_effect = (
+            lambda _, nameserver, **__: unittest.mock.MagicMock(nameserver=nameserver)
+        )
+
+        self.query_tool.nameservers.set_nameservers(["192.168.1.1", "10.0.0.1"])
+        self.query_tool.follow_nameserver_order = True
+        self.query_tool.hedge = True
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool._get_result_from_response = lambda x: [
+            f"from {x.nameserver}"
+        ]
+
+        expected = ["from 192.168.1.1"]
+        actual = self.query_tool.query()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, self.mock_udp_query.call_count)
+
+    def test_query_with_cache(self) -> None:
+        """
+        Tests the method which let us query.
+
+        In this case we check that what our nameservers responded is cached
+        and given back by the next query.
+        """
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.query_tool.cache = DNSCache(os.path.join(temp_dir.name, "dns_cache.db"))
+
+        def fake_get_result_from_response(_):
+            self.query_tool._response_ttl = 60
+            return ["93.184.216.34"]
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool._get_result_from_response = fake_get_result_from_response
+
+        expected = ["93.184.216.34"]
+        actual = self.query_tool.query()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(False, self.query_tool.lookup_record.from_cache)
+        self.assertEqual(1, self.mock_udp_query.call_count)
+
+        self.query_tool.subject = "example.org"
+
+        actual = self.query_tool.query()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(expected, self.query_tool.lookup_record.response)
+        self.assertEqual(True, self.query_tool.lookup_record.from_cache)
+        self.assertEqual(1, self.mock_udp_query.call_count)
+
+        expected = {"hits": 1, "misses": 1}
+        actual = self.query_tool.cache.get_counters()
+
+        self.assertEqual(expected, actual)
+
+        self.query_tool.cache.delete()
+        temp_dir.cleanup()
+
+    def test_query_with_cache_not_cacheable(self) -> None:
+        """
+        Tests the method which let us query.
+
+        In this case we check that nothing is cached when our nameservers
+        didn't give us a TTL.
+        """
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.query_tool.cache = DNSCache(os.path.join(temp_dir.name, "dns_cache.db"))
+
+        self.query_tool.preferred_protocol = "UDP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+
+        self.query_tool.query()
+        call_count = self.mock_udp_query.call_count
+
+        self.query_tool.query()
+
+        self.assertEqual(call_count * 2, self.mock_udp_query.call_count)
+
+        self.query_tool.cache.delete()
+        temp_dir.cleanup()
+
     def test_udp_query_bad_escape(self) -> None:
         """
         Tests the method which let us query through the UDP protocol.
@@ -907,6 +1712,28 @@ class TestDNSQueryTool(unittest.TestCase):
         self.mock_https_query.assert_not_called()
         self.mock_tls_query.assert_not_called()
 
+    def test_tcp_query_persistent_connections(self) -> None:
+        """
+        Tests the method which let us query through the TCP protocol.
+
+        In this case, we check that our query goes through our connection pool.
+        """
+
+        self.query_tool.preferred_protocol = "TCP"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+        self.query_tool.persistent_connections = True
+
+        with unittest.mock.patch.object(
+            self.query_tool.connection_pool, "tcp"
+        ) as mock_pool_tcp:
+            _ = self.query_tool.query()
+
+        mock_pool_tcp.assert_called()
+        self.mock_tcp_query.assert_not_called()
+
+        self.assertEqual(53, mock_pool_tcp.call_args.kwargs["port"])
+
     def test_tcp_query_timeout(self) -> None:
         """
         Tests the method which let us query through the TCP protocol.
@@ -1073,6 +1900,26 @@ class TestDNSQueryTool(unittest.TestCase):
         self.mock_tcp_query.assert_not_called()
         self.mock_tls_query.assert_not_called()
 
+    def test_https_query_persistent_connections(self) -> None:
+        """
+        Tests the method which let us query through the HTTPS protocol.
+
+        In this case, we check that our query goes through our connection pool.
+        """
+
+        self.query_tool.preferred_protocol = "HTTPS"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+        self.query_tool.persistent_connections = True
+
+        with unittest.mock.patch.object(
+            self.query_tool.connection_pool, "https"
+        ) as mock_pool_https:
+            _ = self.query_tool.query()
+
+        mock_pool_https.assert_called()
+        self.mock_https_query.assert_not_called()
+
     def test_https_query_timeout(self) -> None:
         """
         Tests the method which let us query through the HTTPS protocol.
@@ -1241,6 +2088,28 @@ class TestDNSQueryTool(unittest.TestCase):
         self.mock_tcp_query.assert_not_called()
         self.mock_https_query.assert_not_called()
 
+    def test_tls_query_persistent_connections(self) -> None:
+        """
+        Tests the method which let us query through the TLS protocol.
+
+        In this case, we check that our query goes through our connection pool.
+        """
+
+        self.query_tool.preferred_protocol = "TLS"
+        self.query_tool.query_record_type = "A"
+        self.query_tool.subject = "example.org"
+        self.query_tool.persistent_connections = True
+
+        with unittest.mock.patch.object(
+            self.query_tool.connection_pool, "tls"
+        ) as mock_pool_tls:
+            _ = self.query_tool.query()
+
+        mock_pool_tls.assert_called()
+        self.mock_tls_query.assert_not_called()
+
+        self.assertEqual(853, mock_pool_tls.call_args.kwargs["port"])
+
     def test_tls_query_timeout(self) -> None:
         """
         Tests the method which let us query through the TLS protocol.
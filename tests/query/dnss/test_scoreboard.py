@@ -0,0 +1,279 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our nameserver scoreboard.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import time
+import unittest
+import unittest.mock
+
+from PyFunceble.query.dns.scoreboard import NameserverScoreboard
+
+
+class TestNameserverScoreboard(unittest.TestCase):
+    """
+    Tests our nameserver scoreboard.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.scoreboard = NameserverScoreboard()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything previously initiated for the tests.
+        """
+
+        del self.scoreboard
+
+    def test_get_unknown(self) -> None:
+        """
+        Tests the method which let us get the score of a nameserver.
+
+        In this test, we check the case that we know nothing about it.
+        """
+
+        expected = {
+            "rtt": None,
+            "timeout_rate": 0.0,
+            "servfail_rate": 0.0,
+            "failures": 0,
+            "backoff_until": 0.0,
+        }
+        actual = self.scoreboard.get("192.168.1.1")
+
+        self.assertEqual(expected, actual)
+
+    def test_record_response(self) -> None:
+        """
+        Tests the method which let us record a response.
+        """
+
+        self.scoreboard.record_response("192.168.1.1", 0.1)
+        self.scoreboard.record_response("192.168.1.1", 0.2)
+
+        expected = 0.1 + self.scoreboard.EWMA_WEIGHT * 0.1
+        actual = self.scoreboard.get("192.168.1.1")["rtt"]
+
+        self.assertAlmostEqual(expected, actual)
+        self.assertFalse(self.scoreboard.is_backed_off("192.168.1.1"))
+
+    def test_get_rtt_percentile(self) -> None:
+        """
+        Tests the method which let us get a percentile of the round-trip times
+        of a nameserver.
+        """
+
+        for rtt in range(1, self.scoreboard.MIN_RTT_SAMPLES):
+            self.scoreboard.record_response("192.168.1.1", rtt / 100)
+
+        actual = self.scoreboard.get_rtt_percentile("192.168.1.1", 90)
+
+        self.assertIsNone(actual)
+
+        self.scoreboard.record_response("192.168.1.1", 0.1)
+
+        expected = 0.09
+        actual = self.scoreboard.get_rtt_percentile("192.168.1.1", 90)
+
+        self.assertEqual(expected, actual)
+
+        expected = 0.1
+        actual = self.scoreboard.get_rtt_percentile("192.168.1.1", 100)
+
+        self.assertEqual(expected, actual)
+
+    def test_record_response_servfail(self) -> None:
+        """
+        Tests the method which let us record a response.
+
+        In this test, we check that a SERVFAIL is counted as a failure.
+        """
+
+        self.scoreboard.record_response("192.168.1.1", 0.1, servfail=True)
+
+        expected = self.scoreboard.EWMA_WEIGHT
+        actual = self.scoreboard.get("192.168.1.1")["servfail_rate"]
+
+        self.assertAlmostEqual(expected, actual)
+        self.assertTrue(self.scoreboard.is_backed_off("192.168.1.1"))
+
+    def test_record_timeout(self) -> None:
+        """
+        Tests the method which let us record a timeout.
+        """
+
+        self.scoreboard.record_timeout("192.168.1.1")
+
+        expected = self.scoreboard.EWMA_WEIGHT
+        actual = self.scoreboard.get("192.168.1.1")["timeout_rate"]
+
+        self.assertAlmostEqual(expected, actual)
+        self.assertTrue(self.scoreboard.is_backed_off("192.168.1.1"))
+
+    def test_backoff_is_exponential(self) -> None:
+        """
+        Tests that the backoff of a nameserver grows with its consecutive
+        failures - up to our maximum.
+        """
+
+        for failures in range(1, 10):
+            self.scoreboard.record_timeout("192.168.1.1")
+
+            expected = min(
+                self.scoreboard.BACKOFF_BASE * 2 ** (failures - 1),
+                self.scoreboard.BACKOFF_MAX,
+            )
+            actual = self.scoreboard.get("192.168.1.1")["backoff_until"] - (
+                time.monotonic()
+            )
+
+            self.assertAlmostEqual(expected, actual, places=1)
+
+    def test_backoff_expires(self) -> None:
+        """
+        Tests that a backed off nameserver gets its chance once its backoff
+        expired and that a response resets it.
+        """
+
+        self.scoreboard.record_timeout("192.168.1.1")
+
+        with unittest.mock.patch.object(
+            time, "monotonic", return_value=time.monotonic() + 2
+        ):
+            self.assertFalse(self.scoreboard.is_backed_off("192.168.1.1"))
+
+        self.scoreboard.record_response("192.168.1.1", 0.1)
+
+        expected = 0
+        actual = self.scoreboard.get("192.168.1.1")["failures"]
+
+        self.assertEqual(expected, actual)
+        self.assertFalse(self.scoreboard.is_backed_off("192.168.1.1"))
+
+    def test_get_cost(self) -> None:
+        """
+        Tests the method which let us get the expected cost of a query.
+        """
+
+        self.assertEqual(0.0, self.scoreboard.get_cost("192.168.1.1", 5.0))
+
+        self.scoreboard.record_response("192.168.1.1", 0.1)
+        self.scoreboard.record_timeout("192.168.1.1")
+
+        expected = 0.1 + 5.0 * self.scoreboard.EWMA_WEIGHT
+        actual = self.scoreboard.get_cost("192.168.1.1", 5.0)
+
+        self.assertAlmostEqual(expected, actual)
+
+    def test_sort(self) -> None:
+        """
+        Tests the method which let us sort our nameservers.
+        """
+
+        self.scoreboard.record_response("192.168.1.1", 0.3)
+        self.scoreboard.record_response("192.168.1.2", 0.1)
+        self.scoreboard.record_response("192.168.1.3", 0.2)
+
+        given = ["192.168.1.1", "192.168.1.2", "192.168.1.3"]
+
+        expected = ["192.168.1.2", "192.168.1.3", "192.168.1.1"]
+        actual = self.scoreboard.sort(given, 5.0)
+
+        self.assertEqual(expected, actual)
+
+    def test_sort_backed_off(self) -> None:
+        """
+        Tests the method which let us sort our nameservers.
+
+        In this test, we check that the backed off nameservers are left out.
+        """
+
+        self.scoreboard.record_response("192.168.1.2", 0.3)
+        self.scoreboard.record_response("192.168.1.3", 0.1)
+        self.scoreboard.record_timeout("192.168.1.1")
+
+        given = ["192.168.1.1", "192.168.1.2", "192.168.1.3"]
+
+        expected = ["192.168.1.3", "192.168.1.2"]
+        actual = self.scoreboard.sort(given, 5.0)
+
+        self.assertEqual(expected, actual)
+
+    def test_drop_backed_off(self) -> None:
+        """
+        Tests the method which let us drop the backed off nameservers.
+
+        In this test, we check that the given order is kept and that the
+        backed off nameservers are left out - unless all of them are.
+        """
+
+        self.scoreboard.record_timeout("192.168.1.1")
+
+        given = ["192.168.1.1", "192.168.1.2"]
+
+        expected = ["192.168.1.2"]
+        actual = self.scoreboard.drop_backed_off(given)
+
+        self.assertEqual(expected, actual)
+
+        self.scoreboard.record_timeout("192.168.1.2")
+
+        expected = ["192.168.1.1", "192.168.1.2"]
+        actual = self.scoreboard.drop_backed_off(given)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,6 +50,9 @@ License:
     limitations under the License.
 """
 
+import socket
+import threading
+import time
 import unittest
 import unittest.mock
 
@@ -148,6 +151,140 @@ class TestNetInfobase(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_set_timeout_return(self) -> None:
+        """
+        Tests the response from the method which let us set the timeout to
+        apply.
+        """
+
+        given = 3.0
+
+        actual = self.interface.set_timeout(given)
+
+        self.assertIsInstance(actual, NetInfoBase)
+
+    def test_set_timeout_method(self) -> None:
+        """
+        Tests the method which let us set the timeout to apply.
+        """
+
+        given = 3
+        expected = 3.0
+
+        self.interface.set_timeout(given)
+
+        actual = self.interface.timeout
+
+        self.assertEqual(expected, actual)
+
+    def test_set_timeout_through_init(self) -> None:
+        """
+        Tests the overwritting of the timeout to apply through the class
+        constructor.
+        """
+
+        given = 3.0
+        expected = 3.0
+
+        interface = NetInfoBase(timeout=given)
+        actual = interface.timeout
+
+        self.assertEqual(expected, actual)
+
+    def test_set_timeout_not_int_nor_float(self) -> None:
+        """
+        Tests the method which let us set the timeout to apply for the case
+        that a non integer nor float value is given.
+        """
+
+        given = "3"
+
+        self.assertRaises(TypeError, lambda: self.interface.set_timeout(given))
+
+    def test_set_timeout_not_positive(self) -> None:
+        """
+        Tests the method which let us set the timeout to apply for the case
+        that a value less or equal to 0 is given.
+        """
+
+        given = -1
+
+        self.assertRaises(ValueError, lambda: self.interface.set_timeout(given))
+
+    def test_call(self) -> None:
+        """
+        Tests the method which let us call a function while respecting our
+        timeout.
+        """
+
+        self.interface.subject = "example.com"
+        self.interface.timeout = 2.0
+
+        expected = 3
+        actual = self.interface.call(sum, [1, 2])
+
+        self.assertEqual(expected, actual)
+
+    def test_call_exception(self) -> None:
+        """
+        Tests the method which let us call a function while respecting our
+        timeout; but for the case that the function raises an exception.
+        """
+
+        def fake_function():
+            raise socket.gaierror("This is a test :-)")
+
+        self.interface.subject = "example.com"
+        self.interface.timeout = 2.0
+
+        self.assertRaises(socket.gaierror, lambda: self.interface.call(fake_function))
+
+    def test_call_timeout(self) -> None:
+        """
+        Tests the method which let us call a function while respecting our
+        timeout; but for the case that the function does not return in time.
+        """
+
+        self.interface.subject = "example.com"
+        self.interface.timeout = 0.1
+
+        self.assertRaises(socket.timeout, lambda: self.interface.call(time.sleep, 1))
+
+    def test_call_timeout_abandoned(self) -> None:
+        """
+        Tests the method which let us call a function while respecting our
+        timeout; but for the case that we stopped waiting for a function
+        which is still running.
+        """
+
+        self.interface.subject = "example.com"
+        self.interface.timeout = 0.1
+
+        abandoned_calls = NetInfoBase.abandoned_calls
+
+        self.assertRaises(
+            socket.timeout, lambda: self.interface.call(time.sleep, 0.5)
+        )
+
+        expected = abandoned_calls + 1
+        actual = NetInfoBase.abandoned_calls
+
+        self.assertEqual(expected, actual)
+
+    def test_call_shared_executor(self) -> None:
+        """
+        Tests that our calls are run from the pool of threads shared by all
+        network information classes.
+        """
+
+        self.interface.subject = "example.com"
+        self.interface.timeout = 2.0
+
+        actual = self.interface.call(threading.current_thread)
+
+        self.assertTrue(actual.name.startswith("pyfunceble_netinfo"))
+        self.assertIs(NetInfoBase.executor, NetInfoBase().executor)
+
     def test_get_info_no_subject_given(self) -> None:
         """
         Tests the method which let us get the information we are looking for;
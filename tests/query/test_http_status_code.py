@@ -437,6 +437,7 @@ class TestHTTPStatusCode(unittest.TestCase):
             response_content = "I'm a teapot."
 
             response = requests.models.Response()
+            response.raw = unittest.mock.MagicMock()
             response.url = "https://example.org"
             response.status_code = 418
 
@@ -456,6 +457,26 @@ class TestHTTPStatusCode(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    @unittest.mock.patch.object(PyFunceble.factory.Requester, "get")
+    def test_get_status_code_closes_response(self, request_mock) -> None:
+        """
+        Tests that the (streamed) response is closed once we got its status
+        code.
+        """
+
+        response = unittest.mock.MagicMock(
+            url="https://example.org", status_code=200, history=[]
+        )
+        request_mock.return_value = response
+
+        self.query_tool.subject = "https://example.org"
+
+        expected = 200
+        actual = self.query_tool.get_status_code()
+
+        self.assertEqual(expected, actual)
+        response.close.assert_called_once_with()
+
     @unittest.mock.patch.object(PyFunceble.factory.Requester, "get")
     def test_get_status_code_error(self, request_mock) -> None:
         """
@@ -512,6 +533,7 @@ class TestHTTPStatusCode(unittest.TestCase):
             first_response.status_code = 302
 
             final_response = requests.models.Response()
+            final_response.raw = unittest.mock.MagicMock()
             final_response.url = "https://example.org"
             final_response.status_code = 200
 
@@ -548,6 +570,7 @@ class TestHTTPStatusCode(unittest.TestCase):
             first_response.status_code = 302
 
             final_response = requests.models.Response()
+            final_response.raw = unittest.mock.MagicMock()
             final_response.url = "https://test.example.org"
             final_response.status_code = 200
 
@@ -587,6 +610,7 @@ class TestHTTPStatusCode(unittest.TestCase):
             first_response.status_code = 302
 
             final_response = requests.models.Response()
+            final_response.raw = unittest.mock.MagicMock()
             final_response.url = "https://test.example.org"
             final_response.status_code = 200
 
@@ -634,6 +658,7 @@ class TestHTTPStatusCode(unittest.TestCase):
             third_response.status_code = 302
 
             final_response = requests.models.Response()
+            final_response.raw = unittest.mock.MagicMock()
             final_response.url = "https://test.example.org"
             final_response.status_code = 200
 
@@ -683,6 +708,7 @@ class TestHTTPStatusCode(unittest.TestCase):
             third_response.status_code = 302
 
             final_response = requests.models.Response()
+            final_response.raw = unittest.mock.MagicMock()
             final_response.url = "https://test.example.org"
             final_response.status_code = 200
 
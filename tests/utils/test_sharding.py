@@ -0,0 +1,270 @@
+"""
+The tool to check the availability or syntax of domain, IP or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of our sharding utilities.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/#/special-thanks
+
+Contributors:
+    https://pyfunceble.github.io/#/contributors
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/dev/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    Copyright 2017, 2018, 2019, 2020, 2021 Nissar Chababy
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+
+import hashlib
+import unittest
+
+from PyFunceble.config.loader import ConfigLoader
+from PyFunceble.utils import sharding
+
+
+class TestSharding(unittest.TestCase):
+    """
+    Tests of our sharding utilities.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.config_loader = ConfigLoader()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything needed by the tests.
+        """
+
+        del self.config_loader
+
+    def test_get_shard_config_not_loaded(self) -> None:
+        """
+        Tests the method which provides the configured shard for the case that
+        the configuration was not loaded.
+        """
+
+        expected = None
+        actual = sharding.get_shard()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard(self) -> None:
+        """
+        Tests the method which provides the configured shard.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"shard_count": 4, "shard_index": 3}}
+        ).start()
+
+        expected = (3, 4)
+        actual = sharding.get_shard()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard_no_index(self) -> None:
+        """
+        Tests the method which provides the configured shard for the case that
+        no index was given.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"shard_count": 4, "shard_index": None}}
+        ).start()
+
+        expected = (0, 4)
+        actual = sharding.get_shard()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard_single_shard(self) -> None:
+        """
+        Tests the method which provides the configured shard for the case that
+        we are not sharding.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"shard_count": 1, "shard_index": 0}}
+        ).start()
+
+        expected = None
+        actual = sharding.get_shard()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard_index_out_of_bounds(self) -> None:
+        """
+        Tests the method which provides the configured shard for the case that
+        the index is not in the configured count.
+        """
+
+        for shard_index in (4, 5, -1):
+            self.config_loader.set_custom_config(
+                {"cli_testing": {"shard_count": 4, "shard_index": shard_index}}
+            ).start()
+
+            self.assertRaises(ValueError, sharding.get_shard)
+
+    def test_get_shard_of_subject(self) -> None:
+        """
+        Tests the method which provides the shard of a subject.
+        """
+
+        given = "example.org"
+
+        digest = hashlib.sha256(given.encode("utf-8")).digest()
+
+        expected = int.from_bytes(digest[:8], "big") % 7
+        actual = sharding.get_shard_of_subject(given, 7)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard_of_subject_deterministic(self) -> None:
+        """
+        Tests that a subject always ends up into the same shard.
+        """
+
+        given = [f"example-{x}.org" for x in range(100)]
+
+        expected = [sharding.get_shard_of_subject(x, 5) for x in given]
+        actual = [sharding.get_shard_of_subject(x, 5) for x in given]
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard_of_subject_in_bounds(self) -> None:
+        """
+        Tests that the shard of a subject is always in the given count - and
+        that all our shards are used.
+        """
+
+        given = [f"example-{x}.org" for x in range(1000)]
+
+        expected = set(range(5))
+        actual = {sharding.get_shard_of_subject(x, 5) for x in given}
+
+        self.assertEqual(expected, actual)
+
+    def test_is_subject_of_shard(self) -> None:
+        """
+        Tests the method which checks if a subject belongs to a given shard.
+        """
+
+        given = "example.org"
+        shard_index = sharding.get_shard_of_subject(given, 3)
+
+        expected = [x == shard_index for x in range(3)]
+        actual = [sharding.is_subject_of_shard(given, (x, 3)) for x in range(3)]
+
+        self.assertEqual(expected, actual)
+
+    def test_is_subject_of_shard_not_sharding(self) -> None:
+        """
+        Tests the method which checks if a subject belongs to a given shard for
+        the case that we are not sharding.
+        """
+
+        expected = True
+        actual = sharding.is_subject_of_shard("example.org")
+
+        self.assertEqual(expected, actual)
+
+    def test_is_subject_of_shard_from_config(self) -> None:
+        """
+        Tests the method which checks if a subject belongs to the configured
+        shard.
+        """
+
+        given = "example.org"
+        shard_index = sharding.get_shard_of_subject(given, 3)
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"shard_count": 3, "shard_index": shard_index}}
+        ).start()
+
+        expected = True
+        actual = sharding.is_subject_of_shard(given)
+
+        self.assertEqual(expected, actual)
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"shard_count": 3, "shard_index": (shard_index + 1) % 3}}
+        ).start()
+
+        expected = False
+        actual = sharding.is_subject_of_shard(given)
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard_filename(self) -> None:
+        """
+        Tests the method which provides the name of a file for the configured
+        shard.
+        """
+
+        self.config_loader.set_custom_config(
+            {"cli_testing": {"shard_count": 4, "shard_index": 2}}
+        ).start()
+
+        expected = "continue_shard_2_of_4.csv"
+        actual = sharding.get_shard_filename("continue.csv")
+
+        self.assertEqual(expected, actual)
+
+        expected = "output_shard_2_of_4"
+        actual = sharding.get_shard_filename("output")
+
+        self.assertEqual(expected, actual)
+
+    def test_get_shard_filename_not_sharding(self) -> None:
+        """
+        Tests the method which provides the name of a file for the configured
+        shard for the case that we are not sharding.
+        """
+
+        expected = "continue.csv"
+        actual = sharding.get_shard_filename("continue.csv")
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()